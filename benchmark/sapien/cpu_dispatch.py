@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Compare per-scene PhysX CPU dispatchers against one shared, process-wide worker pool, and
+sweep the CPU broad phase algorithm. Each combination runs in its own subprocess since the
+shared pool is sized once per process.
+Run from repo root: python3 -m benchmark.sapien.cpu_dispatch --tasks cube_stack --scenes 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+MODES = ["per-scene", "shared"]
+BROAD_PHASES = ["sap", "mbp", "abp", "pabp"]
+
+
+def _parse_affinity(text: str, workers: int) -> list[list[int]]:
+    """'0-3' pins worker i to one CPU of the range; '0,1;2,3' lists the CPUs of each worker."""
+    if not text:
+        return []
+    if ";" not in text and "-" in text:
+        lo, hi = (int(x) for x in text.split("-"))
+        cpus = list(range(lo, hi + 1))
+        return [[cpus[i % len(cpus)]] for i in range(workers)]
+    return [[int(c) for c in group.split(",") if c.strip()] for group in text.split(";")]
+
+
+def _thread_count() -> int:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("Threads:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return -1
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Per-scene vs shared PhysX CPU dispatcher")
+    parser.add_argument("--tasks", type=str, default="cube_stack", help="Comma-separated tasks")
+    parser.add_argument("--scenes", type=int, default=32, help="CPU systems per task")
+    parser.add_argument("--workers", type=int, default=4, help="Worker threads (per scene or shared)")
+    parser.add_argument(
+        "--affinity",
+        type=str,
+        default="",
+        help='Pin shared workers: "0-7" (one CPU each, round robin) or "0,1;2,3" (list per worker)',
+    )
+    parser.add_argument("--steps", type=int, default=200, help="Measured steps")
+    parser.add_argument("--warmup-steps", type=int, default=20, help="Unmeasured steps")
+    parser.add_argument("--dt", type=float, default=1.0 / 240.0, help="Simulation timestep")
+    parser.add_argument(
+        "--modes", type=str, default=",".join(MODES), help=f"Comma-separated modes: {', '.join(MODES)}"
+    )
+    parser.add_argument(
+        "--broad-phases",
+        type=str,
+        default="pabp",
+        help=f"Comma-separated CPU broad phases to sweep: {', '.join(BROAD_PHASES)}",
+    )
+    parser.add_argument(
+        "--mbp-subdivisions",
+        type=int,
+        default=4,
+        help="MBP regions per horizontal axis; regions tile the bounds of each scene",
+    )
+    parser.add_argument(
+        "--split-step",
+        action="store_true",
+        help="Start every system with step_start before waiting on any of them with step_finish",
+    )
+    parser.add_argument("--mode", choices=MODES, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--broad-phase", choices=BROAD_PHASES, default=None, help=argparse.SUPPRESS)
+
+    from envs import add_all_env_args
+
+    add_all_env_args(parser)
+    return parser.parse_args()
+
+
+def run_mode(args: argparse.Namespace, task_name: str) -> dict:
+    os.environ.setdefault("SAPIEN_SKIP_VULKAN", "1")
+    import sapien
+
+    from envs import get_task_scene_builder
+
+    scene_builder = get_task_scene_builder(task_name)
+    if scene_builder is None:
+        raise RuntimeError(f"Task '{task_name}' does not expose build_scene_{task_name}()")
+
+    shared = args.mode == "shared"
+    if shared:
+        sapien.physx.set_shared_cpu_dispatcher_config(
+            args.workers, _parse_affinity(args.affinity, args.workers)
+        )
+    sapien.physx.set_scene_config(
+        cpu_workers=0 if shared else args.workers,
+        broad_phase=args.broad_phase,
+        mbp_subdivisions=args.mbp_subdivisions,
+    )
+
+    # Scenes must outlive the run: a destroyed Scene removes its entities from the system
+    systems = []
+    scenes = []
+    for _ in range(args.scenes):
+        px = sapien.physx.PhysxCpuSystem(shared_dispatcher=shared)
+        scene = sapien.Scene([px])
+        scene_builder(scene, args)
+        systems.append(px)
+        scenes.append(scene)
+    for px in systems:
+        assert px.get_rigid_dynamic_components() or px.get_articulation_link_components(), (
+            f"Task '{task_name}' built a scene without dynamic bodies"
+        )
+
+    def step_all() -> None:
+        if args.split_step:
+            for px in systems:
+                px.step_start()
+            for px in systems:
+                px.step_finish()
+        else:
+            for px in systems:
+                px.step()
+
+    for _ in range(args.warmup_steps):
+        step_all()
+
+    samples = []
+    for _ in range(args.steps):
+        start = time.perf_counter()
+        step_all()
+        samples.append((time.perf_counter() - start) * 1e3)
+
+    return {
+        "mode": args.mode,
+        "broad_phase": args.broad_phase,
+        "task": task_name,
+        "threads": _thread_count(),
+        "mean_ms": statistics.fmean(samples),
+        "median_ms": statistics.median(samples),
+        "p90_ms": sorted(samples)[int(0.9 * (len(samples) - 1))],
+    }
+
+
+def main() -> int:
+    args = _parse_args()
+    tasks = [t.strip() for t in args.tasks.split(",") if t.strip()]
+
+    if args.mode is not None and args.broad_phase is not None:
+        for task_name in tasks:
+            print(json.dumps(run_mode(args, task_name)), flush=True)
+        return 0
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    for mode in modes:
+        if mode not in MODES:
+            print(f"Unknown mode '{mode}'. Available: {', '.join(MODES)}", file=sys.stderr)
+            return 1
+    broad_phases = [b.strip() for b in args.broad_phases.split(",") if b.strip()]
+    for broad_phase in broad_phases:
+        if broad_phase not in BROAD_PHASES:
+            print(
+                f"Unknown broad phase '{broad_phase}'. Available: {', '.join(BROAD_PHASES)}",
+                file=sys.stderr,
+            )
+            return 1
+
+    print(f"{args.scenes} scenes, {args.workers} workers")
+    print(
+        f"{'task':<20} {'mode':<10} {'broad_phase':<12} {'threads':>8} {'mean_ms':>10} "
+        f"{'median_ms':>10} {'p90_ms':>10}"
+    )
+    for mode in modes:
+        for broad_phase in broad_phases:
+            out = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmark.sapien.cpu_dispatch",
+                    *sys.argv[1:],
+                    "--mode",
+                    mode,
+                    "--broad-phase",
+                    broad_phase,
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            for line in out.stdout.splitlines():
+                if not line.startswith("{"):
+                    continue
+                row = json.loads(line)
+                print(
+                    f"{row['task']:<20} {row['mode']:<10} {row['broad_phase']:<12} "
+                    f"{row['threads']:>8} {row['mean_ms']:>10.3f} {row['median_ms']:>10.3f} "
+                    f"{row['p90_ms']:>10.3f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Measure how long `import sapien` takes in a fresh interpreter.
+Each mode runs in its own subprocess so nothing is cached between samples.
+Run from repo root: python3 -m benchmark.sapien.import_time
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# name -> (statement run after `import sapien`, extra environment)
+MODES: dict[str, tuple[str, dict[str, str]]] = {
+    "physics": ("sapien.physx.PhysxCpuSystem", {"SAPIEN_SKIP_VULKAN": "1"}),
+    "scene": ("sapien.Scene", {"SAPIEN_SKIP_VULKAN": "1"}),
+    "eager": ("sapien.Scene", {"SAPIEN_SKIP_VULKAN": "1", "SAPIEN_EAGER_IMPORT": "1"}),
+}
+
+_SNIPPET = """
+import time
+t = time.perf_counter()
+import sapien
+{statement}
+print(time.perf_counter() - t)
+"""
+
+
+def time_import(statement: str, env: dict[str, str]) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", _SNIPPET.format(statement=statement)],
+        env={**os.environ, **env},
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time `import sapien` in fresh interpreters")
+    parser.add_argument("--repeats", type=int, default=5, help="Subprocesses per mode")
+    parser.add_argument(
+        "--modes",
+        type=str,
+        default=",".join(MODES),
+        help=f"Comma-separated modes: {', '.join(MODES)}",
+    )
+    args = parser.parse_args()
+
+    print(f"{'mode':<10} {'median_ms':>10} {'min_ms':>10} {'max_ms':>10}")
+    for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+        if mode not in MODES:
+            print(f"Unknown mode '{mode}'. Available: {', '.join(MODES)}", file=sys.stderr)
+            return 1
+        statement, env = MODES[mode]
+        samples = [time_import(statement, env) * 1e3 for _ in range(args.repeats)]
+        print(
+            f"{mode:<10} {statistics.median(samples):>10.1f} {min(samples):>10.1f} {max(samples):>10.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
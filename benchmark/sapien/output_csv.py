@@ -5,7 +5,21 @@ from pathlib import Path
 from typing import Iterable
 
 
-STAGE_NAMES = ["broadphase", "narrowphase", "coloring", "solver", "update", "total"]
+STAGE_NAMES = ["broadphase", "narrowphase", "coloring", "solver", "update", "scene_query", "total"]
+# Wall-clock buckets of one measured loop iteration (always on, also in release builds):
+# before_step hook, step(), trajectory/workload recording, viewer sync, remaining loop overhead,
+# and the whole iteration.
+WALL_NAMES = ["hook_wall", "step_wall", "record_wall", "sync_wall", "loop_wall", "iter_wall"]
+# Resource telemetry of the measured loop (see benchmark.sapien.telemetry)
+TELEMETRY_COLUMNS = [
+    "peak_rss_mb",
+    "pinned_growth_mb",
+    "mean_cpu_pct",
+    "max_core_util_pct",
+    "invol_ctx_switches_per_step",
+    "page_faults_per_step",
+    "telemetry_samples",
+]
 
 STEP_COLUMNS = [
     "run_id",
@@ -18,15 +32,27 @@ STEP_COLUMNS = [
     "coloring_ms",
     "solver_ms",
     "update_ms",
+    "scene_query_ms",
     "total_ms",
+    "hook_wall_ms",
+    "step_wall_ms",
+    "record_wall_ms",
+    "sync_wall_ms",
+    "loop_wall_ms",
+    "iter_wall_ms",
 ]
 
 
 def summary_columns() -> list[str]:
     columns = ["run_id", "task", "config", "steps", "warmup_steps", "dt", "task_config"]
+    columns.extend(["warmup_mode", "warmup_converged", "warmup_drift", "warmup_cv"])
     # All means, then p90, p99, max, min for each metric
     for suffix in ["mean", "p90", "p99", "max", "min"]:
         columns.extend([f"{stage}_{suffix}_ms" for stage in STAGE_NAMES])
+    for suffix in ["mean", "p90", "p99", "max", "min"]:
+        columns.extend([f"{name}_{suffix}_ms" for name in WALL_NAMES])
+    columns.extend(["num_envs", "substeps", "env_steps_per_s", "real_time_factor"])
+    columns.extend(TELEMETRY_COLUMNS)
     return columns
 
 
@@ -40,9 +66,25 @@ def write_rows(path: Path, fieldnames: list[str], rows: Iterable[dict]) -> None:
 
 
 def append_rows(path: Path, fieldnames: list[str], rows: Iterable[dict]) -> None:
-    """Append rows to CSV; write header only if file is new or empty."""
+    """Append rows to CSV; write header only if file is new or empty.
+
+    Rows are appended under the existing header when it already has every column. Only when
+    there are new columns is the file rewritten, with them appended to the old ones so old
+    rows stay aligned.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
     write_header = not path.exists() or path.stat().st_size == 0
+    if not write_header:
+        with path.open("r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            old_fieldnames = list(reader.fieldnames or [])
+            new_names = [name for name in fieldnames if name not in old_fieldnames]
+            if new_names:
+                old_rows = list(reader)
+        if new_names:
+            write_rows(path, old_fieldnames + new_names, [*old_rows, *rows])
+            return
+        fieldnames = old_fieldnames
     with path.open("a", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         if write_header:
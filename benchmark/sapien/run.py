@@ -36,7 +36,40 @@ def _parse_args() -> argparse.Namespace:
         help='Comma-separated tasks. Sequential mode: "cube_stack,pouring_balls". Mixed mode: "cube_stack:4,franka:16".',
     )
     parser.add_argument("--steps", type=int, default=600, help="Measured simulation steps")
-    parser.add_argument("--warmup-steps", type=int, default=120, help="Warmup steps")
+    parser.add_argument(
+        "--warmup-mode",
+        choices=["adaptive", "fixed"],
+        default="adaptive",
+        help="adaptive: warm up until step times are stationary (bounded by --warmup-min/max-steps); "
+        "fixed: run exactly --warmup-steps",
+    )
+    parser.add_argument("--warmup-steps", type=int, default=120, help="Warmup steps for --warmup-mode fixed")
+    parser.add_argument(
+        "--warmup-min-steps",
+        type=int,
+        default=None,
+        help="Adaptive warmup lower bound; defaults to and is clamped to at least 2 * --warmup-window, "
+        "the samples the steady-state test needs",
+    )
+    parser.add_argument("--warmup-max-steps", type=int, default=1000, help="Adaptive warmup upper bound")
+    parser.add_argument(
+        "--warmup-window",
+        type=int,
+        default=30,
+        help="Adaptive warmup compares the medians of two adjacent windows of this many steps",
+    )
+    parser.add_argument(
+        "--warmup-tolerance",
+        type=float,
+        default=0.05,
+        help="Adaptive warmup: max relative change of the median step time between the two windows",
+    )
+    parser.add_argument(
+        "--warmup-max-cv",
+        type=float,
+        default=0.25,
+        help="Adaptive warmup: max coefficient of variation of the newest window",
+    )
     parser.add_argument("--dt", type=float, default=1.0 / 240.0, help="Simulation timestep")
     parser.add_argument("--device", type=str, default="cuda", help="PhysX GPU device string")
     parser.add_argument(
@@ -70,6 +103,52 @@ def _parse_args() -> argparse.Namespace:
         metavar="N",
         help="Number of parallel envs (vectorized). N>1 uses one PhysX GPU system and N scenes. Only supported by some tasks.",
     )
+    parser.add_argument(
+        "--record-dir",
+        type=Path,
+        default=None,
+        help="Record the state of every measured step to {record_dir}/{task}.traj (see sapien.physx.trajectory).",
+    )
+    parser.add_argument(
+        "--workload-record",
+        type=Path,
+        default=None,
+        help="Record per-step drive targets and external forces of the measured steps to "
+        "{workload_record}/{task}.npz (see sapien.physx.workload).",
+    )
+    parser.add_argument(
+        "--workload-replay",
+        type=Path,
+        default=None,
+        help="Drive each task with {workload_replay}/{task}.npz instead of its before_step hook.",
+    )
+    parser.add_argument(
+        "--scene-query-update",
+        choices=["commit", "build", "disabled"],
+        default="commit",
+        help="Scene query structure updates per step; 'disabled' skips them for physics-only runs",
+    )
+    parser.add_argument(
+        "--scene-query-pruner",
+        choices=["aabb_tree", "bvh", "none"],
+        default="aabb_tree",
+        help="Pruning structure used by scene queries",
+    )
+    parser.add_argument(
+        "--substeps",
+        type=int,
+        default=1,
+        help="Physics steps per before_step call, run natively by one step(n_substeps) call that "
+        "re-applies drive targets and forces every substep; each row then covers all substeps",
+    )
+    parser.add_argument(
+        "--telemetry-interval-ms",
+        type=float,
+        default=50.0,
+        help="Sample CPU, RSS, page faults and context switches from /proc on a background thread "
+        "every N ms during warmup and the measured loop (0 disables). With --prefix, the time series "
+        "goes to {output_dir}/telemetry/{run_id}_{task}.csv",
+    )
     parser.add_argument(
         "--debug-gpu-config",
         action="store_true",
@@ -84,19 +163,23 @@ def _parse_args() -> argparse.Namespace:
 _ARGS = _parse_args()
 
 import math
+import time
 
 import sapien
 
 from benchmark.sapien.config import GPUMemoryConfig
+from benchmark.sapien.telemetry import ResourceSampler
+from benchmark.sapien.warmup import SteadyStateDetector, WarmupResult
 from benchmark.sapien.output_csv import (
     STAGE_NAMES,
+    WALL_NAMES,
     metadata_to_string,
     summary_columns,
     append_rows,
     write_rows,
 )
-from envs import get_task_scene_builder, list_tasks, resolve_task_name
-from envs.base import TaskRuntime
+from envs import get_task_hook_factory, get_task_scene_builder, list_tasks, resolve_task_name
+from envs.base import TaskEnvs, TaskRuntime
 
 TaskSpec = tuple[str, int | None]
 
@@ -155,18 +238,32 @@ def percentile(values: list[float], p: float) -> float:
 
 
 def summarize_task_rows(
-    rows: list[dict], *, run_id: str, task: str, config: str, steps: int, warmup_steps: int, dt: float, task_config: str
+    rows: list[dict],
+    *,
+    run_id: str,
+    task: str,
+    config: str,
+    steps: int,
+    warmup: WarmupResult,
+    dt: float,
+    task_config: str,
+    num_envs: int = 1,
+    substeps: int = 1,
 ) -> dict:
     summary = {
         "run_id": run_id,
         "task": task,
         "config": config,
         "steps": steps,
-        "warmup_steps": warmup_steps,
+        "warmup_steps": warmup.steps,
         "dt": dt,
         "task_config": task_config,
+        "warmup_mode": warmup.mode,
+        "warmup_converged": int(warmup.converged),
+        "warmup_drift": warmup.drift,
+        "warmup_cv": warmup.cv,
     }
-    for stage in STAGE_NAMES:
+    for stage in STAGE_NAMES + WALL_NAMES:
         key = f"{stage}_ms"
         values = [float(row[key]) for row in rows]
         if values:
@@ -181,9 +278,34 @@ def summarize_task_rows(
             summary[f"{stage}_p99_ms"] = 0.0
             summary[f"{stage}_max_ms"] = 0.0
             summary[f"{stage}_min_ms"] = 0.0
+
+    # Throughput from wall-clock time, so release builds (no profile zones) still report it
+    wall_s = sum(float(row["iter_wall_ms"]) for row in rows) / 1e3
+    simulated_steps = len(rows) * substeps
+    summary["num_envs"] = num_envs
+    summary["substeps"] = substeps
+    summary["env_steps_per_s"] = simulated_steps * num_envs / wall_s if wall_s > 0.0 else 0.0
+    summary["real_time_factor"] = simulated_steps * dt / wall_s if wall_s > 0.0 else 0.0
     return summary
 
 
+def _format_summary(summary: dict, brief: bool) -> str:
+    if brief:
+        parts = [
+            f"total_mean_ms={summary['total_mean_ms']:.4f}",
+            f"total_p90_ms={summary['total_p90_ms']:.4f}",
+            f"iter_wall_mean_ms={summary['iter_wall_mean_ms']:.4f}",
+        ]
+    else:
+        parts = [f"{s}_mean={summary[f'{s}_mean_ms']:.4f}" for s in STAGE_NAMES + WALL_NAMES]
+    parts.append(f"env_steps_per_s={summary['env_steps_per_s']:.1f}")
+    parts.append(f"real_time_factor={summary['real_time_factor']:.2f}")
+    if summary.get("telemetry_samples"):
+        parts.append(f"peak_rss_mb={summary['peak_rss_mb']:.0f}")
+        parts.append(f"mean_cpu_pct={summary['mean_cpu_pct']:.0f}")
+    return ", ".join(parts)
+
+
 def _print_gpu_config_debug(gpu_config: dict, num_envs: int) -> None:
     """Print GPU config and rough memory estimates. PhysX: contact/patch in pinned host, heap in GPU."""
     print("\n=== GPU memory config (PhysX) ===")
@@ -205,7 +327,7 @@ def _print_gpu_config_debug(gpu_config: dict, num_envs: int) -> None:
     print(f"  num_envs: {num_envs}\n")
 
 
-def _set_physx_scene_config() -> None:
+def _set_physx_scene_config(args: argparse.Namespace) -> None:
     """Match ManiSkill's PhysX config (scene_config, body_config, shape_config, default_material).
     Must be called before creating PhysxGpuSystem; PhysxSystem reads PhysxDefault at construction."""
     import numpy as np
@@ -225,6 +347,8 @@ def _set_physx_scene_config() -> None:
         enable_enhanced_determinism=False,
         enable_friction_every_iteration=True,
         cpu_workers=0,
+        scene_query_update_mode=args.scene_query_update,
+        scene_query_pruner=args.scene_query_pruner,
     )
     sapien.physx.set_default_material(
         static_friction=0.3,
@@ -274,7 +398,12 @@ def _build_runtime_from_specs(
     render = bool(getattr(args, "render", False))
     scenes = []
     before_steps = []
-    metadata: dict[str, object] = {"total_envs": total_envs}
+    metadata: dict[str, object] = {
+        "total_envs": total_envs,
+        "scene_query_update": args.scene_query_update,
+        "scene_query_pruner": args.scene_query_pruner,
+        "substeps": args.substeps,
+    }
     scene_idx = 0
 
     for task_name, count in task_specs:
@@ -285,6 +414,7 @@ def _build_runtime_from_specs(
                 "Please add a single-scene builder for centralized vectorization."
             )
         metadata[f"{task_name}_num_envs"] = count
+        task_envs = TaskEnvs(physx_system=px, env_indices=[], scenes=[], results=[])
         for _ in range(count):
             systems = [px]
             if render:
@@ -293,13 +423,25 @@ def _build_runtime_from_specs(
             px.set_scene_offset(scene, _scene_offset(scene_idx, total_envs))
             result = scene_builder(scene, args)
             scenes.append(scene)
-            if getattr(result, "before_step", None) is not None:
-                before_steps.append(result.before_step)
+            task_envs.env_indices.append(scene_idx)
+            task_envs.scenes.append(scene)
+            task_envs.results.append(result)
             if getattr(result, "metadata", None):
                 for key, value in result.metadata.items():
                     metadata[f"{task_name}_{key}"] = value
             scene_idx += 1
 
+        # One hook per task acting on all of its envs; per-scene hooks only for tasks without one
+        hook_factory = get_task_hook_factory(task_name)
+        if hook_factory is not None:
+            hook = hook_factory(task_envs)
+            if hook is not None:
+                before_steps.append(hook)
+        else:
+            for result in task_envs.results:
+                if getattr(result, "before_step", None) is not None:
+                    before_steps.append(result.before_step)
+
     def combined_before_step(step_idx: int, time_s: float) -> None:
         for hook in before_steps:
             hook(step_idx, time_s)
@@ -314,6 +456,70 @@ def _build_runtime_from_specs(
     )
 
 
+def _step_physics(args: argparse.Namespace, runtime: TaskRuntime) -> None:
+    if args.substeps > 1:
+        runtime.physx_system.step(args.substeps, reapply_drives_and_forces=True)
+    else:
+        runtime.physx_system.step()
+
+
+def _run_warmup(
+    args: argparse.Namespace,
+    task_label: str,
+    num_envs: int,
+    runtime: TaskRuntime,
+    dt: float,
+    before_step,
+) -> WarmupResult:
+    if args.warmup_mode == "fixed":
+        # Cap for large num_envs so we don't sit on CPU-bound setup forever before GPU runs
+        warmup_steps = int(args.warmup_steps)
+        if num_envs > 512 and warmup_steps > 30:
+            warmup_steps = 30
+            print(f"[{task_label}] Capping fixed warmup to 30 steps for num_envs > 512", flush=True)
+        print(f"[{task_label}] Warmup ({warmup_steps} steps) ...", flush=True)
+        for step_idx in range(warmup_steps):
+            if before_step is not None:
+                before_step(step_idx, step_idx * dt * args.substeps)
+            _step_physics(args, runtime)
+        print(f"[{task_label}] Warmup done", flush=True)
+        return WarmupResult("fixed", warmup_steps, False, float("nan"), float("nan"))
+
+    # The detector cannot report a steady state before it has seen two full windows
+    min_steps = 2 * int(args.warmup_window)
+    if args.warmup_min_steps is not None:
+        min_steps = max(min_steps, int(args.warmup_min_steps))
+    max_steps = max(min_steps, int(args.warmup_max_steps))
+    detector = SteadyStateDetector(args.warmup_window, args.warmup_tolerance, args.warmup_max_cv)
+    print(f"[{task_label}] Adaptive warmup ({min_steps}-{max_steps} steps) ...", flush=True)
+
+    converged = False
+    step_idx = 0
+    while step_idx < max_steps:
+        if before_step is not None:
+            before_step(step_idx, step_idx * dt * args.substeps)
+        start = time.perf_counter()
+        sapien.physx.stage_profiler_begin_frame()
+        _step_physics(args, runtime)
+        sapien.physx.stage_profiler_end_frame()
+        wall_ms = (time.perf_counter() - start) * 1e3
+        step_idx += 1
+
+        # Stage timings are zero when PhysX profile zones are compiled out; fall back to wall time
+        total_ms = float(sapien.physx.get_stage_profiler_last_frame_stage_ms().get("total_ms", 0.0))
+        stationary = detector.add(total_ms if total_ms > 0.0 else wall_ms)
+        if stationary and step_idx >= min_steps:
+            converged = True
+            break
+
+    print(
+        f"[{task_label}] Warmup done ({step_idx} steps, converged={converged}, "
+        f"drift={detector.drift:.4f}, cv={detector.cv:.4f})",
+        flush=True,
+    )
+    return WarmupResult("adaptive", step_idx, converged, detector.drift, detector.cv)
+
+
 def _run_runtime(args: argparse.Namespace, task_label: str, num_envs: int, runtime: TaskRuntime) -> tuple[list[dict], dict]:
     if not isinstance(runtime.physx_system, sapien.physx.PhysxGpuSystem):
         raise RuntimeError(f"Task '{task_label}' did not create a PhysxGpuSystem")
@@ -366,59 +572,119 @@ def _run_runtime(args: argparse.Namespace, task_label: str, num_envs: int, runti
 
     before_step = runtime.before_step
     dt = float(args.dt)
+    file_label = task_label.replace(":", "_")
 
-    # Warmup (cap for large num_envs so we don't sit on CPU-bound setup forever before GPU runs)
-    warmup_steps = int(args.warmup_steps)
-    if num_envs > 512:
-        warmup_steps = min(warmup_steps, 30)
-    print(f"[{task_label}] Warmup ({warmup_steps} steps) ...", flush=True)
-    for step_idx in range(warmup_steps):
-        if before_step is not None:
-            before_step(step_idx, step_idx * dt)
-        runtime.physx_system.step()
-    print(f"[{task_label}] Warmup done", flush=True)
+    if args.workload_replay is not None:
+        from sapien.physx.workload import WorkloadReplayer
 
-    print(f"[{task_label}] Running {args.steps} steps ...", flush=True)
-    rows: list[dict] = []
-    for step_idx in range(args.steps):
-        if before_step is not None:
-            before_step(step_idx, step_idx * dt)
+        workload_path = args.workload_replay / f"{file_label}.npz"
+        replayer = WorkloadReplayer(workload_path)
+        physx_system = runtime.physx_system
 
-        sapien.physx.stage_profiler_begin_frame()
-        runtime.physx_system.step()
-        sapien.physx.stage_profiler_end_frame()
+        def before_step(step_idx: int, time_s: float) -> None:
+            replayer.apply(physx_system, step_idx)
+
+        runtime.metadata["workload"] = workload_path.name
+        print(f"[{task_label}] Replaying {len(replayer)}-step workload {workload_path}", flush=True)
+
+    sampler = ResourceSampler(args.telemetry_interval_ms / 1e3)
+    sampler.start("warmup")
+    try:
+        warmup = _run_warmup(args, task_label, num_envs, runtime, dt, before_step)
 
-        if viewer is not None:
-            # Keep articulation links (e.g., Franka) in sync for rendering in GPU mode.
-            # Without this, mixed articulated scenes can appear overlapped or scrambled.
-            if hasattr(runtime.physx_system, "gpu_update_articulation_kinematics"):
-                runtime.physx_system.gpu_update_articulation_kinematics()
-            if hasattr(runtime.physx_system, "gpu_fetch_articulation_link_pose"):
-                runtime.physx_system.gpu_fetch_articulation_link_pose()
-            runtime.physx_system.sync_poses_gpu_to_cpu()
-            scenes = getattr(runtime, "scenes", None) or ([runtime.scene] if runtime.scene else [])
-            for s in scenes:
-                s.update_render()
-            viewer.window.update_render()
-            viewer.render()
-
-        stage = sapien.physx.get_stage_profiler_last_frame_stage_ms()
-        config = runtime.metadata.get("config", "N/A")
-        row = {
-            "run_id": args.run_id,
-            "task": runtime.name,
-            "config": config,
-            "step": step_idx,
-            "dt": dt,
-            "broadphase_ms": float(stage.get("broadphase_ms", 0.0)),
-            "narrowphase_ms": float(stage.get("narrowphase_ms", 0.0)),
-            "coloring_ms": float(stage.get("coloring_ms", 0.0)),
-            "solver_ms": float(stage.get("solver_ms", 0.0)),
-            "update_ms": float(stage.get("update_ms", 0.0)),
-            "total_ms": float(stage.get("total_ms", 0.0)),
-        }
-        rows.append(row)
+        recorder = None
+        if args.record_dir is not None:
+            from sapien.physx.trajectory import TrajectoryRecorder
 
+            args.record_dir.mkdir(parents=True, exist_ok=True)
+            record_path = args.record_dir / f"{file_label}.traj"
+            recorder = TrajectoryRecorder(runtime.physx_system, record_path)
+            print(f"[{task_label}] Recording to {record_path}", flush=True)
+
+        workload_recorder = None
+        if args.workload_record is not None:
+            from sapien.physx.workload import WorkloadRecorder
+
+            workload_recorder = WorkloadRecorder(
+                runtime.physx_system,
+                metadata={"task": runtime.name, "config": runtime.metadata.get("config", "N/A"), "dt": dt},
+            )
+
+        print(f"[{task_label}] Running {args.steps} steps ...", flush=True)
+        rows: list[dict] = []
+        sampler.mark("measure")
+        for step_idx in range(args.steps):
+            t_start = time.perf_counter()
+            if before_step is not None:
+                before_step(step_idx, step_idx * dt * args.substeps)
+            t_hook = time.perf_counter()
+            if workload_recorder is not None:
+                workload_recorder.capture()
+            t_capture = time.perf_counter()
+
+            sapien.physx.stage_profiler_begin_frame()
+            _step_physics(args, runtime)
+            sapien.physx.stage_profiler_end_frame()
+            t_step = time.perf_counter()
+
+            if recorder is not None:
+                recorder.record()
+            t_record = time.perf_counter()
+
+            if viewer is not None:
+                # Keep articulation links (e.g., Franka) in sync for rendering in GPU mode.
+                # Without this, mixed articulated scenes can appear overlapped or scrambled.
+                if hasattr(runtime.physx_system, "gpu_update_articulation_kinematics"):
+                    runtime.physx_system.gpu_update_articulation_kinematics()
+                if hasattr(runtime.physx_system, "gpu_fetch_articulation_link_pose"):
+                    runtime.physx_system.gpu_fetch_articulation_link_pose()
+                runtime.physx_system.sync_poses_gpu_to_cpu()
+                scenes = getattr(runtime, "scenes", None) or ([runtime.scene] if runtime.scene else [])
+                for s in scenes:
+                    s.update_render()
+                viewer.window.update_render()
+                viewer.render()
+            t_sync = time.perf_counter()
+
+            stage = sapien.physx.get_stage_profiler_last_frame_stage_ms()
+            config = runtime.metadata.get("config", "N/A")
+            row = {
+                "run_id": args.run_id,
+                "task": runtime.name,
+                "config": config,
+                "step": step_idx,
+                "dt": dt,
+                "broadphase_ms": float(stage.get("broadphase_ms", 0.0)),
+                "narrowphase_ms": float(stage.get("narrowphase_ms", 0.0)),
+                "coloring_ms": float(stage.get("coloring_ms", 0.0)),
+                "solver_ms": float(stage.get("solver_ms", 0.0)),
+                "update_ms": float(stage.get("update_ms", 0.0)),
+                "scene_query_ms": float(stage.get("scene_query_ms", 0.0)),
+                "total_ms": float(stage.get("total_ms", 0.0)),
+                "hook_wall_ms": (t_hook - t_start) * 1e3,
+                "step_wall_ms": (t_step - t_capture) * 1e3,
+                "record_wall_ms": ((t_capture - t_hook) + (t_record - t_step)) * 1e3,
+                "sync_wall_ms": (t_sync - t_record) * 1e3,
+            }
+            t_end = time.perf_counter()
+            row["loop_wall_ms"] = (t_end - t_sync) * 1e3
+            row["iter_wall_ms"] = (t_end - t_start) * 1e3
+            rows.append(row)
+    finally:
+        # also runs when the run raises, so the sampler thread stops and partial samples are kept
+        sampler.stop()
+        if args.prefix and sampler.samples:
+            telemetry_path = Path(args.output_dir) / "telemetry" / f"{args.run_id}_{file_label}.csv"
+            write_rows(telemetry_path, *sampler.rows())
+            print(f"[{task_label}] Wrote telemetry to {telemetry_path}", flush=True)
+
+    if recorder is not None:
+        recorder.close()
+    if workload_recorder is not None:
+        args.workload_record.mkdir(parents=True, exist_ok=True)
+        workload_path = args.workload_record / f"{file_label}.npz"
+        workload_recorder.save(workload_path)
+        print(f"[{task_label}] Saved workload to {workload_path}", flush=True)
     print(f"[{task_label}] Done ({args.steps} steps)", flush=True)
     task_config = metadata_to_string(runtime.metadata)
     config = runtime.metadata.get("config", "N/A")
@@ -428,10 +694,13 @@ def _run_runtime(args: argparse.Namespace, task_label: str, num_envs: int, runti
         task=runtime.name,
         config=config,
         steps=args.steps,
-        warmup_steps=warmup_steps,
+        warmup=warmup,
         dt=dt,
         task_config=task_config,
+        num_envs=num_envs,
+        substeps=args.substeps,
     )
+    summary.update(sampler.summary(args.steps))
 
     scenes = getattr(runtime, "scenes", None)
     if scenes:
@@ -450,7 +719,7 @@ def run_task(args: argparse.Namespace, task_name: str) -> tuple[list[dict], dict
     _apply_gpu_memory_config(gpu_config)
 
     # Match ManiSkill: set scene/body/shape/material config before creating PhysxGpuSystem.
-    _set_physx_scene_config()
+    _set_physx_scene_config(args)
     runtime = _build_runtime_from_specs(args, [(task_name, num_envs)], runtime_name=task_name)
     return _run_runtime(args, task_name, num_envs, runtime)
 
@@ -461,7 +730,7 @@ def run_combined_task(args: argparse.Namespace, task_specs: list[tuple[str, int]
     if getattr(args, "debug_gpu_config", False):
         _print_gpu_config_debug(gpu_config, total_envs)
     _apply_gpu_memory_config(gpu_config)
-    _set_physx_scene_config()
+    _set_physx_scene_config(args)
     task_name = "+".join(f"{name}:{count}" for name, count in task_specs)
     runtime = _build_runtime_from_specs(args, task_specs, runtime_name=task_name)
     return _run_runtime(args, task_name, total_envs, runtime)
@@ -510,28 +779,13 @@ def main() -> int:
         _, summary = run_combined_task(args, combined_specs)
         summary_rows.append(summary)
         task_label = summary["task"]
-        if args.prefix:
-            print(
-                f"[{task_label}] total_mean_ms={summary['total_mean_ms']:.4f}, "
-                f"total_p90_ms={summary['total_p90_ms']:.4f}"
-            )
-        else:
-            parts = [f"{s}_mean={summary[f'{s}_mean_ms']:.4f}" for s in STAGE_NAMES]
-            print(f"[{task_label}] " + ", ".join(parts))
+        print(f"[{task_label}] " + _format_summary(summary, brief=bool(args.prefix)))
     else:
         requested_tasks = [name for name, _ in requested_task_specs]
         for task_name in requested_tasks:
             _, summary = run_task(args, task_name)
             summary_rows.append(summary)
-
-            if args.prefix:
-                print(
-                    f"[{task_name}] total_mean_ms={summary['total_mean_ms']:.4f}, "
-                    f"total_p90_ms={summary['total_p90_ms']:.4f}"
-                )
-            else:
-                parts = [f"{s}_mean={summary[f'{s}_mean_ms']:.4f}" for s in STAGE_NAMES]
-                print(f"[{task_name}] " + ", ".join(parts))
+            print(f"[{task_name}] " + _format_summary(summary, brief=bool(args.prefix)))
 
     if args.prefix:
         output_dir = Path(args.output_dir)
@@ -547,7 +801,9 @@ def main() -> int:
         print(
             "\nWARNING: All stage timings are zero. PhysX only emits profile zones when "
             "built with PHYSX_CONFIG=checked or profile (they are compiled out in release). "
-            "Rebuild PhysX and SAPIEN with e.g. PHYSX_CONFIG=profile /workspace/scripts/update_toolchain.sh"
+            "The *_wall_ms columns, env_steps_per_s and real_time_factor are wall-clock and still valid. "
+            "For the stage breakdown, rebuild PhysX and SAPIEN with e.g. "
+            "PHYSX_CONFIG=profile /workspace/scripts/update_toolchain.sh"
         )
 
     return 0
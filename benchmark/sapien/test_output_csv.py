@@ -0,0 +1,51 @@
+import csv
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from benchmark.sapien.output_csv import append_rows
+
+
+def read_csv(path: Path):
+    with path.open(newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        return reader.fieldnames, list(reader)
+
+
+class TestAppendRows(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "summary.csv"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_new_columns(self):
+        append_rows(self.path, ["a", "b"], [{"a": 1, "b": 2}])
+        append_rows(self.path, ["a", "c"], [{"a": 3, "c": 4}])
+        fieldnames, rows = read_csv(self.path)
+        self.assertEqual(fieldnames, ["a", "b", "c"])
+        self.assertEqual(rows, [{"a": "1", "b": "2", "c": ""}, {"a": "3", "b": "", "c": "4"}])
+
+    def test_second_append(self):
+        append_rows(self.path, ["a", "b"], [{"a": 1, "b": 2}])
+        append_rows(self.path, ["a", "c"], [{"a": 3, "c": 4}])
+        size = self.path.stat().st_size
+
+        # the header already has every column: append in its order, no rewrite
+        with mock.patch("benchmark.sapien.output_csv.write_rows") as write_rows:
+            append_rows(self.path, ["c", "a"], [{"a": 5, "c": 6}])
+        write_rows.assert_not_called()
+        with self.path.open(encoding="utf-8") as f:
+            f.seek(size)
+            self.assertEqual(f.read().strip(), "5,,6")
+
+        fieldnames, rows = read_csv(self.path)
+        self.assertEqual(fieldnames, ["a", "b", "c"])
+        self.assertEqual(rows[-1], {"a": "5", "b": "", "c": "6"})
+        self.assertEqual(len(rows), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Steady-state detection for the benchmark warmup."""
+from __future__ import annotations
+
+import statistics
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass
+class WarmupResult:
+    mode: str
+    steps: int
+    converged: bool
+    # relative change of the median step time between the last two windows
+    drift: float
+    # coefficient of variation of the last window
+    cv: float
+
+
+class SteadyStateDetector:
+    """Declares step times stationary when two adjacent windows agree.
+
+    The last 2 * window step times are split into an older and a newer window. The run is
+    stationary once the medians of both windows differ by at most `tolerance` (relative)
+    and the newer window has a coefficient of variation of at most `max_cv`. Medians keep
+    single spikes (e.g. a one-off buffer resize) from resetting the test.
+    """
+
+    def __init__(self, window: int = 30, tolerance: float = 0.05, max_cv: float = 0.25):
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.window = window
+        self.tolerance = tolerance
+        self.max_cv = max_cv
+        self.values: deque[float] = deque(maxlen=2 * window)
+        self.drift = float("inf")
+        self.cv = float("inf")
+
+    def add(self, value: float) -> bool:
+        """Add one step time, return True when the distribution looks stationary."""
+        self.values.append(value)
+        if len(self.values) < self.values.maxlen:
+            return False
+
+        values = list(self.values)
+        old, new = values[: self.window], values[self.window :]
+        old_median = statistics.median(old)
+        new_median = statistics.median(new)
+        mean = statistics.fmean(new)
+        self.drift = abs(new_median - old_median) / old_median if old_median > 0 else 0.0
+        self.cv = statistics.pstdev(new) / mean if mean > 0 else 0.0
+        return self.drift <= self.tolerance and self.cv <= self.max_cv
@@ -6,7 +6,7 @@ import pkgutil
 from collections.abc import Callable
 from typing import Any
 
-from envs.base import TaskRuntime
+from envs.base import TaskEnvs, TaskHookFactory, TaskRuntime
 
 TaskBuilder = Callable[[Any], TaskRuntime]
 TaskSceneBuilder = Callable[[Any, Any], Any]
@@ -71,26 +71,35 @@ def get_task_builder(name: str) -> TaskBuilder:
     return builders[resolved]
 
 
-def get_task_scene_builder(name: str) -> TaskSceneBuilder | None:
-    """Return optional single-scene builder hook for centralized vectorization."""
+def _get_task_function(name: str, prefix: str) -> Callable | None:
     resolved = resolve_task_name(name)
     build_fn = get_task_builder(resolved)
     module_name = build_fn.__module__
     module = importlib.import_module(module_name)
-    scene_builder_name = f"build_scene_{resolved}"
-    scene_builder = getattr(module, scene_builder_name, None)
-    if scene_builder is None and hasattr(module, "__path__"):
+    function_name = f"{prefix}{resolved}"
+    function = getattr(module, function_name, None)
+    if function is None and hasattr(module, "__path__"):
         # Task builders are often re-exported from package __init__.py, while scene builders live in .builder.
         try:
             builder_module = importlib.import_module(f"{module_name}.builder")
-            scene_builder = getattr(builder_module, scene_builder_name, None)
+            function = getattr(builder_module, function_name, None)
         except Exception:
-            scene_builder = None
-    if callable(scene_builder):
-        return scene_builder
+            function = None
+    if callable(function):
+        return function
     return None
 
 
+def get_task_scene_builder(name: str) -> TaskSceneBuilder | None:
+    """Return optional single-scene builder hook for centralized vectorization."""
+    return _get_task_function(name, "build_scene_")
+
+
+def get_task_hook_factory(name: str) -> TaskHookFactory | None:
+    """Return optional make_task_hook_<task>, which builds one before_step for all envs of a task."""
+    return _get_task_function(name, "make_task_hook_")
+
+
 def list_tasks() -> list[str]:
     return sorted(_get_builders().keys())
 
@@ -98,15 +107,20 @@ def list_tasks() -> list[str]:
 def add_all_env_args(parser) -> None:
     """Call add_args from each discovered env."""
     discovered = discover_envs()
+    # Packages exporting several tasks share one add_args; register it once.
+    seen = set()
     for _name, (_build, add_args_fn) in discovered.items():
-        if add_args_fn is not None:
+        if add_args_fn is not None and add_args_fn not in seen:
+            seen.add(add_args_fn)
             add_args_fn(parser)
 
 
 __all__ = [
+    "TaskEnvs",
     "TaskRuntime",
     "discover_envs",
     "get_task_builder",
+    "get_task_hook_factory",
     "get_task_scene_builder",
     "list_tasks",
     "resolve_task_name",
@@ -12,8 +12,26 @@ BeforeStepHook = Callable[[int, float], None]
 class SceneBuildResult:
     """Result of building one task scene."""
 
+    # Per-scene hook, only used for tasks without make_task_hook_<task>
     before_step: BeforeStepHook | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Handles the task hook needs from this scene (articulations, joint layout, ...)
+    state: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class TaskEnvs:
+    """Every env of one task in a runtime, handed to make_task_hook_<task> at once."""
+
+    physx_system: Any
+    # Scene indices of the task's envs within the runtime
+    env_indices: list[int]
+    scenes: list[Any]
+    results: list[SceneBuildResult]
+
+
+# Builds one before_step for all envs of a task, acting on them as a single index set
+TaskHookFactory = Callable[[TaskEnvs], BeforeStepHook | None]
 
 
 @dataclass
@@ -6,7 +6,12 @@ from pathlib import Path
 
 import sapien
 
-from envs.base import SceneBuildResult, TaskRuntime
+from envs.base import BeforeStepHook, SceneBuildResult, TaskEnvs, TaskRuntime
+
+try:
+    import torch
+except ImportError:
+    torch = None  # type: ignore
 
 
 def add_args(parser: argparse.ArgumentParser) -> None:
@@ -48,7 +53,8 @@ def build_scene_humanoid_from_urdf(scene: sapien.Scene, args) -> SceneBuildResul
     )
 
     qpos0 = articulation.qpos
-    joint_specs: list[tuple[object, float, float]] = []
+    # (dof index, base target, phase) of every driven joint
+    joint_specs: list[tuple[int, float, float]] = []
     qpos_offset = 0
 
     for joint_idx, joint in enumerate(articulation.active_joints):
@@ -67,7 +73,7 @@ def build_scene_humanoid_from_urdf(scene: sapien.Scene, args) -> SceneBuildResul
             )
             joint.set_drive_target(base)
             joint.set_drive_velocity_target(0.0)
-            joint_specs.append((joint, base, phase))
+            joint_specs.append((qpos_offset, base, phase))
         qpos_offset += dof
 
     if args.humanoid_motion == "walk":
@@ -77,14 +83,13 @@ def build_scene_humanoid_from_urdf(scene: sapien.Scene, args) -> SceneBuildResul
         frequency_hz = 3.0
         amplitude = args.humanoid_target_scale * 1.8
 
-    def before_step(step_index: int, time_s: float) -> None:
-        phase = 2.0 * math.pi * frequency_hz * time_s
-        for joint, base, joint_phase in joint_specs:
-            target = base + amplitude * math.sin(phase + joint_phase)
-            joint.set_drive_target(float(target))
-
     return SceneBuildResult(
-        before_step=before_step,
+        state={
+            "articulation": articulation,
+            "joint_specs": joint_specs,
+            "frequency_hz": frequency_hz,
+            "amplitude": amplitude,
+        },
         metadata={
             "config": args.humanoid_motion,
             "humanoid_urdf": str(urdf_path),
@@ -97,6 +102,43 @@ def build_scene_humanoid_from_urdf(scene: sapien.Scene, args) -> SceneBuildResul
     )
 
 
+def make_task_hook_humanoid_from_urdf(envs: TaskEnvs) -> BeforeStepHook:
+    """Drive every joint of every humanoid along its sine with one target apply per step."""
+    if torch is None:
+        raise RuntimeError(
+            "humanoid_from_urdf with GPU PhysX requires PyTorch for drive targets. "
+            "Install: pip install torch"
+        )
+    physx_system = envs.physx_system
+    states = [result.state for result in envs.results]
+    frequency_hz = states[0]["frequency_hz"]
+    amplitude = states[0]["amplitude"]
+    cached: dict[str, object] = {}
+
+    def before_step(step_index: int, time_s: float) -> None:
+        target_qpos = physx_system.cuda_articulation_target_qpos.torch()
+        if not cached:
+            # GPU indices are only valid after gpu_init, so resolve them on the first step
+            device = target_qpos.device
+            gpu_indices = [state["articulation"].get_gpu_index() for state in states]
+            rows = [gpu_index for gpu_index, state in zip(gpu_indices, states) for _ in state["joint_specs"]]
+            specs = [spec for state in states for spec in state["joint_specs"]]
+            index = torch.tensor(gpu_indices, dtype=torch.int32, device=device)
+            cached["index"] = index
+            cached["index_buffer"] = sapien.CudaArray(index)
+            cached["rows"] = torch.tensor(rows, dtype=torch.long, device=device)
+            cached["cols"] = torch.tensor([s[0] for s in specs], dtype=torch.long, device=device)
+            cached["base"] = torch.tensor([s[1] for s in specs], dtype=torch.float32, device=device)
+            cached["phase"] = torch.tensor([s[2] for s in specs], dtype=torch.float32, device=device)
+        phase = 2.0 * math.pi * frequency_hz * time_s
+        target_qpos[cached["rows"], cached["cols"]] = cached["base"] + amplitude * torch.sin(
+            cached["phase"] + phase
+        )
+        physx_system.gpu_apply_articulation_target_position(cached["index_buffer"])
+
+    return before_step
+
+
 def build_humanoid_from_urdf(args) -> TaskRuntime:
     scene = sapien.Scene([sapien.physx.PhysxGpuSystem(device=args.device)])
     result = build_scene_humanoid_from_urdf(scene, args)
@@ -104,6 +146,8 @@ def build_humanoid_from_urdf(args) -> TaskRuntime:
         name="humanoid_from_urdf",
         scene=scene,
         physx_system=scene.physx_system,
-        before_step=result.before_step,
+        before_step=make_task_hook_humanoid_from_urdf(
+            TaskEnvs(scene.physx_system, [0], [scene], [result])
+        ),
         metadata=result.metadata,
     )
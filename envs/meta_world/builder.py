@@ -6,7 +6,7 @@ from pathlib import Path
 
 import sapien
 
-from envs.base import SceneBuildResult, TaskRuntime
+from envs.base import BeforeStepHook, SceneBuildResult, TaskEnvs, TaskRuntime
 
 try:
     import torch
@@ -34,31 +34,37 @@ def _make_before_step_gpu(
     physx_system: sapien.physx.PhysxGpuSystem,
     frankas: list[sapien.Articulation],
     default_dof: list[float],
-):
-    """Create before_step that sets drive targets via GPU API (required when Direct GPU API is enabled)."""
+) -> BeforeStepHook:
+    """Create one before_step that sets the drive targets of all Frankas with a single indexed GPU
+    apply (required when Direct GPU API is enabled)."""
     if torch is None:
         raise RuntimeError(
             "Meta-World Franka tasks with GPU PhysX require PyTorch for drive targets. "
             "Install: pip install torch"
         )
     default_dof_tup = tuple(default_dof)
-    cached = [None, None]  # [default_tensor, zero_vel]
+    cached: dict[str, object] = {}
 
     def before_step(step_index: int, time_s: float) -> None:
         target_qpos = physx_system.cuda_articulation_target_qpos.torch()
         target_qvel = physx_system.cuda_articulation_target_qvel.torch()
-        if cached[0] is None:
+        if not cached:
+            # GPU indices are only valid after gpu_init, so resolve them on the first step
             device = target_qpos.device
-            cached[0] = torch.tensor(default_dof_tup, dtype=torch.float32, device=device)
-            cached[1] = torch.zeros(len(default_dof_tup), dtype=torch.float32, device=device)
-        default_tensor, zero_vel = cached[0], cached[1]
-        dof = min(len(default_dof_tup), target_qpos.shape[1])
-        for franka in frankas:
-            gpu_idx = franka.get_gpu_index()
-            target_qpos[gpu_idx, :dof].copy_(default_tensor[:dof])
-            target_qvel[gpu_idx, :dof].copy_(zero_vel[:dof])
-        physx_system.gpu_apply_articulation_target_position()
-        physx_system.gpu_apply_articulation_target_velocity()
+            dof = min(len(default_dof_tup), target_qpos.shape[1])
+            index = torch.tensor(
+                [franka.get_gpu_index() for franka in frankas], dtype=torch.int32, device=device
+            )
+            cached["index"] = index
+            cached["index_buffer"] = sapien.CudaArray(index)
+            cached["rows"] = index.long()
+            cached["dof"] = dof
+            cached["default"] = torch.tensor(default_dof_tup[:dof], dtype=torch.float32, device=device)
+        rows, dof = cached["rows"], cached["dof"]
+        target_qpos[rows, :dof] = cached["default"]
+        target_qvel[rows, :dof] = 0.0
+        physx_system.gpu_apply_articulation_target_position(cached["index_buffer"])
+        physx_system.gpu_apply_articulation_target_velocity(cached["index_buffer"])
 
     return before_step
 
@@ -225,10 +231,13 @@ def build_scene_franka_cylinder(
     """Build one franka+cylinder scene into an existing scene."""
     render = getattr(args, "render", False)
     franka, _ = _build_into_scene_franka_cylinder(scene, args, render)
-    return SceneBuildResult(
-        before_step=_make_before_step_gpu(scene.physx_system, [franka], FRANKA_DEFAULT_DOF),
-        metadata={},
-    )
+    return SceneBuildResult(metadata={}, state={"franka": franka})
+
+
+def make_task_hook_franka_cylinder(envs: TaskEnvs) -> BeforeStepHook:
+    """Hold every Franka of the task at its default pose with one target apply per step."""
+    frankas = [result.state["franka"] for result in envs.results]
+    return _make_before_step_gpu(envs.physx_system, frankas, FRANKA_DEFAULT_DOF)
 
 
 def build_cylinder(args: argparse.Namespace) -> TaskRuntime:
@@ -275,26 +284,22 @@ def build_franka_cylinder(args: argparse.Namespace) -> TaskRuntime:
     if num_envs > 1:
         px = sapien.physx.PhysxGpuSystem(device=args.device)
         scenes = []
-        before_steps = []
+        results = []
         for _ in range(num_envs):
             systems = [px]
             if render:
                 systems.append(sapien.render.RenderSystem())
             scene = sapien.Scene(systems)
-            result = build_scene_franka_cylinder(scene, args)
+            results.append(build_scene_franka_cylinder(scene, args))
             scenes.append(scene)
-            if result.before_step is not None:
-                before_steps.append(result.before_step)
-
-        def before_step(step_idx: int, time_s: float) -> None:
-            for hook in before_steps:
-                hook(step_idx, time_s)
 
         return TaskRuntime(
             name="franka_cylinder",
             scene=scenes[0],
             physx_system=px,
-            before_step=before_step if before_steps else None,
+            before_step=make_task_hook_franka_cylinder(
+                TaskEnvs(px, list(range(num_envs)), scenes, results)
+            ),
             metadata={"num_envs": num_envs},
             scenes=scenes,
         )
@@ -306,6 +311,6 @@ def build_franka_cylinder(args: argparse.Namespace) -> TaskRuntime:
         name="franka_cylinder",
         scene=scene,
         physx_system=scene.physx_system,
-        before_step=result.before_step,
+        before_step=make_task_hook_franka_cylinder(TaskEnvs(scene.physx_system, [0], [scene], [result])),
         metadata={"num_envs": num_envs},
     )
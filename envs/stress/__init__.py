@@ -0,0 +1,17 @@
+from .builder import (
+    add_args,
+    build_stress_chains,
+    build_stress_convex_pile,
+    build_stress_pendulum_forest,
+    build_stress_primitive_mix,
+    build_stress_terrain,
+)
+
+__all__ = [
+    "build_stress_chains",
+    "build_stress_convex_pile",
+    "build_stress_pendulum_forest",
+    "build_stress_primitive_mix",
+    "build_stress_terrain",
+    "add_args",
+]
@@ -0,0 +1,577 @@
+"""Procedural stress scenes for scaling studies.
+
+Each generator is parametric in object count, packing density and shape mix, and
+reports the broadphase pair count of its initial layout plus a rough estimate of
+the contact pairs once the scene has settled, so runs can be lined up against the
+PhysX stage timings.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import math
+import os
+import random
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import sapien
+
+from envs.base import SceneBuildResult, TaskRuntime
+
+SHAPE_KINDS = ("sphere", "capsule", "box", "convex")
+
+# Mean number of touching neighbours per body in a random close packing.
+_PILE_COORDINATION = 6.0
+
+_COLORS = {
+    "sphere": [0.2, 0.6, 1.0, 1.0],
+    "capsule": [1.0, 0.6, 0.2, 1.0],
+    "box": [0.4, 0.8, 0.3, 1.0],
+    "convex": [0.8, 0.3, 0.6, 1.0],
+    "link": [0.7, 0.7, 0.7, 1.0],
+    "terrain": [0.5, 0.5, 0.5, 1.0],
+}
+
+
+def add_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--stress-count",
+        type=int,
+        default=256,
+        help="Bodies per stress scene (chains/pendulums for stress_chains and stress_pendulum_forest)",
+    )
+    parser.add_argument(
+        "--stress-density",
+        type=float,
+        default=0.5,
+        help="Packing density in (0, 1]; higher values spawn bodies closer together",
+    )
+    parser.add_argument(
+        "--stress-shape-mix",
+        type=str,
+        default="sphere:1,capsule:1,box:1",
+        help=f"Comma-separated kind:weight pairs, kinds: {', '.join(SHAPE_KINDS)}",
+    )
+    parser.add_argument("--stress-size", type=float, default=0.05, help="Characteristic body radius")
+    parser.add_argument("--stress-hull-variants", type=int, default=8)
+    parser.add_argument("--stress-chain-links", type=int, default=16)
+    parser.add_argument("--stress-terrain-resolution", type=int, default=64)
+    parser.add_argument("--stress-terrain-amplitude", type=float, default=0.15)
+    parser.add_argument("--stress-seed", type=int, default=0)
+
+
+def parse_shape_mix(text: str) -> dict[str, float]:
+    """Parse "sphere:2,box:1" into normalized weights."""
+    weights: dict[str, float] = {}
+    for item in text.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        kind, _, weight = item.partition(":")
+        kind = kind.strip().lower()
+        if kind not in SHAPE_KINDS:
+            raise ValueError(f"Unknown stress shape '{kind}'. Available: {', '.join(SHAPE_KINDS)}")
+        weights[kind] = weights.get(kind, 0.0) + (float(weight) if weight else 1.0)
+    total = sum(weights.values())
+    if total <= 0:
+        raise ValueError(f"Shape mix '{text}' has no positive weights")
+    return {kind: w / total for kind, w in weights.items() if w > 0}
+
+
+@dataclass
+class _Body:
+    kind: str
+    pose: sapien.Pose
+    params: dict
+    lower: np.ndarray
+    upper: np.ndarray
+
+
+@dataclass
+class _Bounds:
+    """Axis-aligned bounds plus the (articulation, link) tag used to skip jointed pairs."""
+
+    lower: list[np.ndarray] = field(default_factory=list)
+    upper: list[np.ndarray] = field(default_factory=list)
+    tags: list[tuple[int, int]] = field(default_factory=list)
+
+    def add(self, lower, upper, tag=(-1, -1)) -> None:
+        self.lower.append(np.asarray(lower, dtype=np.float64))
+        self.upper.append(np.asarray(upper, dtype=np.float64))
+        self.tags.append(tag)
+
+
+def count_overlapping_pairs(bounds: _Bounds, margin: float = 0.0) -> int:
+    """Sweep-and-prune along x over bounds inflated by margin.
+
+    Links of the same articulation that share a joint are skipped, as PhysX filters them.
+    """
+    if not bounds.lower:
+        return 0
+    lower = np.stack(bounds.lower) - margin
+    upper = np.stack(bounds.upper) + margin
+    order = np.argsort(lower[:, 0], kind="stable")
+    pairs = 0
+    active: list[int] = []
+    for i in order:
+        active = [j for j in active if upper[j, 0] >= lower[i, 0]]
+        for j in active:
+            if np.all(lower[i, 1:] <= upper[j, 1:]) and np.all(lower[j, 1:] <= upper[i, 1:]):
+                ai, li = bounds.tags[i]
+                aj, lj = bounds.tags[j]
+                if ai >= 0 and ai == aj and abs(li - lj) == 1:
+                    continue
+                pairs += 1
+        active.append(i)
+    return pairs
+
+
+def _random_quat(rng: random.Random) -> list[float]:
+    u1, u2, u3 = rng.random(), rng.random(), rng.random()
+    a, b = math.sqrt(1.0 - u1), math.sqrt(u1)
+    return [
+        a * math.sin(2 * math.pi * u2),
+        a * math.cos(2 * math.pi * u2),
+        b * math.sin(2 * math.pi * u3),
+        b * math.cos(2 * math.pi * u3),
+    ]
+
+
+def _rotation(q) -> np.ndarray:
+    w, x, y, z = q
+    return np.array(
+        [
+            [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+            [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+            [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+        ]
+    )
+
+
+def _mesh_cache_dir() -> Path:
+    path = Path(tempfile.gettempdir()) / "elytar_stress_meshes"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _write_obj(path: Path, vertices: np.ndarray, faces: np.ndarray) -> None:
+    if path.is_file():
+        return
+    lines = [f"v {v[0]:.6f} {v[1]:.6f} {v[2]:.6f}" for v in vertices]
+    lines += [f"f {f[0] + 1} {f[1] + 1} {f[2] + 1}" for f in faces]
+    # Several benchmark processes may race on the same file.
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text("\n".join(lines) + "\n")
+    os.replace(tmp, path)
+
+
+def _hull_variants(size: float, count: int, seed: int) -> list[tuple[str, np.ndarray]]:
+    """Random star-shaped blobs written as .obj; PhysX cooks their convex hulls.
+
+    Files are keyed by their parameters so repeated builds share the cooked mesh cache.
+    """
+    rng = np.random.default_rng(seed)
+    n_lat, n_lon = 6, 8
+    variants = []
+    for idx in range(max(1, count)):
+        theta = np.linspace(0.0, math.pi, n_lat + 2)[1:-1]
+        phi = np.linspace(0.0, 2 * math.pi, n_lon, endpoint=False)
+        t, p = np.meshgrid(theta, phi, indexing="ij")
+        dirs = np.stack([np.sin(t) * np.cos(p), np.sin(t) * np.sin(p), np.cos(t)], -1).reshape(-1, 3)
+        dirs = np.concatenate([dirs, [[0.0, 0.0, 1.0], [0.0, 0.0, -1.0]]])
+        radii = size * rng.uniform(0.55, 1.0, size=(len(dirs), 1))
+        axes = rng.uniform(0.6, 1.0, size=3)
+        vertices = dirs * radii * axes
+
+        faces = []
+        for i in range(n_lat - 1):
+            for j in range(n_lon):
+                a, b = i * n_lon + j, i * n_lon + (j + 1) % n_lon
+                c, d = a + n_lon, b + n_lon
+                faces += [(a, c, b), (b, c, d)]
+        top, bottom = n_lat * n_lon, n_lat * n_lon + 1
+        last = (n_lat - 1) * n_lon
+        for j in range(n_lon):
+            faces.append((top, j, (j + 1) % n_lon))
+            faces.append((bottom, last + (j + 1) % n_lon, last + j))
+
+        key = hashlib.sha1(f"hull-{size}-{seed}-{idx}".encode()).hexdigest()[:16]
+        path = _mesh_cache_dir() / f"hull_{key}.obj"
+        _write_obj(path, vertices, np.asarray(faces))
+        variants.append((str(path), vertices))
+    return variants
+
+
+def _sample_bodies(
+    count: int,
+    mix: dict[str, float],
+    size: float,
+    density: float,
+    base_z: float,
+    rng: random.Random,
+    hulls: list[tuple[str, np.ndarray]],
+) -> tuple[list[_Body], int]:
+    """Sample bodies on a jittered cubic grid. Returns the bodies and the grid side."""
+    kinds = list(mix)
+    weights = [mix[k] for k in kinds]
+    grid = max(1, math.ceil(count ** (1.0 / 3.0)))
+    bound = {"sphere": size, "capsule": size, "box": size * math.sqrt(3.0) * 0.7, "convex": size}
+    spacing = 2.0 * max(bound[k] for k in kinds) / min(1.0, max(density, 1e-3)) ** (1.0 / 3.0)
+    jitter = 0.05 * spacing * (1.0 - min(1.0, density))
+    origin = -0.5 * (grid - 1) * spacing
+
+    bodies = []
+    for idx in range(count):
+        kind = rng.choices(kinds, weights)[0]
+        center = np.array(
+            [
+                origin + (idx % grid) * spacing + rng.uniform(-jitter, jitter),
+                origin + ((idx // grid) % grid) * spacing + rng.uniform(-jitter, jitter),
+                base_z + (idx // (grid * grid)) * spacing,
+            ]
+        )
+        q = _random_quat(rng)
+        rot = _rotation(q)
+        if kind == "sphere":
+            params = {"radius": size * rng.uniform(0.6, 1.0)}
+            extent = np.full(3, params["radius"])
+        elif kind == "capsule":
+            params = {"radius": 0.5 * size, "half_length": 0.5 * size}
+            extent = np.abs(rot[:, 0]) * params["half_length"] + params["radius"]
+        elif kind == "box":
+            params = {"half_size": [size * rng.uniform(0.4, 0.7) for _ in range(3)]}
+            extent = np.abs(rot) @ np.asarray(params["half_size"])
+        else:
+            filename, vertices = hulls[rng.randrange(len(hulls))]
+            params = {"filename": filename}
+            world = vertices @ rot.T
+            bodies.append(
+                _Body(kind, sapien.Pose(center, q), params, center + world.min(0), center + world.max(0))
+            )
+            continue
+        bodies.append(_Body(kind, sapien.Pose(center, q), params, center - extent, center + extent))
+    return bodies, grid
+
+
+def _build_body(scene: sapien.Scene, body: _Body, name: str, render: bool) -> None:
+    builder = scene.create_actor_builder()
+    builder.set_physx_body_type("dynamic")
+    material = sapien.render.RenderMaterial(base_color=_COLORS[body.kind], roughness=0.5) if render else None
+    if body.kind == "sphere":
+        builder.add_sphere_collision(radius=body.params["radius"])
+        if render:
+            builder.add_sphere_visual(radius=body.params["radius"], material=material)
+    elif body.kind == "capsule":
+        builder.add_capsule_collision(
+            radius=body.params["radius"], half_length=body.params["half_length"]
+        )
+        if render:
+            builder.add_capsule_visual(
+                radius=body.params["radius"],
+                half_length=body.params["half_length"],
+                material=material,
+            )
+    elif body.kind == "box":
+        builder.add_box_collision(half_size=body.params["half_size"])
+        if render:
+            builder.add_box_visual(half_size=body.params["half_size"], material=material)
+    else:
+        builder.add_convex_collision_from_file(body.params["filename"])
+        if render:
+            builder.add_visual_from_file(body.params["filename"], material=material)
+    builder.set_initial_pose(body.pose)
+    builder.build(name=name)
+
+
+def _setup_scene(scene: sapien.Scene, args, ground: bool = True) -> bool:
+    render = getattr(args, "render", False)
+    scene.set_timestep(args.dt)
+    if ground:
+        scene.add_ground(altitude=0.0, render=render)
+    if render:
+        scene.set_ambient_light([0.25, 0.25, 0.25])
+        scene.add_directional_light([0, 1, -1], [0.8, 0.8, 0.8])
+    return render
+
+
+def _contact_margin() -> float:
+    return 2.0 * sapien.physx.get_shape_config().contact_offset
+
+
+def _spawn_pile(scene: sapien.Scene, args, mix: dict[str, float], base_z: float, render: bool):
+    rng = random.Random(args.stress_seed)
+    hulls = []
+    if "convex" in mix:
+        hulls = _hull_variants(args.stress_size, args.stress_hull_variants, args.stress_seed)
+    bodies, grid = _sample_bodies(
+        args.stress_count, mix, args.stress_size, args.stress_density, base_z, rng, hulls
+    )
+    bounds = _Bounds()
+    for idx, body in enumerate(bodies):
+        _build_body(scene, body, f"{body.kind}_{idx}", render)
+        bounds.add(body.lower, body.upper)
+    return bodies, grid, bounds
+
+
+def _pile_metadata(args, mix, bodies, grid, bounds, floor_pairs: int) -> dict:
+    count = len(bodies)
+    # Once settled, every body touches about six neighbours and the bottom layer touches the floor.
+    settled = int(count * _PILE_COORDINATION / 2.0) + min(count, grid * grid)
+    metadata = {
+        "config": f"{count}@{args.stress_density:g}",
+        "stress_count": count,
+        "stress_density": args.stress_density,
+        "stress_shape_mix": ",".join(f"{k}:{w:.3g}" for k, w in mix.items()),
+        "stress_size": args.stress_size,
+        "stress_seed": args.stress_seed,
+        "expected_broadphase_pairs": count_overlapping_pairs(bounds, _contact_margin()) + floor_pairs,
+        "expected_settled_pairs": settled,
+    }
+    for kind in SHAPE_KINDS:
+        n = sum(1 for b in bodies if b.kind == kind)
+        if n:
+            metadata[f"stress_{kind}_count"] = n
+    return metadata
+
+
+def build_scene_stress_convex_pile(scene: sapien.Scene, args) -> SceneBuildResult:
+    """Random convex hulls dropped as one pile, stressing convex-convex narrowphase."""
+    render = _setup_scene(scene, args)
+    mix = {"convex": 1.0}
+    bodies, grid, bounds = _spawn_pile(scene, args, mix, 2.0 * args.stress_size, render)
+    metadata = _pile_metadata(args, mix, bodies, grid, bounds, floor_pairs=len(bodies))
+    metadata["stress_hull_variants"] = args.stress_hull_variants
+    return SceneBuildResult(metadata=metadata)
+
+
+def build_scene_stress_primitive_mix(scene: sapien.Scene, args) -> SceneBuildResult:
+    """Dense mix of primitives, stressing broadphase pair counts."""
+    render = _setup_scene(scene, args)
+    mix = parse_shape_mix(args.stress_shape_mix)
+    bodies, grid, bounds = _spawn_pile(scene, args, mix, 2.0 * args.stress_size, render)
+    return SceneBuildResult(
+        metadata=_pile_metadata(args, mix, bodies, grid, bounds, floor_pairs=len(bodies))
+    )
+
+
+def _terrain_mesh(extent: float, resolution: int, amplitude: float, seed: int):
+    rng = np.random.default_rng(seed)
+    n = max(2, resolution) + 1
+    xs = np.linspace(-extent, extent, n)
+    gx, gy = np.meshgrid(xs, xs, indexing="ij")
+    heights = np.zeros_like(gx)
+    for _ in range(4):
+        kx, ky = rng.uniform(0.5, 3.0, size=2) * math.pi / extent
+        phase = rng.uniform(0.0, 2 * math.pi)
+        heights += np.sin(kx * gx + ky * gy + phase)
+    heights *= amplitude / 4.0
+    vertices = np.stack([gx, gy, heights], -1).reshape(-1, 3)
+
+    idx = np.arange(n * n).reshape(n, n)
+    a, b = idx[:-1, :-1].ravel(), idx[1:, :-1].ravel()
+    c, d = idx[:-1, 1:].ravel(), idx[1:, 1:].ravel()
+    faces = np.concatenate([np.stack([a, b, d], -1), np.stack([a, d, c], -1)])
+    return vertices, faces
+
+
+def build_scene_stress_terrain(scene: sapien.Scene, args) -> SceneBuildResult:
+    """Bodies falling onto a triangle-mesh heightfield, stressing mesh contacts."""
+    amplitude = args.stress_terrain_amplitude
+    render = _setup_scene(scene, args, ground=False)
+    # Catch bodies that roll off the terrain edge.
+    scene.add_ground(altitude=-amplitude - 0.5, render=False)
+
+    mix = parse_shape_mix(args.stress_shape_mix)
+    bodies, grid, bounds = _spawn_pile(
+        scene, args, mix, amplitude + 2.0 * args.stress_size, render
+    )
+    footprint = max(
+        (float(np.abs(np.concatenate([b.lower[:2], b.upper[:2]])).max()) for b in bodies),
+        default=0.0,
+    )
+    extent = 2.0 * footprint + 4.0 * args.stress_size
+
+    resolution = args.stress_terrain_resolution
+    vertices, faces = _terrain_mesh(extent, resolution, amplitude, args.stress_seed)
+    key = f"terrain-{extent}-{resolution}-{amplitude}-{args.stress_seed}"
+    key = hashlib.sha1(key.encode()).hexdigest()[:16]
+    path = _mesh_cache_dir() / f"terrain_{key}.obj"
+    _write_obj(path, vertices, faces)
+
+    builder = scene.create_actor_builder()
+    builder.set_physx_body_type("static")
+    builder.add_nonconvex_collision_from_file(str(path))
+    if render:
+        mat = sapien.render.RenderMaterial(base_color=_COLORS["terrain"], roughness=0.9)
+        builder.add_visual_from_file(str(path), material=mat)
+    builder.build(name="terrain")
+
+    bounds.add(vertices.min(0), vertices.max(0))
+    # The ground plane has infinite bounds and pairs with every body.
+    metadata = _pile_metadata(args, mix, bodies, grid, bounds, floor_pairs=len(bodies))
+    metadata["stress_terrain_resolution"] = resolution
+    metadata["stress_terrain_amplitude"] = amplitude
+    metadata["stress_terrain_triangles"] = int(len(faces))
+    return SceneBuildResult(metadata=metadata)
+
+
+# Revolute joints turn about the joint frame x axis; alternate between y and z for 3D motion.
+_AXIS_Y = [0.7071068, 0.0, 0.0, 0.7071068]
+_AXIS_Z = [0.7071068, 0.0, -0.7071068, 0.0]
+
+
+def _build_chain(scene: sapien.Scene, links: int, radius: float, half_length: float, render: bool):
+    builder = scene.create_articulation_builder()
+    material = sapien.render.RenderMaterial(base_color=_COLORS["link"], roughness=0.5) if render else None
+    parent = None
+    for i in range(links):
+        link = builder.create_link_builder(parent)
+        link.set_name(f"link_{i}")
+        link.add_capsule_collision(radius=radius, half_length=half_length)
+        if render:
+            link.add_capsule_visual(radius=radius, half_length=half_length, material=material)
+        if parent is not None:
+            q = _AXIS_Y if i % 2 else _AXIS_Z
+            link.set_joint_name(f"joint_{i}")
+            link.set_joint_properties(
+                "revolute",
+                limits=[[-0.5 * math.pi, 0.5 * math.pi]],
+                pose_in_parent=sapien.Pose([half_length + radius, 0, 0], q),
+                pose_in_child=sapien.Pose([-half_length - radius, 0, 0], q),
+                damping=0.01,
+            )
+        parent = link
+    return builder
+
+
+def _chain_metadata(args, chains: int, links: int, bounds: _Bounds, floor_pairs: int, settled: int):
+    return {
+        "config": f"{chains}x{links}@{args.stress_density:g}",
+        "stress_count": chains,
+        "stress_chain_links": links,
+        "stress_density": args.stress_density,
+        "stress_size": args.stress_size,
+        "stress_seed": args.stress_seed,
+        "expected_broadphase_pairs": count_overlapping_pairs(bounds, _contact_margin()) + floor_pairs,
+        "expected_settled_pairs": settled,
+    }
+
+
+def build_scene_stress_chains(scene: sapien.Scene, args) -> SceneBuildResult:
+    """Free N-link chains stacked crosswise, stressing long articulations with contacts."""
+    render = _setup_scene(scene, args)
+    chains, links = args.stress_count, max(1, args.stress_chain_links)
+    radius, half_length = 0.5 * args.stress_size, args.stress_size
+    link_length = 2.0 * (half_length + radius)
+    grid = max(1, math.ceil(math.sqrt(chains)))
+    spacing = 2.0 * radius / min(1.0, max(args.stress_density, 1e-3)) ** (1.0 / 3.0)
+    rng = random.Random(args.stress_seed)
+
+    bounds = _Bounds()
+    for c in range(chains):
+        row, layer = c % grid, c // grid
+        # Alternate layers between x and y so upper chains rest across lower ones.
+        along_y = layer % 2 == 1
+        offset = (row - 0.5 * (grid - 1)) * spacing + rng.uniform(-0.1, 0.1) * radius
+        start = -0.5 * links * link_length + 0.5 * link_length
+        z = radius + 0.01 + layer * 2.0 * spacing
+        q = [0.7071068, 0.0, 0.0, 0.7071068] if along_y else [1.0, 0.0, 0.0, 0.0]
+        root = [offset, start, z] if along_y else [start, offset, z]
+
+        builder = _build_chain(scene, links, radius, half_length, render=render)
+        builder.set_initial_pose(sapien.Pose(root, q))
+        articulation = builder.build(fix_root_link=False)
+        articulation.name = f"chain_{c}"
+
+        for i in range(links):
+            center = np.array(root, dtype=np.float64)
+            center[1 if along_y else 0] += i * link_length
+            extent = np.array([radius, radius, radius])
+            extent[1 if along_y else 0] += half_length
+            bounds.add(center - extent, center + extent, (c, i))
+
+    # Settled chains lie flat, each link resting on the ground or on a chain below.
+    settled = chains * links
+    return SceneBuildResult(
+        metadata=_chain_metadata(args, chains, links, bounds, chains * links, settled)
+    )
+
+
+def build_scene_stress_pendulum_forest(scene: sapien.Scene, args) -> SceneBuildResult:
+    """Grid of hanging chains with perturbed joints that swing into their neighbours."""
+    render = _setup_scene(scene, args)
+    chains, links = args.stress_count, max(1, args.stress_chain_links)
+    radius, half_length = 0.5 * args.stress_size, args.stress_size
+    link_length = 2.0 * (half_length + radius)
+    grid = max(1, math.ceil(math.sqrt(chains)))
+    spacing = 2.0 * radius / min(1.0, max(args.stress_density, 1e-3)) ** 0.5
+    top = links * link_length + 2.0 * args.stress_size
+    rng = random.Random(args.stress_seed)
+    # Rotate the chain's x axis to point down.
+    hanging = [0.7071068, 0.0, 0.7071068, 0.0]
+
+    bounds = _Bounds()
+    for c in range(chains):
+        x = (c % grid - 0.5 * (grid - 1)) * spacing
+        y = (c // grid - 0.5 * (grid - 1)) * spacing
+        builder = _build_chain(scene, links, radius, half_length, render=render)
+        builder.set_initial_pose(sapien.Pose([x, y, top], hanging))
+        articulation = builder.build(fix_root_link=True)
+        articulation.name = f"pendulum_{c}"
+        if articulation.dof:
+            articulation.set_qpos(
+                np.array([rng.uniform(-0.3, 0.3) for _ in range(articulation.dof)], dtype=np.float32)
+            )
+
+        for i in range(links):
+            z = top - i * link_length
+            bounds.add(
+                [x - radius, y - radius, z - half_length - radius],
+                [x + radius, y + radius, z + half_length + radius],
+                (c, i),
+            )
+
+    # At rest the pendulums hang straight, so the hanging layout is also the settled one.
+    hanging_pairs = count_overlapping_pairs(bounds, _contact_margin())
+    return SceneBuildResult(
+        metadata=_chain_metadata(args, chains, links, bounds, chains * links, hanging_pairs)
+    )
+
+
+def _build_runtime(name: str, scene_builder, args) -> TaskRuntime:
+    render = getattr(args, "render", False)
+    systems = [sapien.physx.PhysxGpuSystem(device=args.device)]
+    if render:
+        systems.append(sapien.render.RenderSystem())
+    scene = sapien.Scene(systems)
+    result = scene_builder(scene, args)
+    return TaskRuntime(
+        name=name,
+        scene=scene,
+        physx_system=scene.physx_system,
+        before_step=result.before_step,
+        metadata=result.metadata,
+    )
+
+
+def build_stress_convex_pile(args) -> TaskRuntime:
+    return _build_runtime("stress_convex_pile", build_scene_stress_convex_pile, args)
+
+
+def build_stress_primitive_mix(args) -> TaskRuntime:
+    return _build_runtime("stress_primitive_mix", build_scene_stress_primitive_mix, args)
+
+
+def build_stress_terrain(args) -> TaskRuntime:
+    return _build_runtime("stress_terrain", build_scene_stress_terrain, args)
+
+
+def build_stress_chains(args) -> TaskRuntime:
+    return _build_runtime("stress_chains", build_scene_stress_chains, args)
+
+
+def build_stress_pendulum_forest(args) -> TaskRuntime:
+    return _build_runtime("stress_pendulum_forest", build_scene_stress_pendulum_forest, args)
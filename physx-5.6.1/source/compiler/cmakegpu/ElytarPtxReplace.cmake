@@ -8,6 +8,8 @@
 ## Pipeline per .cu file:
 ##   1. Pre-generated <stem>.ptx  (by scripts/generate_ptx.sh)
 ##   2. nvcc -fatbin .ptx -> <stem>.fatbin  (build time, custom command)
+##      ptxas runs once per ELYTAR_PTX_CUBIN_ARCHS entry; the fatbin holds those
+##      cubins plus the PTX as JIT fallback for GPUs outside the list
 ##   3. bin2c .fatbin -> <stem>_fatbin.h   (build time, custom command)
 ##   4. Auto-generated <stem>_host_stub.cpp  (configure time, file(GENERATE))
 ##   5. Auto-generated <stem>_ptx_register.cpp  (configure time, file(GENERATE))
@@ -52,6 +54,9 @@
 ##       TARGET_INCLUDE_DIRECTORIES(MyTarget PRIVATE
 ##           ${CMAKE_CURRENT_BINARY_DIR}/elytar_ptx)
 ##   ENDIF()
+##
+## After all sub-libraries, ELYTAR_WRITE_PTX_MANIFEST() writes
+## elytar_ptx/manifest.json listing every replaced stem and its cubin archs.
 
 cmake_minimum_required(VERSION 3.16)
 include_guard(GLOBAL)
@@ -75,6 +80,40 @@ if(NOT DEFINED ELYTAR_PTX_SM_ARCH)
     message(STATUS "[Elytar] PTX arch: ${PX_PTX_ARCH} -> fatbin arch: ${ELYTAR_PTX_SM_ARCH}")
 endif()
 
+# ---- Cubin archs compiled ahead of time -------------------------------------
+# Each entry is compiled by ptxas at build time (no GPU needed), so processes on
+# those GPUs load SASS directly instead of JIT-compiling the PTX at startup.
+# Empty means only the arch matching PX_PTX_ARCH.
+if(NOT DEFINED ELYTAR_PTX_CUBIN_ARCHS)
+    set(ELYTAR_PTX_CUBIN_ARCHS "" CACHE STRING
+        "Semicolon-separated sm_XX archs to precompile replaced PTX for (e.g. sm_86;sm_90).")
+endif()
+if(ELYTAR_PTX_CUBIN_ARCHS)
+    set(_eptx_cubin_archs ${ELYTAR_PTX_CUBIN_ARCHS})
+else()
+    set(_eptx_cubin_archs ${ELYTAR_PTX_SM_ARCH})
+endif()
+list(REMOVE_DUPLICATES _eptx_cubin_archs)
+
+string(REGEX REPLACE "^compute_([0-9]+).*$" "\\1" _eptx_ptx_arch_num "${PX_PTX_ARCH}")
+set(ELYTAR_PTX_GENCODE_FLAGS "")
+foreach(_eptx_arch IN LISTS _eptx_cubin_archs)
+    if(NOT _eptx_arch MATCHES "^sm_([0-9]+)[a-z]?$")
+        message(FATAL_ERROR
+            "[Elytar] Invalid entry '${_eptx_arch}' in ELYTAR_PTX_CUBIN_ARCHS (expected sm_XX).")
+    endif()
+    if(CMAKE_MATCH_1 LESS _eptx_ptx_arch_num)
+        message(FATAL_ERROR
+            "[Elytar] ptxas cannot compile ${PX_PTX_ARCH} PTX for the older ${_eptx_arch}.\n"
+            "         Lower PX_PTX_ARCH or drop ${_eptx_arch} from ELYTAR_PTX_CUBIN_ARCHS.")
+    endif()
+    list(APPEND ELYTAR_PTX_GENCODE_FLAGS -gencode "arch=${PX_PTX_ARCH},code=${_eptx_arch}")
+endforeach()
+# Keep the PTX itself in the fatbin as JIT fallback for GPUs without a cubin
+list(APPEND ELYTAR_PTX_GENCODE_FLAGS -gencode "arch=${PX_PTX_ARCH},code=${PX_PTX_ARCH}")
+string(REPLACE ";" ", " _eptx_cubin_archs_msg "${_eptx_cubin_archs}")
+message(STATUS "[Elytar] PTX cubin archs: ${_eptx_cubin_archs_msg} (+ ${PX_PTX_ARCH} PTX fallback)")
+
 # ---------------------------------------------------------------------------
 # ELYTAR_REPLACE_CU_WITH_PTX(
 #     KERNELS_VAR <list-variable-name>
@@ -215,9 +254,9 @@ macro(ELYTAR_REPLACE_CU_WITH_PTX)
         COMMAND "${CMAKE_CUDA_COMPILER}" -fatbin
                 "${_eptx_ptx_file}"
                 -o "${_eptx_fatbin_file}"
-                -arch=${ELYTAR_PTX_SM_ARCH}
+                ${ELYTAR_PTX_GENCODE_FLAGS}
         DEPENDS "${_eptx_ptx_file}"
-        COMMENT "[Elytar] ${_eptx_stem}.ptx -> fatbin (${ELYTAR_PTX_SM_ARCH})"
+        COMMENT "[Elytar] ${_eptx_stem}.ptx -> fatbin (${_eptx_cubin_archs_msg} + PTX)"
         VERBATIM
     )
 
@@ -243,6 +282,43 @@ macro(ELYTAR_REPLACE_CU_WITH_PTX)
     # Append generated sources (caller must have initialized ELYTAR_PTX_EXTRA_SOURCES)
     list(APPEND ELYTAR_PTX_EXTRA_SOURCES "${_eptx_stub_file}" "${_eptx_reg_file}")
 
+    # ---- Record the stem for the manifest ----------------------------------
+    set_property(GLOBAL APPEND PROPERTY ELYTAR_PTX_MANIFEST_ENTRIES
+        "    \"${_eptx_stem}\": {\"ptx\": \"${_eptx_ptx_file}\", \"fatbin\": \"${_eptx_fatbin_file}\", \"kernels\": ${_eptx_nkernels}}")
+
     message(STATUS "[Elytar]   ${_eptx_stem}.cu -> PTX (${_eptx_nkernels} kernels)")
 
 endmacro()
+
+# ---------------------------------------------------------------------------
+# ELYTAR_WRITE_PTX_MANIFEST()
+#
+# Writes elytar_ptx/manifest.json: the PTX arch and suffix, the cubin archs
+# embedded next to the PTX, and every stem replaced by ELYTAR_REPLACE_CU_WITH_PTX.
+# Stems not listed are compiled from .cu as usual.
+# ---------------------------------------------------------------------------
+function(ELYTAR_WRITE_PTX_MANIFEST)
+    get_property(_eptx_entries GLOBAL PROPERTY ELYTAR_PTX_MANIFEST_ENTRIES)
+    list(SORT _eptx_entries)
+    string(REPLACE ";" ",\n" _eptx_stems_json "${_eptx_entries}")
+    set(_eptx_archs_json "")
+    foreach(_eptx_arch IN LISTS _eptx_cubin_archs)
+        list(APPEND _eptx_archs_json "\"${_eptx_arch}\"")
+    endforeach()
+    string(REPLACE ";" ", " _eptx_archs_json "${_eptx_archs_json}")
+
+    string(CONCAT _eptx_manifest
+        "{\n"
+        "  \"ptx_arch\": \"${PX_PTX_ARCH}\",\n"
+        "  \"ptx_suffix\": \".ptx\",\n"
+        "  \"cubin_archs\": [${_eptx_archs_json}],\n"
+        "  \"stems\": {\n"
+        "${_eptx_stems_json}\n"
+        "  }\n"
+        "}\n"
+    )
+    file(MAKE_DIRECTORY "${CMAKE_CURRENT_BINARY_DIR}/elytar_ptx")
+    file(WRITE "${CMAKE_CURRENT_BINARY_DIR}/elytar_ptx/manifest.json" "${_eptx_manifest}")
+    list(LENGTH _eptx_entries _eptx_count)
+    message(STATUS "[Elytar] PTX manifest: ${_eptx_count} stem(s) -> ${CMAKE_CURRENT_BINARY_DIR}/elytar_ptx/manifest.json")
+endfunction()
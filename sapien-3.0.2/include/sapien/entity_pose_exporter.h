@@ -0,0 +1,59 @@
+/*
+ * Copyright 2025 Hillbot Inc.
+ * Copyright 2020-2024 UCSD SU Lab
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at:
+ * 
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#pragma once
+#include "math/pose.h"
+#include <Eigen/Eigen>
+#include <memory>
+#include <vector>
+
+namespace sapien {
+class Entity;
+class Scene;
+
+/** Copies entity poses of one or more scenes into a flat (N, 7) float array with rows
+ *  [px, py, pz, qw, qx, qy, qz]. Rows are ordered by scene and then by per-scene entity id.
+ *  The row assignment is fixed until update is called, so it can be used as an index map. */
+class EntityPoseExporter {
+public:
+  /** Export all entities of scenes, or only the given entities, which must belong to one of
+   *  the scenes. */
+  EntityPoseExporter(std::vector<std::shared_ptr<Scene>> const &scenes,
+                     std::vector<std::shared_ptr<Entity>> const &entities = {});
+
+  /** Recollect entities, e.g. after entities are added to or removed from the scenes. */
+  void update();
+
+  size_t getCount() const { return mEntities.size(); }
+  std::vector<std::shared_ptr<Entity>> const &getEntities() const { return mEntities; }
+
+  /** (scene index, per-scene entity id) of each row */
+  Eigen::Matrix<int64_t, Eigen::Dynamic, 2, Eigen::RowMajor> const &getIndexMap() const {
+    return mIndexMap;
+  }
+
+  /** write getCount() x 7 floats to out */
+  void exportPoses(float *out) const;
+
+private:
+  std::vector<std::shared_ptr<Scene>> mScenes;
+  std::vector<std::shared_ptr<Entity>> mSubset;
+
+  std::vector<std::shared_ptr<Entity>> mEntities;
+  Eigen::Matrix<int64_t, Eigen::Dynamic, 2, Eigen::RowMajor> mIndexMap;
+};
+
+} // namespace sapien
@@ -0,0 +1,94 @@
+/*
+ * Copyright 2025 Hillbot Inc.
+ * Copyright 2020-2024 UCSD SU Lab
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at:
+ * 
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#pragma once
+#include "sapien/math/pose.h"
+#include <Eigen/Eigen>
+#include <PxPhysicsAPI.h>
+#include <array>
+#include <memory>
+#include <string>
+#include <vector>
+
+namespace sapien {
+class Entity;
+namespace physx {
+class PhysxRigidBaseComponent;
+class PhysxArticulationLinkComponent;
+class PhysxMaterial;
+
+/** Plain description of one collision shape, mirrors the Python CollisionShapeRecord. Mesh
+ *  filenames must already point to a format the mesh loaders understand. */
+struct PhysxCollisionShapeSpec {
+  std::string type; // plane, box, capsule, cylinder, sphere, convex_mesh, nonconvex_mesh,
+                    // multiple_convex_meshes
+  std::string filename;
+  Vec3 scale{1.f, 1.f, 1.f};
+  float radius{1.f};
+  float length{1.f};
+  Pose pose{};
+
+  // static friction, dynamic friction, restitution
+  std::array<float, 3> material{0.3f, 0.3f, 0.1f};
+  // material of the builder, used as is when set; null for specs unpickled from coefficients
+  std::shared_ptr<PhysxMaterial> materialHandle;
+  float density{1000.f};
+  float patchRadius{0.f};
+  float minPatchRadius{0.f};
+};
+
+struct PhysxJointSpec {
+  std::string name;
+  ::physx::PxArticulationJointType::Enum type{::physx::PxArticulationJointType::eUNDEFINED};
+  Eigen::Matrix<float, Eigen::Dynamic, 2, Eigen::RowMajor> limits;
+  Pose poseInParent{};
+  Pose poseInChild{};
+  float damping{0.f};
+};
+
+/** Everything needed to create the physx component of an actor or an articulation link
+ *  without further calls from Python. A spec holds no PhysX objects other than shared
+ *  materials, so it can be built once and instantiated in any number of scenes. */
+struct PhysxBodySpec {
+  std::string name;
+  std::string bodyType{"dynamic"}; // dynamic, kinematic, static, link
+  std::array<uint32_t, 4> collisionGroups{1, 1, 0, 0};
+  std::vector<PhysxCollisionShapeSpec> shapes;
+
+  bool autoInertial{true};
+  float mass{0.f};
+  Pose cmassLocalPose{};
+  Vec3 inertia{0.f, 0.f, 0.f};
+
+  // links only, index of the parent link in the articulation spec (-1 for root)
+  int parent{-1};
+  PhysxJointSpec joint;
+};
+
+/** Create the physx component described by spec. Shapes that fail to load or cook are
+ *  skipped, matching the Python builder. Shapes with a material handle use it; shapes
+ *  without one share a new material per distinct coefficient triple. */
+std::shared_ptr<PhysxRigidBaseComponent>
+BuildPhysxComponent(PhysxBodySpec const &spec,
+                    std::shared_ptr<PhysxArticulationLinkComponent> linkParent = nullptr);
+
+/** Create one entity per link (in spec order) holding its articulation link component. The
+ *  root entity is placed at rootPose. */
+std::vector<std::shared_ptr<Entity>>
+BuildArticulationEntities(std::vector<PhysxBodySpec> const &links, Pose const &rootPose);
+
+} // namespace physx
+} // namespace sapien
@@ -19,13 +19,16 @@
 #include "articulation.h"
 #include "articulation_link_component.h"
 #include "base_component.h"
+#include "body_spec.h"
 #include "collision_shape.h"
 #include "joint_component.h"
 #include "material.h"
 #include "mesh_manager.h"
 #include "physx_default.h"
+#include "physx_dispatcher.h"
 #include "physx_engine.h"
 #include "physx_stage_profiler.h"
 #include "physx_system.h"
+#include "physx_system_group.h"
 #include "rigid_component.h"
 #include "scene_query.h"
@@ -28,6 +28,19 @@ namespace sapien {
 namespace physx {
 class PhysxMaterial;
 
+/** CPU broad phase algorithm, GPU systems always use the GPU broad phase */
+enum class BroadPhaseType { eSAP, eMBP, eABP, ePABP };
+
+/** When pruning structures used by scene queries are updated. eCOMMIT builds and commits them
+ *  in fetchResults (PhysX default), eBUILD defers the refit to the first query after a step,
+ *  eDISABLED skips all work in the step and rebuilds on demand before the next query. */
+enum class SceneQueryUpdateMode { eCOMMIT, eBUILD, eDISABLED };
+
+/** eAABB_TREE: dynamic AABB trees (PhysX default), eBVH: dynamic AABB trees with a PxBVH
+ *  secondary pruner for new objects, eNONE: flat list without a tree for dynamic objects (static
+ *  objects always use an AABB tree) */
+enum class SceneQueryPruner { eAABB_TREE, eBVH, eNONE };
+
 struct PhysxSceneConfig {
   Vec3 gravity = {0, 0, -9.81};           // default gravity
   float bounceThreshold = 2.f;            // relative velocity below this will not bounce
@@ -38,6 +51,13 @@ struct PhysxSceneConfig {
   bool enableFrictionEveryIteration =
       true;                // better friction calculation, recommended for robotics
   uint32_t cpuWorkers = 0; // CPU workers, 0 for using main thread
+  BroadPhaseType broadPhaseType = BroadPhaseType::ePABP; // CPU broad phase
+  // MBP regions tile these bounds; when empty they are derived from actor bounds on step
+  Vec3 mbpWorldLower = {0, 0, 0};
+  Vec3 mbpWorldUpper = {0, 0, 0};
+  uint32_t mbpSubdivisions = 4; // regions per horizontal axis, at most 16
+  SceneQueryUpdateMode sceneQueryUpdateMode = SceneQueryUpdateMode::eCOMMIT;
+  SceneQueryPruner sceneQueryPruner = SceneQueryPruner::eAABB_TREE;
 };
 
 struct PhysxBodyConfig {
@@ -71,7 +91,10 @@ public:
 
   static void setSceneConfig(Vec3 gravity, float bounceThreshold, bool enablePCM, bool enableTGS,
                              bool enableCCD, bool enableEnhancedDeterminism,
-                             bool enableFrictionEveryIteration, uint32_t cpuWorkers);
+                             bool enableFrictionEveryIteration, uint32_t cpuWorkers,
+                             BroadPhaseType broadPhaseType, uint32_t mbpSubdivisions,
+                             SceneQueryUpdateMode sceneQueryUpdateMode,
+                             SceneQueryPruner sceneQueryPruner);
   static void setSceneConfig(PhysxSceneConfig const &);
   static PhysxSceneConfig const &getSceneConfig();
 
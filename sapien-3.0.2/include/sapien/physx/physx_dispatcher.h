@@ -0,0 +1,97 @@
+/*
+ * Copyright 2025 Hillbot Inc.
+ * Copyright 2020-2024 UCSD SU Lab
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at:
+ * 
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#pragma once
+#include <PxPhysicsAPI.h>
+#include <condition_variable>
+#include <cstdint>
+#include <memory>
+#include <mutex>
+#include <queue>
+#include <thread>
+#include <vector>
+
+namespace sapien {
+namespace physx {
+
+/** Process-wide pool of PhysX worker threads that CPU systems can share instead of each
+ *  creating its own dispatcher. Queued tasks run highest system priority first, then in
+ *  submission order. */
+class PhysxSharedDispatcher {
+public:
+  /** Size the pool before its first use. Calling it again with the same configuration is a
+   *  no-op; a different configuration throws once the pool exists.
+   *  @param workerCount number of worker threads, 0 runs tasks on the submitting thread
+   *  @param affinity optional CPU ids per worker, worker i is pinned to affinity[i] */
+  static void Configure(uint32_t workerCount,
+                        std::vector<std::vector<uint32_t>> const &affinity = {});
+
+  /** the pool, created with hardware concurrency workers if Configure was not called */
+  static std::shared_ptr<PhysxSharedDispatcher> Get();
+  static std::shared_ptr<PhysxSharedDispatcher> GetIfExists();
+
+  PhysxSharedDispatcher(uint32_t workerCount, std::vector<std::vector<uint32_t>> affinity);
+  PhysxSharedDispatcher(PhysxSharedDispatcher const &) = delete;
+  PhysxSharedDispatcher &operator=(PhysxSharedDispatcher const &) = delete;
+
+  uint32_t getWorkerCount() const { return mWorkers.size(); }
+  std::vector<std::vector<uint32_t>> const &getAffinity() const { return mAffinity; }
+
+  void submit(::physx::PxBaseTask &task, int priority);
+
+  ~PhysxSharedDispatcher();
+
+private:
+  struct Entry {
+    int priority;
+    uint64_t order;
+    ::physx::PxBaseTask *task;
+    bool operator<(Entry const &other) const {
+      return priority != other.priority ? priority < other.priority : order > other.order;
+    }
+  };
+
+  void workerLoop();
+
+  std::vector<std::thread> mWorkers;
+  std::vector<std::vector<uint32_t>> mAffinity;
+
+  std::mutex mLock;
+  std::condition_variable mCv;
+  std::priority_queue<Entry> mQueue;
+  uint64_t mOrder{0};
+  bool mStop{false};
+};
+
+/** CPU dispatcher handed to one PhysX scene, forwarding its tasks to the shared pool */
+class PhysxSharedDispatcherClient : public ::physx::PxCpuDispatcher {
+public:
+  explicit PhysxSharedDispatcherClient(std::shared_ptr<PhysxSharedDispatcher> pool)
+      : mPool(pool) {}
+
+  void submitTask(::physx::PxBaseTask &task) override { mPool->submit(task, mPriority); }
+  uint32_t getWorkerCount() const override { return mPool->getWorkerCount(); }
+
+  void setPriority(int priority) { mPriority = priority; }
+  int getPriority() const { return mPriority; }
+
+private:
+  std::shared_ptr<PhysxSharedDispatcher> mPool;
+  int mPriority{0};
+};
+
+} // namespace physx
+} // namespace sapien
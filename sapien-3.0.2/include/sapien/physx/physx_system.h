@@ -20,12 +20,14 @@
 #include "../device.h"
 #include "../system.h"
 #include "./physx_default.h"
+#include "./physx_dispatcher.h"
 #include "./physx_engine.h"
 #include "mesh_manager.h"
 #include "sapien/scene.h"
 #include "scene_query.h"
 #include "simulation_callback.hpp"
 #include <PxPhysicsAPI.h>
+#include <map>
 #include <memory>
 #include <set>
 
@@ -36,7 +38,9 @@
 namespace sapien {
 namespace physx {
 class PhysxArticulation;
+class PhysxArticulationJoint;
 class PhysxMaterial;
+class PhysxRigidBaseComponent;
 class PhysxRigidBodyComponent;
 class PhysxRigidDynamicComponent;
 class PhysxRigidStaticComponent;
@@ -50,6 +54,14 @@ public:
   PhysxSceneConfig const &getSceneConfig() const { return mSceneConfig; };
 
   virtual ::physx::PxScene *getPxScene() const { return mPxScene; }
+
+  /** Add or remove an actor of a registered component. While an actor batch is open the
+   *  actors are queued and inserted with a single PxScene::addActors/removeActors call. */
+  void addActor(::physx::PxActor &actor);
+  void removeActor(::physx::PxActor &actor);
+  void beginActorBatch();
+  void endActorBatch();
+
   virtual void registerComponent(std::shared_ptr<PhysxRigidDynamicComponent> component) = 0;
   virtual void registerComponent(std::shared_ptr<PhysxRigidStaticComponent> component) = 0;
   virtual void registerComponent(std::shared_ptr<PhysxArticulationLinkComponent> component) = 0;
@@ -95,11 +107,22 @@ protected:
   ::physx::PxDefaultCpuDispatcher *mPxCPUDispatcher;
 
   int mSceneCollisionId{0};
+
+  int mActorBatchDepth{0};
+  std::vector<::physx::PxActor *> mPendingAddActors;
+  std::vector<::physx::PxActor *> mPendingRemoveActors;
 };
 
 class PhysxSystemCpu : public PhysxSystem {
 public:
-  PhysxSystemCpu();
+  /** @param sharedDispatcher run tasks on PhysxSharedDispatcher instead of creating a
+   * dispatcher with config.cpuWorkers threads for this system */
+  explicit PhysxSystemCpu(bool sharedDispatcher = false);
+
+  bool isUsingSharedDispatcher() const { return mSharedDispatcher != nullptr; }
+  /** tasks of systems with higher priority are taken first from the shared dispatcher */
+  void setDispatcherPriority(int priority);
+  int getDispatcherPriority() const;
 
   void registerComponent(std::shared_ptr<PhysxRigidDynamicComponent> component) override;
   void registerComponent(std::shared_ptr<PhysxRigidStaticComponent> component) override;
@@ -114,20 +137,178 @@ public:
   std::vector<std::shared_ptr<PhysxArticulationLinkComponent>>
   getArticulationLinkComponents() const override;
 
+  /** Rebuild the scene query structures now. Queries do this automatically after a step or
+   *  an added or removed body when the scene query update mode is eDISABLED. */
+  void updateSceneQueries();
+
   std::unique_ptr<PhysxHitInfo> raycast(Vec3 const &origin, Vec3 const &direction, float distance);
 
+  /** Casts count rays in parallel and reports the closest hit of each ray.
+   *  @param origins, directions row-major [count, 3] buffers
+   *  @param outDistance [count] hit distances, inf for misses
+   *  @param outPosition, outNormal row-major [count, 3] hit positions and normals
+   *  @param outIndex [count] index into the returned components, -1 for misses
+   *  @return unique components hit by the rays */
+  std::vector<std::shared_ptr<PhysxRigidBaseComponent>>
+  raycastBatch(float const *origins, float const *directions, float distance, uint32_t count,
+               float *outDistance, float *outPosition, float *outNormal, int *outIndex);
+
+  /** Sweeps geometry count times in parallel, outputs are the same as raycastBatch.
+   *  @param positions row-major [count, 3] start positions of the geometry
+   *  @param rotations row-major [count, 4] quaternions (wxyz), nullptr for identity */
+  std::vector<std::shared_ptr<PhysxRigidBaseComponent>>
+  sweepBatch(::physx::PxGeometry const &geometry, float const *positions, float const *rotations,
+             float const *directions, float distance, uint32_t count, float *outDistance,
+             float *outPosition, float *outNormal, int *outIndex);
+
+  /** Tests geometry placed at count poses for overlaps in parallel.
+   *  @param outIndex [count] index of any overlapping component, -1 if there is no overlap */
+  std::vector<std::shared_ptr<PhysxRigidBaseComponent>>
+  overlapBatch(::physx::PxGeometry const &geometry, float const *positions, float const *rotations,
+               uint32_t count, int *outIndex);
+
   void step() override;
   bool isGpu() const override { return false; }
 
+  /** Run substeps simulation steps back to back and sync poses to entities once at the end.
+   *  @param reapply apply the rigid dynamic force and torque, articulation qf and drive target
+   *         buffers applied since the last step again before every later substep
+   *  @param accumulateContacts keep the contact points of every substep, so getContacts
+   *         impulses sum over all substeps */
+  void step(uint32_t substeps, bool reapply, bool accumulateContacts);
+
+  /** Split step: stepStart hands the step to the PhysX workers and returns, stepFinish waits
+   *  for it and syncs poses to entities. Bodies must not be read or written in between.
+   *  With 0 CPU workers the simulation runs inside stepStart. */
+  void stepStart();
+  void stepFinish();
+  bool isStepping() const { return mStepping; }
+
   std::string packState() const;
   void unpackState(std::string const &data);
 
   std::vector<Contact *> getContacts() const { return mSimulationCallback.getContacts(); }
 
+  /** Choose which colliding pairs report contacts to getContacts. Existing pairs are filtered
+   * again on the next step; switching to eOFF drops stored contacts. */
+  void setContactReportMode(ContactReportMode mode);
+  ContactReportMode getContactReportMode() const { return mContactReportMode; }
+
+  /** MBP regions currently registered in the broad phase, empty for other broad phases.
+   *  Regions tile the configured world bounds, or the bounds of all actors when those are
+   *  empty, and are rebuilt on step when an object leaves every region. */
+  std::vector<std::array<Vec3, 2>> getBroadPhaseRegions() const;
+
+  /** Allocate host buffers with the same layout as the GPU system buffers. This function must
+   * be called each time when actors are added or removed from the scene. */
+  void cpuInit();
+  bool isCpuInitialized() const { return mCpuInitialized; }
+  void checkCpuInitialized() const;
+
+  /** rigid dynamic bodies in buffer order, valid after cpuInit */
+  std::vector<std::shared_ptr<PhysxRigidDynamicComponent>> const &
+  cpuGetRigidDynamicComponents() const {
+    return mCpuRigidDynamicComponents;
+  }
+  /** articulations in buffer order, valid after cpuInit */
+  std::vector<std::shared_ptr<PhysxArticulation>> const &cpuGetArticulations() const {
+    return mCpuArticulations;
+  }
+
+  /** handle to the pose-vel buffer for rigid dynamic bodies and links */
+  CpuArrayHandle cpuGetRigidBodyHandle();
+  CpuArrayHandle cpuGetRigidDynamicHandle();
+  CpuArrayHandle cpuGetArticulationLinkHandle();
+
+  CpuArrayHandle cpuGetRigidBodyForceHandle();
+  CpuArrayHandle cpuGetRigidDynamicForceHandle();
+  CpuArrayHandle cpuGetRigidBodyTorqueHandle();
+  CpuArrayHandle cpuGetRigidDynamicTorqueHandle();
+
+  void cpuFetchRigidDynamicData();
+  void cpuFetchArticulationLinkPose();
+  void cpuFetchArticulationLinkVel();
+
+  void cpuApplyRigidDynamicData();
+  /** @param indices rows of the rigid dynamic buffer to apply */
+  void cpuApplyRigidDynamicData(int const *indices, int count);
+  void cpuApplyRigidDynamicForce();
+  void cpuApplyRigidDynamicTorque();
+
+  /** handles to [articulation count, max dof] buffers */
+  CpuArrayHandle cpuGetArticulationQposHandle();
+  CpuArrayHandle cpuGetArticulationQvelHandle();
+  CpuArrayHandle cpuGetArticulationQfHandle();
+  CpuArrayHandle cpuGetArticulationQaccHandle();
+  CpuArrayHandle cpuGetArticulationQTargetPosHandle();
+  CpuArrayHandle cpuGetArticulationQTargetVelHandle();
+
+  void cpuFetchArticulationQpos();
+  void cpuFetchArticulationQvel();
+  void cpuFetchArticulationQacc();
+  void cpuFetchArticulationQTargetPos();
+  void cpuFetchArticulationQTargetVel();
+
+  void cpuApplyArticulationQpos();
+  void cpuApplyArticulationQvel();
+  void cpuApplyArticulationQf();
+  void cpuApplyArticulationQTargetPos();
+  void cpuApplyArticulationQTargetVel();
+
+  /** @param indices rows of the articulation buffers to apply */
+  void cpuApplyArticulationQpos(int const *indices, int count);
+  void cpuApplyArticulationQvel(int const *indices, int count);
+  void cpuApplyArticulationQf(int const *indices, int count);
+  void cpuApplyArticulationQTargetPos(int const *indices, int count);
+  void cpuApplyArticulationQTargetVel(int const *indices, int count);
+
   ~PhysxSystemCpu();
 
 private:
   DefaultEventCallback mSimulationCallback;
+  ContactReportFilterCallback mFilterCallback;
+  std::unique_ptr<PhysxSharedDispatcherClient> mSharedDispatcher;
+  ContactReportMode mContactReportMode{ContactReportMode::eFULL};
+  bool mStepping{false};
+  bool mSceneQueryDirty{true};
+  void ensureSceneQueriesUpdated();
+  BroadPhaseBoundsCallback mBroadPhaseCallback;
+  ::physx::PxBounds3 mBroadPhaseBounds{::physx::PxBounds3::empty()};
+  std::vector<uint32_t> mBroadPhaseRegionHandles;
+
+  void updateBroadPhaseRegions();
+  void syncPosesToEntities();
+
+  bool mCpuInitialized{false};
+  int mCpuArticulationMaxLinkCount{0};
+  std::vector<std::shared_ptr<PhysxRigidDynamicComponent>> mCpuRigidDynamicComponents;
+  std::vector<std::shared_ptr<PhysxArticulation>> mCpuArticulations;
+
+  std::vector<float> mCpuRigidBodyBuffer;       // [rigid body count, 13]
+  std::vector<float> mCpuRigidBodyForceBuffer;  // [rigid body count, 4]
+  std::vector<float> mCpuRigidBodyTorqueBuffer; // [rigid body count, 4]
+
+  // qpos, qvel, qf, qacc, target qpos, target qvel, each [articulation count, max dof]
+  int mCpuArticulationMaxDof{0};
+  std::vector<float> mCpuArticulationBuffer;
+  // active joints of each articulation in dof order
+  std::vector<std::vector<std::shared_ptr<PhysxArticulationJoint>>> mCpuArticulationActiveJoints;
+
+  CpuArrayHandle cpuGetArticulationPlaneHandle(int plane);
+  float *cpuGetArticulationRow(int plane, int index);
+  std::vector<int> cpuCheckArticulationIndices(int const *indices, int count) const;
+  std::vector<int> cpuAllArticulationIndices() const;
+
+  void cpuFetchArticulationQTarget(int plane, bool velocity);
+  void cpuApplyArticulationQTarget(int plane, bool velocity, std::vector<int> const &indices);
+  void cpuApplyArticulationState(int plane, std::vector<int> const &indices);
+
+  // batched applies since the last step, replayed before the substeps of step(n, true)
+  bool mCpuReapplyForce{false};
+  bool mCpuReapplyTorque{false};
+  std::map<int, std::vector<int>> mCpuReapplyArticulation; // buffer plane -> rows
+  void cpuReapplyBuffers();
+  void cpuClearReapplyBuffers();
 
   std::set<std::shared_ptr<PhysxRigidDynamicComponent>, comp_cmp> mRigidDynamicComponents;
   std::set<std::shared_ptr<PhysxRigidStaticComponent>, comp_cmp> mRigidStaticComponents;
@@ -165,6 +346,15 @@ public:
 
   void step() override;
 
+  /** Run substeps simulation steps back to back without returning to the caller.
+   *  @param reapply apply the rigid dynamic force and torque, articulation qf and drive target
+   *         buffers applied since the last step again before every later substep
+   *  @param pairQueries, bodyQueries contact impulse queries whose buffers are filled with
+   *         impulses summed over all substeps */
+  void step(uint32_t substeps, bool reapply,
+            std::vector<PhysxGpuContactPairImpulseQuery *> const &pairQueries,
+            std::vector<PhysxGpuContactBodyImpulseQuery *> const &bodyQueries);
+
   void stepStart();
   void stepFinish();
 
@@ -337,6 +527,23 @@ private:
   bool mContactUpToDate{false};
   int mContactCount{0}; // current contact count, valid only when contactUpdaToDate is true
   void copyContactData();
+  void gpuAccumulateContactPairImpulses(PhysxGpuContactPairImpulseQuery const &query);
+  void gpuAccumulateContactBodyImpulses(PhysxGpuContactBodyImpulseQuery const &query);
+
+  // batched applies since the last step, replayed before the substeps of step(n, true)
+  struct GpuReapplyIndices {
+    CudaArray buffer; // copy of the applied articulation indices
+    bool all{false};  // applied with the index buffer of all articulations
+    bool active{false};
+  };
+  bool mGpuReapplyForce{false};
+  bool mGpuReapplyTorque{false};
+  GpuReapplyIndices mGpuReapplyQf;
+  GpuReapplyIndices mGpuReapplyQTargetPos;
+  GpuReapplyIndices mGpuReapplyQTargetVel;
+  void gpuRecordReapply(GpuReapplyIndices &record, CudaArrayHandle const &indices);
+  void gpuReapplyBuffers();
+  void gpuClearReapplyBuffers();
 };
 #else
 class PhysxSystemGpu : public PhysxSystem {
@@ -0,0 +1,48 @@
+/*
+ * Copyright 2025 Hillbot Inc.
+ * Copyright 2020-2024 UCSD SU Lab
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at:
+ * 
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#pragma once
+#include "physx_system.h"
+#include "sapien/utils/thread_pool.h"
+#include <memory>
+#include <vector>
+
+namespace sapien {
+namespace physx {
+
+/** A collection of independent CPU systems stepped together on a thread pool.
+ *  Each system is stepped by exactly one thread, so systems must not share PhysX scenes. */
+class PhysxSystemCpuGroup {
+public:
+  /** @param threadCount number of threads stepping systems, 0 means hardware concurrency */
+  explicit PhysxSystemCpuGroup(uint32_t threadCount = 0);
+
+  void addSystem(std::shared_ptr<PhysxSystemCpu> system);
+  void removeSystem(std::shared_ptr<PhysxSystemCpu> system);
+  std::vector<std::shared_ptr<PhysxSystemCpu>> const &getSystems() const { return mSystems; }
+
+  uint32_t getThreadCount() const { return mThreadPool.getThreadCount(); }
+
+  /** step all systems, blocks until every system finishes */
+  void step();
+
+private:
+  std::vector<std::shared_ptr<PhysxSystemCpu>> mSystems;
+  ThreadPool mThreadPool;
+};
+
+} // namespace physx
+} // namespace sapien
@@ -52,9 +52,14 @@ public:
   /** returns true if the physx actor is added to a GPU-enabled scene */
   bool isUsingDirectGPUAPI() const;
 
+  /** report contacts of this body when the CPU system contact report mode is "flagged" */
+  void setReportContacts(bool enable);
+  bool getReportContacts() const { return mReportContacts; }
+
 protected:
   std::vector<std::weak_ptr<PhysxJointComponent>> mJoints;
   std::vector<std::shared_ptr<PhysxCollisionShape>> mCollisionShapes{};
+  bool mReportContacts{false};
 };
 
 class PhysxRigidStaticComponent : public PhysxRigidBaseComponent {
@@ -17,8 +17,10 @@
 #pragma once
 #include "sapien/math/conversion.h"
 #include <PxPhysicsAPI.h>
-#include <map>
+#include <array>
 #include <memory>
+#include <unordered_map>
+#include <vector>
 
 namespace sapien {
 namespace physx {
@@ -26,6 +28,15 @@ namespace physx {
 class PhysxRigidBaseComponent;
 class PhysxCollisionShape;
 
+/** Which colliding pairs of a CPU system produce contact reports.
+ *  eFLAGGED reports pairs where at least one body has report contacts enabled. */
+enum class ContactReportMode { eOFF, eFLAGGED, eFULL };
+
+/** shared filter shader data of the CPU system */
+struct ContactReportFilterData {
+  uint32_t mode;
+};
+
 struct ContactPoint {
   Vec3 position;
   Vec3 normal;
@@ -39,41 +50,46 @@ struct Contact {
   std::vector<ContactPoint> points;
 };
 
+/** In eFLAGGED mode the filter shader defers contact pairs to this callback, which enables
+ *  contact reports when either body has report contacts enabled. */
+class ContactReportFilterCallback : public ::physx::PxSimulationFilterCallback {
+public:
+  ::physx::PxFilterFlags
+  pairFound(::physx::PxU64 pairID, ::physx::PxFilterObjectAttributes attributes0,
+            ::physx::PxFilterData filterData0, const ::physx::PxActor *a0,
+            const ::physx::PxShape *s0, ::physx::PxFilterObjectAttributes attributes1,
+            ::physx::PxFilterData filterData1, const ::physx::PxActor *a1,
+            const ::physx::PxShape *s1, ::physx::PxPairFlags &pairFlags) override;
+  void pairLost(::physx::PxU64 pairID, ::physx::PxFilterObjectAttributes attributes0,
+                ::physx::PxFilterData filterData0, ::physx::PxFilterObjectAttributes attributes1,
+                ::physx::PxFilterData filterData1, bool objectRemoved) override {}
+  bool statusChange(::physx::PxU64 &pairID, ::physx::PxPairFlags &pairFlags,
+                    ::physx::PxFilterFlags &filterFlags) override {
+    return false;
+  }
+};
+
+/** Records objects that left every MBP region so the CPU system can rebuild its regions
+ *  before the next step. */
+class BroadPhaseBoundsCallback : public ::physx::PxBroadPhaseCallback {
+public:
+  void onObjectOutOfBounds(::physx::PxShape &shape, ::physx::PxActor &actor) override {
+    mOutOfBounds = true;
+  }
+  void onObjectOutOfBounds(::physx::PxAggregate &aggregate) override { mOutOfBounds = true; }
+
+  bool hasOutOfBounds() const { return mOutOfBounds; }
+  void clear() { mOutOfBounds = false; }
+
+private:
+  bool mOutOfBounds{false};
+};
+
 class DefaultEventCallback : public ::physx::PxSimulationEventCallback {
 
 public:
   void onContact(const ::physx::PxContactPairHeader &pairHeader,
-                 const ::physx::PxContactPair *pairs, ::physx::PxU32 nbPairs) override {
-    for (uint32_t i = 0; i < nbPairs; ++i) {
-      if (pairs[i].events & ::physx::PxPairFlag::eNOTIFY_TOUCH_LOST) {
-        mContacts.erase({pairs[i].shapes[0], pairs[i].shapes[1]});
-        continue;
-      }
-
-      if (pairs[i].events & ::physx::PxPairFlag::eNOTIFY_TOUCH_FOUND ||
-          pairs[i].events & ::physx::PxPairFlag::eNOTIFY_TOUCH_PERSISTS) {
-        void *a0 = pairHeader.actors[0]->userData;
-        void *a1 = pairHeader.actors[1]->userData;
-        if (!a0 || !a1) {
-          continue;
-        }
-        std::unique_ptr<Contact> contact = std::make_unique<Contact>();
-        contact->components[0] = static_cast<PhysxRigidBaseComponent *>(a0);
-        contact->components[1] = static_cast<PhysxRigidBaseComponent *>(a1);
-        contact->shapes[0] = static_cast<PhysxCollisionShape *>(pairs[i].shapes[0]->userData);
-        contact->shapes[1] = static_cast<PhysxCollisionShape *>(pairs[i].shapes[1]->userData);
-
-        std::vector<::physx::PxContactPairPoint> points(pairs[i].contactCount);
-        pairs[i].extractContacts(points.data(), pairs[i].contactCount);
-
-        for (auto &p : points) {
-          contact->points.push_back({PxVec3ToVec3(p.position), PxVec3ToVec3(p.normal),
-                                     PxVec3ToVec3(p.impulse), p.separation});
-        }
-        mContacts[{pairs[i].shapes[0], pairs[i].shapes[1]}] = std::move(contact);
-      }
-    }
-  }
+                 const ::physx::PxContactPair *pairs, ::physx::PxU32 nbPairs) override;
 
   void onAdvance(const ::physx::PxRigidBody *const *bodyBuffer,
                  const ::physx::PxTransform *poseBuffer, const ::physx::PxU32 count) override {}
@@ -82,16 +98,39 @@ public:
   void onConstraintBreak(::physx::PxConstraintInfo *constraints, ::physx::PxU32 count) override {}
   void onTrigger(::physx::PxTriggerPair *pairs, ::physx::PxU32 count) override {}
 
-  std::vector<Contact *> getContacts() const {
-    std::vector<Contact *> contacts{};
-    for (auto &it : mContacts) {
-      contacts.push_back(it.second.get());
-    }
-    return contacts;
-  }
+  std::vector<Contact *> getContacts() const;
+  uint32_t getContactCount() const { return mContactCount; }
+  void clearContacts();
+
+  /** Between beginAccumulate and endAccumulate, a pair reported in several steps keeps the
+   *  points of every step, so their impulses sum over all of those steps, and a pair that
+   *  loses touch is kept until endAccumulate. */
+  void beginAccumulate();
+  void endAccumulate();
 
 private:
-  std::map<std::pair<::physx::PxShape *, ::physx::PxShape *>, std::unique_ptr<Contact>> mContacts;
+  using ShapePair = std::pair<::physx::PxShape *, ::physx::PxShape *>;
+  struct ShapePairHash {
+    size_t operator()(ShapePair const &p) const {
+      size_t h0 = std::hash<void *>{}(p.first);
+      size_t h1 = std::hash<void *>{}(p.second);
+      return h0 ^ (h1 + 0x9e3779b97f4a7c15ull + (h0 << 6) + (h0 >> 2));
+    }
+  };
+
+  void removeContact(ShapePair const &key);
+
+  enum AccumulateState : uint8_t { eNotReported = 0, eReported = 1, eLost = 2 };
+
+  // Contacts live in the first mContactCount slots. Slots past that are kept with their point
+  // storage so touching pairs reuse memory across steps instead of allocating.
+  std::vector<std::unique_ptr<Contact>> mContacts;
+  std::vector<ShapePair> mContactKeys;
+  std::vector<uint8_t> mAccumulateStates;
+  bool mAccumulating{false};
+  uint32_t mContactCount{0};
+  std::unordered_map<ShapePair, uint32_t, ShapePairHash> mContactIndex;
+  std::vector<::physx::PxContactPairPoint> mPointBuffer;
 };
 
 } // namespace physx
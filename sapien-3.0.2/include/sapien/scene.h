@@ -39,6 +39,11 @@ public:
   void addEntity(std::shared_ptr<Entity> entity);
   void removeEntity(std::shared_ptr<Entity> entity);
 
+  /** Add or remove many entities at once. All entities are validated before the scene is
+   *  modified and physx actors are inserted into the PxScene in a single batch. */
+  void addEntities(std::vector<std::shared_ptr<Entity>> const &entities);
+  void removeEntities(std::vector<std::shared_ptr<Entity>> const &entities);
+
   void addSystem(std::shared_ptr<System> system);
   std::shared_ptr<System> getSystem(std::string const &name) const;
 
@@ -49,7 +54,7 @@ public:
     throw std::runtime_error("failed to get system: type mismatch");
   }
 
-  std::vector<std::shared_ptr<Entity>> getEntities() const { return mEntities; };
+  std::vector<std::shared_ptr<Entity>> getEntities() const;
 
   // for convenience
   std::shared_ptr<physx::PhysxSystem> getPhysxSystem() const;
@@ -76,7 +81,16 @@ private:
 
   uint64_t mId{};
   std::unordered_map<std::string, std::shared_ptr<System>> mSystems;
+
+  // removed entities leave a null slot so removal is O(1) and entity order is preserved;
+  // slots are compacted once they make up a large part of mEntities
   std::vector<std::shared_ptr<Entity>> mEntities;
+  std::unordered_map<Entity *, size_t> mEntityIndex;
+  size_t mTombstoneCount{0};
+
+  void internalAddEntity(std::shared_ptr<Entity> entity);
+  void internalRemoveEntity(std::shared_ptr<Entity> entity);
+  void compactEntities();
 };
 
 } // namespace sapien
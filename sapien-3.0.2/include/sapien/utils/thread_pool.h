@@ -0,0 +1,75 @@
+/*
+ * Copyright 2025 Hillbot Inc.
+ * Copyright 2020-2024 UCSD SU Lab
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at:
+ * 
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#pragma once
+#include <condition_variable>
+#include <cstdint>
+#include <exception>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace sapien {
+
+/** Fixed-size pool of persistent worker threads for data-parallel loops.
+ *  Only one parallel loop runs on a pool at a time; the calling thread participates in the
+ *  loop. Calling parallelFor from inside a running loop executes the nested loop serially. */
+class ThreadPool {
+public:
+  /** @param threadCount total number of threads working on a loop, including the caller. 0
+   * means std::thread::hardware_concurrency() */
+  explicit ThreadPool(uint32_t threadCount = 0);
+  ThreadPool(ThreadPool const &) = delete;
+  ThreadPool &operator=(ThreadPool const &) = delete;
+
+  uint32_t getThreadCount() const { return mWorkers.size() + 1; }
+
+  /** call fn(begin, end) on disjoint chunks covering [0, count) and block until all chunks are
+   *  done. The first exception thrown by fn is rethrown on the calling thread.
+   *  @param grain maximum number of items per chunk */
+  void parallelFor(uint32_t count, std::function<void(uint32_t, uint32_t)> const &fn,
+                   uint32_t grain = 1);
+
+  ~ThreadPool();
+
+  /** process-wide pool sized to the hardware concurrency */
+  static ThreadPool &Get();
+
+private:
+  void workerLoop();
+  void runChunks();
+
+  std::vector<std::thread> mWorkers;
+
+  std::mutex mLoopLock; // serializes parallelFor callers
+
+  std::mutex mLock;
+  std::condition_variable mWorkCv;
+  std::condition_variable mDoneCv;
+  bool mStop{false};
+  uint64_t mGeneration{0};
+  uint32_t mActive{0};
+
+  // current loop, guarded by mLock
+  std::function<void(uint32_t, uint32_t)> const *mFn{};
+  uint32_t mCount{0};
+  uint32_t mGrain{1};
+  uint32_t mNext{0};
+  std::exception_ptr mError;
+};
+
+} // namespace sapien
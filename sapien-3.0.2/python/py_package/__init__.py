@@ -14,10 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from warnings import warn
-import pkg_resources
+import importlib
 import os
-from pathlib import Path
 import platform
 from .version import __version__
 try:
@@ -31,42 +29,50 @@ except ImportError:
 
 os.environ["SAPIEN_PACKAGE_PATH"] = os.path.dirname(__file__)
 from . import _libcxx_tricks
-from . import _oidn_tricks
+from . import _oidn_tricks  # must be loaded before pysapien
 
 from . import pysapien
 
 from .pysapien import Entity, Component, System, CudaArray, Pose, Device
+from .pysapien import EntityPoseExporter
 from .pysapien import profile
 from .pysapien import set_log_level
 from .pysapien import math
 
-import platform
 if platform.system() != "Darwin":
     from .pysapien import simsense
 
 from . import physx
-from . import render
 
-from . import _vulkan_tricks
+# Renderer, viewer, asset and wrapper modules are imported on first access so
+# physics-only processes do not pay for Vulkan setup, pinocchio or requests.
+_LAZY_SUBMODULES = {"render", "utils", "asset", "wrapper", "sensor", "internal_renderer"}
+_LAZY_ATTRIBUTES = {
+    "Scene": ".wrapper.scene",
+    "SceneConfig": ".wrapper.scene",
+    "Widget": ".wrapper.scene",
+    "Engine": ".wrapper.engine",
+    "SapienRenderer": ".wrapper.renderer",
+    "ActorBuilder": ".wrapper.actor_builder",
+    "ArticulationBuilder": ".wrapper.articulation_builder",
+    "PinocchioModel": ".wrapper.pinocchio_model",
+}
 
-from .wrapper.scene import Scene, SceneConfig, Widget
-from .wrapper.engine import Engine
-from .wrapper.renderer import SapienRenderer
-from .wrapper.actor_builder import ActorBuilder
-from .wrapper.articulation_builder import ArticulationBuilder
-from .wrapper.pinocchio_model import PinocchioModel
 
-import pkg_resources
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_SUBMODULES | set(_LAZY_ATTRIBUTES))
 
-try:
-    render.set_imgui_ini_filename(str(Path.home() / ".sapien" / "imgui.ini"))
-    pysapien.render._internal_set_shader_search_path(
-        pkg_resources.resource_filename("sapien", "vulkan_shader")
-    )
-    render.set_viewer_shader_dir("default")
-    render.set_camera_shader_dir("default")
-except RuntimeError:
-    pass
 
-from . import utils
-from . import asset
+if os.environ.get("SAPIEN_EAGER_IMPORT"):
+    for _name in ["render", "utils", "asset", *_LAZY_ATTRIBUTES]:
+        __getattr__(_name)
@@ -14,12 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import pkg_resources
 from warnings import warn
 import platform
 import os
 
 
+def _package_file(name):
+    return os.path.join(os.path.dirname(__file__), name)
+
+
 def _ensure_libvulkan_linux():
     # find and use system vulkan
     LD_LIBRARY_PATH = os.environ.get("LD_LIBRARY_PATH", "")
@@ -30,9 +33,7 @@ def _ensure_libvulkan_linux():
             return
 
     # add our vulkan to LD_LIBRARY_PATH
-    vulkan_library_path = pkg_resources.resource_filename(
-        "sapien", "vulkan_library/libvulkan.so.1.3.224"
-    )
+    vulkan_library_path = _package_file("vulkan_library/libvulkan.so.1.3.224")
 
     warn("Failed to find system libvulkan. Fallback to SAPIEN builtin libvulkan.")
     os.environ["SAPIEN_VULKAN_LIBRARY_PATH"] = vulkan_library_path
@@ -51,9 +52,7 @@ def _ensure_libvulkan_mac():
         if os.path.isfile(libPath):
             os.environ["SAPIEN_VULKAN_LIBRARY_PATH"] = libPath
             return
-    vulkan_library_path = pkg_resources.resource_filename(
-        "sapien", "vulkan_library/libvulkan.1.3.290.dylib"
-    )
+    vulkan_library_path = _package_file("vulkan_library/libvulkan.1.3.290.dylib")
 
     warn("Failed to find system libvulkan. Fallback to SAPIEN builtin libvulkan.")
     os.environ["SAPIEN_VULKAN_LIBRARY_PATH"] = vulkan_library_path
@@ -73,9 +72,7 @@ def _ensure_vulkan_icd():
     warn(
         "Failed to find Vulkan ICD file. This is probably due to an incorrect or partial installation of the NVIDIA driver. SAPIEN will attempt to provide an ICD file anyway but it may not work."
     )
-    os.environ["VK_ICD_FILENAMES"] = pkg_resources.resource_filename(
-        "sapien", "vulkan_library/nvidia_icd.json"
-    )
+    os.environ["VK_ICD_FILENAMES"] = _package_file("vulkan_library/nvidia_icd.json")
 
 
 def _ensure_egl_icd():
@@ -96,9 +93,7 @@ def _ensure_egl_icd():
         "Failed to find glvnd ICD file. This is probably due to an incorrect or partial installation of the NVIDIA driver. SAPIEN will attempt to provide an ICD file anyway but it may not work."
     )
 
-    os.environ["__EGL_VENDOR_LIBRARY_FILENAMES"] = pkg_resources.resource_filename(
-        "sapien", "vulkan_library/10_nvidia.json"
-    )
+    os.environ["__EGL_VENDOR_LIBRARY_FILENAMES"] = _package_file("vulkan_library/10_nvidia.json")
 
 
 # Skip Vulkan/EGL setup when only using PhysX GPU (e.g. headless benchmark). Avoids "invalid device context"
@@ -20,8 +20,6 @@ import platform
 from pathlib import Path
 from zipfile import ZipFile
 
-import requests
-
 from ..pysapien.physx import *
 from ..pysapien.physx import _enable_gpu
 
@@ -118,6 +116,8 @@ def enable_gpu():
                 f"Downloading PhysX GPU library to {parent} from Github. This can take several minutes."
                 f" If it fails to download, please manually download {url} and unzip at {parent}."
             )
+            import requests
+
             res = requests.get(url)
             z = ZipFile(io.BytesIO(res.content))
             z.extractall(parent)
@@ -133,3 +133,14 @@ def enable_gpu():
         ctypes.CDLL(str(dll), ctypes.RTLD_LOCAL)
 
     _enable_gpu()
+
+
+def _create_pinocchio_model(articulation, gravity=[0, 0, -9.81]):
+    # pinocchio is heavy to import; load the wrapper (which replaces this
+    # method with the real implementation) only when first requested
+    from ..wrapper import pinocchio_model
+
+    return pinocchio_model._create_pinocchio_model(articulation, gravity)
+
+
+PhysxArticulation.create_pinocchio_model = _create_pinocchio_model
@@ -0,0 +1,342 @@
+#
+# Copyright 2025 Hillbot Inc.
+# Copyright 2020-2024 UCSD SU Lab
+# 
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Record the state of a PhysxCpuSystem or PhysxGpuSystem every step and replay it later.
+
+Each step stores the rigid dynamic data, articulation link data and articulation
+qpos/qvel buffers (same layout on CPU and GPU). Steps are grouped into chunks. In a chunk
+every float is XOR-ed with the same float of the previous step, the bytes are shuffled into
+planes and each buffer is compressed with zlib, or zstandard when it is installed and
+requested. Encoding and writing happen on a background thread, so `record` only copies the
+buffers.
+
+File layout: magic, a JSON header (buffer names, shapes, codec), then chunks of
+[chunk header, per-buffer compressed sizes, compressed buffers].
+"""
+
+import json
+import os
+import queue
+import struct
+import threading
+import zlib
+
+import numpy as np
+
+from ..pysapien import Pose
+from ..pysapien.physx import PhysxCpuSystem, PhysxGpuSystem
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_MAGIC = b"SAPIENTRAJ\x00\x01"
+_CHUNK_MAGIC = b"CHNK"
+_CHUNK_HEADER = struct.Struct("<4sQII")  # magic, first step, step count, payload size
+
+FIELDS = [
+    "rigid_dynamic_data",
+    "articulation_link_data",
+    "articulation_qpos",
+    "articulation_qvel",
+]
+
+
+def _fetch_state(system):
+    if isinstance(system, PhysxGpuSystem):
+        system.gpu_fetch_rigid_dynamic_data()
+        system.gpu_fetch_articulation_link_pose()
+        system.gpu_fetch_articulation_link_velocity()
+        system.gpu_fetch_articulation_qpos()
+        system.gpu_fetch_articulation_qvel()
+        return {
+            name: getattr(system, f"cuda_{name}").torch().cpu().numpy() for name in FIELDS
+        }
+
+    system.cpu_fetch_rigid_dynamic_data()
+    system.cpu_fetch_articulation_link_pose()
+    system.cpu_fetch_articulation_link_velocity()
+    system.cpu_fetch_articulation_qpos()
+    system.cpu_fetch_articulation_qvel()
+    return {name: getattr(system, f"cpu_{name}").copy() for name in FIELDS}
+
+
+def _encode(frames: np.ndarray) -> bytes:
+    """XOR consecutive steps of a (T, ...) float32 array and shuffle bytes into planes"""
+    bits = np.ascontiguousarray(frames, dtype=np.float32).view(np.uint32)
+    bits = bits.reshape(len(bits), bits[0].size)
+    delta = bits.copy()
+    np.bitwise_xor(bits[1:], bits[:-1], out=delta[1:])
+    return np.ascontiguousarray(delta.view(np.uint8).reshape(-1, 4).T).tobytes()
+
+
+def _decode(data: bytes, count: int, shape) -> np.ndarray:
+    planes = np.frombuffer(data, dtype=np.uint8).reshape(4, -1)
+    delta = np.ascontiguousarray(planes.T).view(np.uint32).reshape(count, int(np.prod(shape)))
+    bits = np.bitwise_xor.accumulate(delta, axis=0)
+    return bits.view(np.float32).reshape(count, *shape)
+
+
+def _compressor(codec: str, level):
+    if codec == "zlib":
+        level = 1 if level is None else level
+        return lambda data: zlib.compress(data, level)
+    if codec == "zstd":
+        if zstandard is None:
+            raise ImportError("zstd compression requires the zstandard package")
+        c = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return c.compress
+    raise ValueError(f"unknown compression [{codec}], expected zlib or zstd")
+
+
+def _decompressor(codec: str):
+    if codec == "zlib":
+        return zlib.decompress
+    if codec == "zstd":
+        if zstandard is None:
+            raise ImportError("reading this trajectory requires the zstandard package")
+        return zstandard.ZstdDecompressor().decompress
+    raise ValueError(f"unknown compression [{codec}]")
+
+
+class TrajectoryRecorder:
+    def __init__(
+        self,
+        system,
+        path,
+        chunk_size: int = 64,
+        compression: str = "zlib",
+        level=None,
+    ):
+        """
+        Args:
+            system: PhysxCpuSystem or PhysxGpuSystem (after gpu_init). cpu_init is called on
+                CPU systems, so add all actors before creating the recorder.
+            path: output file
+            chunk_size: number of steps per chunk, the unit of compression and seeking
+            compression: "zlib" or "zstd" (requires the zstandard package)
+            level: compression level, fast defaults are used when None
+        """
+        if isinstance(system, PhysxCpuSystem):
+            system.cpu_init()
+        elif not isinstance(system, PhysxGpuSystem):
+            raise TypeError("system must be a PhysxCpuSystem or PhysxGpuSystem")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        self.system = system
+        self.chunk_size = chunk_size
+        self._compress = _compressor(compression, level)
+        self._codec = compression
+
+        self._file = open(path, "wb")
+        self._frames = []
+        self._step = 0
+        self._first_step = 0
+        self._shapes = None
+        self._error = None
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+    @property
+    def num_steps(self):
+        return self._step
+
+    def record(self):
+        """Capture the current state of the system, call it after each step"""
+        if self._error is not None:
+            raise RuntimeError("trajectory writer failed") from self._error
+
+        state = _fetch_state(self.system)
+        if self._shapes is None:
+            self._shapes = {name: list(state[name].shape) for name in FIELDS}
+            header = json.dumps(
+                {"version": 1, "compression": self._codec, "fields": self._shapes}
+            ).encode()
+            self._queue.put(_MAGIC + struct.pack("<I", len(header)) + header)
+
+        self._frames.append(state)
+        self._step += 1
+        if len(self._frames) == self.chunk_size:
+            self._flush()
+
+    def _flush(self):
+        if self._frames:
+            self._queue.put((self._first_step, self._frames))
+            self._first_step += len(self._frames)
+            self._frames = []
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if self._error is not None:
+                continue
+            try:
+                if isinstance(item, bytes):
+                    self._file.write(item)
+                    continue
+                first, frames = item
+                blobs = [
+                    self._compress(_encode(np.stack([f[name] for f in frames])))
+                    for name in FIELDS
+                ]
+                sizes = struct.pack(f"<{len(blobs)}Q", *[len(b) for b in blobs])
+                payload = len(sizes) + sum(len(b) for b in blobs)
+                self._file.write(_CHUNK_HEADER.pack(_CHUNK_MAGIC, first, len(frames), payload))
+                self._file.write(sizes)
+                for b in blobs:
+                    self._file.write(b)
+            except Exception as e:
+                self._error = e
+
+    def close(self):
+        """Write the remaining steps and wait for the writer thread"""
+        if self._file.closed:
+            return
+        self._flush()
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+        if self._error is not None:
+            raise RuntimeError("trajectory writer failed") from self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class TrajectoryReader:
+    def __init__(self, path):
+        """
+        Open a trajectory written by TrajectoryRecorder. Only chunk headers are read here;
+        a chunk is decompressed when one of its steps is requested.
+        """
+        self._file = open(path, "rb")
+        if self._file.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{path} is not a SAPIEN trajectory")
+        (size,) = struct.unpack("<I", self._file.read(4))
+        header = json.loads(self._file.read(size))
+        self.fields = {name: tuple(shape) for name, shape in header["fields"].items()}
+        self._decompress = _decompressor(header["compression"])
+
+        # (first step, count, offset of payload)
+        self._chunks = []
+        file_size = os.fstat(self._file.fileno()).st_size
+        while True:
+            data = self._file.read(_CHUNK_HEADER.size)
+            if len(data) < _CHUNK_HEADER.size:
+                break
+            magic, first, count, payload = _CHUNK_HEADER.unpack(data)
+            if magic != _CHUNK_MAGIC:
+                raise ValueError(f"{path} is corrupted")
+            offset = self._file.tell()
+            if offset + payload > file_size:
+                break  # truncated chunk from an interrupted recording
+            self._file.seek(offset + payload)
+            self._chunks.append((first, count, offset))
+        self._chunk_starts = [c[0] for c in self._chunks]
+        self._cached_chunk = None
+        self._cached_data = None
+
+    @property
+    def num_steps(self):
+        if not self._chunks:
+            return 0
+        first, count, _ = self._chunks[-1]
+        return first + count
+
+    def __len__(self):
+        return self.num_steps
+
+    def _load_chunk(self, index):
+        if self._cached_chunk == index:
+            return self._cached_data
+        first, count, offset = self._chunks[index]
+        self._file.seek(offset)
+        sizes = struct.unpack(f"<{len(FIELDS)}Q", self._file.read(8 * len(FIELDS)))
+        data = {}
+        for name, size in zip(FIELDS, sizes):
+            raw = self._decompress(self._file.read(size))
+            data[name] = _decode(raw, count, self.fields[name])
+        self._cached_chunk = index
+        self._cached_data = data
+        return data
+
+    def read(self, step: int):
+        """Returns a dict from buffer name to the state array of the given step"""
+        if step < 0:
+            step += self.num_steps
+        if not 0 <= step < self.num_steps:
+            raise IndexError(f"step {step} is out of range [0, {self.num_steps})")
+        index = int(np.searchsorted(self._chunk_starts, step, side="right")) - 1
+        data = self._load_chunk(index)
+        local = step - self._chunks[index][0]
+        return {name: data[name][local] for name in FIELDS}
+
+    def restore(self, system, step: int):
+        """
+        Write the state of a recorded step back into system through its batched apply
+        functions. system must contain the same bodies and articulations in the same order
+        as the recorded one.
+        """
+        state = self.read(step)
+        if isinstance(system, PhysxGpuSystem):
+            import torch
+
+            for name in FIELDS:
+                target = getattr(system, f"cuda_{name}").torch()
+                if tuple(target.shape) != self.fields[name]:
+                    raise RuntimeError(f"failed to restore trajectory: {name} shape mismatch")
+                target.copy_(torch.from_numpy(state[name]))
+            system.gpu_apply_rigid_dynamic_data()
+            system.gpu_apply_articulation_root_pose()
+            system.gpu_apply_articulation_root_velocity()
+            system.gpu_apply_articulation_qpos()
+            system.gpu_apply_articulation_qvel()
+            system.gpu_update_articulation_kinematics()
+            return
+
+        system.cpu_init()
+        for name in FIELDS:
+            target = getattr(system, f"cpu_{name}")
+            if target.shape != self.fields[name]:
+                raise RuntimeError(f"failed to restore trajectory: {name} shape mismatch")
+            target[...] = state[name]
+        system.cpu_apply_rigid_dynamic_data()
+        for articulation, root in zip(
+            system.cpu_articulations, state["articulation_link_data"][:, 0]
+        ):
+            articulation.root_pose = Pose(root[:3], root[3:7])
+            articulation.root_linear_velocity = root[7:10]
+            articulation.root_angular_velocity = root[10:13]
+        system.cpu_apply_articulation_qpos()
+        system.cpu_apply_articulation_qvel()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
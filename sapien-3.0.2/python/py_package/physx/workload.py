@@ -0,0 +1,178 @@
+#
+# Copyright 2025 Hillbot Inc.
+# Copyright 2020-2024 UCSD SU Lab
+# 
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Record the per-step inputs a controller feeds a PhysxCpuSystem or PhysxGpuSystem and
+replay them later, so different builds can be benchmarked on identical workloads.
+
+A workload stores, for every step, the articulation drive targets and joint forces and the
+rigid dynamic external forces and torques, as the system buffers hold them right before
+the step. Each buffer becomes one (T, ...) float32 array in a compressed .npz file together
+with a JSON header. Buffers that were never written during the recording (zero and unchanged
+from their contents when the recorder was created) are marked inactive and skipped on replay;
+a written buffer is replayed even when the recorded command is all zeros.
+"""
+
+import json
+
+import numpy as np
+
+from ..pysapien.physx import PhysxCpuSystem, PhysxGpuSystem
+
+# buffer name -> (fetch suffix or None, apply suffix)
+FIELDS = {
+    "articulation_target_qpos": ("articulation_target_qpos", "articulation_target_position"),
+    "articulation_target_qvel": ("articulation_target_qvel", "articulation_target_velocity"),
+    "articulation_qf": (None, "articulation_qf"),
+    "rigid_dynamic_force": (None, "rigid_dynamic_force"),
+    "rigid_dynamic_torque": (None, "rigid_dynamic_torque"),
+}
+
+_VERSION = 1
+
+
+def _check_system(system):
+    if isinstance(system, PhysxCpuSystem):
+        system.cpu_init()
+        return False
+    if isinstance(system, PhysxGpuSystem):
+        return True
+    raise TypeError("system must be a PhysxCpuSystem or PhysxGpuSystem")
+
+
+class WorkloadRecorder:
+    def __init__(self, system, metadata=None):
+        """
+        Args:
+            system: PhysxCpuSystem or PhysxGpuSystem (after gpu_init). cpu_init is called on
+                CPU systems, so add all actors before creating the recorder.
+            metadata: optional JSON-serializable dict saved with the workload
+        """
+        self.system = system
+        self.metadata = dict(metadata or {})
+        self._gpu = _check_system(system)
+        self._frames = {name: [] for name in FIELDS}
+        # "written" is tracked apart from "non-zero": a zero command that replaces earlier
+        # values must still be replayed
+        self._initial = {name: self._read(name) for name in FIELDS}
+        self._written = {name: False for name in FIELDS}
+
+    @property
+    def num_steps(self):
+        return len(self._frames["rigid_dynamic_force"])
+
+    def _read(self, name):
+        fetch = FIELDS[name][0]
+        if fetch is not None:
+            getattr(self.system, f"{'gpu' if self._gpu else 'cpu'}_fetch_{fetch}")()
+        if self._gpu:
+            return getattr(self.system, f"cuda_{name}").torch().cpu().numpy()
+        return getattr(self.system, f"cpu_{name}").copy()
+
+    def capture(self):
+        """Capture the inputs of the coming step, call it after the controller and before step"""
+        for name in FIELDS:
+            value = self._read(name)
+            if not self._written[name]:
+                self._written[name] = bool(np.any(value)) or not np.array_equal(
+                    value, self._initial[name]
+                )
+            self._frames[name].append(value)
+
+    def save(self, path):
+        """Write the captured steps to path (.npz)"""
+        arrays = {}
+        active = []
+        for name, frames in self._frames.items():
+            if frames:
+                data = np.stack(frames).astype(np.float32, copy=False)
+            else:
+                data = np.zeros((0,), dtype=np.float32)
+            arrays[name] = data
+            if data.size and self._written[name]:
+                active.append(name)
+        header = {
+            "version": _VERSION,
+            "num_steps": self.num_steps,
+            "active": active,
+            "metadata": self.metadata,
+        }
+        arrays["header"] = np.frombuffer(json.dumps(header).encode(), dtype=np.uint8)
+        with open(path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+
+
+class WorkloadReplayer:
+    def __init__(self, path):
+        """
+        Load a workload written by WorkloadRecorder. Steps past the end wrap around, so a
+        workload can drive runs of any length.
+        """
+        with np.load(path) as data:
+            header = json.loads(data["header"].tobytes())
+            if header.get("version") != _VERSION:
+                raise ValueError(f"{path} has unsupported workload version {header.get('version')}")
+            self.metadata = header["metadata"]
+            self.active = list(header["active"])
+            self.frames = {name: data[name] for name in self.active}
+        self._frames = self.frames
+        self.num_steps = int(header["num_steps"])
+        self._system = None
+        self._targets = None
+
+    def __len__(self):
+        return self.num_steps
+
+    def _bind(self, system):
+        gpu = _check_system(system)
+        targets = {}
+        for name in self.active:
+            shape = self.frames[name].shape[1:]
+            if gpu:
+                buffer = getattr(system, f"cuda_{name}").torch()
+            else:
+                buffer = getattr(system, f"cpu_{name}")
+            if tuple(buffer.shape) != tuple(shape):
+                raise RuntimeError(
+                    f"failed to replay workload: {name} has shape {tuple(buffer.shape)}, "
+                    f"recorded {tuple(shape)}"
+                )
+            targets[name] = buffer
+
+        if gpu:
+            import torch
+
+            # upload once so replay costs one device copy per buffer and step
+            device = next(iter(targets.values())).device if targets else None
+            self._frames = {
+                name: torch.as_tensor(frames, device=device) for name, frames in self.frames.items()
+            }
+        else:
+            self._frames = self.frames
+        self._system = system
+        self._targets = targets
+        self._prefix = "gpu" if gpu else "cpu"
+
+    def apply(self, system, step: int):
+        """Write the recorded inputs of step into system and apply them through the batched API"""
+        if not self.num_steps:
+            return
+        if system is not self._system:
+            self._bind(system)
+        step %= self.num_steps
+        for name in self.active:
+            self._targets[name][...] = self._frames[name][step]
+            getattr(system, f"{self._prefix}_apply_{FIELDS[name][1]}")()
@@ -9,7 +9,7 @@ from . import math
 from . import physx
 from . import render
 from . import simsense
-__all__ = ['Component', 'CudaArray', 'Device', 'Entity', 'Pose', 'Profiler', 'Scene', 'System', 'abi_version', 'compiled_with_cxx11_abi', 'internal_renderer', 'math', 'physx', 'profile', 'pybind11_internals_id', 'pybind11_use_smart_holder', 'render', 'set_log_level', 'simsense']
+__all__ = ['Component', 'CudaArray', 'Device', 'Entity', 'EntityPoseExporter', 'Pose', 'Profiler', 'Scene', 'System', 'abi_version', 'compiled_with_cxx11_abi', 'internal_renderer', 'math', 'physx', 'profile', 'pybind11_internals_id', 'pybind11_use_smart_holder', 'render', 'set_log_level', 'simsense']
 _T = typing.TypeVar("_T", Component)
 class Component:
     entity_pose: Pose
@@ -151,6 +151,39 @@ class Entity:
     @property
     def scene(self) -> Scene:
         ...
+class EntityPoseExporter:
+    @staticmethod
+    def _pybind11_conduit_v1_(*args, **kwargs):
+        ...
+    def __init__(self, scenes: list[Scene], entities: list[Entity] = []) -> None:
+        """
+        Export entity poses of many scenes into a single (N, 7) float32 array.
+        
+        Args:
+            scenes: scenes to export, rows are ordered by scene and then by entity id
+            entities: only export these entities (they must be in one of the scenes),
+                all entities are exported if empty
+        """
+    def export_poses(self, out: numpy.ndarray | None = None) -> numpy.ndarray:
+        """
+        Write [px, py, pz, qw, qx, qy, qz] of every exported entity into out (allocated if None)
+        and return it.
+        """
+    def update(self) -> None:
+        """
+        recollect entities after entities are added to or removed from the scenes
+        """
+    @property
+    def count(self) -> int:
+        ...
+    @property
+    def entities(self) -> list[Entity]:
+        ...
+    @property
+    def index_map(self) -> typing.Annotated[numpy.typing.NDArray[numpy.int64], "[m, 2]"]:
+        """
+        (N, 2) array of (scene index, per-scene entity id) for each row
+        """
 class Pose:
     p: numpy.ndarray[typing.Literal[3], numpy.dtype[numpy.float32]]
     q: numpy.ndarray[typing.Literal[4], numpy.dtype[numpy.float32]]
@@ -206,6 +239,8 @@ class Scene:
         ...
     def __init__(self, systems: list[System]) -> None:
         ...
+    def add_entities(self, entities: list[Entity]) -> None:
+        ...
     def add_entity(self, entity: Entity) -> None:
         ...
     def add_system(self, system: System) -> None:
@@ -224,6 +259,8 @@ class Scene:
         ...
     def pack_poses(self) -> bytes:
         ...
+    def remove_entities(self, entities: list[Entity]) -> None:
+        ...
     def remove_entity(self, entity: Entity) -> None:
         ...
     def unpack_poses(self, data: bytes) -> None:
@@ -5,7 +5,7 @@ import pybind11_stubgen.typing_ext
 import sapien.pysapien
 import sapien.pysapien_pinocchio
 import typing
-__all__ = ['PhysxArticulation', 'PhysxArticulationJoint', 'PhysxArticulationLinkComponent', 'PhysxBaseComponent', 'PhysxBodyConfig', 'PhysxCollisionShape', 'PhysxCollisionShapeBox', 'PhysxCollisionShapeCapsule', 'PhysxCollisionShapeConvexMesh', 'PhysxCollisionShapeCylinder', 'PhysxCollisionShapePlane', 'PhysxCollisionShapeSphere', 'PhysxCollisionShapeTriangleMesh', 'PhysxContact', 'PhysxContactPoint', 'PhysxCpuSystem', 'PhysxDistanceJointComponent', 'PhysxDriveComponent', 'PhysxEngine', 'PhysxGearComponent', 'PhysxGpuContactBodyImpulseQuery', 'PhysxGpuContactPairImpulseQuery', 'PhysxGpuSystem', 'PhysxJointComponent', 'PhysxMaterial', 'PhysxRayHit', 'PhysxRigidBaseComponent', 'PhysxRigidBodyComponent', 'PhysxRigidDynamicComponent', 'PhysxRigidStaticComponent', 'PhysxSDFConfig', 'PhysxSceneConfig', 'PhysxShapeConfig', 'PhysxSystem', 'clear_cache', 'get_body_config', 'get_default_material', 'get_scene_config', 'get_sdf_config', 'get_shape_config', 'get_stage_profiler_last_frame_stage_ms', 'get_stage_profiler_last_frame_zone_ms', 'is_gpu_enabled', 'is_stage_profiler_enabled', 'set_body_config', 'set_default_material', 'set_gpu_memory_config', 'set_scene_config', 'set_sdf_config', 'set_shape_config', 'set_stage_profiler_enabled', 'stage_profiler_begin_frame', 'stage_profiler_end_frame', 'version']
+__all__ = ['PhysxArticulation', 'PhysxArticulationJoint', 'PhysxArticulationLinkComponent', 'PhysxBaseComponent', 'PhysxBodyConfig', 'PhysxCollisionShape', 'PhysxCollisionShapeBox', 'PhysxCollisionShapeCapsule', 'PhysxCollisionShapeConvexMesh', 'PhysxCollisionShapeCylinder', 'PhysxCollisionShapePlane', 'PhysxCollisionShapeSphere', 'PhysxCollisionShapeTriangleMesh', 'PhysxContact', 'PhysxContactPoint', 'PhysxCpuSystem', 'PhysxCpuSystemGroup', 'PhysxDistanceJointComponent', 'PhysxDriveComponent', 'PhysxEngine', 'PhysxGearComponent', 'PhysxGpuContactBodyImpulseQuery', 'PhysxGpuContactPairImpulseQuery', 'PhysxGpuSystem', 'PhysxJointComponent', 'PhysxMaterial', 'PhysxRayHit', 'PhysxRigidBaseComponent', 'PhysxRigidBodyComponent', 'PhysxRigidDynamicComponent', 'PhysxRigidStaticComponent', 'PhysxSDFConfig', 'PhysxSceneConfig', 'PhysxShapeConfig', 'PhysxSystem', 'build_articulation_entities', 'build_physx_component', 'clear_cache', 'get_body_config', 'get_default_material', 'get_scene_config', 'get_sdf_config', 'get_shape_config', 'get_shared_cpu_dispatcher_worker_count', 'get_stage_profiler_last_frame_stage_ms', 'get_stage_profiler_last_frame_zone_ms', 'is_gpu_enabled', 'is_stage_profiler_enabled', 'set_body_config', 'set_default_material', 'set_gpu_memory_config', 'set_scene_config', 'set_sdf_config', 'set_shape_config', 'set_shared_cpu_dispatcher_config', 'set_stage_profiler_enabled', 'stage_profiler_begin_frame', 'stage_profiler_end_frame', 'version']
 class PhysxArticulation:
     name: str
     pose: sapien.pysapien.Pose
@@ -577,18 +577,269 @@ class PhysxCpuSystem(PhysxSystem):
     @staticmethod
     def _pybind11_conduit_v1_(*args, **kwargs):
         ...
-    def __init__(self) -> None:
+    def __init__(self, shared_dispatcher: bool = False) -> None:
+        ...
+    @typing.overload
+    def cpu_apply_articulation_qf(self) -> None:
+        ...
+    @typing.overload
+    def cpu_apply_articulation_qf(self, indices: typing.Annotated[numpy.typing.ArrayLike, numpy.int32]) -> None:
+        ...
+    @typing.overload
+    def cpu_apply_articulation_qpos(self) -> None:
+        ...
+    @typing.overload
+    def cpu_apply_articulation_qpos(self, indices: typing.Annotated[numpy.typing.ArrayLike, numpy.int32]) -> None:
+        ...
+    @typing.overload
+    def cpu_apply_articulation_qvel(self) -> None:
+        ...
+    @typing.overload
+    def cpu_apply_articulation_qvel(self, indices: typing.Annotated[numpy.typing.ArrayLike, numpy.int32]) -> None:
+        ...
+    @typing.overload
+    def cpu_apply_articulation_target_position(self) -> None:
+        ...
+    @typing.overload
+    def cpu_apply_articulation_target_position(self, indices: typing.Annotated[numpy.typing.ArrayLike, numpy.int32]) -> None:
+        ...
+    @typing.overload
+    def cpu_apply_articulation_target_velocity(self) -> None:
+        ...
+    @typing.overload
+    def cpu_apply_articulation_target_velocity(self, indices: typing.Annotated[numpy.typing.ArrayLike, numpy.int32]) -> None:
+        ...
+    @typing.overload
+    def cpu_apply_rigid_dynamic_data(self) -> None:
+        ...
+    @typing.overload
+    def cpu_apply_rigid_dynamic_data(self, indices: typing.Annotated[numpy.typing.ArrayLike, numpy.int32]) -> None:
+        ...
+    def cpu_apply_rigid_dynamic_force(self) -> None:
+        ...
+    def cpu_apply_rigid_dynamic_torque(self) -> None:
+        ...
+    def cpu_fetch_articulation_link_pose(self) -> None:
+        ...
+    def cpu_fetch_articulation_link_velocity(self) -> None:
+        ...
+    def cpu_fetch_articulation_qacc(self) -> None:
+        ...
+    def cpu_fetch_articulation_qpos(self) -> None:
+        ...
+    def cpu_fetch_articulation_qvel(self) -> None:
+        ...
+    def cpu_fetch_articulation_target_qpos(self) -> None:
+        ...
+    def cpu_fetch_articulation_target_qvel(self) -> None:
+        ...
+    def cpu_fetch_rigid_dynamic_data(self) -> None:
+        ...
+    def cpu_init(self) -> None:
+        """
+        Allocate NumPy buffers with the same layout as the PhysxGpuSystem CUDA buffers and
+        fill them with the current state. This function must be called each time when
+        actors are added or removed from the scene, which also invalidates previously
+        returned buffers. Rows of cpu_rigid_dynamic_data follow cpu_rigid_dynamic_components
+        and link rows of articulation i start at len(cpu_rigid_dynamic_components) + i * max_link_count.
+        """
+    def get_broad_phase_regions(self) -> list[list[numpy.ndarray[typing.Literal[3], numpy.dtype[numpy.float32]]]]:
+        """
+        Active MBP regions as (lower, upper) pairs, empty unless the broad phase is "mbp". Regions tile
+        mbp_world_lower/upper of the scene config, or the bounds of all actors when those are empty;
+        in that case they are rebuilt on step once an object leaves every region.
+        """
+    def get_contact_report_mode(self) -> typing.Literal['off', 'flagged', 'full']:
         ...
     def get_contacts(self) -> list[PhysxContact]:
         ...
+    def get_dispatcher_priority(self) -> int:
+        ...
+    def is_stepping(self) -> bool:
+        ...
+    def overlap_box_batch(self, positions: typing.Annotated[numpy.typing.ArrayLike, numpy.float32], half_size: numpy.ndarray[typing.Literal[3], numpy.dtype[numpy.float32]] | list[float] | tuple, rotations: typing.Annotated[numpy.typing.ArrayLike, numpy.float32] | None = None) -> tuple:
+        """
+        Tests boxes at N poses for overlaps in parallel, returns the same outputs as overlap_sphere_batch
+        """
+    def overlap_capsule_batch(self, positions: typing.Annotated[numpy.typing.ArrayLike, numpy.float32], radius: float, half_length: float, rotations: typing.Annotated[numpy.typing.ArrayLike, numpy.float32] | None = None) -> tuple:
+        """
+        Tests x-axis capsules at N poses for overlaps in parallel, returns the same outputs as overlap_sphere_batch
+        """
+    def overlap_sphere_batch(self, positions: typing.Annotated[numpy.typing.ArrayLike, numpy.float32], radius: float) -> tuple:
+        """
+        Tests spheres at N positions for overlaps in parallel with the GIL released.
+        
+        Returns:
+            (component_index, components) where component_index is (N,) int32 indexing into the
+            components list for any overlapping component and -1 if there is no overlap.
+        """
     def pack(self) -> bytes:
         ...
     def raycast(self, position: numpy.ndarray[typing.Literal[3], numpy.dtype[numpy.float32]] | list[float] | tuple, direction: numpy.ndarray[typing.Literal[3], numpy.dtype[numpy.float32]] | list[float] | tuple, distance: float) -> PhysxRayHit:
         """
         Casts a ray and returns the closest hit. Returns None if no hit
         """
+    def raycast_batch(self, positions: typing.Annotated[numpy.typing.ArrayLike, numpy.float32], directions: typing.Annotated[numpy.typing.ArrayLike, numpy.float32], distance: float) -> tuple:
+        """
+        Casts N rays in parallel with the GIL released.
+        
+        Args:
+            positions: (N, 3) ray origins
+            directions: (N, 3) ray directions, normalized internally
+            distance: max distance of all rays
+        
+        Returns:
+            (distance, position, normal, component_index, components) where distance is (N,) and inf
+            for misses, position and normal are (N, 3), component_index is (N,) int32 indexing into
+            the components list and -1 for misses.
+        """
+    def set_contact_report_mode(self, mode: typing.Literal['off', 'flagged', 'full']) -> None:
+        """
+        Choose which colliding pairs report contacts to get_contacts.
+        
+        Args:
+            mode: "full" reports every pair (default), "flagged" only pairs where a body has
+                report_contacts enabled, "off" reports nothing and drops stored contacts
+        """
+    def set_dispatcher_priority(self, priority: int) -> None:
+        """
+        tasks of systems with higher priority run first on the shared dispatcher
+        """
+    def step(self, n_substeps: int = 1, reapply_drives_and_forces: bool = False, accumulate_contacts: bool = False) -> None:
+        """
+        Run n_substeps simulation steps natively with the GIL released. Poses are synced to entities
+        once, after the last substep.
+        
+        Args:
+            n_substeps: number of simulation steps
+            reapply_drives_and_forces: apply the rigid dynamic force and torque, articulation qf and
+                drive target buffers applied (cpu_apply_*) since the last step again before every
+                substep, instead of only before the first one
+            accumulate_contacts: keep the contact points of every substep in get_contacts, so their
+                impulses sum over all substeps; pairs that separate during the substeps are kept too
+        """
+    def step_finish(self) -> None:
+        """
+        Wait for the step started by step_start with the GIL released
+        """
+    def step_start(self) -> None:
+        """
+        Start a step on the PhysX CPU workers and return without waiting for it, so Python work can
+        overlap the simulation. Bodies must not be read or written until step_finish. With 0 CPU
+        workers the whole step runs inside this call.
+        """
+    def sweep_box_batch(self, positions: typing.Annotated[numpy.typing.ArrayLike, numpy.float32], directions: typing.Annotated[numpy.typing.ArrayLike, numpy.float32], distance: float, half_size: numpy.ndarray[typing.Literal[3], numpy.dtype[numpy.float32]] | list[float] | tuple, rotations: typing.Annotated[numpy.typing.ArrayLike, numpy.float32] | None = None) -> tuple:
+        """
+        Sweeps a box from N poses in parallel, returns the same outputs as raycast_batch. rotations are (N, 4) quaternions (wxyz)
+        """
+    def sweep_capsule_batch(self, positions: typing.Annotated[numpy.typing.ArrayLike, numpy.float32], directions: typing.Annotated[numpy.typing.ArrayLike, numpy.float32], distance: float, radius: float, half_length: float, rotations: typing.Annotated[numpy.typing.ArrayLike, numpy.float32] | None = None) -> tuple:
+        """
+        Sweeps an x-axis capsule from N poses in parallel, returns the same outputs as raycast_batch. rotations are (N, 4) quaternions (wxyz)
+        """
+    def sweep_sphere_batch(self, positions: typing.Annotated[numpy.typing.ArrayLike, numpy.float32], directions: typing.Annotated[numpy.typing.ArrayLike, numpy.float32], distance: float, radius: float) -> tuple:
+        """
+        Sweeps a sphere from N positions in parallel, returns the same outputs as raycast_batch
+        """
     def unpack(self, data: bytes) -> None:
         ...
+    def update_scene_queries(self) -> None:
+        """
+        Rebuild the structures used by raycast, sweep and overlap queries now. With
+        scene_query_update_mode "disabled" queries do this on demand after a step or an added or
+        removed body; call it after moving bodies by hand.
+        """
+    @property
+    def contact_report_mode(self) -> typing.Literal['off', 'flagged', 'full']:
+        ...
+    @contact_report_mode.setter
+    def contact_report_mode(self, arg1: typing.Literal['off', 'flagged', 'full']) -> None:
+        ...
+    @property
+    def dispatcher_priority(self) -> int:
+        ...
+    @dispatcher_priority.setter
+    def dispatcher_priority(self, arg1: int) -> None:
+        ...
+    @property
+    def cpu_articulation_link_data(self) -> numpy.ndarray:
+        ...
+    @property
+    def cpu_articulation_qacc(self) -> numpy.ndarray:
+        ...
+    @property
+    def cpu_articulation_qf(self) -> numpy.ndarray:
+        ...
+    @property
+    def cpu_articulation_qpos(self) -> numpy.ndarray:
+        ...
+    @property
+    def cpu_articulation_qvel(self) -> numpy.ndarray:
+        ...
+    @property
+    def cpu_articulation_target_qpos(self) -> numpy.ndarray:
+        ...
+    @property
+    def cpu_articulation_target_qvel(self) -> numpy.ndarray:
+        ...
+    @property
+    def cpu_articulations(self) -> list[PhysxArticulation]:
+        ...
+    @property
+    def cpu_rigid_body_data(self) -> numpy.ndarray:
+        ...
+    @property
+    def cpu_rigid_body_force(self) -> numpy.ndarray:
+        ...
+    @property
+    def cpu_rigid_body_torque(self) -> numpy.ndarray:
+        ...
+    @property
+    def cpu_rigid_dynamic_components(self) -> list[PhysxRigidDynamicComponent]:
+        ...
+    @property
+    def cpu_rigid_dynamic_data(self) -> numpy.ndarray:
+        ...
+    @property
+    def cpu_rigid_dynamic_force(self) -> numpy.ndarray:
+        ...
+    @property
+    def cpu_rigid_dynamic_torque(self) -> numpy.ndarray:
+        ...
+    @property
+    def shared_dispatcher(self) -> bool:
+        ...
+    @property
+    def stepping(self) -> bool:
+        ...
+class PhysxCpuSystemGroup:
+    @staticmethod
+    def _pybind11_conduit_v1_(*args, **kwargs):
+        ...
+    def __init__(self, num_threads: int = 0) -> None:
+        """
+        Container stepping many independent PhysxCpuSystem in one call.
+        
+        Args:
+            num_threads: number of threads used to step systems, 0 means one thread per CPU core
+        """
+    def add_system(self, system: PhysxCpuSystem) -> None:
+        ...
+    def get_num_threads(self) -> int:
+        ...
+    def get_systems(self) -> list[PhysxCpuSystem]:
+        ...
+    def remove_system(self, system: PhysxCpuSystem) -> None:
+        ...
+    def step(self) -> None:
+        """
+        Steps all systems in parallel with the GIL released
+        """
+    @property
+    def num_threads(self) -> int:
+        ...
+    @property
+    def systems(self) -> list[PhysxCpuSystem]:
+        ...
 class PhysxDistanceJointComponent(PhysxJointComponent):
     @staticmethod
     def _pybind11_conduit_v1_(*args, **kwargs):
@@ -826,6 +1077,19 @@ class PhysxGpuSystem(PhysxSystem):
         position `[1, 1, 1]` will be at position `[1, 1, 1] + [2, 1, 0] = [3, 2, 1]` in
         PhysX scene.
         """
+    def step(self, n_substeps: int = 1, reapply_drives_and_forces: bool = False, contact_pair_queries: list[PhysxGpuContactPairImpulseQuery] = [], contact_body_queries: list[PhysxGpuContactBodyImpulseQuery] = []) -> None:
+        """
+        Run n_substeps simulation steps natively with the GIL released.
+        
+        Args:
+            n_substeps: number of simulation steps
+            reapply_drives_and_forces: apply the rigid dynamic force and torque, articulation qf and
+                drive target buffers applied (gpu_apply_*) since the last step again before every
+                substep, instead of only before the first one
+            contact_pair_queries: queries whose cuda_impulses are filled with contact impulses summed
+                over all substeps, as gpu_query_contact_pair_impulses does for a single step
+            contact_body_queries: same as contact_pair_queries for gpu_query_contact_body_impulses
+        """
     def step_finish(self) -> None:
         ...
     def step_start(self) -> None:
@@ -961,12 +1225,22 @@ class PhysxRigidBaseComponent(PhysxBaseComponent):
         ...
     def get_global_aabb_fast(self) -> numpy.ndarray[tuple[typing.Literal[2], typing.Literal[3]], numpy.dtype[numpy.float32]]:
         ...
+    def get_report_contacts(self) -> bool:
+        ...
+    def set_report_contacts(self, enable: bool) -> None:
+        ...
     @property
     def _physx_pointer(self) -> int:
         ...
     @property
     def collision_shapes(self) -> list[PhysxCollisionShape]:
         ...
+    @property
+    def report_contacts(self) -> bool:
+        ...
+    @report_contacts.setter
+    def report_contacts(self, arg1: bool) -> None:
+        ...
 class PhysxRigidBodyComponent(PhysxRigidBaseComponent):
     angular_damping: float
     cmass_local_pose: sapien.pysapien.Pose
@@ -1136,12 +1410,18 @@ class PhysxSDFConfig:
         ...
 class PhysxSceneConfig:
     bounce_threshold: float
+    broad_phase: typing.Literal['sap', 'mbp', 'abp', 'pabp']
     enable_ccd: bool
     enable_enhanced_determinism: bool
     enable_friction_every_iteration: bool
     enable_pcm: bool
     enable_tgs: bool
     gravity: numpy.ndarray[typing.Literal[3], numpy.dtype[numpy.float32]]
+    mbp_subdivisions: int
+    mbp_world_lower: numpy.ndarray[typing.Literal[3], numpy.dtype[numpy.float32]]
+    mbp_world_upper: numpy.ndarray[typing.Literal[3], numpy.dtype[numpy.float32]]
+    scene_query_pruner: typing.Literal['aabb_tree', 'bvh', 'none']
+    scene_query_update_mode: typing.Literal['commit', 'build', 'disabled']
     @staticmethod
     def _pybind11_conduit_v1_(*args, **kwargs):
         ...
@@ -1205,6 +1485,18 @@ class PhysxSystem(sapien.pysapien.System):
         ...
 def _enable_gpu() -> None:
     ...
+def build_articulation_entities(spec: dict) -> list[sapien.pysapien.Entity]:
+    """
+    Create one entity per link from an articulation spec produced by
+    ArticulationBuilder.build_spec. Render components are not included.
+    """
+def build_physx_component(spec: dict, link_parent: PhysxArticulationLinkComponent = None) -> PhysxRigidBaseComponent:
+    """
+    Create a physx component from a body spec produced by ActorBuilder.build_physx_spec in a
+    single call. The spec may be reused across scenes. Shapes keep the builder's
+    PhysxMaterial objects; an unpickled spec creates one new material per distinct
+    coefficient triple instead.
+    """
 def clear_cache() -> None:
     ...
 def get_body_config() -> PhysxBodyConfig:
@@ -1217,6 +1509,10 @@ def get_sdf_config() -> PhysxSDFConfig:
     ...
 def get_shape_config() -> PhysxShapeConfig:
     ...
+def get_shared_cpu_dispatcher_worker_count() -> int:
+    """
+    number of shared dispatcher workers, -1 if the pool has not been created
+    """
 def get_stage_profiler_last_frame_stage_ms() -> dict[str, float]:
     ...
 def get_stage_profiler_last_frame_zone_ms() -> dict[str, float]:
@@ -1236,7 +1532,7 @@ def set_default_material(static_friction: float, dynamic_friction: float, restit
 def set_gpu_memory_config(temp_buffer_capacity: int = 16777216, max_rigid_contact_count: int = 524288, max_rigid_patch_count: int = 81920, heap_capacity: int = 67108864, found_lost_pairs_capacity: int = 262144, found_lost_aggregate_pairs_capacity: int = 1024, total_aggregate_pairs_capacity: int = 1024, collision_stack_size: int = 4194304) -> None:
     ...
 @typing.overload
-def set_scene_config(gravity: numpy.ndarray[typing.Literal[3], numpy.dtype[numpy.float32]] = ..., bounce_threshold: float = 2.0, enable_pcm: bool = True, enable_tgs: bool = True, enable_ccd: bool = False, enable_enhanced_determinism: bool = False, enable_friction_every_iteration: bool = True, cpu_workers: int = 0) -> None:
+def set_scene_config(gravity: numpy.ndarray[typing.Literal[3], numpy.dtype[numpy.float32]] = ..., bounce_threshold: float = 2.0, enable_pcm: bool = True, enable_tgs: bool = True, enable_ccd: bool = False, enable_enhanced_determinism: bool = False, enable_friction_every_iteration: bool = True, cpu_workers: int = 0, broad_phase: typing.Literal['sap', 'mbp', 'abp', 'pabp'] = 'pabp', mbp_subdivisions: int = 4, scene_query_update_mode: typing.Literal['commit', 'build', 'disabled'] = 'commit', scene_query_pruner: typing.Literal['aabb_tree', 'bvh', 'none'] = 'aabb_tree') -> None:
     ...
 @typing.overload
 def set_scene_config(config: PhysxSceneConfig) -> None:
@@ -1253,6 +1549,16 @@ def set_shape_config(contact_offset: float = 0.009999999776482582, rest_offset:
 @typing.overload
 def set_shape_config(config: PhysxShapeConfig) -> None:
     ...
+def set_shared_cpu_dispatcher_config(worker_count: int, affinity: list[list[int]] = []) -> None:
+    """
+    Size the process-wide worker pool used by PhysxCpuSystem(shared_dispatcher=True). It must be
+    called before the first such system is created, otherwise the pool starts with one worker per
+    hardware thread.
+    
+    Args:
+        worker_count: number of worker threads, 0 runs tasks on the stepping thread
+        affinity: optional list of CPU ids for each worker, worker i is pinned to affinity[i]
+    """
 def set_stage_profiler_enabled(enabled: bool) -> None:
     ...
 def stage_profiler_begin_frame() -> None:
@@ -14,4 +14,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from pathlib import Path
+
+from .. import _vulkan_tricks
 from ..pysapien.render import *
+from ..pysapien.render import _internal_set_shader_search_path
+from ..wrapper import renderer as _renderer  # deprecated RenderMaterial aliases
+
+try:
+    set_imgui_ini_filename(str(Path.home() / ".sapien" / "imgui.ini"))
+    _internal_set_shader_search_path(str(Path(__file__).parent.parent / "vulkan_shader"))
+    set_viewer_shader_dir("default")
+    set_camera_shader_dir("default")
+except RuntimeError:
+    pass
@@ -21,10 +21,13 @@ from ..core import (
 )
 from .depth_processor import (
     init_rectify_stereo,
-    calc_main_depth_from_left_right_ir,
+    get_ray_grid,
+    depth_to_points,
+    depth_to_pointcloud_batch,
 )
+from .depth_engine import DepthEngine, compute_depth_batch
 from .sensor_base import SensorEntity
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 from copy import deepcopy as copy
 from warnings import warn
 
@@ -124,6 +127,8 @@ class ActiveLightSensor(SensorEntity):
             self.ir_w, self.ir_h, self.ir_intrinsic.astype(float),
             self.ir_intrinsic.astype(float), self._l2r.astype(float)
         )
+        self._depth_engine = DepthEngine.from_sensor(self)
+        self._rgb_rays = get_ray_grid(self.rgb_h, self.rgb_w, self.rgb_intrinsic)
         
     def clear_cache(self):
         self._rgb = None
@@ -170,29 +175,46 @@ class ActiveLightSensor(SensorEntity):
             self._fetch('ir_l')
             self._fetch('ir_r')
 
-            depth = calc_main_depth_from_left_right_ir(
-                self._float2uint8(self._ir_l),
-                self._float2uint8(self._ir_r),
-                self._l2r, self._l2rgb,
-                self.ir_intrinsic, self.ir_intrinsic, self.rgb_intrinsic,
-                self._map1, self._map2, self._q,
-                main_cam_size=(self.rgb_w, self.rgb_h),
-                ndisp=128, use_census=True, register_depth=True, census_wsize=7,
-                use_noise=False
+            self._depth = self._depth_engine.compute(
+                self._float2uint8(self._ir_l), self._float2uint8(self._ir_r)
             )
-            depth[depth > self.max_depth] = 0
-            depth[depth < self.min_depth] = 0
-            self._depth = depth
 
         return copy(self._depth)
 
+    @staticmethod
+    def get_depth_batch(
+        sensors: Sequence["ActiveLightSensor"], max_workers: Optional[int] = None
+    ) -> List[np.ndarray]:
+        """
+        Compute depth for many sensors at once. IR images are fetched on the
+        calling thread; stereo matching runs in a thread pool.
+
+        :param sensors: Sensors that have taken a picture.
+        :param max_workers: Number of worker threads, defaults to the number of CPUs.
+        :return: Depth map of each sensor.
+        """
+        pending = [s for s in sensors if s._depth is None]
+        for s in pending:
+            s._fetch('ir_l')
+            s._fetch('ir_r')
+
+        depths = compute_depth_batch(
+            [s._depth_engine for s in pending],
+            [(s._float2uint8(s._ir_l), s._float2uint8(s._ir_r)) for s in pending],
+            max_workers,
+        )
+        for s, depth in zip(pending, depths):
+            s._depth = depth
+
+        return [copy(s._depth) for s in sensors]
+
     def get_pointcloud(self, frame='camera', with_rgb=False):
         assert frame in ['camera', 'world']
         depth = self.get_depth()
         if frame == 'camera':
-            xyz = self._depth2pts_np(depth, self.rgb_intrinsic)
+            xyz = depth_to_points(depth, self._rgb_rays)
         else:
-            xyz = self._depth2pts_np(depth, self.rgb_intrinsic, self._pose2cv2ex(self.pose))
+            xyz = depth_to_points(depth, self._rgb_rays, self._pose2cv2ex(self.pose))
 
         if with_rgb:
             self._fetch('rgb')
@@ -200,6 +222,28 @@ class ActiveLightSensor(SensorEntity):
 
         return xyz
 
+    @staticmethod
+    def get_pointcloud_batch(
+        sensors: Sequence["ActiveLightSensor"],
+        voxel_size: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Merge the valid depth points of many sensors into one world-frame point cloud.
+
+        :param sensors: Sensors that have taken a picture.
+        :param voxel_size: If set, voxel-downsample the merged cloud with this voxel size.
+        :param max_workers: Number of worker threads for depth computation.
+        :return: (N, 3) float32 points in world frame.
+        """
+        depths = ActiveLightSensor.get_depth_batch(sensors, max_workers)
+        return depth_to_pointcloud_batch(
+            depths,
+            [s._rgb_rays for s in sensors],
+            [s._pose2cv2ex(s.pose) for s in sensors],
+            voxel_size,
+        )
+
     def _create_cameras(self):
         self.scene.update_render()
 
@@ -309,15 +353,5 @@ class ActiveLightSensor(SensorEntity):
 
     @staticmethod
     def _depth2pts_np(depth_map, cam_intrinsic, cam_extrinsic=np.eye(4)):
-        feature_grid = ActiveLightSensor._get_pixel_grids_np(
-            depth_map.shape[0], depth_map.shape[1])
-
-        uv = np.matmul(np.linalg.inv(cam_intrinsic), feature_grid)
-        cam_points = uv * np.reshape(depth_map, (1, -1))
-
-        r = cam_extrinsic[:3, :3]
-        t = cam_extrinsic[:3, 3:4]
-        r_inv = np.linalg.inv(r)
-
-        world_points = np.matmul(r_inv, cam_points - t).transpose()
-        return world_points
+        rays = get_ray_grid(depth_map.shape[0], depth_map.shape[1], cam_intrinsic)
+        return depth_to_points(depth_map, rays, cam_extrinsic)
@@ -0,0 +1,200 @@
+#
+# Copyright 2025 Hillbot Inc.
+# Copyright 2020-2024 UCSD SU Lab
+# 
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Reusable CPU depth engine for active light sensors.
+#
+# Rectification maps, reprojection constants and registration matrices are
+# prepared once per sensor; frames from many sensors can be processed
+# concurrently (OpenCV and numpy release the GIL in their kernels).
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .depth_processor import (
+    calc_disparity,
+    depth_from_disparity,
+    depth_post_processing_fast,
+    init_rectify_stereo,
+)
+
+
+class DepthEngine:
+    def __init__(
+        self,
+        ir_size: Tuple[int, int],
+        main_size: Tuple[int, int],
+        k_ir: np.ndarray,
+        k_main: np.ndarray,
+        l2r: np.ndarray,
+        l2rgb: np.ndarray,
+        map1: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+        map2: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+        q: Optional[np.ndarray] = None,
+        method: str = 'SGBM',
+        ndisp: int = 128,
+        census_wsize: int = 7,
+        register_depth: bool = True,
+        register_blur_ksize: int = 5,
+        min_depth: float = 0.0,
+        max_depth: float = np.inf,
+    ):
+        """
+        :param ir_size: Resolution of the infrared cameras (width x height).
+        :param main_size: Resolution of the main (RGB) camera (width x height).
+        :param k_ir: Intrinsic matrix of the infrared cameras.
+        :param k_main: Intrinsic matrix of the main camera.
+        :param l2r: Change-of-coordinate matrix from left to right infrared camera (OpenCV).
+        :param l2rgb: Change-of-coordinate matrix from left infrared to main camera (OpenCV).
+        :param map1: Left rectification map from init_rectify_stereo; computed if None.
+        :param map2: Right rectification map from init_rectify_stereo; computed if None.
+        :param q: Perspective transformation matrix from init_rectify_stereo.
+        :param method: SGBM or BM
+        :param ndisp: max disparity
+        :param census_wsize: Census window size
+        :param register_depth: Whether to register depth into the main camera.
+        :param register_blur_ksize: Median blur applied after registration (0 disables).
+        :param min_depth: Depth below this value is set to 0.
+        :param max_depth: Depth above this value is set to 0.
+        """
+        if not np.allclose(l2r[:3, :3], np.eye(3), atol=1e-6):
+            raise RuntimeError("extrinsics contain rotation")
+        if not (np.sum(l2r[1:3, 3] ** 2) < 2e-4):
+            raise RuntimeError(f"extrinsics contain translation {l2r[:3, 3]}")
+
+        import cv2
+
+        if map1 is None or map2 is None or q is None:
+            map1, map2, q = init_rectify_stereo(
+                ir_size[0], ir_size[1], k_ir.astype(float), k_ir.astype(float), l2r.astype(float)
+            )
+        # fixed-point maps make every remap considerably cheaper
+        self._map1 = cv2.convertMaps(*map1, cv2.CV_16SC2)
+        self._map2 = cv2.convertMaps(*map2, cv2.CV_16SC2)
+        self._q = np.asarray(q, dtype=np.float64)
+
+        self.ir_size = tuple(ir_size)
+        self.main_size = tuple(main_size)
+        self._k_ir = np.asarray(k_ir, dtype=np.float64)
+        self._k_main = np.asarray(k_main, dtype=np.float64)
+        self._l2rgb = np.asarray(l2rgb, dtype=np.float64)
+
+        self.method = method
+        self.ndisp = ndisp
+        self.census_wsize = census_wsize
+        self.register_depth = register_depth
+        self.register_blur_ksize = register_blur_ksize
+        self.min_depth = min_depth
+        self.max_depth = max_depth
+
+    @classmethod
+    def from_sensor(cls, sensor) -> "DepthEngine":
+        """
+        Create an engine reusing the rectification cached by an ActiveLightSensor.
+        """
+        return cls(
+            (sensor.ir_w, sensor.ir_h), (sensor.rgb_w, sensor.rgb_h),
+            sensor.ir_intrinsic, sensor.rgb_intrinsic,
+            sensor._l2r, sensor._l2rgb,
+            map1=sensor._map1, map2=sensor._map2, q=sensor._q,
+            min_depth=sensor.min_depth, max_depth=sensor.max_depth,
+        )
+
+    def compute(self, ir_l: np.ndarray, ir_r: np.ndarray) -> np.ndarray:
+        """
+        Calculate depth for the main camera from a left/right ir pair.
+
+        :param ir_l: left ir image (uint8)
+        :param ir_r: right ir image (uint8)
+        :return depth: calculated depth (float32)
+        """
+        assert ir_l.shape == ir_r.shape
+
+        import cv2
+        ir_l = cv2.remap(ir_l, *self._map1, cv2.INTER_LINEAR)
+        ir_r = cv2.remap(ir_r, *self._map2, cv2.INTER_LINEAR)
+
+        disp = calc_disparity(
+            ir_l, ir_r, self.method, ndisp=self.ndisp,
+            use_census=True, census_wsize=self.census_wsize
+        )
+
+        mask = disp >= 1
+        depth = depth_from_disparity(disp, self._q)
+        depth[~mask] = 0
+        depth = depth_post_processing_fast(depth)
+        depth[~mask] = 0
+        depth[depth < 0] = 0
+
+        if self.register_depth:
+            try:
+                depth = cv2.rgbd.registerDepth(
+                    self._k_ir, self._k_main, None, self._l2rgb, depth, self.main_size, depthDilation=True
+                )
+            except AttributeError:
+                raise Exception("opencv-contrib-python is required for the CPU depth sensor. Please install with `pip install opencv-contrib-python`")
+            depth[~np.isfinite(depth)] = 0
+            depth[depth < 0] = 0
+            if self.register_blur_ksize > 0:
+                depth = cv2.medianBlur(depth, self.register_blur_ksize)
+
+        depth[depth > self.max_depth] = 0
+        depth[depth < self.min_depth] = 0
+        return depth
+
+    def compute_batch(
+        self, ir_pairs: Sequence[Tuple[np.ndarray, np.ndarray]], max_workers: Optional[int] = None
+    ) -> List[np.ndarray]:
+        """
+        Calculate depth for many frames of this sensor concurrently.
+
+        :param ir_pairs: list of (left ir, right ir) images
+        :param max_workers: number of threads, defaults to the number of CPUs
+        :return: list of depth maps, in input order
+        """
+        return compute_depth_batch([self] * len(ir_pairs), ir_pairs, max_workers)
+
+
+def compute_depth_batch(
+    engines: Sequence[DepthEngine],
+    ir_pairs: Sequence[Tuple[np.ndarray, np.ndarray]],
+    max_workers: Optional[int] = None,
+) -> List[np.ndarray]:
+    """
+    Calculate depth for frames from many sensors concurrently.
+
+    OpenCV's global thread setting is left untouched, so its kernels may still
+    spawn their own threads inside each worker. Processes that mostly run
+    batches can call cv2.setNumThreads(1) once at startup to avoid
+    oversubscription.
+
+    :param engines: engine for each frame
+    :param ir_pairs: (left ir, right ir) images for each frame
+    :param max_workers: number of threads, defaults to the number of CPUs
+    :return: list of depth maps, in input order
+    """
+    assert len(engines) == len(ir_pairs)
+    if len(engines) == 0:
+        return []
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(engines))
+    if max_workers == 1:
+        return [e.compute(l, r) for e, (l, r) in zip(engines, ir_pairs)]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda args: args[0].compute(*args[1]), zip(engines, ir_pairs)))
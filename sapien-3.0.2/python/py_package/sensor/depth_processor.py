@@ -24,7 +24,7 @@
 #  2. `pip3 install opencv-contrib-python scipy open3d`
 # before using this package.
 
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -74,7 +74,7 @@ def sim_ir_noise(
         img = cv2.resize(img, (w, h), interpolation=cv2.INTER_CUBIC)
 
     rng = np.random.default_rng(seed)
-    img = img.astype(np.float)
+    img = img.astype(np.float64)
 
     # speckle noise
     img = img * rng.gamma(shape=speckle_shape, scale=speckle_scale, size=img.shape)
@@ -99,6 +99,26 @@ def depth_post_processing(depth: np.ndarray, ksize: int = 5) -> np.ndarray:
     return depth
 
 
+def depth_post_processing_fast(depth: np.ndarray, ksize: int = 5) -> np.ndarray:
+    """
+    Same result as depth_post_processing (median filter with zero padding),
+    using OpenCV's multithreaded median blur when the kernel size allows it.
+
+    :param depth: Depth map
+    :param ksize: Kernel size of the median filter
+    :return: Filtered depth map (float32)
+    """
+    if ksize not in (3, 5):
+        return depth_post_processing(depth, ksize)
+
+    import cv2
+    pad = ksize // 2
+    padded = cv2.copyMakeBorder(
+        depth.astype(np.float32, copy=False), pad, pad, pad, pad, cv2.BORDER_CONSTANT, value=0
+    )
+    return cv2.medianBlur(padded, ksize)[pad: -pad, pad: -pad]
+
+
 def get_census(img: np.ndarray, wsize:int = 7) -> np.ndarray:
     h, w = img.shape
     assert wsize % 2 == 1
@@ -110,7 +130,8 @@ def get_census(img: np.ndarray, wsize:int = 7) -> np.ndarray:
     offsets = [(u, v) for v in range(wsize) \
                for u in range(wsize) if not u == v == whalf]
 
-    for u, v in offsets:
+    # only the last 8 comparisons survive the shifts into uint8
+    for u, v in offsets[-8:]:
         census = (census << 1) \
                  | (img[v: v + h - 2 * whalf, u: u + w - 2 * whalf] >= center)
 
@@ -225,6 +246,21 @@ def calc_rectified_stereo_pair(
     return imgl_rect, imgr_rect
 
 
+def depth_from_disparity(disparity: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """
+    Depth channel of cv2.reprojectImageTo3D without building the full 3D image.
+
+    :param disparity: Disparity
+    :param q: Perspective transformation matrix
+    :return depth: Depth, 0 where the disparity is not reprojectable
+    """
+    w = q[3, 2] * disparity.astype(np.float32) + np.float32(q[3, 3])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        depth = np.float32(q[2, 3]) / w
+    depth[~np.isfinite(depth)] = 0
+    return depth
+
+
 def calc_depth_and_pointcloud(
     disparity: np.ndarray, mask: np.ndarray, q: np.ndarray,
     no_pointcloud: bool = False
@@ -239,11 +275,6 @@ def calc_depth_and_pointcloud(
     :return depth: Depth
     :return pointcloud: Pointcloud
     """
-    try:
-        import open3d as o3d
-    except ImportError:
-        raise Exception('open3d is required for CPU depth sensor. Please install with `pip3 install open3d`')
-
     import cv2
     _3d_image = cv2.reprojectImageTo3D(disparity, q)
     depth = _3d_image[..., 2]
@@ -251,19 +282,19 @@ def calc_depth_and_pointcloud(
     depth[np.isinf(depth)] = 0
     depth[np.isnan(depth)] = 0
 
-    depth = depth_post_processing(depth) * mask
+    depth = depth_post_processing_fast(depth) * mask
     _3d_image[..., 2] = depth
 
     if no_pointcloud:
         pointcloud = None
     else:
-        points = _3d_image.reshape(-1, 3)
-        valid_flag = mask.reshape(-1)
-        valid_points = []
-        for i, point in enumerate(points):
-            if valid_flag[i]:
-                valid_points.append(point)
-        valid_points = o3d.utility.Vector3dVector(np.array(valid_points))
+        try:
+            import open3d as o3d
+        except ImportError:
+            raise Exception('open3d is required for CPU depth sensor. Please install with `pip3 install open3d`')
+
+        valid_points = _3d_image.reshape(-1, 3)[mask.reshape(-1)].astype(np.float64)
+        valid_points = o3d.utility.Vector3dVector(valid_points)
         pointcloud = o3d.geometry.PointCloud(points=valid_points)
 
     return depth, pointcloud
@@ -331,8 +362,8 @@ def calc_main_depth_from_left_right_ir(
     if register_depth:
         try:
             depth = cv2.rgbd.registerDepth(
-                k_l.astype(np.float), k_main.astype(np.float),
-                None, l2rgb.astype(np.float), depth, (w, h), depthDilation=True)
+                k_l.astype(np.float64), k_main.astype(np.float64),
+                None, l2rgb.astype(np.float64), depth, (w, h), depthDilation=True)
         except AttributeError:
             raise Exception("opencv-contrib-python is required for the CPU depth sensor. Please install with `pip install opencv-contrib-python`")
         depth[np.isnan(depth)] = 0
@@ -342,3 +373,104 @@ def calc_main_depth_from_left_right_ir(
             depth = cv2.medianBlur(depth, register_blur_ksize)
 
     return depth
+
+
+def get_ray_grid(height: int, width: int, intrinsic: np.ndarray) -> np.ndarray:
+    """
+    Camera-space ray (z = 1) through the center of every pixel.
+
+    :param height: image height
+    :param width: image width
+    :param intrinsic: intrinsic matrix (OpenCV convention)
+    :return rays: (height * width, 3) float32, row-major pixel order
+    """
+    u, v = np.meshgrid(
+        np.arange(width, dtype=np.float64) + 0.5, np.arange(height, dtype=np.float64) + 0.5
+    )
+    pixels = np.stack([u, v, np.ones_like(u)], axis=-1).reshape(-1, 3)
+    return (pixels @ np.linalg.inv(intrinsic).T).astype(np.float32)
+
+
+def _camera_to_world(extrinsic: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Row-vector rotation and offset mapping camera points to world for a world->camera extrinsic."""
+    if extrinsic is None:
+        return np.eye(3, dtype=np.float32), np.zeros(3, dtype=np.float32)
+    r_inv = np.linalg.inv(extrinsic[:3, :3])
+    # world = r_inv @ (p - t)  <=>  world_row = p_row @ r_inv.T - r_inv @ t
+    return r_inv.T.astype(np.float32), (-r_inv @ extrinsic[:3, 3]).astype(np.float32)
+
+
+def depth_to_points(
+    depth: np.ndarray, rays: np.ndarray, extrinsic: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Lift a depth map to 3D points for every pixel.
+
+    :param depth: (H, W) depth map
+    :param rays: ray grid from get_ray_grid
+    :param extrinsic: world->camera matrix; points stay in camera frame if None
+    :return points: (H * W, 3) float32
+    """
+    rot, offset = _camera_to_world(extrinsic)
+    points = rays @ rot if extrinsic is not None else rays.copy()
+    points *= depth.reshape(-1, 1).astype(np.float32, copy=False)
+    points += offset
+    return points
+
+
+def voxel_downsample(points: np.ndarray, voxel_size: float) -> np.ndarray:
+    """
+    Replace all points falling into the same voxel by their centroid.
+
+    :param points: (N, 3) points
+    :param voxel_size: voxel edge length
+    :return: (M, 3) float32 points, M <= N
+    """
+    if len(points) == 0:
+        return points.astype(np.float32)
+    keys = np.floor(points / voxel_size).astype(np.int64)
+    _, inverse, counts = np.unique(keys, axis=0, return_inverse=True, return_counts=True)
+    inverse = inverse.reshape(-1)
+    out = np.empty((len(counts), 3), dtype=np.float32)
+    for i in range(3):
+        out[:, i] = np.bincount(inverse, weights=points[:, i], minlength=len(counts)) / counts
+    return out
+
+
+def depth_to_pointcloud_batch(
+    depths: Sequence[np.ndarray],
+    rays: Sequence[np.ndarray],
+    extrinsics: Optional[Sequence[Optional[np.ndarray]]] = None,
+    voxel_size: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Merge the valid (depth > 0) points of several depth maps into one point
+    cloud. Only valid pixels are lifted and they are written straight into
+    the output buffer.
+
+    :param depths: (H_i, W_i) depth maps
+    :param rays: ray grid of each camera (get_ray_grid)
+    :param extrinsics: world->camera matrix of each camera, None for camera frame
+    :param voxel_size: if given, voxel-downsample the merged cloud
+    :return points: (N, 3) float32
+    """
+    if extrinsics is None:
+        extrinsics = [None] * len(depths)
+    assert len(depths) == len(rays) == len(extrinsics)
+
+    valid = [np.flatnonzero(d.reshape(-1) > 0) for d in depths]
+    points = np.empty((sum(len(v) for v in valid), 3), dtype=np.float32)
+
+    begin = 0
+    for depth, ray, extrinsic, idx in zip(depths, rays, extrinsics, valid):
+        end = begin + len(idx)
+        rot, offset = _camera_to_world(extrinsic)
+        out = points[begin:end]
+        np.matmul(ray[idx], rot, out=out)
+        out *= depth.reshape(-1)[idx, None]
+        out += offset
+        begin = end
+
+    if voxel_size is not None:
+        points = voxel_downsample(points, voxel_size)
+    return points
@@ -14,14 +14,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from ..pysapien import Component, Pose, CudaArray
-from ..pysapien.simsense import DepthSensorEngine
+from ..pysapien import Component, Pose, CudaArray, Device
+from .simsense_cpu import CpuDepthSensorEngine
+
+try:
+    from ..pysapien.simsense import DepthSensorEngine
+except ImportError:
+    DepthSensorEngine = None
 
 import numpy as np
 
 from typing import Union
 
 
+def _cuda_available() -> bool:
+    if DepthSensorEngine is None:
+        return False
+    try:
+        Device("cuda")
+        return True
+    except RuntimeError:
+        return False
+
+
 class SimSenseComponent(Component):
     def __init__(
         self,
@@ -48,6 +63,7 @@ class SimSenseComponent(Component):
         lr_max_diff: int,
         median_filter_size: int,
         depth_dilation: bool,
+        engine: str = "auto",
     ):
         super().__init__()
 
@@ -133,6 +149,11 @@ class SimSenseComponent(Component):
         ):
             raise TypeError("Median filter size choices are 1, 3, 5, 7")
 
+        if engine not in ("auto", "cuda", "cpu"):
+            raise ValueError('engine must be one of "auto", "cuda", "cpu"')
+        if engine == "cuda" and DepthSensorEngine is None:
+            raise RuntimeError("SAPIEN is not built with CUDA, use the CPU depth engine instead")
+
         self.rgb_resolution = rgb_resolution
         self.ir_resolution = ir_resolution
         self.rgb_intrinsic = rgb_intrinsic
@@ -156,6 +177,7 @@ class SimSenseComponent(Component):
         self.lr_max_diff = lr_max_diff
         self.median_filter_size = median_filter_size
         self.depth_dilation = depth_dilation
+        self.engine = engine
 
         self._default_speckle_shape = 1333.33
         self._default_gaussian_sigma = 0.25
@@ -214,7 +236,12 @@ class SimSenseComponent(Component):
         rgb_cx = rgb_intrinsic[0][2]
         rgb_cy = rgb_intrinsic[1][2]
 
-        self._engine = DepthSensorEngine(
+        if self.engine == "auto":
+            engine_class = DepthSensorEngine if _cuda_available() else CpuDepthSensorEngine
+        else:
+            engine_class = DepthSensorEngine if self.engine == "cuda" else CpuDepthSensorEngine
+
+        self._engine = engine_class(
             ir_size[1],
             ir_size[0],
             rgb_size[1],
@@ -260,6 +287,11 @@ class SimSenseComponent(Component):
     def on_remove_from_scene(self, scene):
         self._engine = None
 
+    @property
+    def is_cpu(self) -> bool:
+        """Whether depth is computed by the CPU engine (only known once added to scene)."""
+        return isinstance(self._engine, CpuDepthSensorEngine)
+
     def compute(
         self,
         left: Union[np.ndarray, CudaArray],
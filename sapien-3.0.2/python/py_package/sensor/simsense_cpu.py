@@ -0,0 +1,470 @@
+#
+# Copyright 2025 Hillbot Inc.
+# Copyright 2020-2024 UCSD SU Lab
+# 
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+CPU implementation of the SimSense depth pipeline.
+
+Mirrors simsense::DepthSensorEngine stage by stage (center-symmetric census,
+Hamming cost, box filter, 4-path semi-global aggregation, winner-takes-all
+with uniqueness test and sub-pixel interpolation, left-right check, median
+filter, registration) with the same parameters and output layout. Every stage
+is expressed as numpy operations over whole rows or columns of the cost volume
+and split into bands that run on a shared thread pool.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+_POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+_pool = None
+_pool_lock = threading.Lock()
+_local = threading.local()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1, thread_name_prefix="simsense_cpu"
+            )
+        return _pool
+
+
+def _parallel_bands(count: int, func: Callable[[int, int], None], num_threads: int):
+    """Call func(begin, end) on contiguous bands covering range(count)."""
+    bands = max(1, min(num_threads, count))
+    bounds = [count * i // bands for i in range(bands + 1)]
+    # nested calls (e.g. from compute_depth_batch workers) run serially so a
+    # worker never blocks waiting on the pool it occupies
+    if bands == 1 or getattr(_local, "inside", False):
+        for i in range(bands):
+            func(bounds[i], bounds[i + 1])
+        return
+
+    def run(i):
+        _local.inside = True
+        try:
+            func(bounds[i], bounds[i + 1])
+        finally:
+            _local.inside = False
+
+    for f in [_get_pool().submit(run, i) for i in range(bands)]:
+        f.result()
+
+
+def _popcount32(x: np.ndarray) -> np.ndarray:
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(x)
+    x = np.ascontiguousarray(x)
+    return _POPCOUNT8[x.view(np.uint8).reshape(x.shape + (4,))].sum(axis=-1, dtype=np.uint8)
+
+
+def census_transform(img: np.ndarray, census_width: int, census_height: int) -> np.ndarray:
+    """
+    Center-symmetric census transform with zero padding.
+
+    :param img: uint8 image
+    :param census_width: odd window width
+    :param census_height: odd window height
+    :return: uint32 census bits, same bit layout as the CUDA kernel
+    """
+    rows, cols = img.shape
+    left = (census_width - 1) // 2
+    top = (census_height - 1) // 2
+    padded = np.zeros((rows + 2 * top, cols + 2 * left), dtype=np.uint8)
+    padded[top: top + rows, left: left + cols] = img
+
+    census = np.zeros((rows, cols), dtype=np.uint32)
+    bit = np.empty_like(census)
+    for i in range(top + 1):
+        for j in range(census_width // 2 if i == top else census_width):
+            a = padded[i: i + rows, j: j + cols]
+            b = padded[2 * top - i: 2 * top - i + rows, 2 * left - j: 2 * left - j + cols]
+            np.greater_equal(a, b, out=bit, casting="unsafe")
+            np.left_shift(bit, np.uint32(i * census_width + j), out=bit)
+            np.bitwise_or(census, bit, out=census)
+    return census
+
+
+def _box_sum(arr: np.ndarray, size: int, axis: int) -> np.ndarray:
+    """Box filter (sum) with replicated borders along one axis."""
+    half = size // 2
+    n = arr.shape[axis]
+    pad = [(0, 0)] * arr.ndim
+    pad[axis] = (half, half)
+    padded = np.pad(arr, pad, mode="edge")
+    window = [slice(None)] * arr.ndim
+    window[axis] = slice(0, n)
+    out = padded[tuple(window)].copy()
+    for k in range(1, size):
+        window[axis] = slice(k, k + n)
+        out += padded[tuple(window)]
+    return out
+
+
+def _aggregate_step(cost: np.ndarray, prev: np.ndarray, p1: int, p2: int) -> np.ndarray:
+    """One SGM path step for a batch of pixels. cost: (n, D) uint16, prev: (n, D) int32."""
+    prev_min = prev.min(axis=1, keepdims=True)
+    best = np.minimum(prev, prev_min + p2)
+    np.minimum(best[:, 1:], prev[:, :-1] + p1, out=best[:, 1:])
+    np.minimum(best[:, :-1], prev[:, 1:] + p1, out=best[:, :-1])
+    best -= prev_min
+    best += cost
+    return best
+
+
+def _aggregate_paths(cost: np.ndarray, total: np.ndarray, p1: int, p2: int, axis: int):
+    """Accumulate the forward and backward SGM paths along axis (0: rows, 1: cols) into total."""
+    n = cost.shape[axis]
+    for order in (range(n), range(n - 1, -1, -1)):
+        prev = None
+        for i in order:
+            c = cost[i] if axis == 0 else cost[:, i]
+            cur = c.astype(np.int32) if prev is None else _aggregate_step(c, prev, p1, p2)
+            if axis == 0:
+                total[i] += cur
+            else:
+                total[:, i] += cur
+            prev = cur
+
+
+class CpuDepthSensorEngine:
+    """
+    Drop-in CPU replacement for pysapien.simsense.DepthSensorEngine. Infrared
+    noise is drawn from numpy's generator, so noisy results are statistically
+    but not bitwise equal to the CUDA engine.
+    """
+
+    def __init__(
+        self,
+        rows: int, cols: int, rgb_rows: int, rgb_cols: int,
+        focal_len: float, baseline_len: float, min_depth: float, max_depth: float,
+        ir_noise_seed: int, speckle_shape: float, speckle_scale: float,
+        gaussian_mu: float, gaussian_sigma: float, rectified: bool,
+        census_width: int, census_height: int, max_disp: int,
+        block_width: int, block_height: int, p1: int, p2: int,
+        uniqueness_ratio: int, lr_max_diff: int, median_filter_size: int,
+        map_lx: np.ndarray, map_ly: np.ndarray, map_rx: np.ndarray, map_ry: np.ndarray,
+        a1: np.ndarray, a2: np.ndarray, a3: np.ndarray, b1: float, b2: float, b3: float,
+        depth_dilation: bool,
+        main_fx: float, main_fy: float, main_skew: float, main_cx: float, main_cy: float,
+        num_threads: int = 0,
+    ):
+        self.rows, self.cols = rows, cols
+        self.rgb_rows, self.rgb_cols = rgb_rows, rgb_cols
+        self.focal_len, self.baseline_len = focal_len, baseline_len
+        self.min_depth, self.max_depth = min_depth, max_depth
+        self.rectified = rectified
+        self.max_disp = max_disp
+        self.median_filter_size = median_filter_size
+        self.depth_dilation = depth_dilation
+        self.num_threads = num_threads or os.cpu_count() or 1
+
+        self.set_ir_noise_parameters(speckle_shape, speckle_scale, gaussian_mu, gaussian_sigma)
+        self.set_census_window_size(census_width, census_height)
+        self.set_matching_block_size(block_width, block_height)
+        self.set_penalties(p1, p2)
+        self.set_uniqueness_ratio(uniqueness_ratio)
+        self.set_lr_max_diff(lr_max_diff)
+
+        self._rng_l = np.random.default_rng(ir_noise_seed)
+        self._rng_r = np.random.default_rng(ir_noise_seed + 1)
+
+        # the CUDA remap snaps every source coordinate to the nearest pixel
+        # and clamps it into the image, so rectification is a pure gather
+        def gather_index(mapx, mapy):
+            ix = np.clip(np.floor(np.asarray(mapx) + 0.5), 0, cols - 1).astype(np.intp)
+            iy = np.clip(np.floor(np.asarray(mapy) + 0.5), 0, rows - 1).astype(np.intp)
+            return iy * cols + ix
+
+        self._remap_l = gather_index(map_lx, map_ly)
+        self._remap_r = gather_index(map_rx, map_ry)
+
+        self._a = [np.asarray(a, dtype=np.float32) for a in (a1, a2, a3)]
+        self._b = (np.float32(b1), np.float32(b2), np.float32(b3))
+
+        u, v = np.meshgrid(
+            np.arange(rgb_cols, dtype=np.float32), np.arange(rgb_rows, dtype=np.float32)
+        )
+        self._ray_x = (u - main_cx) / main_fx + main_skew * (main_cy - v) / (main_fx * main_fy)
+        self._ray_y = (v - main_cy) / main_fy
+
+        self._depth = None
+
+    # ---------------- parameters ----------------
+
+    def set_ir_noise_parameters(
+        self, speckle_shape: float, speckle_scale: float, gaussian_mu: float, gaussian_sigma: float
+    ):
+        self.speckle_shape = speckle_shape
+        self.speckle_scale = speckle_scale
+        self.gaussian_mu = gaussian_mu
+        self.gaussian_sigma = gaussian_sigma
+
+    def set_census_window_size(self, census_width: int, census_height: int):
+        self.census_width = census_width
+        self.census_height = census_height
+
+    def set_matching_block_size(self, block_width: int, block_height: int):
+        self.block_width = block_width
+        self.block_height = block_height
+
+    def set_penalties(self, p1: int, p2: int):
+        self.p1 = p1
+        self.p2 = p2
+
+    def set_uniqueness_ratio(self, uniqueness_ratio: int):
+        self.uniqueness_ratio = uniqueness_ratio
+
+    def set_lr_max_diff(self, lr_max_diff: int):
+        self.lr_max_diff = lr_max_diff
+
+    # ---------------- compute ----------------
+
+    def compute(
+        self,
+        left: np.ndarray,
+        right: np.ndarray,
+        bbox: bool = False,
+        bbox_start_x: int = 0,
+        bbox_start_y: int = 0,
+        bbox_width: int = 0,
+        bbox_height: int = 0,
+    ) -> None:
+        """
+        :param left: left infrared image, uint8 (H, W) or float RGBA picture (H, W, 4)
+        :param right: right infrared image, same format as left
+        """
+        left = self._to_uint8(left)
+        right = self._to_uint8(right)
+        if left.shape != right.shape:
+            raise RuntimeError("Both images must have the same size")
+        if left.shape != (self.rows, self.cols):
+            raise RuntimeError("Input image size different from initiated")
+        self._depth = None
+
+        if self.speckle_shape > 0:
+            left = self._ir_noise(left, self._rng_l)
+            right = self._ir_noise(right, self._rng_r)
+
+        if not self.rectified:
+            left = left.reshape(-1)[self._remap_l]
+            right = right.reshape(-1)[self._remap_r]
+
+        if bbox:
+            ys = slice(bbox_start_y, bbox_start_y + bbox_height)
+            xs = slice(bbox_start_x, bbox_start_x + bbox_width)
+            disp = np.zeros((self.rows, self.cols), dtype=np.float32)
+            disp[ys, xs] = self._compute_disparity(
+                np.ascontiguousarray(left[ys, xs]), np.ascontiguousarray(right[ys, xs])
+            )
+        else:
+            disp = self._compute_disparity(left, right)
+
+        with np.errstate(divide="ignore"):
+            depth = np.where(
+                disp > 0, np.float32(self.focal_len * self.baseline_len) / disp, np.float32(0)
+            ).astype(np.float32)
+        self._depth = self._register(depth)
+
+    def _compute_disparity(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        rows, cols = left.shape
+        D = self.max_disp
+        nt = self.num_threads
+
+        census_l = census_transform(left, self.census_width, self.census_height)
+        census_r = census_transform(right, self.census_width, self.census_height)
+
+        # Hamming cost (+ horizontal box filter) per row band
+        cost = np.empty((rows, cols, D), dtype=np.uint16)
+
+        def cost_rows(y0, y1):
+            cl, cr = census_l[y0:y1], census_r[y0:y1]
+            # fill disparity-major so every write is contiguous, then
+            # transpose once into the (H, W, D) layout used by the scans
+            planes = np.empty((D, y1 - y0, cols), dtype=np.uint16)
+            for d in range(D):
+                k = min(d, cols)
+                planes[d, :, k:] = _popcount32(cl[:, k:] ^ cr[:, : cols - k])
+                planes[d, :, :k] = _popcount32(cl[:, :k] ^ cr[:, :1])
+            if self.block_width > 1:
+                planes = _box_sum(planes, self.block_width, axis=2)
+            cost[y0:y1] = planes.transpose(1, 2, 0)
+
+        _parallel_bands(rows, cost_rows, nt)
+
+        if self.block_height > 1:
+            def box_cols(x0, x1):
+                cost[:, x0:x1] = _box_sum(cost[:, x0:x1], self.block_height, axis=0)
+
+            _parallel_bands(cols, box_cols, nt)
+
+        # semi-global aggregation: left/right paths per row band, then
+        # top/bottom paths per column band
+        block = self.block_width * self.block_height
+        p1, p2 = self.p1 * block, self.p2 * block
+        total = np.zeros((rows, cols, D), dtype=np.int32)
+        _parallel_bands(
+            rows, lambda y0, y1: _aggregate_paths(cost[y0:y1], total[y0:y1], p1, p2, 1), nt
+        )
+        _parallel_bands(
+            cols, lambda x0, x1: _aggregate_paths(cost[:, x0:x1], total[:, x0:x1], p1, p2, 0), nt
+        )
+        del cost
+
+        # winner takes all, uniqueness, sub-pixel and left-right check per row band
+        disp = np.empty((rows, cols), dtype=np.float32)
+        _parallel_bands(
+            rows, lambda y0, y1: self._winner_takes_all(total[y0:y1], disp[y0:y1]), nt
+        )
+        del total
+
+        if self.median_filter_size > 1:
+            disp = self._median_filter(disp, self.median_filter_size)
+        return disp
+
+    def _winner_takes_all(self, total: np.ndarray, out: np.ndarray):
+        L = total // 4
+        rows, cols, D = L.shape
+
+        idx = L.argmin(axis=2)
+        min_aggr = np.take_along_axis(L, idx[..., None], axis=2)
+
+        # uniqueness: every cost outside the best match's neighbourhood must
+        # satisfy cost * (100 - ratio) >= best * 100, so only the extreme one
+        # (minimum, or maximum when the factor is negative) needs checking
+        factor = 100 - self.uniqueness_ratio
+        info = np.iinfo(np.int32)
+        others = L.copy()
+        for k in (-1, 0, 1):
+            np.put_along_axis(
+                others, np.clip(idx + k, 0, D - 1)[..., None], info.max if factor >= 0 else info.min, axis=2
+            )
+        extreme = others.min(axis=2) if factor >= 0 else others.max(axis=2)
+        del others
+        uniq = extreme.astype(np.int64) * factor >= min_aggr[..., 0].astype(np.int64) * 100
+
+        y0 = np.take_along_axis(L, np.maximum(idx - 1, 0)[..., None], axis=2)[..., 0]
+        y2 = np.take_along_axis(L, np.minimum(idx + 1, D - 1)[..., None], axis=2)[..., 0]
+        min_aggr = min_aggr[..., 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            offset = (y2 - y0) / (2.0 * (y0 - 2 * min_aggr + y2))
+        inner = (idx != 0) & (idx != D - 1)
+        disp = np.where(inner, idx - offset, idx).astype(np.float32)
+        disp[~uniq | ~np.isfinite(disp)] = -1
+
+        if self.lr_max_diff != 255:
+            # best left disparity for each right pixel x, i.e. argmin_d L[x + d, d]
+            best = np.full((rows, cols), np.iinfo(np.int32).max, dtype=np.int32)
+            right_disp = np.zeros((rows, cols), dtype=np.int64)
+            for k in range(min(D, cols)):
+                v = L[:, k:, k]
+                better = v < best[:, : cols - k]
+                best[:, : cols - k][better] = v[better]
+                right_disp[:, : cols - k][better] = k
+
+            ld = np.floor(disp + 0.5).astype(np.int64)
+            xr = np.arange(cols) - ld
+            valid = (ld >= 0) & (xr >= 0)
+            rd = np.take_along_axis(right_disp, np.clip(xr, 0, cols - 1), axis=1)
+            disp[~valid | (np.abs(ld - rd) > self.lr_max_diff)] = -1
+
+        out[:] = disp
+
+    def _median_filter(self, disp: np.ndarray, size: int) -> np.ndarray:
+        rows, cols = disp.shape
+        half = size // 2
+        out = disp.copy()
+        if rows < size or cols < size:
+            return out
+        windows = np.lib.stride_tricks.sliding_window_view(disp, (size, size))
+
+        def median_rows(y0, y1):
+            w = windows[y0:y1].reshape(y1 - y0, cols - 2 * half, size * size)
+            out[half + y0: half + y1, half: cols - half] = np.median(w, axis=2)
+
+        _parallel_bands(rows - 2 * half, median_rows, self.num_threads)
+        return out
+
+    def _register(self, depth: np.ndarray) -> np.ndarray:
+        a1, a2, a3 = self._a
+        b1, b2, b3 = self._b
+        z_rgb = a3 * depth + b3
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = np.floor((a1 * depth + b1) / z_rgb + 0.5)
+            y = np.floor((a2 * depth + b2) / z_rgb + 0.5)
+        valid = (z_rgb > 0) & (x >= 0) & (x < self.rgb_cols) & (y >= 0) & (y < self.rgb_rows)
+
+        rgb = np.full(self.rgb_rows * self.rgb_cols, self.max_depth, dtype=np.float32)
+        target = y[valid].astype(np.intp) * self.rgb_cols + x[valid].astype(np.intp)
+        np.minimum.at(rgb, target, z_rgb[valid])  # keep the closest surface
+        rgb = rgb.reshape(self.rgb_rows, self.rgb_cols)
+
+        if self.depth_dilation:
+            src = rgb.copy()
+            np.minimum(rgb[:, :-1], src[:, 1:], out=rgb[:, :-1])
+            np.minimum(rgb[:-1], src[1:], out=rgb[:-1])
+            np.minimum(rgb[:-1, :-1], src[1:, 1:], out=rgb[:-1, :-1])
+
+        rgb[(rgb < self.min_depth) | (rgb >= self.max_depth)] = 0
+        return rgb
+
+    def _ir_noise(self, img: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        noisy = img * rng.gamma(self.speckle_shape, self.speckle_scale, img.shape).astype(np.float32)
+        noisy += self.gaussian_mu + self.gaussian_sigma * rng.standard_normal(img.shape, dtype=np.float32)
+        return np.clip(np.floor(noisy + 0.5), 0, 255).astype(np.uint8)
+
+    @staticmethod
+    def _to_uint8(img: np.ndarray) -> np.ndarray:
+        img = np.asarray(img)
+        if img.dtype == np.uint8:
+            return np.ascontiguousarray(img)
+        if img.ndim == 3:
+            img = img[..., 0]
+        # same truncation as the CUDA float2uint8 kernel
+        return np.clip((img * 255).astype(np.int32), 0, 255).astype(np.uint8)
+
+    # ---------------- results ----------------
+
+    def _check_computed(self):
+        if self._depth is None:
+            raise RuntimeError("No computed data stored")
+
+    def get_ndarray(self) -> np.ndarray:
+        self._check_computed()
+        return self._depth
+
+    def get_point_cloud_ndarray(self) -> np.ndarray:
+        self._check_computed()
+        z = self._depth
+        return np.stack([z * self._ray_x, z * self._ray_y, z], axis=-1).reshape(-1, 3)
+
+    def get_rgb_point_cloud_ndarray(self, rgba: np.ndarray) -> np.ndarray:
+        self._check_computed()
+        rgb = np.asarray(rgba, dtype=np.float32)[..., :3].reshape(-1, 3)
+        return np.concatenate([self.get_point_cloud_ndarray(), rgb], axis=1)
+
+    def get_cuda(self, *args):
+        raise RuntimeError("CUDA output is not available from the CPU depth engine")
+
+    get_point_cloud_cuda = get_cuda
+    get_rgb_point_cloud_cuda = get_cuda
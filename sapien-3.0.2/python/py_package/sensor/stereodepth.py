@@ -201,6 +201,11 @@ class StereoDepthSensorConfig:
         can dilate the final depth map to avoid holes. Recommended to set as true if rgb_resolution
         is greater than ir_resolution."""
 
+        self.depth_engine = "auto"
+        """Stereo matching engine, one of "auto", "cuda", "cpu". "auto" uses CUDA when a CUDA
+        device exists and the multithreaded CPU engine otherwise. Both take the parameters above
+        and produce the same output layout."""
+
 
 class StereoDepthSensor:
     """
@@ -269,6 +274,7 @@ class StereoDepthSensor:
             config.lr_max_diff,
             config.median_filter_size,
             config.depth_dilation,
+            getattr(config, "depth_engine", "auto"),
         )
         self._mount.add_component(self._ss)
 
@@ -292,9 +298,13 @@ class StereoDepthSensor:
         scene.update_render()
 
     def compute_depth(self, bbox_start: tuple = None, bbox_size: tuple = None):
-        left_cuda = self._cam_ir_l.get_picture_cuda("Color")
-        right_cuda = self._cam_ir_r.get_picture_cuda("Color")
-        self._ss.compute(left_cuda, right_cuda, bbox_start, bbox_size)
+        if self._ss.is_cpu:
+            left = self._cam_ir_l.get_picture("Color")
+            right = self._cam_ir_r.get_picture("Color")
+        else:
+            left = self._cam_ir_l.get_picture_cuda("Color")
+            right = self._cam_ir_r.get_picture_cuda("Color")
+        self._ss.compute(left, right, bbox_start, bbox_size)
 
     def set_local_pose(self, pose: Pose):
         """
@@ -455,8 +465,11 @@ class StereoDepthSensor:
         Note: Returned point cloud is from RGB camera's with x rightward, y downward, z forward.
         """
         if with_rgb:
-            rgba_cuda = self.get_rgba_cuda()
-            pc = self._ss.get_rgb_point_cloud_ndarray(rgba_cuda)
+            if self._ss.is_cpu:
+                rgba = self._cam_rgb.get_picture("Color")
+            else:
+                rgba = self.get_rgba_cuda()
+            pc = self._ss.get_rgb_point_cloud_ndarray(rgba)
         else:
             pc = self._ss.get_point_cloud_ndarray()
 
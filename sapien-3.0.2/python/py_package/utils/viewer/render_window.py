@@ -17,7 +17,6 @@
 from pathlib import Path
 
 import numpy as np
-import pkg_resources
 import sapien
 from sapien import internal_renderer as R
 
@@ -156,9 +155,7 @@ class RenderOptionsWindow(Plugin):
         self.shader_types = []
 
         try:
-            all_shader_dir = Path(
-                pkg_resources.resource_filename("sapien", "vulkan_shader")
-            )
+            all_shader_dir = Path(sapien.__file__).parent / "vulkan_shader"
 
             for f in all_shader_dir.iterdir():
                 if f.is_dir():
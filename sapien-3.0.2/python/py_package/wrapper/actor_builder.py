@@ -15,6 +15,7 @@
 # limitations under the License.
 #
 from .. import pysapien as sapien
+from .. import render as _render  # noqa: F401, sets up Vulkan and shader paths
 from dataclasses import dataclass
 import numpy as np
 import typing
@@ -99,6 +100,18 @@ class VisualShapeRecord:
 Vec3 = Tuple
 
 
+class _MaterialHandles(list):
+    """PhysxMaterial objects of a body spec; pickled as an empty list (materials are not
+    picklable), so an unpickled spec falls back to the shape_materials coefficients."""
+
+    def __reduce__(self):
+        return (list, ())
+
+
+def _pose_to_array(pose: sapien.Pose):
+    return np.concatenate([pose.p, pose.q]).astype(np.float32)
+
+
 class ActorBuilder:
     def __init__(self):
         self.collision_records: List[CollisionShapeRecord] = []
@@ -178,69 +191,29 @@ class ActorBuilder:
         component.name = self.name
         return component
 
-    def build_physx_component(self, link_parent=None):
+    def build_physx_spec(self):
+        """
+        Describe the physx component of this builder as a plain dict of strings and
+        numpy arrays. Mesh files are preprocessed (and decomposed) here, so the spec can be
+        pickled and instantiated any number of times with sapien.physx.build_physx_component.
+        Built shapes share the builder's PhysxMaterial objects; pickling keeps only their
+        coefficients.
+        """
         for r in self.collision_records:
             assert isinstance(r.material, sapien.physx.PhysxMaterial)
 
-        if self.physx_body_type == "dynamic":
-            component = sapien.physx.PhysxRigidDynamicComponent()
-        elif self.physx_body_type == "kinematic":
-            component = sapien.physx.PhysxRigidDynamicComponent()
-            component.kinematic = True
-        elif self.physx_body_type == "static":
-            component = sapien.physx.PhysxRigidStaticComponent()
-        elif self.physx_body_type == "link":
-            component = sapien.physx.PhysxArticulationLinkComponent(link_parent)
-        else:
-            raise Exception(f"invalid physx body type [{self.physx_body_type}]")
-
+        types = []
+        filenames = []
+        shape_params = []
+        poses = []
+        materials = []
+        material_handles = _MaterialHandles()
+        physics = []
         for r in self.collision_records:
+            filename = ""
             try:
-                if r.type == "plane":
-                    shape = sapien.physx.PhysxCollisionShapePlane(
-                        material=r.material,
-                    )
-                    shapes = [shape]
-                elif r.type == "box":
-                    shape = sapien.physx.PhysxCollisionShapeBox(
-                        half_size=r.scale, material=r.material
-                    )
-                    shapes = [shape]
-                elif r.type == "capsule":
-                    shape = sapien.physx.PhysxCollisionShapeCapsule(
-                        radius=r.radius,
-                        half_length=r.length,
-                        material=r.material,
-                    )
-                    shapes = [shape]
-                elif r.type == "cylinder":
-                    shape = sapien.physx.PhysxCollisionShapeCylinder(
-                        radius=r.radius,
-                        half_length=r.length,
-                        material=r.material,
-                    )
-                    shapes = [shape]
-                elif r.type == "sphere":
-                    shape = sapien.physx.PhysxCollisionShapeSphere(
-                        radius=r.radius,
-                        material=r.material,
-                    )
-                    shapes = [shape]
-                elif r.type == "convex_mesh":
-                    shape = sapien.physx.PhysxCollisionShapeConvexMesh(
-                        filename=preprocess_mesh_file(r.filename),
-                        scale=r.scale,
-                        material=r.material,
-                    )
-                    shapes = [shape]
-                elif r.type == "nonconvex_mesh":
-                    shape = sapien.physx.PhysxCollisionShapeTriangleMesh(
-                        filename=preprocess_mesh_file(r.filename),
-                        scale=r.scale,
-                        material=r.material,
-                        sdf=self.physx_body_type in ["dynamic", "link"],
-                    )
-                    shapes = [shape]
+                if r.type in ["convex_mesh", "nonconvex_mesh"]:
+                    filename = preprocess_mesh_file(r.filename)
                 elif r.type == "multiple_convex_meshes":
                     if r.decomposition == "coacd":
                         params = r.decomposition_params
@@ -250,33 +223,41 @@ class ActorBuilder:
                         filename = do_coacd(preprocess_mesh_file(r.filename), **params)
                     else:
                         filename = preprocess_mesh_file(r.filename)
-
-                    shapes = sapien.physx.PhysxCollisionShapeConvexMesh.load_multiple(
-                        filename=filename,
-                        scale=r.scale,
-                        material=r.material,
-                    )
-                else:
-                    raise RuntimeError(f"invalid collision shape type [{r.type}]")
-            except RuntimeError as e:
-                # ignore runtime error (e.g., failed to cooke mesh)
+            except RuntimeError:
+                # ignore runtime error (e.g., failed to convert mesh)
                 continue
 
-            for shape in shapes:
-                shape.local_pose = r.pose
-                shape.set_collision_groups(self.collision_groups)
-                shape.set_density(r.density)
-                shape.set_patch_radius(r.patch_radius)
-                shape.set_min_patch_radius(r.min_patch_radius)
-                component.attach(shape)
+            m = r.material
+            types.append(r.type)
+            filenames.append(filename)
+            shape_params.append([*r.scale, r.radius, r.length])
+            poses.append(_pose_to_array(r.pose))
+            materials.append([m.static_friction, m.dynamic_friction, m.restitution])
+            material_handles.append(m)
+            physics.append([r.density, r.patch_radius, r.min_patch_radius])
 
+        mass = None
         if not self._auto_inertial and self.physx_body_type != "kinematic":
-            component.mass = self._mass
-            component.cmass_local_pose = self._cmass_local_pose
-            component.inertia = self._inertia
+            mass = self._mass
+
+        return {
+            "name": self.name,
+            "body_type": self.physx_body_type,
+            "collision_groups": list(self.collision_groups),
+            "shape_types": types,
+            "shape_filenames": filenames,
+            "shape_params": np.array(shape_params, dtype=np.float32).reshape(-1, 5),
+            "shape_poses": np.array(poses, dtype=np.float32).reshape(-1, 7),
+            "shape_materials": np.array(materials, dtype=np.float32).reshape(-1, 3),
+            "shape_material_handles": material_handles,
+            "shape_physics": np.array(physics, dtype=np.float32).reshape(-1, 3),
+            "mass": mass,
+            "cmass_local_pose": _pose_to_array(self._cmass_local_pose),
+            "inertia": np.array(self._inertia, dtype=np.float32),
+        }
 
-        component.name = self.name
-        return component
+    def build_physx_component(self, link_parent=None):
+        return sapien.physx.build_physx_component(self.build_physx_spec(), link_parent)
 
     def build_entity(self):
         entity = sapien.Entity()
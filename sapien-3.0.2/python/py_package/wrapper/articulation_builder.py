@@ -14,7 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from .actor_builder import ActorBuilder
+from .actor_builder import ActorBuilder, _pose_to_array
 from .. import pysapien as sapien
 import numpy as np
 from dataclasses import dataclass
@@ -64,6 +64,20 @@ class LinkBuilder(ActorBuilder):
             name=self.joint_record.name,
         )
 
+    def build_physx_spec(self):
+        spec = super().build_physx_spec()
+        j = self.joint_record
+        spec.update(
+            parent=self.parent.index if self.parent else -1,
+            joint_name=j.name,
+            joint_type=j.joint_type,
+            joint_limits=np.array(j.limits, dtype=np.float32).reshape(-1, 2),
+            joint_pose_in_parent=_pose_to_array(j.pose_in_parent),
+            joint_pose_in_child=_pose_to_array(j.pose_in_child),
+            joint_damping=j.damping,
+        )
+        return spec
+
     def _check(self):
         if self.parent is None:
             assert self.joint_record.joint_type in ["fixed", "undefined"]
@@ -99,46 +113,29 @@ class ArticulationBuilder:
 
         return builder
 
-    def build_entities(self, fix_root_link=None):
-        entities = []
+    def build_spec(self, fix_root_link=None):
+        """
+        Describe the physx part of the articulation as a plain dict, see
+        ActorBuilder.build_physx_spec. The spec can be reused across scenes with
+        sapien.physx.build_articulation_entities.
+        """
         links = []
         for b in self.link_builders:
             b._check()
             b.physx_body_type = "link"
+            links.append(b.build_physx_spec())
 
-            entity = sapien.Entity()
-
-            link_component = b.build_physx_component(
-                links[b.parent.index] if b.parent else None
-            )
+        if fix_root_link is not None:
+            links[0]["joint_type"] = "fixed" if fix_root_link else "undefined"
+        return {"links": links, "initial_pose": _pose_to_array(self.initial_pose)}
 
-            entity.add_component(link_component)
+    def build_entities(self, fix_root_link=None):
+        entities = sapien.physx.build_articulation_entities(
+            self.build_spec(fix_root_link=fix_root_link)
+        )
+        for b, entity in zip(self.link_builders, entities):
             if b.visual_records:
                 entity.add_component(b.build_render_component())
-            entity.name = b.name
-
-            link_component.name = b.name
-            link_component.joint.name = b.joint_record.name
-            link_component.joint.type = b.joint_record.joint_type
-            link_component.joint.pose_in_child = b.joint_record.pose_in_child
-            link_component.joint.pose_in_parent = b.joint_record.pose_in_parent
-
-            if link_component.joint.type in [
-                "revolute",
-                "prismatic",
-                "revolute_unwrapped",
-            ]:
-                link_component.joint.limit = np.array(b.joint_record.limits).flatten()
-                link_component.joint.set_drive_property(0, b.joint_record.damping)
-
-            links.append(link_component)
-            entities.append(entity)
-
-        if fix_root_link is not None:
-            entities[0].components[0].joint.type = (
-                "fixed" if fix_root_link else "undefined"
-            )
-        entities[0].pose = self.initial_pose
         return entities
 
     def build(
@@ -188,6 +185,5 @@ class ArticulationBuilder:
                         stiffness=1e5,
                     )
 
-        for l in links:
-            self.scene.add_entity(l)
+        self.scene.add_entities(links)
         return articulation
@@ -16,7 +16,7 @@
 #
 from ..pysapien.physx import PhysxSystem, PhysxGpuSystem, PhysxCpuSystem, PhysxMaterial
 from .. import pysapien as sapien
-from ..pysapien.render import RenderSystem
+from ..render import RenderSystem
 from warnings import warn
 from .scene import Scene
 from ..pysapien.physx import PhysxSceneConfig as SceneConfig
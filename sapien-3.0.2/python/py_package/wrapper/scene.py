@@ -37,9 +37,9 @@ class Widget:
 class Scene(_Scene):
     def __init__(self, systems=None):
         if systems is None:
-            super().__init__(
-                [sapien.physx.PhysxCpuSystem(), sapien.render.RenderSystem()]
-            )
+            from .. import render  # sets up Vulkan and shader paths on first use
+
+            super().__init__([sapien.physx.PhysxCpuSystem(), render.RenderSystem()])
         else:
             super().__init__(systems)
 
@@ -87,8 +87,7 @@ class Scene(_Scene):
 
     def remove_articulation(self, articulation):
         entities = [l.entity for l in articulation.links]
-        for e in entities:
-            self.remove_entity(e)
+        self.remove_entities(entities)
 
     # TODO: find actor by id
     def add_camera(
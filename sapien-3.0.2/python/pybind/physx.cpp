@@ -148,6 +148,137 @@ template <> struct type_caster<PhysxDriveComponent::DriveMode> {
   }
 };
 
+template <> struct type_caster<ContactReportMode> {
+  PYBIND11_TYPE_CASTER(ContactReportMode, _("typing.Literal['off', 'flagged', 'full']"));
+
+  bool load(py::handle src, bool convert) {
+    std::string name = py::cast<std::string>(src);
+    if (name == "off") {
+      value = ContactReportMode::eOFF;
+      return true;
+    } else if (name == "flagged") {
+      value = ContactReportMode::eFLAGGED;
+      return true;
+    } else if (name == "full") {
+      value = ContactReportMode::eFULL;
+      return true;
+    }
+    return false;
+  }
+
+  static py::handle cast(ContactReportMode src, py::return_value_policy policy,
+                         py::handle parent) {
+    switch (src) {
+    case ContactReportMode::eOFF:
+      return py::str("off").release();
+    case ContactReportMode::eFLAGGED:
+      return py::str("flagged").release();
+    case ContactReportMode::eFULL:
+      return py::str("full").release();
+    }
+    throw std::runtime_error("invalid contact report mode");
+  }
+};
+
+template <> struct type_caster<BroadPhaseType> {
+  PYBIND11_TYPE_CASTER(BroadPhaseType, _("typing.Literal['sap', 'mbp', 'abp', 'pabp']"));
+
+  bool load(py::handle src, bool convert) {
+    std::string name = py::cast<std::string>(src);
+    if (name == "sap") {
+      value = BroadPhaseType::eSAP;
+      return true;
+    } else if (name == "mbp") {
+      value = BroadPhaseType::eMBP;
+      return true;
+    } else if (name == "abp") {
+      value = BroadPhaseType::eABP;
+      return true;
+    } else if (name == "pabp") {
+      value = BroadPhaseType::ePABP;
+      return true;
+    }
+    return false;
+  }
+
+  static py::handle cast(BroadPhaseType src, py::return_value_policy policy, py::handle parent) {
+    switch (src) {
+    case BroadPhaseType::eSAP:
+      return py::str("sap").release();
+    case BroadPhaseType::eMBP:
+      return py::str("mbp").release();
+    case BroadPhaseType::eABP:
+      return py::str("abp").release();
+    case BroadPhaseType::ePABP:
+      return py::str("pabp").release();
+    }
+    throw std::runtime_error("invalid broad phase type");
+  }
+};
+
+template <> struct type_caster<SceneQueryUpdateMode> {
+  PYBIND11_TYPE_CASTER(SceneQueryUpdateMode, _("typing.Literal['commit', 'build', 'disabled']"));
+
+  bool load(py::handle src, bool convert) {
+    std::string name = py::cast<std::string>(src);
+    if (name == "commit") {
+      value = SceneQueryUpdateMode::eCOMMIT;
+      return true;
+    } else if (name == "build") {
+      value = SceneQueryUpdateMode::eBUILD;
+      return true;
+    } else if (name == "disabled") {
+      value = SceneQueryUpdateMode::eDISABLED;
+      return true;
+    }
+    return false;
+  }
+
+  static py::handle cast(SceneQueryUpdateMode src, py::return_value_policy policy,
+                         py::handle parent) {
+    switch (src) {
+    case SceneQueryUpdateMode::eCOMMIT:
+      return py::str("commit").release();
+    case SceneQueryUpdateMode::eBUILD:
+      return py::str("build").release();
+    case SceneQueryUpdateMode::eDISABLED:
+      return py::str("disabled").release();
+    }
+    throw std::runtime_error("invalid scene query update mode");
+  }
+};
+
+template <> struct type_caster<SceneQueryPruner> {
+  PYBIND11_TYPE_CASTER(SceneQueryPruner, _("typing.Literal['aabb_tree', 'bvh', 'none']"));
+
+  bool load(py::handle src, bool convert) {
+    std::string name = py::cast<std::string>(src);
+    if (name == "aabb_tree") {
+      value = SceneQueryPruner::eAABB_TREE;
+      return true;
+    } else if (name == "bvh") {
+      value = SceneQueryPruner::eBVH;
+      return true;
+    } else if (name == "none") {
+      value = SceneQueryPruner::eNONE;
+      return true;
+    }
+    return false;
+  }
+
+  static py::handle cast(SceneQueryPruner src, py::return_value_policy policy, py::handle parent) {
+    switch (src) {
+    case SceneQueryPruner::eAABB_TREE:
+      return py::str("aabb_tree").release();
+    case SceneQueryPruner::eBVH:
+      return py::str("bvh").release();
+    case SceneQueryPruner::eNONE:
+      return py::str("none").release();
+    }
+    throw std::runtime_error("invalid scene query pruner");
+  }
+};
+
 template <> struct type_caster<::physx::PxForceMode::Enum> {
   PYBIND11_TYPE_CASTER(::physx::PxForceMode::Enum,
                        _("typing.Literal['force', 'acceleration', 'velocity_change', 'impulse']"));
@@ -188,6 +319,180 @@ template <> struct type_caster<::physx::PxForceMode::Enum> {
 
 } // namespace pybind11::detail
 
+using PySpecArray = py::array_t<float, py::array::c_style | py::array::forcecast>;
+
+static Pose PoseFromSpec(py::handle value) {
+  auto a = py::cast<PySpecArray>(value);
+  if (a.size() != 7) {
+    throw std::runtime_error("failed to parse body spec: a pose must have 7 values");
+  }
+  auto d = a.data();
+  return Pose({d[0], d[1], d[2]}, {d[3], d[4], d[5], d[6]});
+}
+
+static PySpecArray RowsFromSpec(py::dict const &spec, char const *key, py::ssize_t rows,
+                                py::ssize_t cols) {
+  auto a = py::cast<PySpecArray>(spec[key]);
+  if (a.size() != rows * cols) {
+    throw std::runtime_error(std::string("failed to parse body spec: [") + key +
+                             "] must have shape (" + std::to_string(rows) + ", " +
+                             std::to_string(cols) + ")");
+  }
+  return a;
+}
+
+static PhysxBodySpec BodySpecFromDict(py::dict const &spec) {
+  PhysxBodySpec result;
+  result.name = py::cast<std::string>(spec["name"]);
+  result.bodyType = py::cast<std::string>(spec["body_type"]);
+  result.collisionGroups = py::cast<std::array<uint32_t, 4>>(spec["collision_groups"]);
+
+  auto types = py::cast<std::vector<std::string>>(spec["shape_types"]);
+  auto filenames = py::cast<std::vector<std::string>>(spec["shape_filenames"]);
+  py::ssize_t n = types.size();
+  if (static_cast<py::ssize_t>(filenames.size()) != n) {
+    throw std::runtime_error("failed to parse body spec: shape_filenames size mismatch");
+  }
+  auto params = RowsFromSpec(spec, "shape_params", n, 5);
+  auto poses = RowsFromSpec(spec, "shape_poses", n, 7);
+  auto materials = RowsFromSpec(spec, "shape_materials", n, 3);
+  auto physics = RowsFromSpec(spec, "shape_physics", n, 3);
+
+  // builder materials; pickling drops them, so unpickled specs rebuild from coefficients
+  std::vector<std::shared_ptr<PhysxMaterial>> handles;
+  if (spec.contains("shape_material_handles")) {
+    for (auto h : py::cast<py::list>(spec["shape_material_handles"])) {
+      handles.push_back(h.is_none() ? nullptr : py::cast<std::shared_ptr<PhysxMaterial>>(h));
+    }
+    if (!handles.empty() && static_cast<py::ssize_t>(handles.size()) != n) {
+      throw std::runtime_error(
+          "failed to parse body spec: shape_material_handles size mismatch");
+    }
+  }
+
+  result.shapes.resize(n);
+  for (py::ssize_t i = 0; i < n; ++i) {
+    auto &shape = result.shapes[i];
+    auto p = params.data() + 5 * i;
+    auto q = poses.data() + 7 * i;
+    auto m = materials.data() + 3 * i;
+    auto f = physics.data() + 3 * i;
+    shape.type = types[i];
+    shape.filename = filenames[i];
+    shape.scale = {p[0], p[1], p[2]};
+    shape.radius = p[3];
+    shape.length = p[4];
+    shape.pose = Pose({q[0], q[1], q[2]}, {q[3], q[4], q[5], q[6]});
+    shape.material = {m[0], m[1], m[2]};
+    if (!handles.empty()) {
+      shape.materialHandle = handles[i];
+    }
+    shape.density = f[0];
+    shape.patchRadius = f[1];
+    shape.minPatchRadius = f[2];
+  }
+
+  if (!spec["mass"].is_none()) {
+    result.autoInertial = false;
+    result.mass = py::cast<float>(spec["mass"]);
+    result.cmassLocalPose = PoseFromSpec(spec["cmass_local_pose"]);
+    result.inertia = py::cast<Vec3>(spec["inertia"]);
+  }
+
+  if (result.bodyType == "link") {
+    result.parent = py::cast<int>(spec["parent"]);
+    result.joint.name = py::cast<std::string>(spec["joint_name"]);
+    result.joint.type = py::cast<::physx::PxArticulationJointType::Enum>(spec["joint_type"]);
+    auto limits = py::cast<PySpecArray>(spec["joint_limits"]);
+    if (limits.size() % 2 != 0) {
+      throw std::runtime_error("failed to parse body spec: joint_limits must have shape (n, 2)");
+    }
+    result.joint.limits =
+        Eigen::Map<Eigen::Matrix<float, Eigen::Dynamic, 2, Eigen::RowMajor> const>(
+            limits.data(), limits.size() / 2, 2);
+    result.joint.poseInParent = PoseFromSpec(spec["joint_pose_in_parent"]);
+    result.joint.poseInChild = PoseFromSpec(spec["joint_pose_in_child"]);
+    result.joint.damping = py::cast<float>(spec["joint_damping"]);
+  }
+  return result;
+}
+
+using PyQueryArray = py::array_t<float, py::array::c_style | py::array::forcecast>;
+
+static uint32_t CheckQueryArray(PyQueryArray const &array, py::ssize_t cols, char const *name,
+                                py::ssize_t rows = -1) {
+  if (array.ndim() != 2 || array.shape(1) != cols || (rows >= 0 && array.shape(0) != rows)) {
+    throw std::runtime_error(
+        std::string("failed to run batch query: ") + name + " must have shape (" +
+        (rows >= 0 ? std::to_string(rows) : std::string("N")) + ", " + std::to_string(cols) + ")");
+  }
+  return array.shape(0);
+}
+
+static float const *QueryRotations(std::optional<PyQueryArray> const &rotations, uint32_t count) {
+  if (!rotations) {
+    return nullptr;
+  }
+  CheckQueryArray(*rotations, 4, "rotations", count);
+  return rotations->data();
+}
+
+static py::tuple PySweepBatch(PhysxSystemCpu &system, ::physx::PxGeometry const *geometry,
+                              PyQueryArray const &positions, PyQueryArray const &directions,
+                              float distance, std::optional<PyQueryArray> const &rotations) {
+  uint32_t count = CheckQueryArray(positions, 3, "positions");
+  CheckQueryArray(directions, 3, "directions", count);
+  float const *rot = QueryRotations(rotations, count);
+
+  py::array_t<float> outDistance(count);
+  py::array_t<float> outPosition({count, 3u});
+  py::array_t<float> outNormal({count, 3u});
+  py::array_t<int> outIndex(count);
+
+  std::vector<std::shared_ptr<PhysxRigidBaseComponent>> components;
+  {
+    py::gil_scoped_release release;
+    if (geometry) {
+      components = system.sweepBatch(*geometry, positions.data(), rot, directions.data(), distance,
+                                     count, outDistance.mutable_data(), outPosition.mutable_data(),
+                                     outNormal.mutable_data(), outIndex.mutable_data());
+    } else {
+      components = system.raycastBatch(positions.data(), directions.data(), distance, count,
+                                       outDistance.mutable_data(), outPosition.mutable_data(),
+                                       outNormal.mutable_data(), outIndex.mutable_data());
+    }
+  }
+  return py::make_tuple(outDistance, outPosition, outNormal, outIndex, components);
+}
+
+static py::tuple PyOverlapBatch(PhysxSystemCpu &system, ::physx::PxGeometry const &geometry,
+                                PyQueryArray const &positions,
+                                std::optional<PyQueryArray> const &rotations) {
+  uint32_t count = CheckQueryArray(positions, 3, "positions");
+  float const *rot = QueryRotations(rotations, count);
+
+  py::array_t<int> outIndex(count);
+  std::vector<std::shared_ptr<PhysxRigidBaseComponent>> components;
+  {
+    py::gil_scoped_release release;
+    components =
+        system.overlapBatch(geometry, positions.data(), rot, count, outIndex.mutable_data());
+  }
+  return py::make_tuple(outIndex, components);
+}
+
+using PyIndexArray = py::array_t<int, py::array::c_style | py::array::forcecast>;
+
+// numpy view of a host buffer owned by a CPU system, the view keeps the system alive
+static auto CpuBufferProperty(CpuArrayHandle (PhysxSystemCpu::*getter)()) {
+  return [getter](py::object self) {
+    CpuArrayHandle handle = (self.cast<PhysxSystemCpu &>().*getter)();
+    std::vector<py::ssize_t> shape(handle.shape.begin(), handle.shape.end());
+    std::vector<py::ssize_t> strides(handle.strides.begin(), handle.strides.end());
+    return py::array(py::dtype(handle.type), shape, strides, handle.ptr, self);
+  };
+}
+
 Generator<int> init_physx(py::module &sapien) {
   auto m = sapien.def_submodule("physx");
 
@@ -201,16 +506,25 @@ Generator<int> init_physx(py::module &sapien) {
       .def_readwrite("enable_enhanced_determinism", &PhysxSceneConfig::enableEnhancedDeterminism)
       .def_readwrite("enable_friction_every_iteration",
                      &PhysxSceneConfig::enableFrictionEveryIteration)
+      .def_readwrite("broad_phase", &PhysxSceneConfig::broadPhaseType)
+      .def_readwrite("mbp_world_lower", &PhysxSceneConfig::mbpWorldLower)
+      .def_readwrite("mbp_world_upper", &PhysxSceneConfig::mbpWorldUpper)
+      .def_readwrite("mbp_subdivisions", &PhysxSceneConfig::mbpSubdivisions)
+      .def_readwrite("scene_query_update_mode", &PhysxSceneConfig::sceneQueryUpdateMode)
+      .def_readwrite("scene_query_pruner", &PhysxSceneConfig::sceneQueryPruner)
       .def("__repr__", [](PhysxSceneConfig &) { return "PhysxSceneConfig()"; })
       .def(py::pickle(
           [](PhysxSceneConfig &config) {
-            return py::make_tuple(config.gravity, config.bounceThreshold, config.enablePCM,
-                                  config.enableTGS, config.enableCCD,
-                                  config.enableEnhancedDeterminism,
-                                  config.enableFrictionEveryIteration);
+            return py::make_tuple(
+                config.gravity, config.bounceThreshold, config.enablePCM, config.enableTGS,
+                config.enableCCD, config.enableEnhancedDeterminism,
+                config.enableFrictionEveryIteration, config.broadPhaseType, config.mbpWorldLower,
+                config.mbpWorldUpper, config.mbpSubdivisions, config.sceneQueryUpdateMode,
+                config.sceneQueryPruner);
           },
           [](py::tuple t) {
-            if (t.size() != 7) {
+            // 7 entries: state pickled before the broad phase and scene query fields existed
+            if (t.size() != 7 && t.size() != 13) {
               throw std::runtime_error("Invalid state!");
             }
             PhysxSceneConfig config;
@@ -223,6 +537,14 @@ Generator<int> init_physx(py::module &sapien) {
                 t[5].cast<decltype(config.enableEnhancedDeterminism)>();
             config.enableFrictionEveryIteration =
                 t[6].cast<decltype(config.enableFrictionEveryIteration)>();
+            if (t.size() == 13) {
+              config.broadPhaseType = t[7].cast<decltype(config.broadPhaseType)>();
+              config.mbpWorldLower = t[8].cast<decltype(config.mbpWorldLower)>();
+              config.mbpWorldUpper = t[9].cast<decltype(config.mbpWorldUpper)>();
+              config.mbpSubdivisions = t[10].cast<decltype(config.mbpSubdivisions)>();
+              config.sceneQueryUpdateMode = t[11].cast<decltype(config.sceneQueryUpdateMode)>();
+              config.sceneQueryPruner = t[12].cast<decltype(config.sceneQueryPruner)>();
+            }
             return config;
           }));
 
@@ -301,6 +623,7 @@ Generator<int> init_physx(py::module &sapien) {
 
   auto PyPhysxSystem = py::classh<PhysxSystem, System>(m, "PhysxSystem");
   auto PyPhysxSystemCpu = py::classh<PhysxSystemCpu, PhysxSystem>(m, "PhysxCpuSystem");
+  auto PyPhysxSystemCpuGroup = py::classh<PhysxSystemCpuGroup>(m, "PhysxCpuSystemGroup");
 
   auto PyPhysxSystemGpu = py::classh<PhysxSystemGpu, PhysxSystem>(m, "PhysxGpuSystem");
 
@@ -416,16 +739,272 @@ Generator<int> init_physx(py::module &sapien) {
                              &PhysxSystem::getArticulationLinkComponents)
       .def("get_articulation_link_components", &PhysxSystem::getArticulationLinkComponents);
 
-  PyPhysxSystemCpu.def(py::init<>())
+  PyPhysxSystemCpu.def(py::init<bool>(), py::arg("shared_dispatcher") = false)
+      .def_property_readonly("shared_dispatcher", &PhysxSystemCpu::isUsingSharedDispatcher)
+      .def_property("dispatcher_priority", &PhysxSystemCpu::getDispatcherPriority,
+                    &PhysxSystemCpu::setDispatcherPriority)
+      .def("get_dispatcher_priority", &PhysxSystemCpu::getDispatcherPriority)
+      .def("set_dispatcher_priority", &PhysxSystemCpu::setDispatcherPriority, py::arg("priority"),
+           "tasks of systems with higher priority run first on the shared dispatcher")
+      .def("step", py::overload_cast<uint32_t, bool, bool>(&PhysxSystemCpu::step),
+           py::arg("n_substeps") = 1, py::arg("reapply_drives_and_forces") = false,
+           py::arg("accumulate_contacts") = false, py::call_guard<py::gil_scoped_release>(),
+           R"doc(
+Run n_substeps simulation steps natively with the GIL released. Poses are synced to entities
+once, after the last substep.
+
+Args:
+    n_substeps: number of simulation steps
+    reapply_drives_and_forces: apply the rigid dynamic force and torque, articulation qf and
+        drive target buffers applied (cpu_apply_*) since the last step again before every
+        substep, instead of only before the first one
+    accumulate_contacts: keep the contact points of every substep in get_contacts, so their
+        impulses sum over all substeps; pairs that separate during the substeps are kept too
+)doc")
+      .def("step_start", &PhysxSystemCpu::stepStart, py::call_guard<py::gil_scoped_release>(),
+           R"doc(
+Start a step on the PhysX CPU workers and return without waiting for it, so Python work can
+overlap the simulation. Bodies must not be read or written until step_finish. With 0 CPU
+workers the whole step runs inside this call.
+)doc")
+      .def("step_finish", &PhysxSystemCpu::stepFinish, py::call_guard<py::gil_scoped_release>(),
+           R"doc(Wait for the step started by step_start with the GIL released)doc")
+      .def_property_readonly("stepping", &PhysxSystemCpu::isStepping)
+      .def("is_stepping", &PhysxSystemCpu::isStepping)
       .def("get_contacts", &PhysxSystemCpu::getContacts, py::return_value_policy::reference)
+      .def_property("contact_report_mode", &PhysxSystemCpu::getContactReportMode,
+                    &PhysxSystemCpu::setContactReportMode)
+      .def("get_contact_report_mode", &PhysxSystemCpu::getContactReportMode)
+      .def("set_contact_report_mode", &PhysxSystemCpu::setContactReportMode, py::arg("mode"),
+           R"doc(
+Choose which colliding pairs report contacts to get_contacts.
+
+Args:
+    mode: "full" reports every pair (default), "flagged" only pairs where a body has
+        report_contacts enabled, "off" reports nothing and drops stored contacts
+)doc")
+      .def("get_broad_phase_regions", &PhysxSystemCpu::getBroadPhaseRegions,
+           R"doc(
+Active MBP regions as (lower, upper) pairs, empty unless the broad phase is "mbp". Regions tile
+mbp_world_lower/upper of the scene config, or the bounds of all actors when those are empty;
+in that case they are rebuilt on step once an object leaves every region.
+)doc")
+      .def("update_scene_queries", &PhysxSystemCpu::updateSceneQueries,
+           R"doc(
+Rebuild the structures used by raycast, sweep and overlap queries now. With
+scene_query_update_mode "disabled" queries do this on demand after a step or an added or
+removed body; call it after moving bodies by hand.
+)doc")
       .def("raycast", &PhysxSystemCpu::raycast, py::arg("position"), py::arg("direction"),
            py::arg("distance"),
            R"doc(Casts a ray and returns the closest hit. Returns None if no hit)doc")
+      .def(
+          "raycast_batch",
+          [](PhysxSystemCpu &s, PyQueryArray const &positions, PyQueryArray const &directions,
+             float distance) {
+            return PySweepBatch(s, nullptr, positions, directions, distance, std::nullopt);
+          },
+          py::arg("positions"), py::arg("directions"), py::arg("distance"),
+          R"doc(
+Casts N rays in parallel with the GIL released.
+
+Args:
+    positions: (N, 3) ray origins
+    directions: (N, 3) ray directions, normalized internally
+    distance: max distance of all rays
+
+Returns:
+    (distance, position, normal, component_index, components) where distance is (N,) and inf
+    for misses, position and normal are (N, 3), component_index is (N,) int32 indexing into
+    the components list and -1 for misses.
+)doc")
+      .def(
+          "sweep_sphere_batch",
+          [](PhysxSystemCpu &s, PyQueryArray const &positions, PyQueryArray const &directions,
+             float distance, float radius) {
+            ::physx::PxSphereGeometry geometry(radius);
+            return PySweepBatch(s, &geometry, positions, directions, distance, std::nullopt);
+          },
+          py::arg("positions"), py::arg("directions"), py::arg("distance"), py::arg("radius"),
+          R"doc(Sweeps a sphere from N positions in parallel, returns the same outputs as raycast_batch)doc")
+      .def(
+          "sweep_box_batch",
+          [](PhysxSystemCpu &s, PyQueryArray const &positions, PyQueryArray const &directions,
+             float distance, Vec3 const &halfSize, std::optional<PyQueryArray> const &rotations) {
+            ::physx::PxBoxGeometry geometry(halfSize.x, halfSize.y, halfSize.z);
+            return PySweepBatch(s, &geometry, positions, directions, distance, rotations);
+          },
+          py::arg("positions"), py::arg("directions"), py::arg("distance"), py::arg("half_size"),
+          py::arg("rotations") = py::none(),
+          R"doc(Sweeps a box from N poses in parallel, returns the same outputs as raycast_batch. rotations are (N, 4) quaternions (wxyz))doc")
+      .def(
+          "sweep_capsule_batch",
+          [](PhysxSystemCpu &s, PyQueryArray const &positions, PyQueryArray const &directions,
+             float distance, float radius, float halfLength,
+             std::optional<PyQueryArray> const &rotations) {
+            ::physx::PxCapsuleGeometry geometry(radius, halfLength);
+            return PySweepBatch(s, &geometry, positions, directions, distance, rotations);
+          },
+          py::arg("positions"), py::arg("directions"), py::arg("distance"), py::arg("radius"),
+          py::arg("half_length"), py::arg("rotations") = py::none(),
+          R"doc(Sweeps an x-axis capsule from N poses in parallel, returns the same outputs as raycast_batch. rotations are (N, 4) quaternions (wxyz))doc")
+      .def(
+          "overlap_sphere_batch",
+          [](PhysxSystemCpu &s, PyQueryArray const &positions, float radius) {
+            return PyOverlapBatch(s, ::physx::PxSphereGeometry(radius), positions, std::nullopt);
+          },
+          py::arg("positions"), py::arg("radius"),
+          R"doc(
+Tests spheres at N positions for overlaps in parallel with the GIL released.
+
+Returns:
+    (component_index, components) where component_index is (N,) int32 indexing into the
+    components list for any overlapping component and -1 if there is no overlap.
+)doc")
+      .def(
+          "overlap_box_batch",
+          [](PhysxSystemCpu &s, PyQueryArray const &positions, Vec3 const &halfSize,
+             std::optional<PyQueryArray> const &rotations) {
+            return PyOverlapBatch(s, ::physx::PxBoxGeometry(halfSize.x, halfSize.y, halfSize.z),
+                                  positions, rotations);
+          },
+          py::arg("positions"), py::arg("half_size"), py::arg("rotations") = py::none(),
+          R"doc(Tests boxes at N poses for overlaps in parallel, returns the same outputs as overlap_sphere_batch)doc")
+      .def(
+          "overlap_capsule_batch",
+          [](PhysxSystemCpu &s, PyQueryArray const &positions, float radius, float halfLength,
+             std::optional<PyQueryArray> const &rotations) {
+            return PyOverlapBatch(s, ::physx::PxCapsuleGeometry(radius, halfLength), positions,
+                                  rotations);
+          },
+          py::arg("positions"), py::arg("radius"), py::arg("half_length"),
+          py::arg("rotations") = py::none(),
+          R"doc(Tests x-axis capsules at N poses for overlaps in parallel, returns the same outputs as overlap_sphere_batch)doc")
+
+      .def("cpu_init", &PhysxSystemCpu::cpuInit, R"doc(
+Allocate NumPy buffers with the same layout as the PhysxGpuSystem CUDA buffers and
+fill them with the current state. This function must be called each time when
+actors are added or removed from the scene, which also invalidates previously
+returned buffers. Rows of cpu_rigid_dynamic_data follow cpu_rigid_dynamic_components
+and link rows of articulation i start at len(cpu_rigid_dynamic_components) + i * max_link_count.
+)doc")
+      .def_property_readonly("cpu_rigid_dynamic_components",
+                             &PhysxSystemCpu::cpuGetRigidDynamicComponents)
+      .def_property_readonly("cpu_articulations", &PhysxSystemCpu::cpuGetArticulations)
+      .def_property_readonly("cpu_rigid_body_data",
+                             CpuBufferProperty(&PhysxSystemCpu::cpuGetRigidBodyHandle))
+      .def_property_readonly("cpu_rigid_dynamic_data",
+                             CpuBufferProperty(&PhysxSystemCpu::cpuGetRigidDynamicHandle))
+      .def_property_readonly("cpu_articulation_link_data",
+                             CpuBufferProperty(&PhysxSystemCpu::cpuGetArticulationLinkHandle))
+      .def_property_readonly("cpu_rigid_body_force",
+                             CpuBufferProperty(&PhysxSystemCpu::cpuGetRigidBodyForceHandle))
+      .def_property_readonly("cpu_rigid_dynamic_force",
+                             CpuBufferProperty(&PhysxSystemCpu::cpuGetRigidDynamicForceHandle))
+      .def_property_readonly("cpu_rigid_body_torque",
+                             CpuBufferProperty(&PhysxSystemCpu::cpuGetRigidBodyTorqueHandle))
+      .def_property_readonly("cpu_rigid_dynamic_torque",
+                             CpuBufferProperty(&PhysxSystemCpu::cpuGetRigidDynamicTorqueHandle))
+
+      .def("cpu_fetch_rigid_dynamic_data", &PhysxSystemCpu::cpuFetchRigidDynamicData)
+      .def("cpu_fetch_articulation_link_pose", &PhysxSystemCpu::cpuFetchArticulationLinkPose)
+      .def("cpu_fetch_articulation_link_velocity", &PhysxSystemCpu::cpuFetchArticulationLinkVel)
+
+      .def("cpu_apply_rigid_dynamic_data",
+           py::overload_cast<>(&PhysxSystemCpu::cpuApplyRigidDynamicData))
+      .def(
+          "cpu_apply_rigid_dynamic_data",
+          [](PhysxSystemCpu &s, PyIndexArray const &indices) {
+            s.cpuApplyRigidDynamicData(indices.data(), indices.size());
+          },
+          py::arg("indices"))
+      .def("cpu_apply_rigid_dynamic_force", &PhysxSystemCpu::cpuApplyRigidDynamicForce)
+      .def("cpu_apply_rigid_dynamic_torque", &PhysxSystemCpu::cpuApplyRigidDynamicTorque)
+
+      .def_property_readonly("cpu_articulation_qpos",
+                             CpuBufferProperty(&PhysxSystemCpu::cpuGetArticulationQposHandle))
+      .def_property_readonly("cpu_articulation_qvel",
+                             CpuBufferProperty(&PhysxSystemCpu::cpuGetArticulationQvelHandle))
+      .def_property_readonly("cpu_articulation_qacc",
+                             CpuBufferProperty(&PhysxSystemCpu::cpuGetArticulationQaccHandle))
+      .def_property_readonly("cpu_articulation_qf",
+                             CpuBufferProperty(&PhysxSystemCpu::cpuGetArticulationQfHandle))
+      .def_property_readonly(
+          "cpu_articulation_target_qpos",
+          CpuBufferProperty(&PhysxSystemCpu::cpuGetArticulationQTargetPosHandle))
+      .def_property_readonly(
+          "cpu_articulation_target_qvel",
+          CpuBufferProperty(&PhysxSystemCpu::cpuGetArticulationQTargetVelHandle))
+
+      .def("cpu_fetch_articulation_qpos", &PhysxSystemCpu::cpuFetchArticulationQpos)
+      .def("cpu_fetch_articulation_qvel", &PhysxSystemCpu::cpuFetchArticulationQvel)
+      .def("cpu_fetch_articulation_qacc", &PhysxSystemCpu::cpuFetchArticulationQacc)
+      .def("cpu_fetch_articulation_target_qpos", &PhysxSystemCpu::cpuFetchArticulationQTargetPos)
+      .def("cpu_fetch_articulation_target_qvel", &PhysxSystemCpu::cpuFetchArticulationQTargetVel)
+
+      .def("cpu_apply_articulation_qpos",
+           py::overload_cast<>(&PhysxSystemCpu::cpuApplyArticulationQpos))
+      .def(
+          "cpu_apply_articulation_qpos",
+          [](PhysxSystemCpu &s, PyIndexArray const &indices) {
+            s.cpuApplyArticulationQpos(indices.data(), indices.size());
+          },
+          py::arg("indices"))
+      .def("cpu_apply_articulation_qvel",
+           py::overload_cast<>(&PhysxSystemCpu::cpuApplyArticulationQvel))
+      .def(
+          "cpu_apply_articulation_qvel",
+          [](PhysxSystemCpu &s, PyIndexArray const &indices) {
+            s.cpuApplyArticulationQvel(indices.data(), indices.size());
+          },
+          py::arg("indices"))
+      .def("cpu_apply_articulation_qf",
+           py::overload_cast<>(&PhysxSystemCpu::cpuApplyArticulationQf))
+      .def(
+          "cpu_apply_articulation_qf",
+          [](PhysxSystemCpu &s, PyIndexArray const &indices) {
+            s.cpuApplyArticulationQf(indices.data(), indices.size());
+          },
+          py::arg("indices"))
+      .def("cpu_apply_articulation_target_position",
+           py::overload_cast<>(&PhysxSystemCpu::cpuApplyArticulationQTargetPos))
+      .def(
+          "cpu_apply_articulation_target_position",
+          [](PhysxSystemCpu &s, PyIndexArray const &indices) {
+            s.cpuApplyArticulationQTargetPos(indices.data(), indices.size());
+          },
+          py::arg("indices"))
+      .def("cpu_apply_articulation_target_velocity",
+           py::overload_cast<>(&PhysxSystemCpu::cpuApplyArticulationQTargetVel))
+      .def(
+          "cpu_apply_articulation_target_velocity",
+          [](PhysxSystemCpu &s, PyIndexArray const &indices) {
+            s.cpuApplyArticulationQTargetVel(indices.data(), indices.size());
+          },
+          py::arg("indices"))
+
       .def("pack", [](PhysxSystemCpu &s) { return py::bytes(s.packState()); })
       .def(
           "unpack", [](PhysxSystemCpu &s, py::bytes data) { s.unpackState(data); },
           py::arg("data"));
 
+  PyPhysxSystemCpuGroup
+      .def(py::init<uint32_t>(), py::arg("num_threads") = 0,
+           R"doc(
+Container stepping many independent PhysxCpuSystem in one call.
+
+Args:
+    num_threads: number of threads used to step systems, 0 means one thread per CPU core
+)doc")
+      .def("add_system", &PhysxSystemCpuGroup::addSystem, py::arg("system"))
+      .def("remove_system", &PhysxSystemCpuGroup::removeSystem, py::arg("system"))
+      .def_property_readonly("systems", &PhysxSystemCpuGroup::getSystems)
+      .def("get_systems", &PhysxSystemCpuGroup::getSystems)
+      .def_property_readonly("num_threads", &PhysxSystemCpuGroup::getThreadCount)
+      .def("get_num_threads", &PhysxSystemCpuGroup::getThreadCount)
+      .def("step", &PhysxSystemCpuGroup::step, py::call_guard<py::gil_scoped_release>(),
+           R"doc(Steps all systems in parallel with the GIL released)doc");
+
 #ifdef SAPIEN_CUDA
   PyPhysxSystemGpu
       .def(py::init([](std::string const &device) {
@@ -580,6 +1159,27 @@ Usage:
            "Warning: this function is super slow and for debug only. Download all poses from the "
            "GPU and copy to SAPIEN entities.")
 
+      .def(
+          "step",
+          py::overload_cast<uint32_t, bool, std::vector<PhysxGpuContactPairImpulseQuery *> const &,
+                            std::vector<PhysxGpuContactBodyImpulseQuery *> const &>(
+              &PhysxSystemGpu::step),
+          py::arg("n_substeps") = 1, py::arg("reapply_drives_and_forces") = false,
+          py::arg("contact_pair_queries") = std::vector<PhysxGpuContactPairImpulseQuery *>{},
+          py::arg("contact_body_queries") = std::vector<PhysxGpuContactBodyImpulseQuery *>{},
+          py::call_guard<py::gil_scoped_release>(),
+          R"doc(
+Run n_substeps simulation steps natively with the GIL released.
+
+Args:
+    n_substeps: number of simulation steps
+    reapply_drives_and_forces: apply the rigid dynamic force and torque, articulation qf and
+        drive target buffers applied (gpu_apply_*) since the last step again before every
+        substep, instead of only before the first one
+    contact_pair_queries: queries whose cuda_impulses are filled with contact impulses summed
+        over all substeps, as gpu_query_contact_pair_impulses does for a single step
+    contact_body_queries: same as contact_pair_queries for gpu_query_contact_body_impulses
+)doc")
       .def("step_start", &PhysxSystemGpu::stepStart)
       .def("step_finish", &PhysxSystemGpu::stepFinish);
 
@@ -734,6 +1334,10 @@ If after testing g2 and g3, the objects may collide, g0 and g1 come into play. g
 
       .def("compute_global_aabb_tight", &PhysxRigidBaseComponent::computeGlobalAABBTight)
       .def("get_global_aabb_fast", &PhysxRigidBaseComponent::getGlobalAABBFast)
+      .def_property("report_contacts", &PhysxRigidBaseComponent::getReportContacts,
+                    &PhysxRigidBaseComponent::setReportContacts)
+      .def("get_report_contacts", &PhysxRigidBaseComponent::getReportContacts)
+      .def("set_report_contacts", &PhysxRigidBaseComponent::setReportContacts, py::arg("enable"))
       .def_property_readonly("_physx_pointer", [](PhysxRigidBaseComponent const &c) {
         return reinterpret_cast<uintptr_t>(c.getPxActor());
       });
@@ -1222,6 +1826,32 @@ Example:
   ////////// global //////////
 
   m.def("clear_cache", MeshManager::Clear)
+      .def(
+          "build_physx_component",
+          [](py::dict spec, std::shared_ptr<PhysxArticulationLinkComponent> linkParent) {
+            return BuildPhysxComponent(BodySpecFromDict(spec), linkParent);
+          },
+          py::arg("spec"), py::arg("link_parent") = nullptr,
+          R"doc(
+Create a physx component from a body spec produced by ActorBuilder.build_physx_spec in a
+single call. The spec may be reused across scenes. Shapes keep the builder's
+PhysxMaterial objects; an unpickled spec creates one new material per distinct
+coefficient triple instead.
+)doc")
+      .def(
+          "build_articulation_entities",
+          [](py::dict spec) {
+            std::vector<PhysxBodySpec> links;
+            for (auto link : py::cast<py::list>(spec["links"])) {
+              links.push_back(BodySpecFromDict(py::cast<py::dict>(link)));
+            }
+            return BuildArticulationEntities(links, PoseFromSpec(spec["initial_pose"]));
+          },
+          py::arg("spec"),
+          R"doc(
+Create one entity per link from an articulation spec produced by
+ArticulationBuilder.build_spec. Render components are not included.
+)doc")
       .def("set_default_material", &PhysxDefault::SetDefaultMaterial, py::arg("static_friction"),
            py::arg("dynamic_friction"), py::arg("restitution"))
       .def("get_default_material", &PhysxDefault::GetDefaultMaterial)
@@ -1238,12 +1868,16 @@ Example:
            py::arg("collision_stack_size") = 64 * 64 * 1024)
 
       .def("set_scene_config",
-           py::overload_cast<Vec3, float, bool, bool, bool, bool, bool, uint32_t>(
+           py::overload_cast<Vec3, float, bool, bool, bool, bool, bool, uint32_t, BroadPhaseType,
+                             uint32_t, SceneQueryUpdateMode, SceneQueryPruner>(
                &PhysxDefault::setSceneConfig),
            py::arg("gravity") = Vec3{0, 0, -9.81}, py::arg("bounce_threshold") = 2.f,
            py::arg("enable_pcm") = true, py::arg("enable_tgs") = true,
            py::arg("enable_ccd") = false, py::arg("enable_enhanced_determinism") = false,
-           py::arg("enable_friction_every_iteration") = true, py::arg("cpu_workers") = 0)
+           py::arg("enable_friction_every_iteration") = true, py::arg("cpu_workers") = 0,
+           py::arg("broad_phase") = BroadPhaseType::ePABP, py::arg("mbp_subdivisions") = 4,
+           py::arg("scene_query_update_mode") = SceneQueryUpdateMode::eCOMMIT,
+           py::arg("scene_query_pruner") = SceneQueryPruner::eAABB_TREE)
       .def("set_scene_config",
            py::overload_cast<PhysxSceneConfig const &>(&PhysxDefault::setSceneConfig),
            py::arg("config"))
@@ -1281,6 +1915,25 @@ Example:
       .def("get_stage_profiler_last_frame_stage_ms", &getStageProfilerLastFrameStageMs)
       .def("get_stage_profiler_last_frame_zone_ms", &getStageProfilerLastFrameZoneMs)
 
+      .def("set_shared_cpu_dispatcher_config", &PhysxSharedDispatcher::Configure,
+           py::arg("worker_count"), py::arg("affinity") = std::vector<std::vector<uint32_t>>{},
+           R"doc(
+Size the process-wide worker pool used by PhysxCpuSystem(shared_dispatcher=True). It must be
+called before the first such system is created, otherwise the pool starts with one worker per
+hardware thread.
+
+Args:
+    worker_count: number of worker threads, 0 runs tasks on the stepping thread
+    affinity: optional list of CPU ids for each worker, worker i is pinned to affinity[i]
+)doc")
+      .def(
+          "get_shared_cpu_dispatcher_worker_count",
+          []() {
+            auto pool = PhysxSharedDispatcher::GetIfExists();
+            return pool ? static_cast<int>(pool->getWorkerCount()) : -1;
+          },
+          "number of shared dispatcher workers, -1 if the pool has not been created")
+
       .def("version", []() { return PhysxDefault::getPhysxVersion(); });
 
   ////////// end global //////////
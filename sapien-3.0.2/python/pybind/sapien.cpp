@@ -20,6 +20,7 @@
 #include "sapien/component.h"
 #include "sapien/device.h"
 #include "sapien/entity.h"
+#include "sapien/entity_pose_exporter.h"
 #include "sapien/logger.h"
 #include "sapien/math/math.h"
 #include "sapien/physx/physx_system.h"
@@ -95,6 +96,7 @@ Generator<int> init_sapien(py::module &m) {
   auto PyPose = py::classh<Pose>(m, "Pose");
   auto PyScene = py::classh<Scene>(m, "Scene");
   auto PyEntity = py::classh<Entity>(m, "Entity");
+  auto PyEntityPoseExporter = py::classh<EntityPoseExporter>(m, "EntityPoseExporter");
 
   auto PyComponent = py::classh<Component, PythonComponent>(m, "Component");
 
@@ -156,6 +158,8 @@ Generator<int> init_sapien(py::module &m) {
       .def("get_entities", &Scene::getEntities)
       .def("add_entity", &Scene::addEntity, py::arg("entity"))
       .def("remove_entity", &Scene::removeEntity, py::arg("entity"))
+      .def("add_entities", &Scene::addEntities, py::arg("entities"))
+      .def("remove_entities", &Scene::removeEntities, py::arg("entities"))
       .def("add_system", &Scene::addSystem, py::arg("system"))
       .def("get_system", &Scene::getSystem, py::arg("name"))
       .def_property_readonly("physx_system", &Scene::getPhysxSystem)
@@ -168,6 +172,51 @@ Generator<int> init_sapien(py::module &m) {
           py::arg("data"))
       .def("clear", &Scene::clear);
 
+  PyEntityPoseExporter
+      .def(py::init<std::vector<std::shared_ptr<Scene>> const &,
+                    std::vector<std::shared_ptr<Entity>> const &>(),
+           py::arg("scenes"), py::arg("entities") = std::vector<std::shared_ptr<Entity>>{},
+           R"doc(
+Export entity poses of many scenes into a single (N, 7) float32 array.
+
+Args:
+    scenes: scenes to export, rows are ordered by scene and then by entity id
+    entities: only export these entities (they must be in one of the scenes),
+        all entities are exported if empty
+)doc")
+      .def("update", &EntityPoseExporter::update,
+           "recollect entities after entities are added to or removed from the scenes")
+      .def_property_readonly("count", &EntityPoseExporter::getCount)
+      .def_property_readonly("entities", &EntityPoseExporter::getEntities)
+      .def_property_readonly("index_map", &EntityPoseExporter::getIndexMap,
+                             "(N, 2) array of (scene index, per-scene entity id) for each row")
+      .def(
+          "export_poses",
+          [](EntityPoseExporter &e, std::optional<py::array> out) {
+            py::ssize_t n = e.getCount();
+            if (!out) {
+              out = py::array_t<float>({n, py::ssize_t(7)});
+            }
+            if (!out->dtype().is(py::dtype::of<float>()) || out->ndim() != 2 ||
+                out->shape(0) != n || out->shape(1) != 7 || !(out->flags() & py::array::c_style) ||
+                !out->writeable()) {
+              throw std::runtime_error("failed to export poses: out must be a writable C "
+                                       "contiguous float32 array of shape (" +
+                                       std::to_string(n) + ", 7)");
+            }
+            float *data = static_cast<float *>(out->mutable_data());
+            {
+              py::gil_scoped_release release;
+              e.exportPoses(data);
+            }
+            return *out;
+          },
+          py::arg("out") = py::none(),
+          R"doc(
+Write [px, py, pz, qw, qx, qy, qz] of every exported entity into out (allocated if None)
+and return it.
+)doc");
+
   PyEntity.def(py::init<>())
       .def_property_readonly("per_scene_id", &Entity::getPerSceneId)
       .def("get_per_scene_id", &Entity::getPerSceneId)
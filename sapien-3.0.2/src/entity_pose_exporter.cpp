@@ -0,0 +1,99 @@
+/*
+ * Copyright 2025 Hillbot Inc.
+ * Copyright 2020-2024 UCSD SU Lab
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at:
+ * 
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#include "sapien/entity_pose_exporter.h"
+#include "sapien/entity.h"
+#include "sapien/scene.h"
+#include <algorithm>
+#include <unordered_map>
+
+namespace sapien {
+
+EntityPoseExporter::EntityPoseExporter(std::vector<std::shared_ptr<Scene>> const &scenes,
+                                       std::vector<std::shared_ptr<Entity>> const &entities)
+    : mScenes(scenes), mSubset(entities) {
+  for (auto &s : mScenes) {
+    if (!s) {
+      throw std::runtime_error("failed to create pose exporter: scene is null");
+    }
+  }
+  for (auto &e : mSubset) {
+    if (!e) {
+      throw std::runtime_error("failed to create pose exporter: entity is null");
+    }
+  }
+  update();
+}
+
+void EntityPoseExporter::update() {
+  struct Row {
+    int64_t scene;
+    int64_t id;
+    std::shared_ptr<Entity> entity;
+  };
+  std::vector<Row> rows;
+
+  if (mSubset.empty()) {
+    for (size_t i = 0; i < mScenes.size(); ++i) {
+      for (auto &e : mScenes[i]->getEntities()) {
+        rows.push_back({static_cast<int64_t>(i), static_cast<int64_t>(e->getPerSceneId()), e});
+      }
+    }
+  } else {
+    std::unordered_map<Scene *, int64_t> sceneIndex;
+    for (size_t i = 0; i < mScenes.size(); ++i) {
+      sceneIndex[mScenes[i].get()] = i;
+    }
+    for (auto &e : mSubset) {
+      auto scene = e->getScene();
+      auto it = sceneIndex.find(scene.get());
+      if (!scene || it == sceneIndex.end()) {
+        throw std::runtime_error(
+            "failed to update pose exporter: entity is not added to any of the scenes");
+      }
+      rows.push_back({it->second, static_cast<int64_t>(e->getPerSceneId()), e});
+    }
+  }
+
+  std::stable_sort(rows.begin(), rows.end(), [](Row const &a, Row const &b) {
+    return a.scene < b.scene || (a.scene == b.scene && a.id < b.id);
+  });
+
+  mEntities.clear();
+  mEntities.reserve(rows.size());
+  mIndexMap.resize(rows.size(), 2);
+  for (size_t i = 0; i < rows.size(); ++i) {
+    mEntities.push_back(rows[i].entity);
+    mIndexMap(i, 0) = rows[i].scene;
+    mIndexMap(i, 1) = rows[i].id;
+  }
+}
+
+void EntityPoseExporter::exportPoses(float *out) const {
+  for (auto &e : mEntities) {
+    Pose pose = e->getPose();
+    out[0] = pose.p.x;
+    out[1] = pose.p.y;
+    out[2] = pose.p.z;
+    out[3] = pose.q.w;
+    out[4] = pose.q.x;
+    out[5] = pose.q.y;
+    out[6] = pose.q.z;
+    out += 7;
+  }
+}
+
+} // namespace sapien
@@ -0,0 +1,198 @@
+/*
+ * Copyright 2025 Hillbot Inc.
+ * Copyright 2020-2024 UCSD SU Lab
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at:
+ * 
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#include "sapien/physx/body_spec.h"
+#include "sapien/entity.h"
+#include "sapien/physx/articulation_link_component.h"
+#include "sapien/physx/material.h"
+#include "sapien/physx/rigid_component.h"
+#include <map>
+
+namespace sapien {
+namespace physx {
+
+namespace {
+
+// shares one new PhysxMaterial between all shapes of a build that carry only coefficients,
+// never the global default material, so mutating one built material affects only that build
+class MaterialCache {
+public:
+  std::shared_ptr<PhysxMaterial> get(PhysxCollisionShapeSpec const &spec) {
+    if (spec.materialHandle) {
+      return spec.materialHandle;
+    }
+    auto &m = mMaterials[spec.material];
+    if (!m) {
+      m = std::make_shared<PhysxMaterial>(spec.material[0], spec.material[1], spec.material[2]);
+    }
+    return m;
+  }
+
+private:
+  std::map<std::array<float, 3>, std::shared_ptr<PhysxMaterial>> mMaterials;
+};
+
+std::vector<std::shared_ptr<PhysxCollisionShape>>
+createShapes(PhysxCollisionShapeSpec const &spec, std::string const &bodyType,
+             std::shared_ptr<PhysxMaterial> material) {
+  if (spec.type == "plane") {
+    return {std::make_shared<PhysxCollisionShapePlane>(material)};
+  }
+  if (spec.type == "box") {
+    return {std::make_shared<PhysxCollisionShapeBox>(spec.scale, material)};
+  }
+  if (spec.type == "capsule") {
+    return {std::make_shared<PhysxCollisionShapeCapsule>(spec.radius, spec.length, material)};
+  }
+  if (spec.type == "cylinder") {
+    return {std::make_shared<PhysxCollisionShapeCylinder>(spec.radius, spec.length, material)};
+  }
+  if (spec.type == "sphere") {
+    return {std::make_shared<PhysxCollisionShapeSphere>(spec.radius, material)};
+  }
+  if (spec.type == "convex_mesh") {
+    return {std::make_shared<PhysxCollisionShapeConvexMesh>(spec.filename, spec.scale, material)};
+  }
+  if (spec.type == "nonconvex_mesh") {
+    bool sdf = bodyType == "dynamic" || bodyType == "link";
+    return {std::make_shared<PhysxCollisionShapeTriangleMesh>(spec.filename, spec.scale,
+                                                              material, sdf)};
+  }
+  if (spec.type == "multiple_convex_meshes") {
+    std::vector<std::shared_ptr<PhysxCollisionShape>> shapes;
+    for (auto &s : PhysxCollisionShapeConvexMesh::LoadMultiple(spec.filename, spec.scale,
+                                                                material)) {
+      shapes.push_back(s);
+    }
+    return shapes;
+  }
+  throw std::runtime_error("invalid collision shape type [" + spec.type + "]");
+}
+
+std::shared_ptr<PhysxRigidBaseComponent>
+buildComponent(PhysxBodySpec const &spec,
+               std::shared_ptr<PhysxArticulationLinkComponent> linkParent,
+               MaterialCache &materials) {
+  std::shared_ptr<PhysxRigidBaseComponent> component;
+  if (spec.bodyType == "dynamic") {
+    component = std::make_shared<PhysxRigidDynamicComponent>();
+  } else if (spec.bodyType == "kinematic") {
+    auto body = std::make_shared<PhysxRigidDynamicComponent>();
+    body->setKinematic(true);
+    component = body;
+  } else if (spec.bodyType == "static") {
+    component = std::make_shared<PhysxRigidStaticComponent>();
+  } else if (spec.bodyType == "link") {
+    component = PhysxArticulationLinkComponent::Create(linkParent);
+  } else {
+    throw std::runtime_error("failed to build physx component: invalid physx body type [" +
+                             spec.bodyType + "]");
+  }
+
+  for (auto const &s : spec.shapes) {
+    std::vector<std::shared_ptr<PhysxCollisionShape>> shapes;
+    try {
+      shapes = createShapes(s, spec.bodyType, materials.get(s));
+    } catch (std::runtime_error const &) {
+      // ignore runtime error (e.g., failed to cook mesh)
+      continue;
+    }
+    for (auto &shape : shapes) {
+      shape->setLocalPose(s.pose);
+      shape->setCollisionGroups(spec.collisionGroups);
+      shape->setDensity(s.density);
+      shape->setTorsionalPatchRadius(s.patchRadius);
+      shape->setMinTorsionalPatchRadius(s.minPatchRadius);
+      component->attachCollision(shape);
+    }
+  }
+
+  if (!spec.autoInertial && spec.bodyType != "kinematic") {
+    if (auto body = std::dynamic_pointer_cast<PhysxRigidBodyComponent>(component)) {
+      body->setMass(spec.mass);
+      body->setCMassLocalPose(spec.cmassLocalPose);
+      body->setInertia(spec.inertia);
+    }
+  }
+
+  component->setName(spec.name);
+  return component;
+}
+
+} // namespace
+
+std::shared_ptr<PhysxRigidBaseComponent>
+BuildPhysxComponent(PhysxBodySpec const &spec,
+                    std::shared_ptr<PhysxArticulationLinkComponent> linkParent) {
+  MaterialCache materials;
+  return buildComponent(spec, linkParent, materials);
+}
+
+std::vector<std::shared_ptr<Entity>>
+BuildArticulationEntities(std::vector<PhysxBodySpec> const &links, Pose const &rootPose) {
+  if (links.empty()) {
+    throw std::runtime_error("failed to build articulation: no links");
+  }
+
+  MaterialCache materials;
+  std::vector<std::shared_ptr<Entity>> entities;
+  std::vector<std::shared_ptr<PhysxArticulationLinkComponent>> components;
+  entities.reserve(links.size());
+  components.reserve(links.size());
+
+  for (size_t i = 0; i < links.size(); ++i) {
+    auto const &spec = links[i];
+    if (spec.bodyType != "link") {
+      throw std::runtime_error("failed to build articulation: body type of link [" + spec.name +
+                               "] is not link");
+    }
+    if ((i == 0) != (spec.parent < 0) || spec.parent >= static_cast<int>(i)) {
+      throw std::runtime_error("failed to build articulation: invalid parent of link [" +
+                               spec.name + "]");
+    }
+    auto parent = spec.parent < 0 ? nullptr : components[spec.parent];
+    auto link = std::static_pointer_cast<PhysxArticulationLinkComponent>(
+        buildComponent(spec, parent, materials));
+
+    auto joint = link->getJoint();
+    joint->setName(spec.joint.name);
+    joint->setType(spec.joint.type);
+    joint->setAnchorPoseInChild(spec.joint.poseInChild);
+    joint->setAnchorPoseInParent(spec.joint.poseInParent);
+
+    auto type = joint->getType();
+    if (type == ::physx::PxArticulationJointType::eREVOLUTE ||
+        type == ::physx::PxArticulationJointType::eREVOLUTE_UNWRAPPED ||
+        type == ::physx::PxArticulationJointType::ePRISMATIC) {
+      joint->setLimit(spec.joint.limits);
+      joint->setDriveProperties(0.f, spec.joint.damping, PX_MAX_F32,
+                                ::physx::PxArticulationDriveType::eFORCE);
+    }
+
+    auto entity = std::make_shared<Entity>();
+    entity->addComponent(link);
+    entity->setName(spec.name);
+
+    components.push_back(link);
+    entities.push_back(entity);
+  }
+
+  entities[0]->setPose(rootPose);
+  return entities;
+}
+
+} // namespace physx
+} // namespace sapien
@@ -15,12 +15,17 @@
  * limitations under the License.
  */
 #pragma once
+#include "sapien/physx/simulation_callback.hpp"
 #include <PxFiltering.h>
 
 using namespace physx;
 namespace sapien {
 namespace physx {
 
+inline const PxPairFlags kContactReportPairFlags =
+    PxPairFlags(PxPairFlag::eNOTIFY_CONTACT_POINTS | PxPairFlag::eNOTIFY_TOUCH_PERSISTS |
+                PxPairFlag::eNOTIFY_TOUCH_FOUND | PxPairFlag::eNOTIFY_TOUCH_LOST);
+
 inline PxFilterFlags
 TypeAffinityIgnoreFilterShader(PxFilterObjectAttributes attributes0, PxFilterData filterData0,
                                PxFilterObjectAttributes attributes1, PxFilterData filterData1,
@@ -48,11 +53,20 @@ TypeAffinityIgnoreFilterShader(PxFilterObjectAttributes attributes0, PxFilterDat
 
   // Otherwise, apply MuJoCo's collision model to word0 and word1
   if ((filterData0.word0 & filterData1.word1) || (filterData1.word0 & filterData0.word1)) {
-    pairFlags = PxPairFlag::eCONTACT_DEFAULT | PxPairFlag::eNOTIFY_CONTACT_POINTS |
-                PxPairFlag::eNOTIFY_TOUCH_PERSISTS | PxPairFlag::eNOTIFY_TOUCH_FOUND |
-                PxPairFlag::eNOTIFY_TOUCH_LOST | PxPairFlag::ePRE_SOLVER_VELOCITY |
-                PxPairFlag::ePOST_SOLVER_VELOCITY | PxPairFlag::eDETECT_CCD_CONTACT;
+    pairFlags = PxPairFlag::eCONTACT_DEFAULT | PxPairFlag::eDETECT_CCD_CONTACT;
 
+    // constantBlock holds the ContactReportFilterData of the scene
+    auto mode = ContactReportMode::eFULL;
+    if (constantBlockSize == sizeof(ContactReportFilterData)) {
+      mode = static_cast<ContactReportMode>(
+          static_cast<ContactReportFilterData const *>(constantBlock)->mode);
+    }
+    if (mode == ContactReportMode::eFULL) {
+      pairFlags |= kContactReportPairFlags;
+    } else if (mode == ContactReportMode::eFLAGGED) {
+      // let ContactReportFilterCallback look at the bodies
+      return PxFilterFlag::eCALLBACK;
+    }
     return PxFilterFlag::eDEFAULT;
   }
   return PxFilterFlag::eKILL;
@@ -74,7 +74,10 @@ void PhysxDefault::setGpuMemoryConfig(uint32_t tempBufferCapacity, uint32_t maxR
 
 void PhysxDefault::setSceneConfig(Vec3 gravity, float bounceThreshold, bool enablePCM,
                                   bool enableTGS, bool enableCCD, bool enableEnhancedDeterminism,
-                                  bool enableFrictionEveryIteration, uint32_t cpuWorkers) {
+                                  bool enableFrictionEveryIteration, uint32_t cpuWorkers,
+                                  BroadPhaseType broadPhaseType, uint32_t mbpSubdivisions,
+                                  SceneQueryUpdateMode sceneQueryUpdateMode,
+                                  SceneQueryPruner sceneQueryPruner) {
   gSceneConfig.gravity = gravity;
   gSceneConfig.bounceThreshold = bounceThreshold;
   gSceneConfig.enablePCM = enablePCM;
@@ -83,6 +86,10 @@ void PhysxDefault::setSceneConfig(Vec3 gravity, float bounceThreshold, bool enab
   gSceneConfig.enableEnhancedDeterminism = enableEnhancedDeterminism;
   gSceneConfig.enableFrictionEveryIteration = enableFrictionEveryIteration;
   gSceneConfig.cpuWorkers = cpuWorkers;
+  gSceneConfig.broadPhaseType = broadPhaseType;
+  gSceneConfig.mbpSubdivisions = mbpSubdivisions;
+  gSceneConfig.sceneQueryUpdateMode = sceneQueryUpdateMode;
+  gSceneConfig.sceneQueryPruner = sceneQueryPruner;
 }
 void PhysxDefault::setSceneConfig(PhysxSceneConfig const &config) { gSceneConfig = config; }
 PhysxSceneConfig const &PhysxDefault::getSceneConfig() { return gSceneConfig; }
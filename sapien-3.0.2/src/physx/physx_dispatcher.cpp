@@ -0,0 +1,138 @@
+/*
+ * Copyright 2025 Hillbot Inc.
+ * Copyright 2020-2024 UCSD SU Lab
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at:
+ * 
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#include "sapien/physx/physx_dispatcher.h"
+#include "../logger.h"
+#include <algorithm>
+#include <stdexcept>
+#ifdef __linux__
+#include <pthread.h>
+#include <sched.h>
+#endif
+
+using namespace physx;
+namespace sapien {
+namespace physx {
+
+static std::mutex gSharedDispatcherLock;
+static std::shared_ptr<PhysxSharedDispatcher> gSharedDispatcher;
+
+void PhysxSharedDispatcher::Configure(uint32_t workerCount,
+                                      std::vector<std::vector<uint32_t>> const &affinity) {
+  if (!affinity.empty() && affinity.size() != workerCount) {
+    throw std::runtime_error(
+        "failed to configure shared PhysX dispatcher: affinity must list CPUs for every worker");
+  }
+  std::lock_guard lock(gSharedDispatcherLock);
+  if (gSharedDispatcher) {
+    if (gSharedDispatcher->getWorkerCount() == workerCount &&
+        gSharedDispatcher->getAffinity() == affinity) {
+      return;
+    }
+    throw std::runtime_error("failed to configure shared PhysX dispatcher: it is already "
+                             "running with a different configuration");
+  }
+  gSharedDispatcher = std::make_shared<PhysxSharedDispatcher>(workerCount, affinity);
+}
+
+std::shared_ptr<PhysxSharedDispatcher> PhysxSharedDispatcher::Get() {
+  std::lock_guard lock(gSharedDispatcherLock);
+  if (!gSharedDispatcher) {
+    gSharedDispatcher = std::make_shared<PhysxSharedDispatcher>(
+        std::max(1u, std::thread::hardware_concurrency()), std::vector<std::vector<uint32_t>>{});
+  }
+  return gSharedDispatcher;
+}
+
+std::shared_ptr<PhysxSharedDispatcher> PhysxSharedDispatcher::GetIfExists() {
+  std::lock_guard lock(gSharedDispatcherLock);
+  return gSharedDispatcher;
+}
+
+static void SetThreadAffinity(std::thread &thread, std::vector<uint32_t> const &cpus) {
+  if (cpus.empty()) {
+    return;
+  }
+#ifdef __linux__
+  cpu_set_t set;
+  CPU_ZERO(&set);
+  for (uint32_t cpu : cpus) {
+    if (cpu < CPU_SETSIZE) {
+      CPU_SET(cpu, &set);
+    }
+  }
+  if (pthread_setaffinity_np(thread.native_handle(), sizeof(set), &set) != 0) {
+    logger::warn("failed to set PhysX worker affinity");
+  }
+#else
+  logger::warn("PhysX worker affinity is only supported on Linux");
+#endif
+}
+
+PhysxSharedDispatcher::PhysxSharedDispatcher(uint32_t workerCount,
+                                             std::vector<std::vector<uint32_t>> affinity)
+    : mAffinity(std::move(affinity)) {
+  for (uint32_t i = 0; i < workerCount; ++i) {
+    mWorkers.emplace_back([this]() { workerLoop(); });
+    if (i < mAffinity.size()) {
+      SetThreadAffinity(mWorkers.back(), mAffinity[i]);
+    }
+  }
+}
+
+void PhysxSharedDispatcher::submit(PxBaseTask &task, int priority) {
+  if (mWorkers.empty()) {
+    task.run();
+    task.release();
+    return;
+  }
+  {
+    std::lock_guard lock(mLock);
+    mQueue.push({priority, mOrder++, &task});
+  }
+  mCv.notify_one();
+}
+
+void PhysxSharedDispatcher::workerLoop() {
+  while (true) {
+    PxBaseTask *task;
+    {
+      std::unique_lock lock(mLock);
+      mCv.wait(lock, [this] { return mStop || !mQueue.empty(); });
+      if (mQueue.empty()) {
+        return;
+      }
+      task = mQueue.top().task;
+      mQueue.pop();
+    }
+    task->run();
+    task->release();
+  }
+}
+
+PhysxSharedDispatcher::~PhysxSharedDispatcher() {
+  {
+    std::lock_guard lock(mLock);
+    mStop = true;
+  }
+  mCv.notify_all();
+  for (auto &t : mWorkers) {
+    t.join();
+  }
+}
+
+} // namespace physx
+} // namespace sapien
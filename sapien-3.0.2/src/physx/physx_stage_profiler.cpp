@@ -40,9 +40,10 @@ enum class StageBucket : uint8_t {
   eSolver = 3,
   eUpdate = 4,
   eOther = 5,
+  eSceneQuery = 6,
 };
 
-constexpr size_t kStageBucketCount = 6;
+constexpr size_t kStageBucketCount = 7;
 constexpr uintptr_t kPackedStageMask = 0x7;
 
 uint64_t nowNs() {
@@ -76,6 +77,17 @@ StageBucket classifyZone(char const *eventName) {
 
   std::string_view name(eventName);
 
+  // --- Scene query structure maintenance (queries themselves are not stage work) ---
+  if (containsCI(name, "SceneQuer") || containsCI(name, "QuerySystem") ||
+      containsCI(name, "PruningPool") || containsCI(name, "flushQueryUpdates") ||
+      containsCI(name, "DynamicTreeRebuild")) {
+    if (containsCI(name, ".raycast") || containsCI(name, ".sweep") ||
+        containsCI(name, ".overlap")) {
+      return StageBucket::eOther;
+    }
+    return StageBucket::eSceneQuery;
+  }
+
   // --- Coloring / constraint partitioning (check before solver) ---
   if (containsCI(name, "partition") || containsCI(name, "coloring") ||
       containsCI(name, "AccumulateSlabs") || containsCI(name, "Compaction")) {
@@ -139,7 +151,6 @@ StageBucket classifyZone(char const *eventName) {
       containsCI(name, "fetchResult") || containsCI(name, "afterIntegration") ||
       containsCI(name, "SimulationController") || containsCI(name, "SimController") ||
       containsCI(name, "finalization") || containsCI(name, "completion") ||
-      containsCI(name, "sceneQuery") || containsCI(name, "pruner") ||
       containsCI(name, "Pruning") || containsCI(name, "flushShapes") ||
       containsCI(name, "Callback") || containsCI(name, "callback") ||
       containsCI(name, "pvdFrame") || containsCI(name, "visualize") ||
@@ -306,11 +317,13 @@ public:
     out["coloring_ms"] = mLastFrame.stageNs[static_cast<size_t>(StageBucket::eColoring)] * 1e-6;
     out["solver_ms"] = mLastFrame.stageNs[static_cast<size_t>(StageBucket::eSolver)] * 1e-6;
     out["update_ms"] = mLastFrame.stageNs[static_cast<size_t>(StageBucket::eUpdate)] * 1e-6;
+    out["scene_query_ms"] =
+        mLastFrame.stageNs[static_cast<size_t>(StageBucket::eSceneQuery)] * 1e-6;
     out["other_ms"] = mLastFrame.stageNs[static_cast<size_t>(StageBucket::eOther)] * 1e-6;
 
-    // total = sum of the 5 known stages (excluding other)
+    // total = sum of the 6 known stages (excluding other)
     double total = out["broadphase_ms"] + out["narrowphase_ms"] + out["coloring_ms"] +
-                   out["solver_ms"] + out["update_ms"];
+                   out["solver_ms"] + out["update_ms"] + out["scene_query_ms"];
     out["total_ms"] = total;
     return out;
   }
@@ -24,7 +24,11 @@
 #include "sapien/physx/physx_default.h"
 #include "sapien/physx/rigid_component.h"
 #include "sapien/profiler.h"
+#include "sapien/utils/thread_pool.h"
 #include <extensions/PxExtensionsAPI.h>
+#include <limits>
+#include <numeric>
+#include <unordered_map>
 
 #ifdef SAPIEN_CUDA
 #include "./physx_system.cuh"
@@ -45,10 +49,35 @@ struct SapienBodyDataTest {
 
 static_assert(sizeof(SapienBodyDataTest) == 52);
 
+static void SetSceneQueryDesc(PxSceneDesc &sceneDesc, PhysxSceneConfig const &config) {
+  switch (config.sceneQueryUpdateMode) {
+  case SceneQueryUpdateMode::eCOMMIT:
+    sceneDesc.sceneQueryUpdateMode = PxSceneQueryUpdateMode::eBUILD_ENABLED_COMMIT_ENABLED;
+    break;
+  case SceneQueryUpdateMode::eBUILD:
+    sceneDesc.sceneQueryUpdateMode = PxSceneQueryUpdateMode::eBUILD_ENABLED_COMMIT_DISABLED;
+    break;
+  case SceneQueryUpdateMode::eDISABLED:
+    sceneDesc.sceneQueryUpdateMode = PxSceneQueryUpdateMode::eBUILD_DISABLED_COMMIT_DISABLED;
+    break;
+  }
+  switch (config.sceneQueryPruner) {
+  case SceneQueryPruner::eAABB_TREE:
+    break;
+  case SceneQueryPruner::eBVH:
+    sceneDesc.dynamicTreeSecondaryPruner = PxDynamicTreeSecondaryPruner::eBVH;
+    break;
+  case SceneQueryPruner::eNONE:
+    // PxSceneQueryDesc::isValid only accepts AABB trees for static objects
+    sceneDesc.dynamicStructure = PxPruningStructureType::eNONE;
+    break;
+  }
+}
+
 PhysxSystem::PhysxSystem()
     : mSceneConfig(PhysxDefault::getSceneConfig()), mEngine(PhysxEngine::Get()) {}
 
-PhysxSystemCpu::PhysxSystemCpu() {
+PhysxSystemCpu::PhysxSystemCpu(bool sharedDispatcher) {
   if (PhysxDefault::GetGPUEnabled()) {
     logger::warn(
         "A PhysX CPU system is being created while PhysX GPU is enabled. You can safely ignore "
@@ -60,6 +89,10 @@ PhysxSystemCpu::PhysxSystemCpu() {
   PxSceneDesc sceneDesc(mEngine->getPxPhysics()->getTolerancesScale());
   sceneDesc.gravity = Vec3ToPxVec3(config.gravity);
   sceneDesc.filterShader = TypeAffinityIgnoreFilterShader;
+  ContactReportFilterData filterData{static_cast<uint32_t>(mContactReportMode)};
+  sceneDesc.filterShaderData = &filterData;
+  sceneDesc.filterShaderDataSize = sizeof(filterData);
+  sceneDesc.filterCallback = &mFilterCallback;
   sceneDesc.solverType = config.enableTGS ? PxSolverType::eTGS : PxSolverType::ePGS;
   sceneDesc.bounceThresholdVelocity = config.bounceThreshold;
 
@@ -78,14 +111,54 @@ PhysxSystemCpu::PhysxSystemCpu() {
   }
 
   sceneDesc.flags = sceneFlags;
-
-  mPxCPUDispatcher = PxDefaultCpuDispatcherCreate(config.cpuWorkers);
-  if (!mPxCPUDispatcher) {
-    throw std::runtime_error("PhysX system creation failed: failed to create CPU dispatcher");
+  SetSceneQueryDesc(sceneDesc, config);
+
+  switch (config.broadPhaseType) {
+  case BroadPhaseType::eSAP:
+    sceneDesc.broadPhaseType = PxBroadPhaseType::eSAP;
+    break;
+  case BroadPhaseType::eMBP:
+    sceneDesc.broadPhaseType = PxBroadPhaseType::eMBP;
+    break;
+  case BroadPhaseType::eABP:
+    sceneDesc.broadPhaseType = PxBroadPhaseType::eABP;
+    break;
+  case BroadPhaseType::ePABP:
+    sceneDesc.broadPhaseType = PxBroadPhaseType::ePABP;
+    break;
+  }
+  sceneDesc.broadPhaseCallback = &mBroadPhaseCallback;
+
+  if (sharedDispatcher) {
+    mPxCPUDispatcher = nullptr;
+    mSharedDispatcher =
+        std::make_unique<PhysxSharedDispatcherClient>(PhysxSharedDispatcher::Get());
+    sceneDesc.cpuDispatcher = mSharedDispatcher.get();
+  } else {
+    mPxCPUDispatcher = PxDefaultCpuDispatcherCreate(config.cpuWorkers);
+    if (!mPxCPUDispatcher) {
+      throw std::runtime_error("PhysX system creation failed: failed to create CPU dispatcher");
+    }
+    sceneDesc.cpuDispatcher = mPxCPUDispatcher;
   }
-  sceneDesc.cpuDispatcher = mPxCPUDispatcher;
   mPxScene = mEngine->getPxPhysics()->createScene(sceneDesc);
+  if (!mPxScene) {
+    throw std::runtime_error("PhysX system creation failed: failed to create PhysX scene");
+  }
   mPxScene->setSimulationEventCallback(&mSimulationCallback);
+  updateBroadPhaseRegions();
+}
+
+void PhysxSystemCpu::setDispatcherPriority(int priority) {
+  if (!mSharedDispatcher) {
+    throw std::runtime_error(
+        "failed to set dispatcher priority: system does not use the shared dispatcher");
+  }
+  mSharedDispatcher->setPriority(priority);
+}
+
+int PhysxSystemCpu::getDispatcherPriority() const {
+  return mSharedDispatcher ? mSharedDispatcher->getPriority() : 0;
 }
 
 #ifdef SAPIEN_CUDA
@@ -139,6 +212,7 @@ PhysxSystemGpu::PhysxSystemGpu(std::shared_ptr<Device> device) {
   }
 
   sceneDesc.flags = sceneFlags;
+  SetSceneQueryDesc(sceneDesc, config);
 
   mPxCPUDispatcher = PxDefaultCpuDispatcherCreate(config.cpuWorkers);
   if (!mPxCPUDispatcher) {
@@ -146,6 +220,9 @@ PhysxSystemGpu::PhysxSystemGpu(std::shared_ptr<Device> device) {
   }
   sceneDesc.cpuDispatcher = mPxCPUDispatcher;
   mPxScene = mEngine->getPxPhysics()->createScene(sceneDesc);
+  if (!mPxScene) {
+    throw std::runtime_error("PhysX system creation failed: failed to create PhysX scene");
+  }
 }
 #else
 PhysxSystemGpu::PhysxSystemGpu(std::shared_ptr<Device> device) {
@@ -156,22 +233,35 @@ PhysxSystemGpu::PhysxSystemGpu(std::shared_ptr<Device> device) {
 
 void PhysxSystemCpu::registerComponent(std::shared_ptr<PhysxRigidDynamicComponent> component) {
   mRigidDynamicComponents.insert(component);
+  mSceneQueryDirty = true;
+  mCpuInitialized = false;
 }
 void PhysxSystemCpu::registerComponent(std::shared_ptr<PhysxRigidStaticComponent> component) {
   mRigidStaticComponents.insert(component);
+  mSceneQueryDirty = true;
 }
 void PhysxSystemCpu::registerComponent(std::shared_ptr<PhysxArticulationLinkComponent> component) {
   mArticulationLinkComponents.insert(component);
+  mSceneQueryDirty = true;
+  mCpuInitialized = false;
 }
 void PhysxSystemCpu::unregisterComponent(std::shared_ptr<PhysxRigidDynamicComponent> component) {
   mRigidDynamicComponents.erase(component);
+  mSceneQueryDirty = true;
+  mCpuInitialized = false;
+  mCpuRigidDynamicComponents.clear();
 }
 void PhysxSystemCpu::unregisterComponent(std::shared_ptr<PhysxRigidStaticComponent> component) {
   mRigidStaticComponents.erase(component);
+  mSceneQueryDirty = true;
 }
 void PhysxSystemCpu::unregisterComponent(
     std::shared_ptr<PhysxArticulationLinkComponent> component) {
   mArticulationLinkComponents.erase(component);
+  mSceneQueryDirty = true;
+  mCpuInitialized = false;
+  mCpuArticulations.clear();
+  mCpuArticulationActiveJoints.clear();
 }
 std::vector<std::shared_ptr<PhysxRigidDynamicComponent>>
 PhysxSystemCpu::getRigidDynamicComponents() const {
@@ -226,8 +316,38 @@ PhysxSystemGpu::getArticulationLinkComponents() const {
 }
 #endif
 
+void PhysxSystemCpu::setContactReportMode(ContactReportMode mode) {
+  if (mode == mContactReportMode) {
+    return;
+  }
+  mContactReportMode = mode;
+  ContactReportFilterData filterData{static_cast<uint32_t>(mode)};
+  mPxScene->setFilterShaderData(&filterData, sizeof(filterData));
+
+  // the new mode only applies to pairs filtered from now on
+  auto refilter = [this](PxActor *actor) {
+    if (actor->getScene() == mPxScene) {
+      mPxScene->resetFiltering(*actor);
+    }
+  };
+  for (auto &c : mRigidDynamicComponents) {
+    refilter(c->getPxActor());
+  }
+  for (auto &c : mRigidStaticComponents) {
+    refilter(c->getPxActor());
+  }
+  for (auto &c : mArticulationLinkComponents) {
+    refilter(c->getPxActor());
+  }
+
+  if (mode == ContactReportMode::eOFF) {
+    mSimulationCallback.clearContacts();
+  }
+}
+
 std::unique_ptr<PhysxHitInfo> PhysxSystemCpu::raycast(Vec3 const &origin, Vec3 const &direction,
                                                       float distance) {
+  ensureSceneQueriesUpdated();
   PxRaycastBuffer hit;
   bool status = mPxScene->raycast(Vec3ToPxVec3(origin), Vec3ToPxVec3(direction), distance, hit);
   if (status) {
@@ -239,9 +359,281 @@ std::unique_ptr<PhysxHitInfo> PhysxSystemCpu::raycast(Vec3 const &origin, Vec3 c
   return nullptr;
 }
 
+// queries handed to a worker at a time
+static constexpr uint32_t kQueryBatchGrain = 256;
+
+static PxTransform BatchQueryPose(float const *positions, float const *rotations, uint32_t i) {
+  PxVec3 p(positions[3 * i], positions[3 * i + 1], positions[3 * i + 2]);
+  if (!rotations) {
+    return PxTransform(p);
+  }
+  float const *q = rotations + 4 * i;
+  return PxTransform(p, PxQuat(q[1], q[2], q[3], q[0]).getNormalized());
+}
+
+static PxVec3 BatchQueryDirection(float const *directions, uint32_t i) {
+  PxVec3 d(directions[3 * i], directions[3 * i + 1], directions[3 * i + 2]);
+  d.normalizeSafe();
+  return d;
+}
+
+static void WriteBatchHit(PxLocationHit const &hit, uint32_t i, float *outDistance,
+                          float *outPosition, float *outNormal) {
+  outDistance[i] = hit.distance;
+  outPosition[3 * i] = hit.position.x;
+  outPosition[3 * i + 1] = hit.position.y;
+  outPosition[3 * i + 2] = hit.position.z;
+  outNormal[3 * i] = hit.normal.x;
+  outNormal[3 * i + 1] = hit.normal.y;
+  outNormal[3 * i + 2] = hit.normal.z;
+}
+
+static void WriteBatchMiss(uint32_t i, float *outDistance, float *outPosition, float *outNormal) {
+  outDistance[i] = std::numeric_limits<float>::infinity();
+  std::fill(outPosition + 3 * i, outPosition + 3 * i + 3, 0.f);
+  std::fill(outNormal + 3 * i, outNormal + 3 * i + 3, 0.f);
+}
+
+// replace per-query actors with indices into a list of unique components
+static std::vector<std::shared_ptr<PhysxRigidBaseComponent>>
+CollectBatchComponents(std::vector<PxRigidActor *> const &actors, int *outIndex) {
+  std::vector<std::shared_ptr<PhysxRigidBaseComponent>> components;
+  std::unordered_map<PxRigidActor *, int> actor2index;
+  for (uint32_t i = 0; i < actors.size(); ++i) {
+    if (!actors[i]) {
+      outIndex[i] = -1;
+      continue;
+    }
+    auto [it, inserted] = actor2index.try_emplace(actors[i], components.size());
+    if (inserted) {
+      auto c = static_cast<PhysxRigidBaseComponent *>(actors[i]->userData);
+      components.push_back(
+          std::static_pointer_cast<PhysxRigidBaseComponent>(c->shared_from_this()));
+    }
+    outIndex[i] = it->second;
+  }
+  return components;
+}
+
+std::vector<std::shared_ptr<PhysxRigidBaseComponent>>
+PhysxSystemCpu::raycastBatch(float const *origins, float const *directions, float distance,
+                             uint32_t count, float *outDistance, float *outPosition,
+                             float *outNormal, int *outIndex) {
+  ensureSceneQueriesUpdated();
+  std::vector<PxRigidActor *> actors(count, nullptr);
+  ThreadPool::Get().parallelFor(
+      count,
+      [&](uint32_t begin, uint32_t end) {
+        for (uint32_t i = begin; i < end; ++i) {
+          PxVec3 origin(origins[3 * i], origins[3 * i + 1], origins[3 * i + 2]);
+          PxVec3 dir = BatchQueryDirection(directions, i);
+          PxRaycastBuffer hit;
+          if (!dir.isZero() && mPxScene->raycast(origin, dir, distance, hit) && hit.hasBlock) {
+            WriteBatchHit(hit.block, i, outDistance, outPosition, outNormal);
+            actors[i] = hit.block.actor;
+          } else {
+            WriteBatchMiss(i, outDistance, outPosition, outNormal);
+          }
+        }
+      },
+      kQueryBatchGrain);
+  return CollectBatchComponents(actors, outIndex);
+}
+
+std::vector<std::shared_ptr<PhysxRigidBaseComponent>>
+PhysxSystemCpu::sweepBatch(PxGeometry const &geometry, float const *positions,
+                           float const *rotations, float const *directions, float distance,
+                           uint32_t count, float *outDistance, float *outPosition,
+                           float *outNormal, int *outIndex) {
+  ensureSceneQueriesUpdated();
+  std::vector<PxRigidActor *> actors(count, nullptr);
+  ThreadPool::Get().parallelFor(
+      count,
+      [&](uint32_t begin, uint32_t end) {
+        for (uint32_t i = begin; i < end; ++i) {
+          PxTransform pose = BatchQueryPose(positions, rotations, i);
+          PxVec3 dir = BatchQueryDirection(directions, i);
+          PxSweepBuffer hit;
+          if (!dir.isZero() && mPxScene->sweep(geometry, pose, dir, distance, hit) &&
+              hit.hasBlock) {
+            WriteBatchHit(hit.block, i, outDistance, outPosition, outNormal);
+            actors[i] = hit.block.actor;
+          } else {
+            WriteBatchMiss(i, outDistance, outPosition, outNormal);
+          }
+        }
+      },
+      kQueryBatchGrain);
+  return CollectBatchComponents(actors, outIndex);
+}
+
+std::vector<std::shared_ptr<PhysxRigidBaseComponent>>
+PhysxSystemCpu::overlapBatch(PxGeometry const &geometry, float const *positions,
+                             float const *rotations, uint32_t count, int *outIndex) {
+  ensureSceneQueriesUpdated();
+  std::vector<PxRigidActor *> actors(count, nullptr);
+  PxQueryFilterData filter(PxQueryFlag::eSTATIC | PxQueryFlag::eDYNAMIC | PxQueryFlag::eANY_HIT);
+  ThreadPool::Get().parallelFor(
+      count,
+      [&](uint32_t begin, uint32_t end) {
+        for (uint32_t i = begin; i < end; ++i) {
+          PxOverlapBuffer hit;
+          if (mPxScene->overlap(geometry, BatchQueryPose(positions, rotations, i), hit, filter) &&
+              hit.hasBlock) {
+            actors[i] = hit.block.actor;
+          }
+        }
+      },
+      kQueryBatchGrain);
+  return CollectBatchComponents(actors, outIndex);
+}
+
+void PhysxSystemCpu::updateBroadPhaseRegions() {
+  if (mSceneConfig.broadPhaseType != BroadPhaseType::eMBP) {
+    return;
+  }
+  if (!mBroadPhaseRegionHandles.empty() && !mBroadPhaseCallback.hasOutOfBounds()) {
+    return;
+  }
+  mBroadPhaseCallback.clear();
+
+  PxBounds3 bounds(Vec3ToPxVec3(mSceneConfig.mbpWorldLower),
+                   Vec3ToPxVec3(mSceneConfig.mbpWorldUpper));
+  bool configured = bounds.minimum.x < bounds.maximum.x && bounds.minimum.y < bounds.maximum.y &&
+                    bounds.minimum.z < bounds.maximum.z;
+  if (configured) {
+    if (!mBroadPhaseRegionHandles.empty()) {
+      logger::warn("objects left the MBP world bounds and no longer collide");
+      return;
+    }
+  } else {
+    // planes are infinite and overlap every region, so only finite shapes define the bounds
+    bounds = PxBounds3::empty();
+    std::vector<PxShape *> shapes;
+    auto addActor = [&](PxRigidActor *actor) {
+      shapes.resize(actor->getNbShapes());
+      actor->getShapes(shapes.data(), shapes.size());
+      for (auto shape : shapes) {
+        if (shape->getGeometry().getType() != PxGeometryType::ePLANE) {
+          bounds.include(PxShapeExt::getWorldBounds(*shape, *actor));
+        }
+      }
+    };
+    for (auto &c : mRigidDynamicComponents) {
+      addActor(c->getPxActor());
+    }
+    for (auto &c : mRigidStaticComponents) {
+      addActor(c->getPxActor());
+    }
+    for (auto &c : mArticulationLinkComponents) {
+      addActor(c->getPxActor());
+    }
+    if (bounds.isEmpty()) {
+      return;
+    }
+    if (!mBroadPhaseBounds.isEmpty() && bounds.isInside(mBroadPhaseBounds)) {
+      return;
+    }
+    // leave room for bodies to move before the regions need to be rebuilt
+    bounds.fattenFast(std::max(1.f, 0.5f * bounds.getExtents().maxElement()));
+  }
+
+  for (auto handle : mBroadPhaseRegionHandles) {
+    mPxScene->removeBroadPhaseRegion(handle);
+  }
+  mBroadPhaseRegionHandles.clear();
+
+  uint32_t subdivisions = std::clamp(mSceneConfig.mbpSubdivisions, 1u, 16u);
+  std::vector<PxBounds3> regions(subdivisions * subdivisions);
+  uint32_t count =
+      PxBroadPhaseExt::createRegionsFromWorldBounds(regions.data(), bounds, subdivisions, 2);
+  for (uint32_t i = 0; i < count; ++i) {
+    PxBroadPhaseRegion region{regions[i], nullptr};
+    mBroadPhaseRegionHandles.push_back(mPxScene->addBroadPhaseRegion(region, true));
+  }
+  mBroadPhaseBounds = bounds;
+}
+
+void PhysxSystemCpu::updateSceneQueries() {
+  if (mStepping) {
+    throw std::runtime_error("failed to update scene queries: a step is in progress");
+  }
+  mPxScene->sceneQueriesUpdate();
+  mPxScene->fetchQueries(true);
+  mSceneQueryDirty = false;
+}
+
+void PhysxSystemCpu::ensureSceneQueriesUpdated() {
+  if (mSceneConfig.sceneQueryUpdateMode == SceneQueryUpdateMode::eDISABLED && mSceneQueryDirty) {
+    updateSceneQueries();
+  }
+}
+
+std::vector<std::array<Vec3, 2>> PhysxSystemCpu::getBroadPhaseRegions() const {
+  std::vector<PxBroadPhaseRegionInfo> infos(mPxScene->getNbBroadPhaseRegions());
+  mPxScene->getBroadPhaseRegions(infos.data(), infos.size());
+  std::vector<std::array<Vec3, 2>> regions;
+  for (auto &info : infos) {
+    if (info.mActive) {
+      regions.push_back({PxVec3ToVec3(info.mRegion.mBounds.minimum),
+                         PxVec3ToVec3(info.mRegion.mBounds.maximum)});
+    }
+  }
+  return regions;
+}
+
 void PhysxSystemCpu::step() {
+  stepStart();
+  stepFinish();
+}
+
+void PhysxSystemCpu::step(uint32_t substeps, bool reapply, bool accumulateContacts) {
+  if (substeps == 0) {
+    throw std::runtime_error("failed to step: substep count must be positive");
+  }
+  if (mStepping) {
+    throw std::runtime_error("failed to step: the previous step has not finished");
+  }
+  if (accumulateContacts) {
+    mSimulationCallback.beginAccumulate();
+  }
+  for (uint32_t i = 0; i < substeps; ++i) {
+    if (i > 0 && reapply) {
+      cpuReapplyBuffers();
+    }
+    updateBroadPhaseRegions();
+    mPxScene->simulate(mTimestep);
+    mPxScene->fetchResults(true);
+  }
+  if (accumulateContacts) {
+    mSimulationCallback.endAccumulate();
+  }
+  cpuClearReapplyBuffers();
+  mSceneQueryDirty = true;
+  syncPosesToEntities();
+}
+
+void PhysxSystemCpu::stepStart() {
+  if (mStepping) {
+    throw std::runtime_error("failed to start step: the previous step has not finished");
+  }
+  updateBroadPhaseRegions();
   mPxScene->simulate(mTimestep);
+  cpuClearReapplyBuffers();
+  mStepping = true;
+}
+
+void PhysxSystemCpu::stepFinish() {
+  if (!mStepping) {
+    throw std::runtime_error("failed to finish step: no step has been started");
+  }
   mPxScene->fetchResults(true);
+  mStepping = false;
+  mSceneQueryDirty = true;
+  syncPosesToEntities();
+}
+
+void PhysxSystemCpu::syncPosesToEntities() {
   for (auto c : mRigidStaticComponents) {
     c->syncPoseToEntity();
   }
@@ -253,6 +645,445 @@ void PhysxSystemCpu::step() {
   }
 }
 
+void PhysxSystemCpu::cpuInit() {
+  SAPIEN_PROFILE_FUNCTION;
+  cpuClearReapplyBuffers();
+  mCpuRigidDynamicComponents = getRigidDynamicComponents();
+  mCpuArticulations.clear();
+  mCpuArticulationMaxLinkCount = 0;
+  for (auto &link : mArticulationLinkComponents) {
+    if (link->isRoot()) {
+      mCpuArticulations.push_back(link->getArticulation());
+      mCpuArticulationMaxLinkCount =
+          std::max(mCpuArticulationMaxLinkCount,
+                   static_cast<int>(link->getArticulation()->getPxArticulation()->getNbLinks()));
+    }
+  }
+
+  size_t rigidBodyCount =
+      mCpuRigidDynamicComponents.size() + mCpuArticulations.size() * mCpuArticulationMaxLinkCount;
+  mCpuRigidBodyBuffer.assign(rigidBodyCount * 13, 0.f);
+  mCpuRigidBodyForceBuffer.assign(rigidBodyCount * 4, 0.f);
+  mCpuRigidBodyTorqueBuffer.assign(rigidBodyCount * 4, 0.f);
+
+  mCpuArticulationMaxDof = 0;
+  mCpuArticulationActiveJoints.clear();
+  for (auto &art : mCpuArticulations) {
+    mCpuArticulationMaxDof = std::max(mCpuArticulationMaxDof, static_cast<int>(art->getDof()));
+    mCpuArticulationActiveJoints.push_back(art->getActiveJoints());
+  }
+  mCpuArticulationBuffer.assign(6 * mCpuArticulations.size() * mCpuArticulationMaxDof, 0.f);
+
+  mCpuInitialized = true;
+
+  cpuFetchRigidDynamicData();
+  cpuFetchArticulationLinkPose();
+  cpuFetchArticulationLinkVel();
+  cpuFetchArticulationQpos();
+  cpuFetchArticulationQvel();
+  cpuFetchArticulationQacc();
+  cpuFetchArticulationQTargetPos();
+  cpuFetchArticulationQTargetVel();
+}
+
+void PhysxSystemCpu::checkCpuInitialized() const {
+  if (!isCpuInitialized()) {
+    throw std::runtime_error("CPU buffers are not initialized, call cpu_init first.");
+  }
+}
+
+CpuArrayHandle PhysxSystemCpu::cpuGetRigidBodyHandle() {
+  checkCpuInitialized();
+  return CpuArrayHandle{.shape = {static_cast<int>(mCpuRigidBodyBuffer.size() / 13), 13},
+                        .strides = {52, 4},
+                        .type = "f4",
+                        .ptr = mCpuRigidBodyBuffer.data()};
+}
+
+CpuArrayHandle PhysxSystemCpu::cpuGetRigidDynamicHandle() {
+  checkCpuInitialized();
+  return CpuArrayHandle{.shape = {static_cast<int>(mCpuRigidDynamicComponents.size()), 13},
+                        .strides = {52, 4},
+                        .type = "f4",
+                        .ptr = mCpuRigidBodyBuffer.data()};
+}
+
+CpuArrayHandle PhysxSystemCpu::cpuGetArticulationLinkHandle() {
+  checkCpuInitialized();
+  return CpuArrayHandle{
+      .shape = {static_cast<int>(mCpuArticulations.size()), mCpuArticulationMaxLinkCount, 13},
+      .strides = {mCpuArticulationMaxLinkCount * 52, 52, 4},
+      .type = "f4",
+      .ptr = mCpuRigidBodyBuffer.data() + 13 * mCpuRigidDynamicComponents.size()};
+}
+
+CpuArrayHandle PhysxSystemCpu::cpuGetRigidBodyForceHandle() {
+  checkCpuInitialized();
+  return CpuArrayHandle{.shape = {static_cast<int>(mCpuRigidBodyForceBuffer.size() / 4), 4},
+                        .strides = {16, 4},
+                        .type = "f4",
+                        .ptr = mCpuRigidBodyForceBuffer.data()};
+}
+
+CpuArrayHandle PhysxSystemCpu::cpuGetRigidDynamicForceHandle() {
+  checkCpuInitialized();
+  return CpuArrayHandle{.shape = {static_cast<int>(mCpuRigidDynamicComponents.size()), 4},
+                        .strides = {16, 4},
+                        .type = "f4",
+                        .ptr = mCpuRigidBodyForceBuffer.data()};
+}
+
+CpuArrayHandle PhysxSystemCpu::cpuGetRigidBodyTorqueHandle() {
+  checkCpuInitialized();
+  return CpuArrayHandle{.shape = {static_cast<int>(mCpuRigidBodyTorqueBuffer.size() / 4), 4},
+                        .strides = {16, 4},
+                        .type = "f4",
+                        .ptr = mCpuRigidBodyTorqueBuffer.data()};
+}
+
+CpuArrayHandle PhysxSystemCpu::cpuGetRigidDynamicTorqueHandle() {
+  checkCpuInitialized();
+  return CpuArrayHandle{.shape = {static_cast<int>(mCpuRigidDynamicComponents.size()), 4},
+                        .strides = {16, 4},
+                        .type = "f4",
+                        .ptr = mCpuRigidBodyTorqueBuffer.data()};
+}
+
+// write pose (p, q) into data[0:7], q in wxyz order
+static void WriteBodyPose(float *data, PxTransform const &pose) {
+  data[0] = pose.p.x;
+  data[1] = pose.p.y;
+  data[2] = pose.p.z;
+  data[3] = pose.q.w;
+  data[4] = pose.q.x;
+  data[5] = pose.q.y;
+  data[6] = pose.q.z;
+}
+
+static void WriteBodyVel(float *data, PxVec3 const &v, PxVec3 const &w) {
+  data[7] = v.x;
+  data[8] = v.y;
+  data[9] = v.z;
+  data[10] = w.x;
+  data[11] = w.y;
+  data[12] = w.z;
+}
+
+void PhysxSystemCpu::cpuFetchRigidDynamicData() {
+  SAPIEN_PROFILE_FUNCTION;
+  checkCpuInitialized();
+  float *data = mCpuRigidBodyBuffer.data();
+  for (auto &body : mCpuRigidDynamicComponents) {
+    auto actor = body->getPxActor();
+    WriteBodyPose(data, actor->getGlobalPose());
+    WriteBodyVel(data, actor->getLinearVelocity(), actor->getAngularVelocity());
+    data += 13;
+  }
+}
+
+void PhysxSystemCpu::cpuFetchArticulationLinkPose() {
+  SAPIEN_PROFILE_FUNCTION;
+  checkCpuInitialized();
+  float *base = mCpuRigidBodyBuffer.data() + 13 * mCpuRigidDynamicComponents.size();
+  for (uint32_t a = 0; a < mCpuArticulations.size(); ++a) {
+    for (auto &link : mCpuArticulations[a]->getLinks()) {
+      float *data = base + 13 * (a * mCpuArticulationMaxLinkCount + link->getIndex());
+      WriteBodyPose(data, link->getPxActor()->getGlobalPose());
+    }
+  }
+}
+
+void PhysxSystemCpu::cpuFetchArticulationLinkVel() {
+  SAPIEN_PROFILE_FUNCTION;
+  checkCpuInitialized();
+  float *base = mCpuRigidBodyBuffer.data() + 13 * mCpuRigidDynamicComponents.size();
+  for (uint32_t a = 0; a < mCpuArticulations.size(); ++a) {
+    for (auto &link : mCpuArticulations[a]->getLinks()) {
+      float *data = base + 13 * (a * mCpuArticulationMaxLinkCount + link->getIndex());
+      auto actor = link->getPxActor();
+      WriteBodyVel(data, actor->getLinearVelocity(), actor->getAngularVelocity());
+    }
+  }
+}
+
+static void ApplyBodyData(PhysxRigidDynamicComponent &body, float const *data) {
+  auto actor = body.getPxActor();
+  actor->setGlobalPose(
+      PxTransform({data[0], data[1], data[2]}, PxQuat(data[4], data[5], data[6], data[3])));
+  if (!body.isKinematic()) {
+    actor->setLinearVelocity({data[7], data[8], data[9]});
+    actor->setAngularVelocity({data[10], data[11], data[12]});
+  }
+  body.syncPoseToEntity();
+}
+
+void PhysxSystemCpu::cpuApplyRigidDynamicData() {
+  SAPIEN_PROFILE_FUNCTION;
+  checkCpuInitialized();
+  for (uint32_t i = 0; i < mCpuRigidDynamicComponents.size(); ++i) {
+    ApplyBodyData(*mCpuRigidDynamicComponents[i], mCpuRigidBodyBuffer.data() + 13 * i);
+  }
+}
+
+void PhysxSystemCpu::cpuApplyRigidDynamicData(int const *indices, int count) {
+  SAPIEN_PROFILE_FUNCTION;
+  checkCpuInitialized();
+  int bodyCount = mCpuRigidDynamicComponents.size();
+  for (int i = 0; i < count; ++i) {
+    if (indices[i] < 0 || indices[i] >= bodyCount) {
+      throw std::runtime_error("failed to apply rigid dynamic data: index out of range");
+    }
+  }
+  for (int i = 0; i < count; ++i) {
+    ApplyBodyData(*mCpuRigidDynamicComponents[indices[i]],
+                  mCpuRigidBodyBuffer.data() + 13 * indices[i]);
+  }
+}
+
+void PhysxSystemCpu::cpuApplyRigidDynamicForce() {
+  SAPIEN_PROFILE_FUNCTION;
+  checkCpuInitialized();
+  for (uint32_t i = 0; i < mCpuRigidDynamicComponents.size(); ++i) {
+    auto &body = mCpuRigidDynamicComponents[i];
+    if (body->isKinematic()) {
+      continue;
+    }
+    float const *f = mCpuRigidBodyForceBuffer.data() + 4 * i;
+    body->getPxActor()->addForce({f[0], f[1], f[2]});
+  }
+  mCpuReapplyForce = true;
+}
+
+void PhysxSystemCpu::cpuApplyRigidDynamicTorque() {
+  SAPIEN_PROFILE_FUNCTION;
+  checkCpuInitialized();
+  for (uint32_t i = 0; i < mCpuRigidDynamicComponents.size(); ++i) {
+    auto &body = mCpuRigidDynamicComponents[i];
+    if (body->isKinematic()) {
+      continue;
+    }
+    float const *t = mCpuRigidBodyTorqueBuffer.data() + 4 * i;
+    body->getPxActor()->addTorque({t[0], t[1], t[2]});
+  }
+  mCpuReapplyTorque = true;
+}
+
+// planes of the CPU articulation buffer, same order as the GPU articulation buffer
+enum CpuArticulationPlane {
+  eCpuQpos = 0,
+  eCpuQvel = 1,
+  eCpuQf = 2,
+  eCpuQacc = 3,
+  eCpuQTargetPos = 4,
+  eCpuQTargetVel = 5,
+};
+
+CpuArrayHandle PhysxSystemCpu::cpuGetArticulationPlaneHandle(int plane) {
+  checkCpuInitialized();
+  int count = mCpuArticulations.size();
+  return CpuArrayHandle{.shape = {count, mCpuArticulationMaxDof},
+                        .strides = {mCpuArticulationMaxDof * 4, 4},
+                        .type = "f4",
+                        .ptr = mCpuArticulationBuffer.data() +
+                               plane * count * mCpuArticulationMaxDof};
+}
+
+CpuArrayHandle PhysxSystemCpu::cpuGetArticulationQposHandle() {
+  return cpuGetArticulationPlaneHandle(eCpuQpos);
+}
+CpuArrayHandle PhysxSystemCpu::cpuGetArticulationQvelHandle() {
+  return cpuGetArticulationPlaneHandle(eCpuQvel);
+}
+CpuArrayHandle PhysxSystemCpu::cpuGetArticulationQfHandle() {
+  return cpuGetArticulationPlaneHandle(eCpuQf);
+}
+CpuArrayHandle PhysxSystemCpu::cpuGetArticulationQaccHandle() {
+  return cpuGetArticulationPlaneHandle(eCpuQacc);
+}
+CpuArrayHandle PhysxSystemCpu::cpuGetArticulationQTargetPosHandle() {
+  return cpuGetArticulationPlaneHandle(eCpuQTargetPos);
+}
+CpuArrayHandle PhysxSystemCpu::cpuGetArticulationQTargetVelHandle() {
+  return cpuGetArticulationPlaneHandle(eCpuQTargetVel);
+}
+
+float *PhysxSystemCpu::cpuGetArticulationRow(int plane, int index) {
+  return mCpuArticulationBuffer.data() +
+         (plane * mCpuArticulations.size() + index) * mCpuArticulationMaxDof;
+}
+
+std::vector<int> PhysxSystemCpu::cpuCheckArticulationIndices(int const *indices, int count) const {
+  int articulationCount = mCpuArticulations.size();
+  for (int i = 0; i < count; ++i) {
+    if (indices[i] < 0 || indices[i] >= articulationCount) {
+      throw std::runtime_error("failed to apply articulation data: index out of range");
+    }
+  }
+  return std::vector<int>(indices, indices + count);
+}
+
+std::vector<int> PhysxSystemCpu::cpuAllArticulationIndices() const {
+  std::vector<int> indices(mCpuArticulations.size());
+  std::iota(indices.begin(), indices.end(), 0);
+  return indices;
+}
+
+void PhysxSystemCpu::cpuFetchArticulationQpos() {
+  SAPIEN_PROFILE_FUNCTION;
+  checkCpuInitialized();
+  for (uint32_t i = 0; i < mCpuArticulations.size(); ++i) {
+    auto q = mCpuArticulations[i]->getQpos();
+    std::copy(q.data(), q.data() + q.size(), cpuGetArticulationRow(eCpuQpos, i));
+  }
+}
+
+void PhysxSystemCpu::cpuFetchArticulationQvel() {
+  SAPIEN_PROFILE_FUNCTION;
+  checkCpuInitialized();
+  for (uint32_t i = 0; i < mCpuArticulations.size(); ++i) {
+    auto q = mCpuArticulations[i]->getQvel();
+    std::copy(q.data(), q.data() + q.size(), cpuGetArticulationRow(eCpuQvel, i));
+  }
+}
+
+void PhysxSystemCpu::cpuFetchArticulationQacc() {
+  SAPIEN_PROFILE_FUNCTION;
+  checkCpuInitialized();
+  for (uint32_t i = 0; i < mCpuArticulations.size(); ++i) {
+    auto q = mCpuArticulations[i]->getQacc();
+    std::copy(q.data(), q.data() + q.size(), cpuGetArticulationRow(eCpuQacc, i));
+  }
+}
+
+void PhysxSystemCpu::cpuFetchArticulationQTarget(int plane, bool velocity) {
+  checkCpuInitialized();
+  for (uint32_t i = 0; i < mCpuArticulations.size(); ++i) {
+    float *row = cpuGetArticulationRow(plane, i);
+    for (auto &joint : mCpuArticulationActiveJoints[i]) {
+      auto target = velocity ? joint->getDriveTargetVelocity() : joint->getDriveTargetPosition();
+      row = std::copy(target.data(), target.data() + target.size(), row);
+    }
+  }
+}
+
+void PhysxSystemCpu::cpuFetchArticulationQTargetPos() {
+  SAPIEN_PROFILE_FUNCTION;
+  cpuFetchArticulationQTarget(eCpuQTargetPos, false);
+}
+
+void PhysxSystemCpu::cpuFetchArticulationQTargetVel() {
+  SAPIEN_PROFILE_FUNCTION;
+  cpuFetchArticulationQTarget(eCpuQTargetVel, true);
+}
+
+void PhysxSystemCpu::cpuApplyArticulationState(int plane, std::vector<int> const &indices) {
+  checkCpuInitialized();
+  for (int i : indices) {
+    auto &art = mCpuArticulations[i];
+    Eigen::VectorXf q =
+        Eigen::Map<Eigen::VectorXf>(cpuGetArticulationRow(plane, i), art->getDof());
+    switch (plane) {
+    case eCpuQpos:
+      art->setQpos(q);
+      break;
+    case eCpuQvel:
+      art->setQvel(q);
+      break;
+    case eCpuQf:
+      art->setQf(q);
+      break;
+    default:
+      throw std::runtime_error("invalid articulation buffer");
+    }
+  }
+  if (plane == eCpuQf) {
+    mCpuReapplyArticulation[plane] = indices;
+  }
+}
+
+void PhysxSystemCpu::cpuApplyArticulationQTarget(int plane, bool velocity,
+                                                 std::vector<int> const &indices) {
+  checkCpuInitialized();
+  for (int i : indices) {
+    float const *row = cpuGetArticulationRow(plane, i);
+    for (auto &joint : mCpuArticulationActiveJoints[i]) {
+      Eigen::VectorXf target = Eigen::Map<Eigen::VectorXf const>(row, joint->getDof());
+      row += joint->getDof();
+      if (velocity) {
+        joint->setDriveTargetVelocity(target);
+      } else {
+        joint->setDriveTargetPosition(target);
+      }
+    }
+  }
+  mCpuReapplyArticulation[plane] = indices;
+}
+
+void PhysxSystemCpu::cpuReapplyBuffers() {
+  SAPIEN_PROFILE_FUNCTION;
+  if (mCpuReapplyForce) {
+    cpuApplyRigidDynamicForce();
+  }
+  if (mCpuReapplyTorque) {
+    cpuApplyRigidDynamicTorque();
+  }
+  for (auto const &[plane, indices] : mCpuReapplyArticulation) {
+    if (plane == eCpuQf) {
+      cpuApplyArticulationState(plane, indices);
+    } else {
+      cpuApplyArticulationQTarget(plane, plane == eCpuQTargetVel, indices);
+    }
+  }
+}
+
+void PhysxSystemCpu::cpuClearReapplyBuffers() {
+  mCpuReapplyForce = false;
+  mCpuReapplyTorque = false;
+  mCpuReapplyArticulation.clear();
+}
+
+void PhysxSystemCpu::cpuApplyArticulationQpos() {
+  SAPIEN_PROFILE_FUNCTION;
+  cpuApplyArticulationState(eCpuQpos, cpuAllArticulationIndices());
+}
+void PhysxSystemCpu::cpuApplyArticulationQvel() {
+  SAPIEN_PROFILE_FUNCTION;
+  cpuApplyArticulationState(eCpuQvel, cpuAllArticulationIndices());
+}
+void PhysxSystemCpu::cpuApplyArticulationQf() {
+  SAPIEN_PROFILE_FUNCTION;
+  cpuApplyArticulationState(eCpuQf, cpuAllArticulationIndices());
+}
+void PhysxSystemCpu::cpuApplyArticulationQTargetPos() {
+  SAPIEN_PROFILE_FUNCTION;
+  cpuApplyArticulationQTarget(eCpuQTargetPos, false, cpuAllArticulationIndices());
+}
+void PhysxSystemCpu::cpuApplyArticulationQTargetVel() {
+  SAPIEN_PROFILE_FUNCTION;
+  cpuApplyArticulationQTarget(eCpuQTargetVel, true, cpuAllArticulationIndices());
+}
+
+void PhysxSystemCpu::cpuApplyArticulationQpos(int const *indices, int count) {
+  SAPIEN_PROFILE_FUNCTION;
+  cpuApplyArticulationState(eCpuQpos, cpuCheckArticulationIndices(indices, count));
+}
+void PhysxSystemCpu::cpuApplyArticulationQvel(int const *indices, int count) {
+  SAPIEN_PROFILE_FUNCTION;
+  cpuApplyArticulationState(eCpuQvel, cpuCheckArticulationIndices(indices, count));
+}
+void PhysxSystemCpu::cpuApplyArticulationQf(int const *indices, int count) {
+  SAPIEN_PROFILE_FUNCTION;
+  cpuApplyArticulationState(eCpuQf, cpuCheckArticulationIndices(indices, count));
+}
+void PhysxSystemCpu::cpuApplyArticulationQTargetPos(int const *indices, int count) {
+  SAPIEN_PROFILE_FUNCTION;
+  cpuApplyArticulationQTarget(eCpuQTargetPos, false, cpuCheckArticulationIndices(indices, count));
+}
+void PhysxSystemCpu::cpuApplyArticulationQTargetVel(int const *indices, int count) {
+  SAPIEN_PROFILE_FUNCTION;
+  cpuApplyArticulationQTarget(eCpuQTargetVel, true, cpuCheckArticulationIndices(indices, count));
+}
+
 #ifdef SAPIEN_CUDA
 void PhysxSystemGpu::step() {
   if (!mGpuInitialized) {
@@ -264,10 +1095,60 @@ void PhysxSystemGpu::step() {
   ++mTotalSteps;
   mPxScene->simulate(mTimestep);
   mPxScene->fetchResults(true);
+  gpuClearReapplyBuffers();
 
   // TODO: does the GPU API require fetch results?
 }
 
+void PhysxSystemGpu::step(uint32_t substeps, bool reapply,
+                          std::vector<PhysxGpuContactPairImpulseQuery *> const &pairQueries,
+                          std::vector<PhysxGpuContactBodyImpulseQuery *> const &bodyQueries) {
+  if (!mGpuInitialized) {
+    throw std::runtime_error("failed to step: gpu simulation is not initialized.");
+  }
+  if (substeps == 0) {
+    throw std::runtime_error("failed to step: substep count must be positive");
+  }
+  for (auto query : pairQueries) {
+    query->query.handle().checkShape({-1, 6});
+  }
+  for (auto query : bodyQueries) {
+    query->query.handle().checkShape({-1, 4});
+  }
+
+  ensureCudaDevice();
+  for (auto query : pairQueries) {
+    cudaMemsetAsync(query->buffer.ptr, 0, query->query.shape.at(0) * 3 * sizeof(float),
+                    mCudaStream);
+  }
+  for (auto query : bodyQueries) {
+    cudaMemsetAsync(query->buffer.ptr, 0, query->query.shape.at(0) * 3 * sizeof(float),
+                    mCudaStream);
+  }
+
+  for (uint32_t i = 0; i < substeps; ++i) {
+    if (i > 0 && reapply) {
+      gpuReapplyBuffers();
+    }
+    mContactUpToDate = false;
+    ++mTotalSteps;
+    mPxScene->simulate(mTimestep);
+    mPxScene->fetchResults(true);
+
+    for (auto query : pairQueries) {
+      gpuAccumulateContactPairImpulses(*query);
+    }
+    for (auto query : bodyQueries) {
+      gpuAccumulateContactBodyImpulses(*query);
+    }
+  }
+  gpuClearReapplyBuffers();
+
+  if (!pairQueries.empty() || !bodyQueries.empty()) {
+    cudaStreamSynchronize(mCudaStream);
+  }
+}
+
 void PhysxSystemGpu::stepStart() {
   if (!mGpuInitialized) {
     throw std::runtime_error("failed to step: gpu simulation is not initialized.");
@@ -277,6 +1158,7 @@ void PhysxSystemGpu::stepStart() {
 
   ++mTotalSteps;
   mPxScene->simulate(mTimestep);
+  gpuClearReapplyBuffers();
 }
 
 void PhysxSystemGpu::stepFinish() { mPxScene->fetchResults(true); }
@@ -369,6 +1251,55 @@ void PhysxSystemCpu::unpackState(std::string const &data) {
   }
 }
 
+void PhysxSystem::addActor(PxActor &actor) {
+  if (mActorBatchDepth == 0) {
+    getPxScene()->addActor(actor);
+    return;
+  }
+  if (!mPendingRemoveActors.empty()) {
+    auto it = std::find(mPendingRemoveActors.begin(), mPendingRemoveActors.end(), &actor);
+    if (it != mPendingRemoveActors.end()) {
+      mPendingRemoveActors.erase(it);
+      return;
+    }
+  }
+  mPendingAddActors.push_back(&actor);
+}
+
+void PhysxSystem::removeActor(PxActor &actor) {
+  if (mActorBatchDepth == 0) {
+    getPxScene()->removeActor(actor);
+    return;
+  }
+  if (!mPendingAddActors.empty()) {
+    auto it = std::find(mPendingAddActors.begin(), mPendingAddActors.end(), &actor);
+    if (it != mPendingAddActors.end()) {
+      mPendingAddActors.erase(it);
+      return;
+    }
+  }
+  mPendingRemoveActors.push_back(&actor);
+}
+
+void PhysxSystem::beginActorBatch() { mActorBatchDepth++; }
+
+void PhysxSystem::endActorBatch() {
+  if (mActorBatchDepth == 0) {
+    throw std::runtime_error("failed to end actor batch: no batch in progress");
+  }
+  if (--mActorBatchDepth > 0) {
+    return;
+  }
+  if (!mPendingRemoveActors.empty()) {
+    getPxScene()->removeActors(mPendingRemoveActors.data(), mPendingRemoveActors.size());
+    mPendingRemoveActors.clear();
+  }
+  if (!mPendingAddActors.empty()) {
+    getPxScene()->addActors(mPendingAddActors.data(), mPendingAddActors.size());
+    mPendingAddActors.clear();
+  }
+}
+
 int PhysxSystem::getArticulationCount() const {
   // TODO: ensure this count matches registered articulations
   return getPxScene()->getNbArticulations();
@@ -542,7 +1473,12 @@ void PhysxSystemGpu::gpuQueryContactPairImpulses(PhysxGpuContactPairImpulseQuery
 
   ensureCudaDevice();
   cudaMemsetAsync(query.buffer.ptr, 0, query.query.shape.at(0) * 3 * sizeof(float), mCudaStream);
+  gpuAccumulateContactPairImpulses(query);
+  cudaStreamSynchronize(mCudaStream);
+}
 
+void PhysxSystemGpu::gpuAccumulateContactPairImpulses(
+    PhysxGpuContactPairImpulseQuery const &query) {
   copyContactData();
 
   if (mContactCount) {
@@ -550,7 +1486,6 @@ void PhysxSystemGpu::gpuQueryContactPairImpulses(PhysxGpuContactPairImpulseQuery
                   (ActorPairQuery *)query.query.ptr, query.query.shape.at(0),
                   (Vec3 *)query.buffer.ptr, mCudaStream);
   }
-  cudaStreamSynchronize(mCudaStream);
 }
 
 void PhysxSystemGpu::gpuQueryContactBodyImpulses(PhysxGpuContactBodyImpulseQuery const &query) {
@@ -559,7 +1494,12 @@ void PhysxSystemGpu::gpuQueryContactBodyImpulses(PhysxGpuContactBodyImpulseQuery
 
   ensureCudaDevice();
   cudaMemsetAsync(query.buffer.ptr, 0, query.query.shape.at(0) * 3 * sizeof(float), mCudaStream);
+  gpuAccumulateContactBodyImpulses(query);
+  cudaStreamSynchronize(mCudaStream);
+}
 
+void PhysxSystemGpu::gpuAccumulateContactBodyImpulses(
+    PhysxGpuContactBodyImpulseQuery const &query) {
   copyContactData();
 
   if (mContactCount) {
@@ -567,7 +1507,6 @@ void PhysxSystemGpu::gpuQueryContactBodyImpulses(PhysxGpuContactBodyImpulseQuery
                            (ActorQuery *)query.query.ptr, query.query.shape.at(0),
                            (Vec3 *)query.buffer.ptr, mCudaStream);
   }
-  cudaStreamSynchronize(mCudaStream);
 }
 
 void PhysxSystemGpu::gpuFetchRigidDynamicData() {
@@ -844,6 +1783,7 @@ void PhysxSystemGpu::gpuApplyRigidDynamicForce() {
                            PxRigidDynamicGPUAPIWriteType::eFORCE, n, mCudaEventRecord.event,
                            mCudaEventWait.event);
   mCudaEventWait.wait(mCudaStream);
+  mGpuReapplyForce = true;
 }
 
 void PhysxSystemGpu::gpuApplyRigidDynamicTorque() {
@@ -861,6 +1801,7 @@ void PhysxSystemGpu::gpuApplyRigidDynamicTorque() {
                            PxRigidDynamicGPUAPIWriteType::eTORQUE, n, mCudaEventRecord.event,
                            mCudaEventWait.event);
   mCudaEventWait.wait(mCudaStream);
+  mGpuReapplyTorque = true;
 }
 
 void PhysxSystemGpu::gpuApplyArticulationRootPose() {
@@ -1014,6 +1955,7 @@ void PhysxSystemGpu::gpuApplyArticulationQf(CudaArrayHandle const &indices) {
                            static_cast<PxU32>(indices.shape.at(0)),
                            mCudaEventRecord.event, mCudaEventWait.event);
   mCudaEventWait.wait(mCudaStream);
+  gpuRecordReapply(mGpuReapplyQf, indices);
 }
 
 void PhysxSystemGpu::gpuApplyArticulationQTargetPos() {
@@ -1044,6 +1986,7 @@ void PhysxSystemGpu::gpuApplyArticulationQTargetPos(CudaArrayHandle const &indic
                            static_cast<PxU32>(indices.shape.at(0)),
                            mCudaEventRecord.event, mCudaEventWait.event);
   mCudaEventWait.wait(mCudaStream);
+  gpuRecordReapply(mGpuReapplyQTargetPos, indices);
 }
 
 void PhysxSystemGpu::gpuApplyArticulationQTargetVel() {
@@ -1074,6 +2017,51 @@ void PhysxSystemGpu::gpuApplyArticulationQTargetVel(CudaArrayHandle const &indic
                            static_cast<PxU32>(indices.shape.at(0)),
                            mCudaEventRecord.event, mCudaEventWait.event);
   mCudaEventWait.wait(mCudaStream);
+  gpuRecordReapply(mGpuReapplyQTargetVel, indices);
+}
+
+void PhysxSystemGpu::gpuRecordReapply(GpuReapplyIndices &record, CudaArrayHandle const &indices) {
+  record.active = true;
+  record.all = indices.ptr == mCudaArticulationIndexBuffer.ptr;
+  if (record.all || indices.ptr == record.buffer.ptr) {
+    return;
+  }
+  int count = indices.shape.at(0);
+  if (!record.buffer.ptr || record.buffer.shape.at(0) != count) {
+    record.buffer = CudaArray({count}, "i4");
+  }
+  cudaMemcpyAsync(record.buffer.ptr, indices.ptr, count * sizeof(int), cudaMemcpyDeviceToDevice,
+                  mCudaStream);
+}
+
+void PhysxSystemGpu::gpuReapplyBuffers() {
+  SAPIEN_PROFILE_FUNCTION;
+  if (mGpuReapplyForce) {
+    gpuApplyRigidDynamicForce();
+  }
+  if (mGpuReapplyTorque) {
+    gpuApplyRigidDynamicTorque();
+  }
+  auto replay = [this](GpuReapplyIndices const &record) {
+    return record.all ? mCudaArticulationIndexBuffer.handle() : record.buffer.handle();
+  };
+  if (mGpuReapplyQf.active) {
+    gpuApplyArticulationQf(replay(mGpuReapplyQf));
+  }
+  if (mGpuReapplyQTargetPos.active) {
+    gpuApplyArticulationQTargetPos(replay(mGpuReapplyQTargetPos));
+  }
+  if (mGpuReapplyQTargetVel.active) {
+    gpuApplyArticulationQTargetVel(replay(mGpuReapplyQTargetVel));
+  }
+}
+
+void PhysxSystemGpu::gpuClearReapplyBuffers() {
+  mGpuReapplyForce = false;
+  mGpuReapplyTorque = false;
+  mGpuReapplyQf.active = false;
+  mGpuReapplyQTargetPos.active = false;
+  mGpuReapplyQTargetVel.active = false;
 }
 
 void PhysxSystemGpu::syncPosesGpuToCpu() {
@@ -1309,6 +2297,9 @@ PhysxSystem::~PhysxSystem() { logger::info("Deleting PhysxSystem"); }
 
 PhysxSystemCpu::~PhysxSystemCpu() {
   if (mPxScene) {
+    if (mStepping) {
+      mPxScene->fetchResults(true);
+    }
     mPxScene->release();
   }
   if (mPxCPUDispatcher) {
@@ -0,0 +1,52 @@
+/*
+ * Copyright 2025 Hillbot Inc.
+ * Copyright 2020-2024 UCSD SU Lab
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at:
+ * 
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#include "sapien/physx/physx_system_group.h"
+#include <algorithm>
+
+namespace sapien {
+namespace physx {
+
+PhysxSystemCpuGroup::PhysxSystemCpuGroup(uint32_t threadCount) : mThreadPool(threadCount) {}
+
+void PhysxSystemCpuGroup::addSystem(std::shared_ptr<PhysxSystemCpu> system) {
+  if (!system) {
+    throw std::runtime_error("failed to add system: system is null");
+  }
+  if (std::find(mSystems.begin(), mSystems.end(), system) != mSystems.end()) {
+    throw std::runtime_error("failed to add system: system is already in the group");
+  }
+  mSystems.push_back(system);
+}
+
+void PhysxSystemCpuGroup::removeSystem(std::shared_ptr<PhysxSystemCpu> system) {
+  auto it = std::find(mSystems.begin(), mSystems.end(), system);
+  if (it == mSystems.end()) {
+    throw std::runtime_error("failed to remove system: system is not in the group");
+  }
+  mSystems.erase(it);
+}
+
+void PhysxSystemCpuGroup::step() {
+  mThreadPool.parallelFor(mSystems.size(), [this](uint32_t begin, uint32_t end) {
+    for (uint32_t i = begin; i < end; ++i) {
+      mSystems[i]->step();
+    }
+  });
+}
+
+} // namespace physx
+} // namespace sapien
@@ -84,6 +84,17 @@ bool PhysxRigidBaseComponent::isUsingDirectGPUAPI() const {
          getPxActor()->getScene()->getFlags().isSet(PxSceneFlag::eENABLE_DIRECT_GPU_API);
 }
 
+void PhysxRigidBaseComponent::setReportContacts(bool enable) {
+  if (mReportContacts == enable) {
+    return;
+  }
+  mReportContacts = enable;
+  // existing pairs keep their report flags until they are filtered again
+  if (auto scene = getPxActor()->getScene()) {
+    scene->resetFiltering(*getPxActor());
+  }
+}
+
 Vec3 PhysxRigidBodyComponent::getLinearVelocity() const {
   // if (isUsingDirectGPUAPI()) {
   //   throw std::runtime_error("failed to set velocity: not supported on GPU mode");
@@ -255,12 +266,12 @@ void PhysxRigidStaticComponent::onAddToScene(Scene &scene) {
     getPxActor()->setGlobalPose(pose);
   }
 #endif
-  system->getPxScene()->addActor(*getPxActor());
+  system->addActor(*getPxActor());
 }
 
 void PhysxRigidStaticComponent::onRemoveFromScene(Scene &scene) {
   auto system = scene.getPhysxSystem();
-  system->getPxScene()->removeActor(*getPxActor());
+  system->removeActor(*getPxActor());
 
   system->unregisterComponent(
       std::static_pointer_cast<PhysxRigidStaticComponent>(shared_from_this()));
@@ -282,12 +293,12 @@ void PhysxRigidDynamicComponent::onAddToScene(Scene &scene) {
   }
 #endif
 
-  system->getPxScene()->addActor(*getPxActor());
+  system->addActor(*getPxActor());
 }
 
 void PhysxRigidDynamicComponent::onRemoveFromScene(Scene &scene) {
   auto system = scene.getPhysxSystem();
-  system->getPxScene()->removeActor(*getPxActor());
+  system->removeActor(*getPxActor());
 
   system->unregisterComponent(
       std::static_pointer_cast<PhysxRigidDynamicComponent>(shared_from_this()));
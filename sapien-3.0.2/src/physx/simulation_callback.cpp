@@ -0,0 +1,162 @@
+/*
+ * Copyright 2025 Hillbot Inc.
+ * Copyright 2020-2024 UCSD SU Lab
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at:
+ * 
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#include "sapien/physx/simulation_callback.hpp"
+#include "./filter_shader.hpp"
+#include "sapien/physx/rigid_component.h"
+
+using namespace physx;
+namespace sapien {
+namespace physx {
+
+PxFilterFlags ContactReportFilterCallback::pairFound(PxU64 pairID,
+                                                     PxFilterObjectAttributes attributes0,
+                                                     PxFilterData filterData0, const PxActor *a0,
+                                                     const PxShape *s0,
+                                                     PxFilterObjectAttributes attributes1,
+                                                     PxFilterData filterData1, const PxActor *a1,
+                                                     const PxShape *s1, PxPairFlags &pairFlags) {
+  auto c0 = static_cast<PhysxRigidBaseComponent *>(a0->userData);
+  auto c1 = static_cast<PhysxRigidBaseComponent *>(a1->userData);
+  if ((c0 && c0->getReportContacts()) || (c1 && c1->getReportContacts())) {
+    pairFlags |= kContactReportPairFlags;
+  }
+  return PxFilterFlag::eDEFAULT;
+}
+
+void DefaultEventCallback::onContact(const PxContactPairHeader &pairHeader,
+                                     const PxContactPair *pairs, PxU32 nbPairs) {
+  for (uint32_t i = 0; i < nbPairs; ++i) {
+    ShapePair key{pairs[i].shapes[0], pairs[i].shapes[1]};
+    if (pairs[i].events & PxPairFlag::eNOTIFY_TOUCH_LOST) {
+      auto it = mContactIndex.find(key);
+      if (mAccumulating && it != mContactIndex.end() &&
+          mAccumulateStates[it->second] != eNotReported) {
+        mAccumulateStates[it->second] = eLost;
+      } else {
+        removeContact(key);
+      }
+      continue;
+    }
+
+    if (pairs[i].events & PxPairFlag::eNOTIFY_TOUCH_FOUND ||
+        pairs[i].events & PxPairFlag::eNOTIFY_TOUCH_PERSISTS) {
+      void *a0 = pairHeader.actors[0]->userData;
+      void *a1 = pairHeader.actors[1]->userData;
+      if (!a0 || !a1) {
+        continue;
+      }
+
+      uint32_t slot;
+      auto it = mContactIndex.find(key);
+      if (it != mContactIndex.end()) {
+        slot = it->second;
+      } else {
+        slot = mContactCount++;
+        if (slot == mContacts.size()) {
+          mContacts.push_back(std::make_unique<Contact>());
+          mContactKeys.emplace_back();
+          mAccumulateStates.push_back(eNotReported);
+        }
+        mContactKeys[slot] = key;
+        mAccumulateStates[slot] = eNotReported;
+        mContactIndex.emplace(key, slot);
+      }
+
+      Contact &contact = *mContacts[slot];
+      contact.components[0] = static_cast<PhysxRigidBaseComponent *>(a0);
+      contact.components[1] = static_cast<PhysxRigidBaseComponent *>(a1);
+      contact.shapes[0] = static_cast<PhysxCollisionShape *>(pairs[i].shapes[0]->userData);
+      contact.shapes[1] = static_cast<PhysxCollisionShape *>(pairs[i].shapes[1]->userData);
+
+      uint32_t count = pairs[i].contactCount;
+      if (mPointBuffer.size() < count) {
+        mPointBuffer.resize(count);
+      }
+      count = pairs[i].extractContacts(mPointBuffer.data(), count);
+
+      // while accumulating, points of later steps are appended to those of earlier steps
+      size_t offset = 0;
+      if (mAccumulating) {
+        if (mAccumulateStates[slot] != eNotReported) {
+          offset = contact.points.size();
+        }
+        mAccumulateStates[slot] = eReported;
+      }
+      contact.points.resize(offset + count);
+      for (uint32_t j = 0; j < count; ++j) {
+        auto &p = mPointBuffer[j];
+        contact.points[offset + j] = {PxVec3ToVec3(p.position), PxVec3ToVec3(p.normal),
+                                      PxVec3ToVec3(p.impulse), p.separation};
+      }
+    }
+  }
+}
+
+void DefaultEventCallback::removeContact(ShapePair const &key) {
+  auto it = mContactIndex.find(key);
+  if (it == mContactIndex.end()) {
+    return;
+  }
+  uint32_t slot = it->second;
+  mContactIndex.erase(it);
+
+  // move the last live contact into the hole and park the removed one, with its point storage,
+  // right after the live range
+  uint32_t last = --mContactCount;
+  if (slot != last) {
+    std::swap(mContacts[slot], mContacts[last]);
+    std::swap(mContactKeys[slot], mContactKeys[last]);
+    std::swap(mAccumulateStates[slot], mAccumulateStates[last]);
+    mContactIndex[mContactKeys[slot]] = slot;
+  }
+}
+
+std::vector<Contact *> DefaultEventCallback::getContacts() const {
+  std::vector<Contact *> contacts;
+  contacts.reserve(mContactCount);
+  for (uint32_t i = 0; i < mContactCount; ++i) {
+    contacts.push_back(mContacts[i].get());
+  }
+  return contacts;
+}
+
+void DefaultEventCallback::clearContacts() {
+  mContactCount = 0;
+  mContactIndex.clear();
+}
+
+void DefaultEventCallback::beginAccumulate() {
+  mAccumulating = true;
+  std::fill(mAccumulateStates.begin(), mAccumulateStates.end(), eNotReported);
+}
+
+void DefaultEventCallback::endAccumulate() {
+  mAccumulating = false;
+  std::vector<ShapePair> lost;
+  for (uint32_t i = 0; i < mContactCount; ++i) {
+    if (mAccumulateStates[i] == eLost) {
+      lost.push_back(mContactKeys[i]);
+    }
+  }
+  for (auto const &key : lost) {
+    removeContact(key);
+  }
+  std::fill(mAccumulateStates.begin(), mAccumulateStates.end(), eNotReported);
+}
+
+} // namespace physx
+} // namespace sapien
@@ -19,6 +19,9 @@
 #include "sapien/entity.h"
 #include "sapien/physx/physx_system.h"
 #include "sapien/sapien_renderer/sapien_renderer.h"
+#include <cstring>
+#include <unordered_set>
+#include <utility>
 
 namespace sapien {
 
@@ -63,6 +66,77 @@ std::shared_ptr<sapien_renderer::SapienRendererSystem> Scene::getSapienRendererS
 void Scene::step() { getPhysxSystem()->step(); }
 void Scene::updateRender() { getSapienRendererSystem()->step(); }
 
+namespace {
+// Opens a physx actor batch when the scene has a physx system. commit() flushes it and may
+// throw; a guard destroyed without commit() (e.g. during unwinding) flushes and only logs errors
+class ActorBatchGuard {
+public:
+  explicit ActorBatchGuard(std::shared_ptr<physx::PhysxSystem> system) : mSystem(system) {
+    if (mSystem) {
+      mSystem->beginActorBatch();
+    }
+  }
+  void commit() {
+    if (auto system = std::exchange(mSystem, nullptr)) {
+      system->endActorBatch();
+    }
+  }
+  ~ActorBatchGuard() noexcept {
+    try {
+      commit();
+    } catch (std::exception const &e) {
+      logger::error("failed to end actor batch: {}", e.what());
+    }
+  }
+  ActorBatchGuard(ActorBatchGuard const &) = delete;
+  ActorBatchGuard &operator=(ActorBatchGuard const &) = delete;
+
+private:
+  std::shared_ptr<physx::PhysxSystem> mSystem;
+};
+} // namespace
+
+static constexpr size_t kMinTombstonesToCompact = 64;
+
+static std::shared_ptr<physx::PhysxSystem>
+findPhysxSystem(std::unordered_map<std::string, std::shared_ptr<System>> const &systems) {
+  auto it = systems.find("physx");
+  if (it == systems.end()) {
+    return nullptr;
+  }
+  return std::dynamic_pointer_cast<physx::PhysxSystem>(it->second);
+}
+
+void Scene::internalAddEntity(std::shared_ptr<Entity> entity) {
+  mEntityIndex[entity.get()] = mEntities.size();
+  mEntities.push_back(entity);
+  entity->internalSetScene(this);
+  entity->internalSetPerSceneId(mNextEntityId++);
+  entity->onAddToScene(*this);
+}
+
+void Scene::internalRemoveEntity(std::shared_ptr<Entity> entity) {
+  auto it = mEntityIndex.find(entity.get());
+  mEntities[it->second] = nullptr;
+  mEntityIndex.erase(it);
+  mTombstoneCount++;
+
+  entity->onRemoveFromScene(*this);
+  entity->internalSetPerSceneId(0);
+  entity->internalSetScene(nullptr);
+}
+
+void Scene::compactEntities() {
+  if (mTombstoneCount < kMinTombstonesToCompact || mTombstoneCount * 2 < mEntities.size()) {
+    return;
+  }
+  std::erase(mEntities, nullptr);
+  for (size_t i = 0; i < mEntities.size(); ++i) {
+    mEntityIndex[mEntities[i].get()] = i;
+  }
+  mTombstoneCount = 0;
+}
+
 void Scene::addEntity(std::shared_ptr<Entity> entity) {
   if (!entity) {
     throw std::runtime_error("failed to add entity to scene: entity is null");
@@ -72,34 +146,95 @@ void Scene::addEntity(std::shared_ptr<Entity> entity) {
     throw std::runtime_error("failed to add entity to scene: entity is already added to a scene.");
   }
 
-  mEntities.push_back(entity);
-  entity->internalSetScene(this);
-  entity->internalSetPerSceneId(mNextEntityId++);
-  entity->onAddToScene(*this);
+  internalAddEntity(entity);
 }
 
 void Scene::removeEntity(std::shared_ptr<Entity> entity) {
-  auto count = std::erase_if(mEntities, [=](auto &e) { return e == entity; });
-  if (count == 0) {
+  if (!entity || !mEntityIndex.contains(entity.get())) {
     throw std::runtime_error("failed to remove entity: not added");
   }
-  entity->onRemoveFromScene(*this);
-  entity->internalSetPerSceneId(0);
-  entity->internalSetScene(nullptr);
+  internalRemoveEntity(entity);
+  compactEntities();
+}
+
+void Scene::addEntities(std::vector<std::shared_ptr<Entity>> const &entities) {
+  std::unordered_set<Entity *> seen;
+  for (auto &entity : entities) {
+    if (!entity) {
+      throw std::runtime_error("failed to add entities to scene: entity is null");
+    }
+    if (entity->getScene()) {
+      throw std::runtime_error(
+          "failed to add entities to scene: entity is already added to a scene.");
+    }
+    if (!seen.insert(entity.get()).second) {
+      throw std::runtime_error("failed to add entities to scene: duplicated entity");
+    }
+  }
+
+  mEntities.reserve(mEntities.size() + entities.size());
+  ActorBatchGuard guard(findPhysxSystem(mSystems));
+  for (auto &entity : entities) {
+    internalAddEntity(entity);
+  }
+  guard.commit();
+}
+
+void Scene::removeEntities(std::vector<std::shared_ptr<Entity>> const &entities) {
+  std::unordered_set<Entity *> seen;
+  for (auto &entity : entities) {
+    if (!entity || !mEntityIndex.contains(entity.get())) {
+      throw std::runtime_error("failed to remove entities: not added");
+    }
+    if (!seen.insert(entity.get()).second) {
+      throw std::runtime_error("failed to remove entities: duplicated entity");
+    }
+  }
+
+  {
+    ActorBatchGuard guard(findPhysxSystem(mSystems));
+    for (auto &entity : entities) {
+      internalRemoveEntity(entity);
+    }
+    guard.commit();
+  }
+  compactEntities();
+}
+
+std::vector<std::shared_ptr<Entity>> Scene::getEntities() const {
+  if (mTombstoneCount == 0) {
+    return mEntities;
+  }
+  std::vector<std::shared_ptr<Entity>> result;
+  result.reserve(mEntities.size() - mTombstoneCount);
+  for (auto &e : mEntities) {
+    if (e) {
+      result.push_back(e);
+    }
+  }
+  return result;
 }
 
 std::string Scene::packEntityPoses() {
-  std::ostringstream ss;
-  for (auto e : mEntities) {
+  std::string data((mEntities.size() - mTombstoneCount) * sizeof(Pose), '\0');
+  char *out = data.data();
+  for (auto &e : mEntities) {
+    if (!e) {
+      continue;
+    }
     Pose pose = e->getPose();
-    ss.write(reinterpret_cast<char *>(&pose), sizeof(Pose));
+    std::memcpy(out, &pose, sizeof(Pose));
+    out += sizeof(Pose);
   }
-  return ss.str();
+  return data;
 }
 
 void Scene::unpackEntityPoses(std::string const &data) {
   std::istringstream ss(data);
   for (auto e : mEntities) {
+    if (!e) {
+      continue;
+    }
     Pose pose;
     ss.read(reinterpret_cast<char *>(&pose), sizeof(Pose));
     e->internalSyncPose(pose);
@@ -109,17 +244,25 @@ void Scene::unpackEntityPoses(std::string const &data) {
 
 void Scene::clear() {
   for (auto &entity : mEntities) {
+    if (!entity) {
+      continue;
+    }
     entity->onRemoveFromScene(*this);
     entity->internalSetPerSceneId(0);
     entity->internalSetScene(nullptr);
   }
   mEntities.clear();
+  mEntityIndex.clear();
+  mTombstoneCount = 0;
 }
 
 Scene::~Scene() {
   gSceneCount--;
   logger::info("Deleting Scene {}, total {}", mId, gSceneCount);
   for (auto &entity : mEntities) {
+    if (!entity) {
+      continue;
+    }
     entity->onRemoveFromScene(*this);
     entity->internalSetPerSceneId(0);
     entity->internalSetScene(nullptr);
@@ -0,0 +1,134 @@
+/*
+ * Copyright 2025 Hillbot Inc.
+ * Copyright 2020-2024 UCSD SU Lab
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at:
+ * 
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#include "sapien/utils/thread_pool.h"
+#include <algorithm>
+
+namespace sapien {
+
+static thread_local bool gInsideParallelFor = false;
+
+ThreadPool::ThreadPool(uint32_t threadCount) {
+  if (threadCount == 0) {
+    threadCount = std::max(1u, std::thread::hardware_concurrency());
+  }
+  for (uint32_t i = 1; i < threadCount; ++i) {
+    mWorkers.emplace_back([this]() { workerLoop(); });
+  }
+}
+
+ThreadPool::~ThreadPool() {
+  {
+    std::lock_guard lock(mLock);
+    mStop = true;
+  }
+  mWorkCv.notify_all();
+  for (auto &t : mWorkers) {
+    t.join();
+  }
+}
+
+ThreadPool &ThreadPool::Get() {
+  static ThreadPool pool;
+  return pool;
+}
+
+void ThreadPool::runChunks() {
+  std::unique_lock lock(mLock);
+  while (mNext < mCount) {
+    uint32_t begin = mNext;
+    uint32_t end = std::min(mCount, begin + mGrain);
+    mNext = end;
+    auto fn = mFn;
+    lock.unlock();
+    try {
+      (*fn)(begin, end);
+    } catch (...) {
+      lock.lock();
+      if (!mError) {
+        mError = std::current_exception();
+      }
+      // skip remaining chunks
+      mNext = mCount;
+      continue;
+    }
+    lock.lock();
+  }
+}
+
+void ThreadPool::workerLoop() {
+  gInsideParallelFor = true;
+  uint64_t seen = 0;
+  while (true) {
+    {
+      std::unique_lock lock(mLock);
+      mWorkCv.wait(lock, [&] { return mStop || mGeneration != seen; });
+      if (mStop) {
+        return;
+      }
+      seen = mGeneration;
+      ++mActive;
+    }
+    runChunks();
+    {
+      std::lock_guard lock(mLock);
+      --mActive;
+    }
+    mDoneCv.notify_one();
+  }
+}
+
+void ThreadPool::parallelFor(uint32_t count, std::function<void(uint32_t, uint32_t)> const &fn,
+                             uint32_t grain) {
+  if (count == 0) {
+    return;
+  }
+  grain = std::max(grain, 1u);
+  if (gInsideParallelFor || mWorkers.empty() || count <= grain) {
+    fn(0, count);
+    return;
+  }
+
+  std::lock_guard loopLock(mLoopLock);
+  {
+    std::lock_guard lock(mLock);
+    mFn = &fn;
+    mCount = count;
+    mGrain = grain;
+    mNext = 0;
+    mError = nullptr;
+    ++mGeneration;
+  }
+  mWorkCv.notify_all();
+
+  gInsideParallelFor = true;
+  runChunks();
+  gInsideParallelFor = false;
+
+  std::exception_ptr error;
+  {
+    std::unique_lock lock(mLock);
+    mDoneCv.wait(lock, [&] { return mActive == 0; });
+    mFn = nullptr;
+    error = mError;
+    mError = nullptr;
+  }
+  if (error) {
+    std::rethrow_exception(error);
+  }
+}
+
+} // namespace sapien
@@ -124,3 +124,41 @@ class TestArticulation(unittest.TestCase):
             self.assertTrue(
                 pose_equal(j.global_pose, j.child_link.entity_pose * j.pose_in_child)
             )
+
+    def test_cpu_articulation_data(self):
+        system = sapien.physx.PhysxCpuSystem()
+        scene = sapien.Scene([system, sapien.render.RenderSystem()])
+        loader = scene.create_urdf_loader()
+        robots = [
+            loader.load(str(Path(".") / "assets" / "movo_simple.urdf")) for _ in range(2)
+        ]
+        dof = robots[0].dof
+
+        system.cpu_init()
+        self.assertEqual(system.cpu_articulations, robots)
+        self.assertEqual(system.cpu_articulation_qpos.shape, (2, dof))
+        for i, robot in enumerate(robots):
+            self.assertTrue(np.allclose(system.cpu_articulation_qpos[i], robot.qpos))
+
+        target = np.random.uniform(-0.5, 0.5, (2, dof)).astype(np.float32)
+        system.cpu_articulation_target_qpos[:] = target
+        system.cpu_apply_articulation_target_position()
+        for i, robot in enumerate(robots):
+            self.assertTrue(
+                np.allclose(
+                    [j.get_drive_target()[0] for j in robot.get_active_joints()], target[i]
+                )
+            )
+
+        qpos = np.random.uniform(-0.5, 0.5, dof).astype(np.float32)
+        system.cpu_articulation_qpos[1] = qpos
+        system.cpu_apply_articulation_qpos(np.array([1], dtype=np.int32))
+        self.assertTrue(np.allclose(robots[1].qpos, qpos, atol=1e-5))
+        self.assertFalse(np.allclose(robots[0].qpos, qpos, atol=1e-5))
+
+        system.cpu_articulation_qpos[:] = 0
+        system.cpu_fetch_articulation_qpos()
+        self.assertTrue(np.allclose(system.cpu_articulation_qpos[1], qpos, atol=1e-5))
+
+        with self.assertRaises(RuntimeError):
+            system.cpu_apply_articulation_qvel(np.array([2], dtype=np.int32))
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 import numpy as np
 from common import pose_equal
@@ -5,6 +6,16 @@ from common import pose_equal
 import sapien
 
 
+# The shared dispatcher pool is sized once per process; tests needing it go through this helper
+SHARED_DISPATCHER_WORKERS = 2
+
+
+def ensure_shared_dispatcher():
+    if sapien.physx.get_shared_cpu_dispatcher_worker_count() < 0:
+        sapien.physx.set_shared_cpu_dispatcher_config(SHARED_DISPATCHER_WORKERS)
+    return sapien.physx.get_shared_cpu_dispatcher_worker_count()
+
+
 class TestSystem(unittest.TestCase):
     def test_timestep(self):
         system = sapien.physx.PhysxCpuSystem()
@@ -129,6 +140,210 @@ class TestSystem(unittest.TestCase):
         self.assertTrue(pose_equal(e1.pose, p1))
         self.assertTrue(np.allclose(c0.linear_velocity, v0, atol=1e-5))
 
+    def test_contact_report_mode(self):
+        system = sapien.physx.PhysxCpuSystem()
+        scene = sapien.Scene([system])
+        self.assertEqual(system.contact_report_mode, "full")
+        mat = sapien.physx.PhysxMaterial(0.2, 0.1, 0.05)
+
+        c0 = sapien.physx.PhysxRigidDynamicComponent()
+        c0.attach(sapien.physx.PhysxCollisionShapeBox([0.1, 0.2, 0.3], mat))
+        c0.disable_gravity = True
+        scene.add_entity(sapien.Entity().add_component(c0))
+
+        c1 = sapien.physx.PhysxRigidDynamicComponent()
+        c1.kinematic = True
+        c1.attach(sapien.physx.PhysxCollisionShapeBox([0.1, 0.2, 0.3], mat))
+        e1 = sapien.Entity().add_component(c1)
+        e1.set_pose(sapien.Pose([0.201, 0, 0]))
+        scene.add_entity(e1)
+
+        system.step()
+        self.assertEqual(len(system.get_contacts()), 1)
+
+        system.contact_report_mode = "off"
+        self.assertEqual(system.get_contacts(), [])
+        system.step()
+        self.assertEqual(system.get_contacts(), [])
+
+        system.contact_report_mode = "flagged"
+        system.step()
+        self.assertEqual(system.get_contacts(), [])
+
+        c1.report_contacts = True
+        self.assertTrue(c1.report_contacts)
+        system.step()
+        contacts = system.get_contacts()
+        self.assertEqual(len(contacts), 1)
+        self.assertEqual(set(contacts[0].bodies), set([c0, c1]))
+
+        with self.assertRaises(TypeError):
+            system.contact_report_mode = "some"
+
+    def test_step_start_finish(self):
+        sapien.physx.set_scene_config(cpu_workers=2)
+        systems = [sapien.physx.PhysxCpuSystem() for _ in range(2)]
+        sapien.physx.set_scene_config()
+        mat = sapien.physx.PhysxMaterial(0.2, 0.1, 0.05)
+        scenes = []
+        bodies = []
+        for system in systems:
+            scene = sapien.Scene([system])
+            body = sapien.physx.PhysxRigidDynamicComponent()
+            body.attach(sapien.physx.PhysxCollisionShapeSphere(0.1, mat))
+            scene.add_entity(sapien.Entity().add_component(body))
+            scenes.append(scene)
+            bodies.append(body)
+
+        for _ in range(10):
+            systems[0].step()
+            systems[1].step_start()
+            self.assertTrue(systems[1].stepping)
+            systems[1].step_finish()
+            self.assertFalse(systems[1].stepping)
+        self.assertTrue(pose_equal(bodies[0].entity.pose, bodies[1].entity.pose))
+        self.assertTrue(bodies[1].entity.pose.p[2] < 0)
+
+        with self.assertRaises(RuntimeError):
+            systems[1].step_finish()
+        systems[1].step_start()
+        with self.assertRaises(RuntimeError):
+            systems[1].step_start()
+        with self.assertRaises(RuntimeError):
+            systems[1].step()
+        systems[1].step_finish()
+
+    def test_substeps(self):
+        sapien.physx.set_scene_config(gravity=[0, 0, 0])
+        systems = [sapien.physx.PhysxCpuSystem() for _ in range(3)]
+        sapien.physx.set_scene_config()
+        mat = sapien.physx.PhysxMaterial(0.2, 0.1, 0.05)
+        scenes = []
+        bodies = []
+        for system in systems:
+            scene = sapien.Scene([system])
+            body = sapien.physx.PhysxRigidDynamicComponent()
+            body.attach(sapien.physx.PhysxCollisionShapeSphere(0.1, mat))
+            scene.add_entity(sapien.Entity().add_component(body))
+            scenes.append(scene)
+            bodies.append(body)
+            system.cpu_init()
+            system.cpu_rigid_dynamic_force[0, :3] = [1, 0, 0]
+
+        for _ in range(4):
+            systems[0].cpu_apply_rigid_dynamic_force()
+            systems[0].step()
+        systems[1].cpu_apply_rigid_dynamic_force()
+        systems[1].step(4, reapply_drives_and_forces=True)
+        systems[2].cpu_apply_rigid_dynamic_force()
+        systems[2].step(4)
+
+        self.assertTrue(pose_equal(bodies[0].entity.pose, bodies[1].entity.pose))
+        self.assertTrue(np.allclose(bodies[0].linear_velocity, bodies[1].linear_velocity))
+        self.assertTrue(bodies[2].linear_velocity[0] < bodies[1].linear_velocity[0])
+
+        with self.assertRaises(RuntimeError):
+            systems[0].step(0)
+
+    def test_substep_contacts(self):
+        system = sapien.physx.PhysxCpuSystem()
+        scene = sapien.Scene([system])
+        scene.add_ground(0)
+        mat = sapien.physx.PhysxMaterial(0.2, 0.1, 0.05)
+        box = sapien.physx.PhysxRigidDynamicComponent()
+        box.attach(sapien.physx.PhysxCollisionShapeBox([0.1, 0.1, 0.1], mat))
+        entity = sapien.Entity().add_component(box)
+        entity.set_pose(sapien.Pose([0, 0, 0.1]))
+        scene.add_entity(entity)
+
+        def impulse():
+            return abs(sum(p.impulse[2] for c in system.get_contacts() for p in c.points))
+
+        for _ in range(20):
+            system.step()
+        single = impulse()
+        self.assertTrue(single > 0)
+
+        system.step(4, accumulate_contacts=True)
+        self.assertAlmostEqual(impulse(), 4 * single, delta=0.05 * single)
+        system.step()
+        self.assertAlmostEqual(impulse(), single, delta=0.05 * single)
+
+    def test_broad_phase(self):
+        config = sapien.physx.PhysxSceneConfig()
+        self.assertEqual(config.broad_phase, "pabp")
+        with self.assertRaises(TypeError):
+            config.broad_phase = "gpu"
+
+        for broad_phase in ["sap", "abp", "pabp"]:
+            sapien.physx.set_scene_config(broad_phase=broad_phase)
+            system = sapien.physx.PhysxCpuSystem()
+            self.assertEqual(system.get_config().broad_phase, broad_phase)
+            self.assertEqual(system.get_broad_phase_regions(), [])
+
+        sapien.physx.set_scene_config(broad_phase="mbp", mbp_subdivisions=2)
+        system = sapien.physx.PhysxCpuSystem()
+        sapien.physx.set_scene_config()
+        scene = sapien.Scene([system])
+        scene.add_ground(0)
+        self.assertEqual(system.get_broad_phase_regions(), [])
+
+        mat = sapien.physx.PhysxMaterial(0.2, 0.1, 0.05)
+        bodies = []
+        for x in [-3, 3]:
+            body = sapien.physx.PhysxRigidDynamicComponent()
+            body.attach(sapien.physx.PhysxCollisionShapeBox([0.1, 0.1, 0.1], mat))
+            entity = sapien.Entity().add_component(body)
+            entity.set_pose(sapien.Pose([x, 0, 0.2]))
+            scene.add_entity(entity)
+            bodies.append(body)
+
+        for _ in range(100):
+            system.step()
+        regions = system.get_broad_phase_regions()
+        self.assertEqual(len(regions), 4)
+        lower = np.min([r[0] for r in regions], axis=0)
+        upper = np.max([r[1] for r in regions], axis=0)
+        self.assertTrue(np.all(lower < [-3, 0, 0]) and np.all(upper > [3, 0, 0.2]))
+        # the ground keeps colliding with bodies inside the regions
+        for body in bodies:
+            self.assertAlmostEqual(body.entity.pose.p[2], 0.1, places=2)
+
+    def test_shared_dispatcher(self):
+        workers = ensure_shared_dispatcher()
+        systems = [sapien.physx.PhysxCpuSystem(shared_dispatcher=True) for _ in range(2)]
+        self.assertEqual(sapien.physx.get_shared_cpu_dispatcher_worker_count(), workers)
+
+        # the pool is sized once; later configs are rejected and leave it unchanged
+        with self.assertRaises(RuntimeError):
+            sapien.physx.set_shared_cpu_dispatcher_config(workers + 1)
+        self.assertEqual(sapien.physx.get_shared_cpu_dispatcher_worker_count(), workers)
+
+        mat = sapien.physx.PhysxMaterial(0.2, 0.1, 0.05)
+        scenes = []
+        bodies = []
+        for i, system in enumerate(systems):
+            self.assertTrue(system.shared_dispatcher)
+            system.dispatcher_priority = i
+            self.assertEqual(system.dispatcher_priority, i)
+            scene = sapien.Scene([system])
+            body = sapien.physx.PhysxRigidDynamicComponent()
+            body.attach(sapien.physx.PhysxCollisionShapeSphere(0.1, mat))
+            scene.add_entity(sapien.Entity().add_component(body))
+            scenes.append(scene)
+            bodies.append(body)
+
+        for _ in range(10):
+            for system in systems:
+                system.step()
+        self.assertTrue(np.allclose(bodies[0].entity.pose.p, bodies[1].entity.pose.p))
+        self.assertTrue(bodies[0].entity.pose.p[2] < 0)
+
+        system = sapien.physx.PhysxCpuSystem()
+        self.assertFalse(system.shared_dispatcher)
+        with self.assertRaises(RuntimeError):
+            system.dispatcher_priority = 1
+
     def test_raycast(self):
         system = sapien.physx.PhysxCpuSystem()
         scene = sapien.Scene([system])
@@ -146,3 +361,177 @@ class TestSystem(unittest.TestCase):
         self.assertEqual(res.component, c0)
         self.assertTrue(np.allclose(res.distance, 8**0.5))
         self.assertTrue(np.allclose(res.position, [2, 0, -1], atol=1e-5))
+
+    def test_scene_query_config(self):
+        config = sapien.physx.PhysxSceneConfig()
+        self.assertEqual(config.scene_query_update_mode, "commit")
+        self.assertEqual(config.scene_query_pruner, "aabb_tree")
+
+        mat = sapien.physx.PhysxMaterial(0.2, 0.1, 0.05)
+        for mode in ["commit", "build", "disabled"]:
+            for pruner in ["aabb_tree", "bvh", "none"]:
+                sapien.physx.set_scene_config(
+                    scene_query_update_mode=mode, scene_query_pruner=pruner
+                )
+                system = sapien.physx.PhysxCpuSystem()
+                self.assertEqual(system.get_config().scene_query_update_mode, mode)
+                self.assertEqual(system.get_config().scene_query_pruner, pruner)
+                scene = sapien.Scene([system])
+                ground = sapien.physx.PhysxRigidStaticComponent()
+                ground.attach(sapien.physx.PhysxCollisionShapeBox([1, 1, 0.1], mat))
+                ground_entity = sapien.Entity().add_component(ground)
+                ground_entity.set_pose(sapien.Pose([0, 0, -10]))
+                scene.add_entity(ground_entity)
+                body = sapien.physx.PhysxRigidDynamicComponent()
+                body.attach(sapien.physx.PhysxCollisionShapeBox([0.1, 0.1, 0.1], mat))
+                body.disable_gravity = True
+                scene.add_entity(sapien.Entity().add_component(body))
+                body.linear_velocity = [0, 0, -24]
+
+                # queries see bodies added or moved by a step without an explicit update
+                res = system.raycast([0, 0, 5], [0, 0, -1], 100)
+                self.assertAlmostEqual(res.distance, 4.9, places=4)
+                for _ in range(10):
+                    system.step()
+                res = system.raycast([0, 0, 5], [0, 0, -1], 100)
+                self.assertAlmostEqual(res.distance, 4.9 + 24 * 10 * system.timestep, places=3)
+                # "none" only flattens the dynamic structure; statics keep their AABB tree
+                res = system.raycast([0, 0, -20], [0, 0, 1], 100)
+                self.assertAlmostEqual(res.distance, 9.9, places=4)
+        sapien.physx.set_scene_config()
+
+    def test_scene_config_pickle(self):
+        config = sapien.physx.PhysxSceneConfig()
+        config.broad_phase = "mbp"
+        config.mbp_world_lower = [-5, -5, -1]
+        config.mbp_world_upper = [5, 5, 3]
+        config.mbp_subdivisions = 8
+        config.scene_query_update_mode = "disabled"
+        config.scene_query_pruner = "bvh"
+        loaded = pickle.loads(pickle.dumps(config))
+        self.assertEqual(loaded.broad_phase, "mbp")
+        self.assertTrue(np.allclose(loaded.mbp_world_lower, [-5, -5, -1]))
+        self.assertTrue(np.allclose(loaded.mbp_world_upper, [5, 5, 3]))
+        self.assertEqual(loaded.mbp_subdivisions, 8)
+        self.assertEqual(loaded.scene_query_update_mode, "disabled")
+        self.assertEqual(loaded.scene_query_pruner, "bvh")
+
+    def test_batch_query(self):
+        system = sapien.physx.PhysxCpuSystem()
+        scene = sapien.Scene([system])
+        mat = sapien.physx.PhysxMaterial(0.2, 0.1, 0.05)
+        b0 = sapien.physx.PhysxCollisionShapeBox([0.5, 0.5, 0.5], mat)
+        c0 = sapien.physx.PhysxRigidStaticComponent()
+        c0.attach(b0)
+        e0 = sapien.Entity().add_component(c0)
+        scene.add_entity(e0)
+
+        n = 1000
+        origins = np.zeros((n, 3), dtype=np.float32)
+        origins[:, 2] = 2
+        origins[n // 2 :, 0] = 10
+        directions = np.tile(np.array([0, 0, -1], dtype=np.float32), (n, 1))
+
+        distance, position, normal, index, components = system.raycast_batch(
+            origins, directions, 100
+        )
+        self.assertEqual(components, [c0])
+        self.assertTrue(np.all(index[: n // 2] == 0))
+        self.assertTrue(np.all(index[n // 2 :] == -1))
+        self.assertTrue(np.allclose(distance[: n // 2], 1.5))
+        self.assertTrue(np.all(np.isinf(distance[n // 2 :])))
+        self.assertTrue(np.allclose(position[: n // 2], [0, 0, 0.5]))
+        self.assertTrue(np.allclose(normal[: n // 2], [0, 0, 1]))
+
+        distance, _, _, index, _ = system.sweep_sphere_batch(origins, directions, 100, 0.25)
+        self.assertTrue(np.allclose(distance[: n // 2], 1.25, atol=1e-4))
+        self.assertTrue(np.all(index[n // 2 :] == -1))
+
+        distance, _, _, index, _ = system.sweep_box_batch(
+            origins, directions, 100, [0.1, 0.1, 0.1]
+        )
+        self.assertTrue(np.allclose(distance[: n // 2], 1.4, atol=1e-4))
+
+        index, components = system.overlap_sphere_batch(origins - [0, 0, 1.6], 0.2)
+        self.assertEqual(components, [c0])
+        self.assertTrue(np.all(index[: n // 2] == 0))
+        self.assertTrue(np.all(index[n // 2 :] == -1))
+
+        index, _ = system.overlap_capsule_batch(origins, 0.1, 0.2)
+        self.assertTrue(np.all(index == -1))
+
+        with self.assertRaises(RuntimeError):
+            system.raycast_batch(origins, directions[:10], 100)
+
+    def test_cpu_system_group(self):
+        group = sapien.physx.PhysxCpuSystemGroup(num_threads=4)
+        self.assertEqual(group.num_threads, 4)
+
+        mat = sapien.physx.PhysxMaterial(0.2, 0.1, 0.05)
+        systems = []
+        scenes = []
+        bodies = []
+        for i in range(8):
+            system = sapien.physx.PhysxCpuSystem()
+            scene = sapien.Scene([system])
+            body = sapien.physx.PhysxRigidDynamicComponent()
+            body.attach(sapien.physx.PhysxCollisionShapeSphere(0.1, mat))
+            scene.add_entity(sapien.Entity().add_component(body))
+            group.add_system(system)
+            systems.append(system)
+            scenes.append(scene)
+            bodies.append(body)
+        self.assertEqual(group.systems, systems)
+
+        with self.assertRaises(RuntimeError):
+            group.add_system(systems[0])
+
+        for _ in range(10):
+            group.step()
+        for body in bodies:
+            self.assertTrue(body.entity.pose.p[2] < 0)
+            self.assertTrue(pose_equal(body.entity.pose, bodies[0].entity.pose))
+
+        group.remove_system(systems[0])
+        self.assertEqual(group.systems, systems[1:])
+
+    def test_cpu_rigid_body_data(self):
+        sapien.physx.set_scene_config(gravity=[0, 0, 0])
+        system = sapien.physx.PhysxCpuSystem()
+        sapien.physx.set_scene_config(gravity=[0, 0, -9.81])
+        scene = sapien.Scene([system])
+        mat = sapien.physx.PhysxMaterial(0.2, 0.1, 0.05)
+
+        bodies = []
+        for i in range(3):
+            body = sapien.physx.PhysxRigidDynamicComponent()
+            body.attach(sapien.physx.PhysxCollisionShapeSphere(0.1, mat))
+            entity = sapien.Entity().add_component(body)
+            entity.set_pose(sapien.Pose([i, 0, 0]))
+            scene.add_entity(entity)
+            bodies.append(body)
+
+        system.cpu_init()
+        self.assertEqual(system.cpu_rigid_dynamic_components, bodies)
+        data = system.cpu_rigid_dynamic_data
+        self.assertEqual(data.shape, (3, 13))
+        self.assertEqual(system.cpu_rigid_dynamic_force.shape, (3, 4))
+        self.assertTrue(np.allclose(data[:, 0], [0, 1, 2]))
+        self.assertTrue(np.allclose(data[:, 3:7], [1, 0, 0, 0]))
+
+        data[1, 0:3] = [5, 5, 5]
+        data[1, 7:10] = [1, 0, 0]
+        system.cpu_apply_rigid_dynamic_data(np.array([1], dtype=np.int32))
+        self.assertTrue(np.allclose(bodies[1].entity.pose.p, [5, 5, 5]))
+        self.assertTrue(np.allclose(bodies[1].linear_velocity, [1, 0, 0]))
+
+        system.cpu_rigid_dynamic_force[2, :3] = [0, 0, 10]
+        system.cpu_apply_rigid_dynamic_force()
+        system.step()
+        system.cpu_fetch_rigid_dynamic_data()
+        self.assertTrue(data[1, 0] > 5)
+        self.assertTrue(data[2, 9] > 0)
+        self.assertTrue(np.allclose(data[0, 7:13], 0))
+
+        with self.assertRaises(RuntimeError):
+            system.cpu_apply_rigid_dynamic_data(np.array([3], dtype=np.int32))
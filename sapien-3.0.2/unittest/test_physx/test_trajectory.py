@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import sapien
+from sapien.physx.trajectory import TrajectoryReader, TrajectoryRecorder
+
+
+class TestTrajectory(unittest.TestCase):
+    def build(self):
+        system = sapien.physx.PhysxCpuSystem()
+        scene = sapien.Scene([system, sapien.render.RenderSystem()])
+        builder = scene.create_actor_builder()
+        builder.add_box_collision(half_size=[0.1, 0.1, 0.1])
+        for i in range(3):
+            builder.set_initial_pose(sapien.Pose([0, 0, 0.5 + 0.3 * i]))
+            builder.build()
+        loader = scene.create_urdf_loader()
+        robot = loader.load(str(Path(".") / "assets" / "movo_simple.urdf"))
+        robot.set_qvel(np.random.uniform(-0.5, 0.5, robot.dof))
+        return system, scene
+
+    def test_record_restore(self):
+        system, scene = self.build()
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "traj.bin")
+            states = []
+            with TrajectoryRecorder(system, path, chunk_size=4) as recorder:
+                for _ in range(10):
+                    scene.step()
+                    recorder.record()
+                    system.cpu_fetch_rigid_dynamic_data()
+                    system.cpu_fetch_articulation_qpos()
+                    states.append(
+                        (
+                            system.cpu_rigid_dynamic_data.copy(),
+                            system.cpu_articulation_qpos.copy(),
+                        )
+                    )
+
+            with TrajectoryReader(path) as reader:
+                self.assertEqual(reader.num_steps, 10)
+                for step in [7, 2, 9, 0]:
+                    state = reader.read(step)
+                    self.assertTrue(np.array_equal(state["rigid_dynamic_data"], states[step][0]))
+                    self.assertTrue(np.array_equal(state["articulation_qpos"], states[step][1]))
+
+                other, _ = self.build()
+                reader.restore(other, 5)
+                other.cpu_fetch_rigid_dynamic_data()
+                other.cpu_fetch_articulation_qpos()
+                self.assertTrue(
+                    np.allclose(other.cpu_rigid_dynamic_data[:, :7], states[5][0][:, :7], atol=1e-5)
+                )
+                self.assertTrue(np.allclose(other.cpu_articulation_qpos, states[5][1], atol=1e-4))
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 import numpy as np
@@ -29,6 +30,30 @@ class TestScene(unittest.TestCase):
         scene.clear()
         self.assertEqual(scene.entities, [])
 
+    def test_add_remove_entities(self):
+        scene = sapien.Scene()
+        entities = [sapien.Entity() for _ in range(200)]
+        for e in entities:
+            e.add_component(sapien.physx.PhysxRigidDynamicComponent())
+        scene.add_entities(entities)
+        self.assertEqual(scene.entities, entities)
+
+        with self.assertRaises(RuntimeError):
+            scene.add_entities([sapien.Entity(), entities[0]])
+        self.assertEqual(len(scene.entities), 200)
+
+        scene.remove_entity(entities[3])
+        scene.remove_entities(entities[100:])
+        with self.assertRaises(RuntimeError):
+            scene.remove_entity(entities[3])
+        self.assertEqual(scene.entities, entities[:3] + entities[4:100])
+        for e in entities[100:]:
+            self.assertIsNone(e.scene)
+
+        scene.add_entities(entities[100:110])
+        self.assertEqual(scene.entities[-10:], entities[100:110])
+        scene.step()
+
     def test_pack_unpack(self):
         p0 = rand_pose()
         p1 = rand_pose()
@@ -187,3 +212,101 @@ class TestScene(unittest.TestCase):
         )
 
         # TODO: check details of the built shapes
+
+    def test_builder_spec(self):
+        builder = sapien.ActorBuilder()
+        mat = sapien.physx.PhysxMaterial(0.5, 0.4, 0.2)
+        builder.add_box_collision(half_size=[0.1, 0.2, 0.3], material=mat, density=500)
+        builder.add_sphere_collision(pose=rand_pose(), radius=0.2)
+        spec = pickle.loads(pickle.dumps(builder.build_physx_spec()))
+
+        for _ in range(2):
+            scene = sapien.Scene()
+            body = sapien.physx.build_physx_component(spec)
+            shapes = body.get_collision_shapes()
+            self.assertEqual(len(shapes), 2)
+            self.assertTrue(np.allclose(shapes[0].half_size, [0.1, 0.2, 0.3]))
+            self.assertAlmostEqual(shapes[0].density, 500)
+            self.assertAlmostEqual(shapes[0].physical_material.static_friction, 0.5)
+            self.assertTrue(np.allclose(shapes[1].radius, 0.2))
+            scene.add_entity(sapien.Entity().add_component(body))
+            scene.step()
+
+        # built shapes keep the builder's materials, never the global default
+        default = sapien.physx.get_default_material()
+        friction = default.static_friction
+        mat = sapien.physx.PhysxMaterial(
+            default.static_friction, default.dynamic_friction, default.restitution
+        )
+        builder = sapien.ActorBuilder()
+        builder.add_box_collision(material=mat)
+        builder.add_sphere_collision(
+            material=sapien.physx.PhysxMaterial(
+                default.static_friction, default.dynamic_friction, default.restitution
+            )
+        )
+        spec = builder.build_physx_spec()
+        shapes = sapien.physx.build_physx_component(spec).get_collision_shapes()
+        shapes[0].physical_material.static_friction = 0.9
+        self.assertAlmostEqual(mat.static_friction, 0.9)
+        self.assertAlmostEqual(shapes[1].physical_material.static_friction, friction)
+        self.assertAlmostEqual(sapien.physx.get_default_material().static_friction, friction)
+
+        # an unpickled spec gets new materials (shared between equal coefficients)
+        spec = pickle.loads(pickle.dumps(spec))
+        shapes = sapien.physx.build_physx_component(spec).get_collision_shapes()
+        shapes[1].physical_material.static_friction = 0.8
+        self.assertAlmostEqual(shapes[0].physical_material.static_friction, 0.8)
+        self.assertAlmostEqual(mat.static_friction, 0.9)
+        self.assertAlmostEqual(sapien.physx.get_default_material().static_friction, friction)
+
+        builder = sapien.ArticulationBuilder()
+        root = builder.create_link_builder()
+        root.add_box_collision(half_size=[0.1, 0.1, 0.1])
+        child = builder.create_link_builder(root)
+        child.add_capsule_collision(radius=0.05, half_length=0.2)
+        child.set_joint_name("joint")
+        child.set_joint_properties("revolute", [[-1, 1]], sapien.Pose(), sapien.Pose())
+        spec = builder.build_spec(fix_root_link=True)
+
+        entities = sapien.physx.build_articulation_entities(spec)
+        self.assertEqual(len(entities), 2)
+        articulation = entities[0].components[0].articulation
+        self.assertEqual(articulation.dof, 1)
+        joint = articulation.find_joint_by_name("joint")
+        self.assertTrue(np.allclose(joint.limit, [[-1, 1]]))
+        self.assertEqual(articulation.root.joint.type, "fixed")
+
+    def test_pose_exporter(self):
+        scenes = [sapien.Scene(), sapien.Scene()]
+        poses = []
+        entities = []
+        for scene in scenes:
+            for _ in range(3):
+                pose = rand_pose()
+                entity = sapien.Entity()
+                entity.set_pose(pose)
+                scene.add_entity(entity)
+                poses.append(pose)
+                entities.append(entity)
+
+        exporter = sapien.EntityPoseExporter(scenes)
+        self.assertEqual(exporter.count, 6)
+        out = np.zeros((6, 7), dtype=np.float32)
+        self.assertIs(exporter.export_poses(out), out)
+        for row, pose in zip(out, poses):
+            self.assertTrue(pose_equal(sapien.Pose(row[:3], row[3:]), pose))
+        self.assertTrue(
+            np.array_equal(
+                exporter.index_map,
+                [[s, e.per_scene_id] for s in range(2) for e in entities[3 * s : 3 * s + 3]],
+            )
+        )
+
+        exporter = sapien.EntityPoseExporter(scenes, [entities[4], entities[1]])
+        out = exporter.export_poses()
+        self.assertEqual(exporter.entities, [entities[1], entities[4]])
+        self.assertTrue(pose_equal(sapien.Pose(out[1, :3], out[1, 3:]), poses[4]))
+
+        with self.assertRaises(RuntimeError):
+            exporter.export_poses(np.zeros((2, 7), dtype=np.float64))
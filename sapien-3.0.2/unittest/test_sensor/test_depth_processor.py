@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+from sapien.sensor import depth_processor as dp
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+
+class TestDepthProcessor(unittest.TestCase):
+    def test_census(self):
+        img = np.random.randint(0, 256, (40, 50), dtype=np.uint8)
+        census = dp.get_census(img, 7)
+        self.assertEqual(census.dtype, np.uint8)
+
+        # reference: all 48 comparisons shifted into a uint8, as the original implementation did
+        y, x = 20, 30
+        expected = 0
+        for v in range(7):
+            for u in range(7):
+                if u == v == 3:
+                    continue
+                expected = ((expected << 1) | int(img[y - 3 + v, x - 3 + u] >= img[y, x])) & 0xFF
+        self.assertEqual(int(census[y, x]), expected)
+        self.assertEqual(int(census[0, 0]), 0)
+
+    @unittest.skipIf(cv2 is None, "opencv is not installed")
+    def test_depth_from_disparity(self):
+        q = np.array(
+            [[1, 0, 0, -640], [0, 1, 0, -360], [0, 0, 0, 920], [0, 0, 1 / 0.0545, 0]]
+        )
+        disp = np.random.uniform(1, 128, (72, 128)).astype(np.float32)
+        disp[0, :5] = 0
+        expected = cv2.reprojectImageTo3D(disp, q)[..., 2]
+        expected[~np.isfinite(expected)] = 0
+        self.assertTrue(np.allclose(dp.depth_from_disparity(disp, q), expected, rtol=1e-5))
+
+    @unittest.skipIf(cv2 is None, "opencv is not installed")
+    def test_post_processing(self):
+        depth = np.random.uniform(0, 2, (60, 80)).astype(np.float32)
+        self.assertTrue(
+            np.allclose(dp.depth_post_processing_fast(depth), dp.depth_post_processing(depth))
+        )
+
+    def test_depth_to_points(self):
+        K = np.array([[50.0, 0, 16], [0, 50.0, 12], [0, 0, 1]])
+        depth = np.random.uniform(0.5, 2, (24, 32)).astype(np.float32)
+        depth[:4] = 0
+        extrinsic = np.eye(4)
+        extrinsic[:3, :3] = np.array([[0, -1, 0], [0, 0, -1], [1, 0, 0]])
+        extrinsic[:3, 3] = [0.1, -0.2, 0.3]
+
+        # reference: pixel-center grid, explicit inverse intrinsics and extrinsics
+        u, v = np.meshgrid(np.arange(32) + 0.5, np.arange(24) + 0.5)
+        grid = np.stack([u.reshape(-1), v.reshape(-1), np.ones(u.size)])
+        cam = (np.linalg.inv(K) @ grid) * depth.reshape(1, -1)
+        world = (np.linalg.inv(extrinsic[:3, :3]) @ (cam - extrinsic[:3, 3:])).T
+
+        rays = dp.get_ray_grid(24, 32, K)
+        self.assertEqual(rays.dtype, np.float32)
+        self.assertTrue(np.allclose(dp.depth_to_points(depth, rays), cam.T, atol=1e-5))
+        self.assertTrue(np.allclose(dp.depth_to_points(depth, rays, extrinsic), world, atol=1e-5))
+
+        merged = dp.depth_to_pointcloud_batch([depth, depth], [rays, rays], [extrinsic, None])
+        valid = depth.reshape(-1) > 0
+        self.assertTrue(np.allclose(merged, np.concatenate([world[valid], cam.T[valid]]), atol=1e-5))
+
+        down = dp.depth_to_pointcloud_batch([depth], [rays], [extrinsic], voxel_size=0.5)
+        self.assertLess(len(down), valid.sum())
+        self.assertTrue(np.allclose(down.mean(axis=0), world[valid].mean(axis=0), atol=0.5))
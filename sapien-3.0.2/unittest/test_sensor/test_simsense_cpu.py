@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+from sapien.sensor.simsense_cpu import CpuDepthSensorEngine, census_transform
+
+
+def make_engine(rows, cols, max_disp, focal, baseline):
+    u, v = np.meshgrid(np.arange(cols, dtype=np.float32), np.arange(rows, dtype=np.float32))
+    ones = np.ones_like(u)
+    # fmt: off
+    return CpuDepthSensorEngine(
+        rows, cols, rows, cols, focal, baseline, 0.1, 10.0,
+        0, 0.0, 0.0, 0.0, 0.0, True,
+        5, 5, max_disp, 3, 3, 8, 32, 15, 1, 3,
+        u, v, u, v, u, v, ones, 0.0, 0.0, 0.0, False,
+        focal, focal, 0.0, cols / 2, rows / 2,
+    )
+    # fmt: on
+
+
+class TestSimsenseCpu(unittest.TestCase):
+    def test_census(self):
+        img = np.random.randint(0, 256, (16, 20), dtype=np.uint8)
+        census = census_transform(img, 3, 3)
+        # bits 0..3 compare (-1,-1), (0,-1), (1,-1), (-1,0) against their mirror
+        y, x = 5, 7
+        expected = (
+            int(img[y - 1, x - 1] >= img[y + 1, x + 1])
+            | int(img[y - 1, x] >= img[y + 1, x]) << 1
+            | int(img[y - 1, x + 1] >= img[y + 1, x - 1]) << 2
+            | int(img[y, x - 1] >= img[y, x + 1]) << 3
+        )
+        self.assertEqual(int(census[y, x]), expected)
+
+    def test_constant_disparity(self):
+        rows, cols, disp = 64, 128, 8
+        rng = np.random.default_rng(0)
+        left = rng.integers(0, 256, (rows, cols), dtype=np.uint8)
+        right = rng.integers(0, 256, (rows, cols), dtype=np.uint8)
+        right[:, :-disp] = left[:, disp:]
+
+        engine = make_engine(rows, cols, 32, 100.0, 0.05)
+        engine.compute(left, right)
+        depth = engine.get_ndarray()
+        self.assertEqual(depth.shape, (rows, cols))
+
+        interior = depth[16:48, 48:100]
+        self.assertGreater(np.mean(interior > 0), 0.8)
+        self.assertAlmostEqual(float(np.median(interior[interior > 0])), 100.0 * 0.05 / disp, 2)
+
+        pc = engine.get_point_cloud_ndarray()
+        self.assertEqual(pc.shape, (rows * cols, 3))
+        self.assertTrue(np.allclose(pc[:, 2], depth.reshape(-1)))
+
+        with self.assertRaises(RuntimeError):
+            engine.get_cuda()
@@ -13,6 +13,11 @@ PHYSX_CONFIG="${PHYSX_CONFIG:-profile}"
 # e.g. PX_PTX_REPLACE_LIST="integration;solver" ./scripts/update_toolchain.sh
 PX_PTX_REPLACE_LIST="${PX_PTX_REPLACE_LIST:-}"
 PX_PTX_ARCH="${PX_PTX_ARCH:-compute_86}"
+# PX_PTX_CUBIN_ARCHS: semicolon-separated sm_XX archs ptxas precompiles the PTX
+# for (no GPU needed); the PTX stays in the fatbin as JIT fallback for other GPUs.
+# Empty uses the arch of PX_PTX_ARCH.
+# e.g. PX_PTX_CUBIN_ARCHS="sm_86;sm_89;sm_90" ./scripts/update_toolchain.sh
+PX_PTX_CUBIN_ARCHS="${PX_PTX_CUBIN_ARCHS:-}"
 # PTX source preference when PTX replacement is enabled.
 # CMake now consumes a single suffix directly (no file copying):
 #   nvcc     -> use <stem>.ptx
@@ -243,13 +248,14 @@ else
   _px_headless_benches=OFF
 fi
 
-echo "[2/4] Configure PhysX (snippets=${_px_buildsnippets}, PTX_LIST=${PX_PTX_REPLACE_LIST:-none}, PTX_SOURCE=${PX_PTX_SOURCE}, PTX_SUFFIX=${ELYTAR_PTX_INPUT_SUFFIX:-.ptx})"
+echo "[2/4] Configure PhysX (snippets=${_px_buildsnippets}, PTX_LIST=${PX_PTX_REPLACE_LIST:-none}, PTX_SOURCE=${PX_PTX_SOURCE}, PTX_SUFFIX=${ELYTAR_PTX_INPUT_SUFFIX:-.ptx}, CUBIN_ARCHS=${PX_PTX_CUBIN_ARCHS:-default})"
 cmake -S "${PHYSX_DIR}/compiler/public" -B "${PHYSX_BUILD_DIR}" \
   -DPX_BUILDSNIPPETS="${_px_buildsnippets}" \
   -DPX_BUILDPVDRUNTIME=FALSE \
   -DPX_GENERATE_GPU_PROJECTS=ON \
   -DPX_PTX_REPLACE_LIST="${PX_PTX_REPLACE_LIST}" \
   -DPX_PTX_ARCH="${PX_PTX_ARCH}" \
+  -DELYTAR_PTX_CUBIN_ARCHS="${PX_PTX_CUBIN_ARCHS}" \
   -DELYTAR_PTX_INPUT_SUFFIX="${ELYTAR_PTX_INPUT_SUFFIX:-.ptx}" \
   -DELYTAR_BUILD_HEADLESS_SNIPPET_BENCHES="${_px_headless_benches}"
 
@@ -317,6 +323,7 @@ verify_ptx_mode() {
   echo ""
   echo "=== PTX hybrid verification ==="
   echo "  arch        : ${PX_PTX_ARCH}"
+  echo "  cubin archs : ${PX_PTX_CUBIN_ARCHS:-sm_${PX_PTX_ARCH#compute_}}"
   echo "  PTX stems   : ${n_expected_ptx} (PX_PTX_REPLACE_LIST=${replace_list})"
   echo "  libs        : ${lib_dir}"
   echo "  build       : ${build_dir}"
@@ -377,6 +384,43 @@ verify_ptx_mode() {
     _ptx_check_fail "elytar_ptx/ not found under ${build_dir} — cmake may not have run with PTX stems"
   fi
 
+  # ------------------------------------------------------------------
+  # Check 2b: Manifest lists every stem and each fatbin embeds a cubin
+  # per requested arch (so no JIT at process start on those GPUs)
+  # ------------------------------------------------------------------
+  echo ""
+  echo "  [2b] Precompiled cubins (elytar_ptx/manifest.json, cuobjdump):"
+  local _cubin_archs
+  IFS=';' read -ra _cubin_archs <<< "${PX_PTX_CUBIN_ARCHS:-sm_${PX_PTX_ARCH#compute_}}"
+  if [[ -f "${elytar_dir}/manifest.json" ]]; then
+    for stem in "${!_ptx_stems[@]}"; do
+      if grep -q "\"${stem}\":" "${elytar_dir}/manifest.json"; then
+        _ptx_check_pass "${stem} listed in manifest.json"
+      else
+        _ptx_check_fail "${stem} missing from ${elytar_dir}/manifest.json"
+      fi
+    done
+  else
+    _ptx_check_fail "manifest.json not found in ${elytar_dir}"
+  fi
+  if command -v cuobjdump >/dev/null 2>&1; then
+    for stem in "${!_ptx_stems[@]}"; do
+      local fatbin="${elytar_dir}/${stem}.fatbin"
+      [[ -f "${fatbin}" ]] || continue
+      local elf_list
+      elf_list=$(cuobjdump --list-elf "${fatbin}" 2>/dev/null || true)
+      for arch in "${_cubin_archs[@]}"; do
+        if grep -q "\.${arch}\.cubin" <<< "${elf_list}"; then
+          _ptx_check_pass "${stem}.fatbin: ${arch} cubin present"
+        else
+          _ptx_check_fail "${stem}.fatbin: no ${arch} cubin (would JIT at startup)"
+        fi
+      done
+    done
+  else
+    echo "    [SKIP] cuobjdump not on PATH; cubin archs not inspected"
+  fi
+
   # ------------------------------------------------------------------
   # Check 3: Per-library symbol counts match configured PTX stems
   # ------------------------------------------------------------------
@@ -455,6 +499,13 @@ verify_ptx_mode() {
 
 if [[ -n "${PX_PTX_REPLACE_LIST}" ]]; then
   verify_ptx_mode "${PHYSX_LIB_DIR}" "${PHYSX_BUILD_DIR}" "${PX_PTX_REPLACE_LIST}" "${ELYTAR_PTX_INPUT_SUFFIX:-.ptx}"
+  # Ship the manifest next to the libraries so consumers can tell which
+  # stems run precompiled cubins and which fall back to PTX JIT
+  _ptx_manifest=$(find "${PHYSX_BUILD_DIR}" -maxdepth 4 -path "*elytar_ptx/manifest.json" 2>/dev/null | head -1)
+  if [[ -n "${_ptx_manifest}" ]]; then
+    cp "${_ptx_manifest}" "${PHYSX_LIB_DIR}/elytar_ptx_manifest.json"
+    echo "  PTX manifest: ${PHYSX_LIB_DIR}/elytar_ptx_manifest.json"
+  fi
 fi
 
 if [[ "${ELYTAR_PHYSX_ONLY}" == "1" ]]; then